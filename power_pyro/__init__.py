@@ -1,3 +1,22 @@
-from .monitor import Monitor
+from typing import Any
 
-__all__ = ['Monitor']
\ No newline at end of file
+__all__ = ['Monitor']
+
+def __getattr__(name: str) -> Any:
+    # Monitor loads the hardware backends (pythonnet), so it is only imported
+    # when used: the pytest plugin imports this package in every test session.
+    if name == 'Monitor':
+        from .monitor import Monitor
+        return Monitor
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def load_ipython_extension(ipython: Any) -> None:
+    """Registers the '%energy' and '%%energy' magics, with '%load_ext power_pyro'."""
+    from .energy_magics import load_ipython_extension
+    load_ipython_extension(ipython)
+
+def unload_ipython_extension(ipython: Any) -> None:
+    """Ends the kernel-wide monitor of the energy magics."""
+    from .energy_magics import unload_ipython_extension
+    unload_ipython_extension(ipython)
@@ -0,0 +1,224 @@
+from typing import Dict, List, Tuple, Union
+from threading import Lock
+import glob
+import os
+import re
+import time
+
+class AmdGpuSysfsReader():
+    """Reads the power and the utilisation of every AMD GPU from sysfs.
+
+    Cards are discovered once through '/sys/class/drm/card<N>/device', whose
+    PCI vendor is AMD and whose driver is 'amdgpu', and the files of each
+    card are kept open, so a read is one 'pread' per file:
+
+    - 'energy1_input' of the card hwmon, in µJ, where the card exposes it:
+      the power is the energy counted since the previous read divided by
+      the time elapsed, so short peaks between two reads are not missed.
+    - 'power1_input' (or 'power1_average' on older kernels), in µW,
+      otherwise and for the first read.
+    - 'gpu_busy_percent' of the device, where it exists.
+
+    Attributes:
+        __cards (List[Dict[str, Union[str, int]]]): Name, PCI slot and open
+        descriptors ('power', 'energy', 'busy', -1 if missing) of every card.
+        __last_energy (Dict[str, Tuple[float, float]]): Energy counter in J
+        and monotonic time of the previous read, by PCI slot.
+        __lock (Lock): Serializes the reads.
+        __AMD_VENDOR (str): PCI vendor id of AMD.
+    """
+    __AMD_VENDOR: str = '0x1002'
+
+    def __init__(self, drm: str = '/sys/class/drm'):
+        """
+        Args:
+            drm (str): The DRM class directory of sysfs (optional, default is
+            '/sys/class/drm').
+
+        Raises:
+            OSError: If no amdgpu card with a power sensor is found.
+        """
+        self.__cards: List[Dict[str, Union[str, int]]] = []
+        self.__last_energy: Dict[str, Tuple[float, float]] = {}
+        self.__lock: Lock = Lock()
+
+        paths = [path for path in glob.glob(os.path.join(drm, 'card*')) if re.fullmatch(r'card\d+', os.path.basename(path))]
+
+        for path in sorted(paths, key=lambda path: int(os.path.basename(path)[4:])):
+            card = self.__open_card(os.path.join(path, 'device'))
+
+            if card is not None:
+                self.__cards.append(card)
+
+        if not self.__cards:
+            raise OSError(f"No amdgpu card with a power sensor in {drm}")
+
+    @staticmethod
+    def __read_text(path: str) -> str:
+        """Reads a small sysfs file once.
+
+        Args:
+            path: File path.
+
+        Returns:
+            str: The stripped content, or '' if it cannot be read.
+        """
+        try:
+            with open(path, 'r') as file:
+                return file.read().strip()
+        except OSError:
+            return ''
+
+    @staticmethod
+    def __open(path: str) -> int:
+        """Opens a sysfs file for reading.
+
+        Args:
+            path: File path.
+
+        Returns:
+            int: The descriptor, or -1 if the file cannot be opened.
+        """
+        try:
+            return os.open(path, os.O_RDONLY)
+        except OSError:
+            return -1
+
+    def __open_card(self, device: str) -> Union[Dict[str, Union[str, int]], None]:
+        """Opens the sensors of a card.
+
+        Args:
+            device: The 'device' directory of the card.
+
+        Returns:
+            Union[Dict[str, Union[str, int]], None]: Name and descriptors of
+            the card, or None if it is not an amdgpu card with a power sensor.
+        """
+        if self.__read_text(os.path.join(device, 'vendor')) != self.__AMD_VENDOR:
+            return None
+
+        if os.path.basename(os.path.realpath(os.path.join(device, 'driver'))) != 'amdgpu':
+            return None
+
+        hwmon = next(iter(sorted(glob.glob(os.path.join(device, 'hwmon', 'hwmon*')))), None)
+
+        if hwmon is None:
+            return None
+
+        power = self.__open(os.path.join(hwmon, 'power1_input'))
+
+        if power < 0:
+            power = self.__open(os.path.join(hwmon, 'power1_average'))
+
+        energy = self.__open(os.path.join(hwmon, 'energy1_input'))
+
+        if power < 0 and energy < 0:
+            return None
+
+        uevent = dict(line.split('=', 1) for line in self.__read_text(os.path.join(device, 'uevent')).splitlines()
+                      if '=' in line)
+        name = (self.__read_text(os.path.join(device, 'product_name'))
+                or f"AMD GPU {uevent.get('PCI_ID', '').lower()} at {uevent.get('PCI_SLOT_NAME', os.path.realpath(device))}")
+
+        return {'name': name, 'slot': uevent.get('PCI_SLOT_NAME', os.path.realpath(device)), 'power': power,
+                'energy': energy, 'busy': self.__open(os.path.join(device, 'gpu_busy_percent'))}
+
+    @staticmethod
+    def __read_value(fd: int) -> float:
+        """Reads an integer sysfs file from its start.
+
+        Args:
+            fd: Open descriptor of the file.
+
+        Returns:
+            float: The value.
+
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If the file does not hold a number.
+        """
+        return float(os.pread(fd, 32, 0))
+
+    @property
+    def names(self) -> List[str]:
+        """Gets the names of the cards.
+
+        Returns:
+            List[str]: Product name of every card, or its PCI id and slot if
+            the driver does not report it.
+        """
+        return [card['name'] for card in self.__cards]
+
+    @property
+    def has_energy_counters(self) -> bool:
+        """Checks if every card counts its energy.
+
+        Returns:
+            bool: True if the power is derived from 'energy1_input'.
+        """
+        return all(card['energy'] >= 0 for card in self.__cards)
+
+    def read_power(self) -> Dict[str, float]:
+        """Reads the power of every card.
+
+        Returns:
+            Dict[str, float]: Power in W by PCI slot of the card.
+
+        Raises:
+            OSError: If a sensor cannot be read.
+            ValueError: If a sensor does not hold a number.
+        """
+        power: Dict[str, float] = {}
+
+        with self.__lock:
+            for card in self.__cards:
+                slot = str(card['slot'])
+
+                if card['energy'] >= 0:
+                    energy, now = self.__read_value(card['energy']) / 1_000_000, time.monotonic()
+                    last = self.__last_energy.get(slot)
+                    self.__last_energy[slot] = (energy, now)
+
+                    if last is not None and now > last[1] and energy >= last[0]:
+                        power[slot] = (energy - last[0]) / (now - last[1])
+                        continue
+
+                if card['power'] >= 0:
+                    power[slot] = self.__read_value(card['power']) / 1_000_000
+                else:
+                    # Only the energy counter exists: the first read has no
+                    # previous value, so it waits for a short interval.
+                    time.sleep(0.1)
+                    energy, now = self.__read_value(card['energy']) / 1_000_000, time.monotonic()
+                    last_energy, last_time = self.__last_energy[slot]
+                    self.__last_energy[slot] = (energy, now)
+                    power[slot] = max(energy - last_energy, 0.0) / (now - last_time)
+
+        return power
+
+    def read_utilization(self) -> Dict[str, float]:
+        """Reads the busy percentage of every card that reports it.
+
+        Returns:
+            Dict[str, float]: Utilisation between 0 and 100 by PCI slot of the
+            card.
+
+        Raises:
+            OSError: If a counter cannot be read.
+            ValueError: If a counter does not hold a number.
+        """
+        with self.__lock:
+            return {str(card['slot']): self.__read_value(card['busy']) for card in self.__cards if card['busy'] >= 0}
+
+    def close(self) -> None:
+        """Closes the files of every card."""
+        with self.__lock:
+            for card in self.__cards:
+                for key in ('power', 'energy', 'busy'):
+                    if card[key] >= 0:
+                        try:
+                            os.close(card[key])
+                        except OSError:
+                            pass
+
+                        card[key] = -1
@@ -0,0 +1,137 @@
+from .request_energy_tracker import RequestEnergyTracker
+
+from typing import Any, Callable, Coroutine, Dict, Generator, Union
+import time
+
+class _TimedCoroutine():
+    """Awaitable that measures the CPU time spent in each step of a coroutine.
+
+    Coroutines of other requests run on the same event loop thread while a
+    request waits, so the thread CPU time is only counted while this
+    coroutine is being resumed.
+    """
+    def __init__(self, coroutine: Coroutine):
+        self.__coroutine: Coroutine = coroutine
+        self.cpu_time: float = 0.0
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        coroutine = self.__coroutine
+        value: Any = None
+        error: Union[BaseException, None] = None
+
+        while True:
+            start = time.thread_time()
+
+            try:
+                if error is not None:
+                    yielded = coroutine.throw(error)
+                else:
+                    yielded = coroutine.send(value)
+            except StopIteration as stop:
+                self.cpu_time += time.thread_time() - start
+                return stop.value
+            except BaseException:
+                self.cpu_time += time.thread_time() - start
+                raise
+
+            self.cpu_time += time.thread_time() - start
+
+            try:
+                value = yield yielded
+                error = None
+            except BaseException as e:
+                value = None
+                error = e
+
+class AsgiEnergyMiddleware():
+    """ASGI middleware charging every request its share of the process energy.
+
+    Each HTTP or WebSocket connection runs inside a timed coroutine that
+    measures the thread CPU time of its own steps only, so requests
+    interleaved on the event loop are not charged for each other. The CPU
+    time is charged by a 'RequestEnergyTracker' into a histogram per route.
+
+    Only the event loop thread is measured: a sync endpoint that the
+    framework runs in its thread pool (the FastAPI and Starlette default
+    for 'def' endpoints) is charged about nothing, and the tracker warns
+    when its coverage drops. Endpoints whose energy matters should be
+    declared 'async def'.
+
+    Attributes:
+        __app (Callable): The wrapped ASGI application.
+        __tracker (RequestEnergyTracker): Tracker charging the requests.
+        __route (Callable[[Dict[str, Any]], str]): Maps the scope of a
+        request to its route.
+    """
+    def __init__(self, app: Callable, tracker: Union[RequestEnergyTracker, None] = None,
+                 route: Union[Callable[[Dict[str, Any]], str], None] = None):
+        """
+        Args:
+            app (Callable): The ASGI application.
+            tracker (Union[RequestEnergyTracker, None]): Tracker charging the
+            requests (optional, default is a new tracker).
+            route (Union[Callable[[Dict[str, Any]], str], None]): Maps the
+            scope of a request to its route once it is served, e.g. to group
+            paths with ids (optional, default is the method followed by the
+            route template set by FastAPI, or by the path).
+
+        Example:
+            ```python
+            from fastapi import FastAPI
+            from power_pyro.asgi_energy_middleware import AsgiEnergyMiddleware
+
+            app = FastAPI()
+            app.add_middleware(AsgiEnergyMiddleware)
+            ```
+        """
+        self.__app: Callable = app
+        self.__tracker: RequestEnergyTracker = tracker if tracker is not None else RequestEnergyTracker()
+        self.__route: Callable[[Dict[str, Any]], str] = route if route is not None else self.__default_route
+
+    @staticmethod
+    def __default_route(scope: Dict[str, Any]) -> str:
+        """Names the route of a request.
+
+        Args:
+            scope: ASGI scope of the request.
+
+        Returns:
+            str: Method (or 'WEBSOCKET') and route template or path of the
+            request.
+        """
+        path = getattr(scope.get('route'), 'path', None)
+
+        if not isinstance(path, str):
+            path = scope.get('path', '')
+
+        return f"{scope.get('method', scope['type'].upper())} {path}"
+
+    @property
+    def tracker(self) -> RequestEnergyTracker:
+        """Gets the tracker charging the requests.
+
+        Returns:
+            RequestEnergyTracker: The tracker.
+        """
+        return self.__tracker
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        """Serves a connection, measuring the CPU time of its steps.
+
+        Args:
+            scope (Dict[str, Any]): ASGI scope.
+            receive (Callable): ASGI receive channel.
+            send (Callable): ASGI send channel.
+        """
+        if scope['type'] not in ('http', 'websocket'):
+            await self.__app(scope, receive, send)
+            return
+
+        timed = _TimedCoroutine(self.__app(scope, receive, send))
+
+        try:
+            await timed
+        finally:
+            # The framework stores the matched route in the scope while
+            # serving the request.
+            self.__tracker.charge(self.__route(scope), timed.cpu_time)
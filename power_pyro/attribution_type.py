@@ -0,0 +1,9 @@
+from enum import Enum
+
+class AttributionType(Enum):
+    """ Enumeration representing the possible models to attribute energy 
+        to the monitored workload."""
+    
+    CPU_PERCENT = 0
+    PERF_COUNTERS = 1
+    CGROUP = 2
@@ -0,0 +1,55 @@
+from .comparison_verdict import ComparisonVerdict
+
+from dataclasses import dataclass
+from typing import Any, Dict, Union
+
+@dataclass(frozen=True)
+class BenchmarkComparison():
+    """Energy of a benchmark at a candidate commit compared with a baseline.
+
+    Attributes:
+        benchmark (str): Benchmark name.
+        verdict (ComparisonVerdict): Outcome of the comparison.
+        baseline_count (int): Number of baseline runs compared.
+        candidate_count (int): Number of candidate runs compared.
+        hosts (int): Number of host classes with runs of both commits.
+        baseline_energy (Union[float, None]): Median baseline energy in kWh.
+        candidate_energy (Union[float, None]): Median candidate energy in kWh.
+        change (Union[float, None]): Relative change of the median energy,
+        e.g. 0.08 for 8% more energy.
+        change_low (Union[float, None]): Lower bound of the bootstrap
+        confidence interval of the change.
+        change_high (Union[float, None]): Upper bound of the bootstrap
+        confidence interval of the change.
+        p_value (Union[float, None]): One-sided Mann-Whitney p-value in the
+        direction of the change.
+    """
+    benchmark: str
+    verdict: ComparisonVerdict
+    baseline_count: int = 0
+    candidate_count: int = 0
+    hosts: int = 0
+    baseline_energy: Union[float, None] = None
+    candidate_energy: Union[float, None] = None
+    change: Union[float, None] = None
+    change_low: Union[float, None] = None
+    change_high: Union[float, None] = None
+    p_value: Union[float, None] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the comparison into a JSON serializable dictionary.
+
+        Returns:
+            Dict[str, Any]: The comparison fields, the verdict by name.
+        """
+        return {'benchmark': self.benchmark,
+                'verdict': self.verdict.name.lower(),
+                'baseline_count': self.baseline_count,
+                'candidate_count': self.candidate_count,
+                'hosts': self.hosts,
+                'baseline_energy': self.baseline_energy,
+                'candidate_energy': self.candidate_energy,
+                'change': self.change,
+                'change_low': self.change_low,
+                'change_high': self.change_high,
+                'p_value': self.p_value}
@@ -0,0 +1,205 @@
+from typing import Dict, List, Union
+import json
+import os
+import socket
+import time
+
+class CalibrationProfile():
+    """Idle power baseline of a host, measured once and reused across runs.
+
+    Attributes:
+        __hostname (str): Name of the host where the calibration was made.
+        __idle_power (Dict[str, float]): Idle power in W of each calibrated
+        component ('cpu', 'gpu', 'memory').
+        __hardware_names (Dict[str, Union[str, None]]): Name of the hardware
+        of each calibrated component, used to detect hardware changes.
+        __window (float): Duration in seconds of the calibration window.
+        __created_at (float): Timestamp at which the calibration was made.
+        __unavailable (List[str]): Components whose power could not be read
+        during the calibration, so they have no idle baseline on their
+        hardware.
+    """
+    def __init__(self, hostname: str, idle_power: Dict[str, float],
+                 hardware_names: Dict[str, Union[str, None]], window: float,
+                 created_at: Union[float, None] = None, unavailable: Union[List[str], None] = None):
+        self.__hostname: str = hostname
+        self.__idle_power: Dict[str, float] = dict(idle_power)
+        self.__hardware_names: Dict[str, Union[str, None]] = dict(hardware_names)
+        self.__window: float = window
+        self.__created_at: float = created_at if created_at is not None else time.time()
+        self.__unavailable: List[str] = [key for key in (unavailable or []) if key not in self.__idle_power]
+
+    @property
+    def hostname(self) -> str:
+        """Gets the name of the calibrated host.
+
+        Returns:
+            str: Host name.
+        """
+        return self.__hostname
+
+    @property
+    def idle_power(self) -> Dict[str, float]:
+        """Gets the idle power of each calibrated component.
+
+        Returns:
+            Dict[str, float]: Idle power in W by component name.
+        """
+        return dict(self.__idle_power)
+
+    @property
+    def hardware_names(self) -> Dict[str, Union[str, None]]:
+        """Gets the hardware name of each calibrated component.
+
+        Returns:
+            Dict[str, Union[str, None]]: Hardware name by component name.
+        """
+        return dict(self.__hardware_names)
+
+    @property
+    def unavailable(self) -> List[str]:
+        """Gets the components that could not be calibrated.
+
+        Returns:
+            List[str]: Names of the components without idle baseline.
+        """
+        return list(self.__unavailable)
+
+    @property
+    def window(self) -> float:
+        """Gets the duration of the calibration window.
+
+        Returns:
+            float: Window in seconds.
+        """
+        return self.__window
+
+    @property
+    def created_at(self) -> float:
+        """Gets the moment at which the calibration was made.
+
+        Returns:
+            float: Unix timestamp.
+        """
+        return self.__created_at
+
+    def covers(self, hardware_names: Dict[str, Union[str, None]]) -> bool:
+        """Checks if the profile can be reused for the given components.
+
+        Args:
+            hardware_names (Dict[str, Union[str, None]]): Hardware name of
+            each component that will be monitored.
+
+        Returns:
+            bool:
+                - 'True' if every component was calibrated, or could not be 
+                  read, on the same hardware.
+                - 'False' otherwise.
+        """
+        return all((component in self.__idle_power or component in self.__unavailable) and
+                   self.__hardware_names.get(component) == name
+                   for component, name in hardware_names.items())
+
+    def to_dict(self) -> Dict[str, object]:
+        """Converts the profile into a JSON serializable dictionary.
+
+        Returns:
+            Dict[str, object]: The profile fields.
+        """
+        return {'hostname': self.__hostname,
+                'idle_power': self.__idle_power,
+                'hardware_names': self.__hardware_names,
+                'window': self.__window,
+                'created_at': self.__created_at,
+                'unavailable': self.__unavailable}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "CalibrationProfile":
+        """Creates a profile from a dictionary produced by 'to_dict'.
+
+        Args:
+            data (Dict[str, object]): The profile fields.
+
+        Returns:
+            CalibrationProfile: The restored profile.
+
+        Raises:
+            ValueError: If the dictionary is not a valid profile.
+        """
+        try:
+            return cls(str(data['hostname']),
+                       {key: float(value) for key, value in data['idle_power'].items()},
+                       dict(data['hardware_names']),
+                       float(data['window']),
+                       float(data['created_at']),
+                       [str(key) for key in data.get('unavailable', [])])
+        except (KeyError, TypeError, AttributeError, ValueError) as e:
+            raise ValueError(f"Invalid calibration profile: {e}")
+
+    @staticmethod
+    def current_hostname() -> str:
+        """Returns the name of the host running the process.
+
+        Returns:
+            str: Host name.
+        """
+        return socket.gethostname()
+
+    @staticmethod
+    def default_path(hostname: Union[str, None] = None) -> str:
+        """Returns where the profile of a host is stored.
+
+        The directory can be changed with the 'POWERPYRO_CALIBRATION_DIR'
+        environment variable and defaults to '~/.powerpyro/calibration'.
+
+        Args:
+            hostname (Union[str, None]): Host name (optional, default is the
+            current host).
+
+        Returns:
+            str: Path of the profile file.
+        """
+        directory = os.environ.get('POWERPYRO_CALIBRATION_DIR',
+                                   os.path.join(os.path.expanduser('~'), '.powerpyro', 'calibration'))
+
+        return os.path.join(directory, (hostname or CalibrationProfile.current_hostname()) + '.json')
+
+    def save(self, path: Union[str, None] = None) -> str:
+        """Writes the profile to disk.
+
+        Args:
+            path (Union[str, None]): Destination file (optional, default is
+            'default_path' of the profile host).
+
+        Returns:
+            str: Path of the written file.
+        """
+        path = path or CalibrationProfile.default_path(self.__hostname)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        temporary_path = path + '.tmp'
+        with open(temporary_path, 'w') as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+        os.replace(temporary_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, None] = None) -> Union["CalibrationProfile", None]:
+        """Reads a profile from disk.
+
+        Args:
+            path (Union[str, None]): Profile file (optional, default is
+            'default_path' of the current host).
+
+        Returns:
+            Union[CalibrationProfile, None]: The stored profile, or None if
+            there is no valid profile at the given path.
+        """
+        path = path or CalibrationProfile.default_path()
+
+        try:
+            with open(path, 'r') as file:
+                return cls.from_dict(json.load(file))
+        except (OSError, ValueError):
+            return None
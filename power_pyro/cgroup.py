@@ -0,0 +1,246 @@
+from .resource_unavailable_exception import ResourceUnavailableException
+
+from typing import Dict, List, Tuple
+import os
+
+class Cgroup():
+    """The cgroup v2 of the running process, read through open descriptors.
+
+    The cgroup is resolved once from '/proc/self/cgroup' and the cgroup2
+    mount point, and 'cpu.stat', 'memory.current', 'memory.stat', 
+    'memory.numa_stat' and '/proc/stat' are kept open, so every value costs a single 'pread' no
+    matter how many processes the cgroup (e.g. a Kubernetes pod) contains.
+
+    Attributes:
+        __path (str): Directory of the cgroup in the cgroup2 hierarchy.
+        __fds (Dict[str, int]): Open descriptors by file name, empty once
+        closed.
+        __memory_controller (bool): Whether the memory files of the cgroup
+        were found.
+        __CLOCK_TICKS (int): Clock ticks per second used by '/proc/stat'.
+        __READ_SIZE (int): Bytes read from each file.
+    """
+    def __init__(self):
+        """
+        Raises:
+            ResourceUnavailableException: If the process does not run in a
+            cgroup v2 hierarchy or its CPU accounting files cannot be opened.
+        """
+        self.__CLOCK_TICKS: int = 100
+        self.__READ_SIZE: int = 8192
+        self.__fds: Dict[str, int] = {}
+
+        try:
+            self.__CLOCK_TICKS = os.sysconf('SC_CLK_TCK')
+            self.__path: str = os.path.join(self.__mount_point(), self.__relative_path().lstrip('/'))
+            self.__open_files()
+        except (OSError, ValueError, AttributeError) as e:
+            self.close()
+            raise ResourceUnavailableException("cgroup v2", str(e))
+
+        self.__memory_controller: bool = 'memory.current' in self.__fds
+
+    def __open_files(self) -> None:
+        """Opens the accounting files of the cgroup.
+
+        Raises:
+            OSError: If the CPU accounting files cannot be opened.
+        """
+        self.__fds['cpu.stat'] = os.open(os.path.join(self.__path, 'cpu.stat'), os.O_RDONLY)
+        self.__fds['/proc/stat'] = os.open('/proc/stat', os.O_RDONLY)
+
+        for name in ('memory.current', 'memory.stat', 'memory.numa_stat'):
+            path = os.path.join(self.__path, name)
+
+            if os.path.exists(path):
+                self.__fds[name] = os.open(path, os.O_RDONLY)
+
+    def __relative_path(self) -> str:
+        """Finds the cgroup v2 path of the process.
+
+        Returns:
+            str: Path relative to the cgroup2 mount point.
+
+        Raises:
+            ValueError: If the process has no cgroup v2 entry.
+        """
+        with open('/proc/self/cgroup', 'r') as file:
+            for line in file:
+                hierarchy, _, path = line.rstrip('\n').split(':', 2)
+
+                if hierarchy == '0':
+                    return path
+
+        raise ValueError("Process is not in a cgroup v2 hierarchy")
+
+    def __mount_point(self) -> str:
+        """Finds where the cgroup2 filesystem is mounted.
+
+        Returns:
+            str: Mount point.
+
+        Raises:
+            ValueError: If there is no cgroup2 mount.
+        """
+        with open('/proc/self/mountinfo', 'r') as file:
+            for line in file:
+                fields = line.split()
+                separator = fields.index('-')
+
+                if fields[separator + 1] == 'cgroup2':
+                    return fields[4]
+
+        raise ValueError("cgroup2 filesystem is not mounted")
+
+    @property
+    def path(self) -> str:
+        """Gets the directory of the cgroup.
+
+        Returns:
+            str: Cgroup directory.
+        """
+        return self.__path
+
+    @property
+    def has_memory_controller(self) -> bool:
+        """Checks if the memory usage of the cgroup can be read.
+
+        Returns:
+            bool: True if the memory controller is enabled for the cgroup.
+        """
+        return self.__memory_controller
+
+    def __read(self, name: str) -> str:
+        """Reads an open file from its start.
+
+        Args:
+            name: File name.
+
+        Returns:
+            str: File content.
+        """
+        return os.pread(self.__fds[name], self.__READ_SIZE, 0).decode()
+
+    def __read_keyed(self, name: str) -> Dict[str, int]:
+        """Reads a flat keyed file such as 'cpu.stat' or 'memory.stat'.
+
+        Args:
+            name: File name.
+
+        Returns:
+            Dict[str, int]: Values by key.
+        """
+        values: Dict[str, int] = {}
+
+        for line in self.__read(name).splitlines():
+            key, _, value = line.partition(' ')
+            values[key] = int(value)
+
+        return values
+
+    def read_cpu_usage(self) -> float:
+        """Reads the CPU time used by every process of the cgroup.
+
+        Returns:
+            float: Cumulative CPU time in seconds ('usage_usec').
+        """
+        return self.__read_keyed('cpu.stat')['usage_usec'] / 1_000_000
+
+    def read_host_cpu_time(self) -> float:
+        """Reads the busy CPU time of the host.
+
+        Returns:
+            float: Cumulative busy CPU time of all CPUs in seconds, without
+            steal time as in 'CpuUtilizationReader'.
+        """
+        fields: List[str] = self.__read('/proc/stat').split('\n', 1)[0].split()
+        user, nice, system, idle, iowait, irq, softirq = (int(value) for value in fields[1:8])
+
+        return (user + nice + system + irq + softirq) / self.__CLOCK_TICKS
+
+    def read_cpu_times(self) -> Tuple[float, float]:
+        """Reads the CPU time of the cgroup and of the host.
+
+        Returns:
+            Tuple[float, float]: Cgroup and host busy CPU time in seconds.
+        """
+        return self.read_cpu_usage(), self.read_host_cpu_time()
+
+    def read_working_set(self) -> int:
+        """Reads the memory used by the cgroup that cannot be dropped easily.
+
+        The working set is 'memory.current' minus the inactive file cache
+        reported in 'memory.stat', as computed by the kubelet.
+
+        Returns:
+            int: Working set in bytes.
+
+        Raises:
+            ResourceUnavailableException: If the memory controller is not
+            enabled for the cgroup.
+        """
+        if 'memory.current' not in self.__fds:
+            raise ResourceUnavailableException("cgroup v2", "memory controller is not enabled")
+
+        current = int(self.__read('memory.current'))
+        inactive_file = self.__read_keyed('memory.stat').get('inactive_file', 0) if 'memory.stat' in self.__fds else 0
+
+        return max(current - inactive_file, 0)
+
+    def read_numa_working_set(self) -> Dict[int, int]:
+        """Reads the working set of the cgroup on each NUMA node.
+
+        Like 'read_working_set', the inactive file cache is left out: the
+        working set of a node is its anonymous and file memory minus its
+        inactive file memory, from 'memory.numa_stat'.
+
+        Returns:
+            Dict[int, int]: Working set in bytes by node id.
+
+        Raises:
+            ResourceUnavailableException: If the memory controller is not
+            enabled for the cgroup or the kernel has no NUMA statistics.
+        """
+        if 'memory.numa_stat' not in self.__fds:
+            raise ResourceUnavailableException("cgroup v2", "memory.numa_stat is not available")
+
+        working_set: Dict[int, int] = {}
+        signs = {'anon': 1, 'file': 1, 'inactive_file': -1}
+
+        for line in self.__read('memory.numa_stat').splitlines():
+            key, _, values = line.partition(' ')
+
+            if key not in signs:
+                continue
+
+            for value in values.split():
+                node, _, size = value.partition('=')
+                working_set[int(node[1:])] = working_set.get(int(node[1:]), 0) + signs[key] * int(size)
+
+        return {node: max(size, 0) for node, size in working_set.items()}
+
+    def open(self) -> None:
+        """Reopens the accounting files after 'close'.
+
+        Raises:
+            ResourceUnavailableException: If the CPU accounting files cannot
+            be opened.
+        """
+        if self.__fds:
+            return
+
+        try:
+            self.__open_files()
+        except OSError as e:
+            self.close()
+            raise ResourceUnavailableException("cgroup v2", str(e))
+
+    def close(self) -> None:
+        """Closes every open descriptor."""
+        for fd in self.__fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+        self.__fds = {}
@@ -0,0 +1,44 @@
+from .cpu_attribution_model import CpuAttributionModel
+from .cgroup import Cgroup
+
+class CgroupAttributionModel(CpuAttributionModel):
+    """Attributes CPU power by the share of host CPU time used by the cgroup
+       of the monitored process, so every process of a container counts.
+
+    Attributes:
+        __cgroup (Cgroup): Cgroup of the monitored process.
+        __last_usage (float): CPU time of the cgroup at the previous call.
+        __last_host_time (float): Busy CPU time of the host at the previous call.
+    """
+    def __init__(self, cgroup: Cgroup):
+        super().__init__()
+        self.__cgroup: Cgroup = cgroup
+        self.__last_usage, self.__last_host_time = cgroup.read_cpu_times()
+
+    def get_share(self) -> float:
+        """Returns the share of host CPU time used by the cgroup since the
+           previous call.
+
+        Returns:
+            float: Share between 0 and 1.
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+            from power_pyro.attribution_type import AttributionType
+
+            monitor = Monitor({'cpu': True, 'memory': True}, attribution=AttributionType.CGROUP)
+            ```
+        """
+        usage, host_time = self.__cgroup.read_cpu_times()
+        usage_delta, host_delta = usage - self.__last_usage, host_time - self.__last_host_time
+        self.__last_usage, self.__last_host_time = usage, host_time
+
+        if host_delta <= 0:
+            return 0.0
+
+        return min(max(usage_delta / host_delta, 0.0), 1.0)
+
+    def close(self) -> None:
+        """Closes the cgroup files."""
+        self.__cgroup.close()
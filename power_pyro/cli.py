@@ -0,0 +1,287 @@
+from typing import List, TextIO, Union
+import argparse
+import json
+import sys
+
+def _open_output(path: Union[str, None], default: TextIO) -> TextIO:
+    """Opens an output file, '-' being the standard output.
+
+    Args:
+        path: File path, '-' or None.
+        default: File used when no path is given.
+
+    Returns:
+        TextIO: The file.
+    """
+    if path is None:
+        return default
+
+    return sys.stdout if path == '-' else open(path, 'w')
+
+def _run(options: argparse.Namespace) -> int:
+    """Runs the 'run' command.
+
+    Args:
+        options: Parsed options.
+
+    Returns:
+        int: Exit code of the measured command.
+    """
+    from .command_runner import CommandRunner
+    from .attribution_type import AttributionType
+
+    command = options.cmd[1:] if options.cmd[:1] == ['--'] else options.cmd
+
+    if not command:
+        print('powerpyro run: no command given', file=sys.stderr)
+        return 2
+
+    components = {'cpu': not options.no_cpu, 'gpu': options.gpu, 'memory': not options.no_memory,
+                  'storage': options.storage, 'network': options.network}
+    stream = _open_output(options.stream, None)
+    output = _open_output(options.output, sys.stderr)
+
+    try:
+        runner = CommandRunner(command, components, options.interval,
+                               AttributionType[options.attribution.upper()], stream)
+        exit_code = runner.run()
+        result = runner.result
+
+        if not options.timeline:
+            result.pop('timeline')
+
+        output.write(json.dumps(result, indent=None if options.compact else 2) + '\n')
+        output.flush()
+    finally:
+        for file in (stream, output):
+            if file not in (None, sys.stdout, sys.stderr):
+                file.close()
+
+    return exit_code
+
+def _record(options: argparse.Namespace) -> int:
+    """Runs the 'record' command.
+
+    Every input document or line is either a result of 'powerpyro run',
+    whose total energy is recorded under the '--benchmark' name, or a record
+    with 'benchmark' and 'energy' (kWh) keys and an optional 'duration'.
+
+    Args:
+        options: Parsed options.
+
+    Returns:
+        int: Exit code.
+    """
+    from .energy_baseline_store import EnergyBaselineStore
+
+    records = []
+
+    for path in options.results or ['-']:
+        file = sys.stdin if path == '-' else open(path, 'r')
+
+        try:
+            text = file.read()
+        finally:
+            if file is not sys.stdin:
+                file.close()
+
+        try:
+            documents = [json.loads(text)]
+        except ValueError:
+            documents = None
+
+        try:
+            documents = documents or [json.loads(line) for line in text.splitlines() if line.strip()]
+        except ValueError as e:
+            print(f'powerpyro record: invalid JSON in {path}: {e}', file=sys.stderr)
+            return 2
+
+        for document in documents:
+            if 'total_energy' in document:
+                if options.benchmark is None:
+                    print('powerpyro record: --benchmark is required for run results', file=sys.stderr)
+                    return 2
+
+                records.append((options.benchmark, float(document['total_energy']), document.get('duration')))
+            elif 'benchmark' in document and 'energy' in document:
+                records.append((str(document['benchmark']), float(document['energy']), document.get('duration')))
+            else:
+                print(f'powerpyro record: unrecognised record in {path}', file=sys.stderr)
+                return 2
+
+    with EnergyBaselineStore(options.store) as store:
+        try:
+            for benchmark, energy, duration in records:
+                store.record(benchmark, energy, options.commit, duration=duration)
+        except ValueError as e:
+            print(f'powerpyro record: {e}', file=sys.stderr)
+            return 2
+
+    return 0
+
+def _compare(options: argparse.Namespace) -> int:
+    """Runs the 'compare' command.
+
+    Args:
+        options: Parsed options.
+
+    Returns:
+        int: 1 if a benchmark regressed (or has no baseline with
+        '--fail-on-missing'), 2 on usage errors, 0 otherwise.
+    """
+    from .energy_baseline_store import EnergyBaselineStore
+    from .energy_regression_checker import EnergyRegressionChecker
+    from .comparison_verdict import ComparisonVerdict
+    from .host_profile import HostProfile
+
+    with EnergyBaselineStore(options.store) as store:
+        host_key = None if options.all_hosts else HostProfile.current().key
+
+        try:
+            candidate = store.resolve_commit(options.candidate or EnergyBaselineStore.current_commit() or '')
+            baseline = options.baseline and store.resolve_commit(options.baseline)
+        except ValueError as e:
+            print(f'powerpyro compare: {e}', file=sys.stderr)
+            return 2
+
+        if baseline is None:
+            baseline = next((commit for commit in store.commits(host_key) if commit != candidate), None)
+
+        if not candidate or baseline is None:
+            print('powerpyro compare: no candidate or baseline commit to compare', file=sys.stderr)
+            return 2
+
+        checker = EnergyRegressionChecker(store, options.threshold, options.alpha, seed=0)
+        comparisons = checker.compare(baseline, candidate, host_key)
+
+    if options.output is not None:
+        output = _open_output(options.output, sys.stdout)
+        output.write(json.dumps({'baseline': baseline, 'candidate': candidate, 'host': host_key,
+                                 'benchmarks': [comparison.to_dict() for comparison in comparisons]}, indent=2) + '\n')
+
+        if output is not sys.stdout:
+            output.close()
+
+    if options.output != '-':
+        print(f'{"benchmark":<32} {"verdict":<17} {"change":>8} {"interval":>19} {"p-value":>8}')
+
+        for comparison in comparisons:
+            change = interval = p_value = ''
+
+            if comparison.change is not None:
+                change = f'{comparison.change:+.1%}'
+                interval = f'[{comparison.change_low:+.1%}, {comparison.change_high:+.1%}]'
+                p_value = f'{comparison.p_value:.3g}'
+
+            print(f'{comparison.benchmark:<32} {comparison.verdict.name.lower():<17} {change:>8} {interval:>19} {p_value:>8}')
+
+    failures = {ComparisonVerdict.REGRESSED}
+
+    if options.fail_on_missing:
+        failures.add(ComparisonVerdict.NO_BASELINE)
+
+    return 1 if any(comparison.verdict in failures for comparison in comparisons) else 0
+
+def _trace(options: argparse.Namespace) -> int:
+    """Runs the 'trace' command.
+
+    Args:
+        options: Parsed options.
+
+    Returns:
+        int: Exit code.
+    """
+    from .trace_event_exporter import TraceEventExporter
+
+    output = _open_output(options.output, sys.stdout)
+
+    try:
+        with TraceEventExporter(output, pid=options.pid, clock_offset=options.clock_offset) as exporter:
+            for path in options.records:
+                exporter.write_records(path)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    return 0
+
+def main(arguments: Union[List[str], None] = None) -> int:
+    """Entry point of the 'powerpyro' console script.
+
+    Args:
+        arguments (Union[List[str], None]): Command line arguments (optional,
+        default is 'sys.argv').
+
+    Returns:
+        int: Exit code.
+
+    Example:
+        ```
+        $ powerpyro run --interval 0.5 --output energy.json -- make -j8
+        $ powerpyro run --gpu --stream - -- python train.py | jq .power
+        $ powerpyro run --output - --compact -- ./bench.sh | powerpyro record --benchmark bench
+        $ powerpyro compare --baseline main --threshold 0.03
+        $ powerpyro run --stream samples.jsonl -- ./bench.sh && powerpyro trace samples.jsonl -o bench.trace.json
+        ```
+    """
+    parser = argparse.ArgumentParser(prog='powerpyro', description='Measure the energy consumed by programs.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='run a command and measure the energy of its process tree',
+                              usage='powerpyro run [options] -- command [arguments ...]')
+    run.add_argument('--interval', type=float, default=1.0, help='seconds between two samples (default: 1)')
+    run.add_argument('--gpu', action='store_true', help='also measure the GPU')
+    run.add_argument('--no-cpu', action='store_true', help='do not measure the CPU')
+    run.add_argument('--no-memory', action='store_true', help='do not measure the memory')
+    run.add_argument('--storage', action='store_true', help='also measure the disks (Linux only)')
+    run.add_argument('--network', action='store_true', help='also measure the network interfaces (Linux only)')
+    run.add_argument('--attribution', choices=['cpu_percent', 'perf_counters', 'cgroup'], default='cpu_percent',
+                     help='how CPU energy is attributed to the command (default: cpu_percent)')
+    run.add_argument('--output', metavar='FILE',
+                     help="file receiving the JSON result, '-' for the standard output (default: standard error)")
+    run.add_argument('--stream', metavar='FILE',
+                     help="file receiving every sample as a JSON line while the command runs, '-' for the standard output")
+    run.add_argument('--no-timeline', dest='timeline', action='store_false', help='leave the timeline out of the result')
+    run.add_argument('--compact', action='store_true', help='write the result on a single line')
+    run.add_argument('cmd', nargs=argparse.REMAINDER, help='command to measure')
+    run.set_defaults(handler=_run)
+
+    record = commands.add_parser('record', help='store benchmark energy results in the baseline store')
+    record.add_argument('results', nargs='*', metavar='FILE',
+                        help="results of 'powerpyro run' or JSON lines with 'benchmark' and 'energy' (kWh) "
+                             "(default: standard input)")
+    record.add_argument('--benchmark', help="benchmark name of 'powerpyro run' results")
+    record.add_argument('--commit', help='measured commit (default: $POWERPYRO_COMMIT or the git HEAD)')
+    record.add_argument('--store', metavar='FILE',
+                        help='baseline database (default: $POWERPYRO_BASELINE_STORE or ~/.powerpyro/baselines.sqlite)')
+    record.set_defaults(handler=_record)
+
+    compare = commands.add_parser('compare', help='compare the energy of a commit with a baseline commit')
+    compare.add_argument('--baseline', help='baseline commit (default: the latest other commit recorded on this host)')
+    compare.add_argument('--candidate', help='candidate commit (default: $POWERPYRO_COMMIT or the git HEAD)')
+    compare.add_argument('--store', metavar='FILE',
+                         help='baseline database (default: $POWERPYRO_BASELINE_STORE or ~/.powerpyro/baselines.sqlite)')
+    compare.add_argument('--threshold', type=float, default=0.05,
+                         help='smallest relative energy growth reported as a regression (default: 0.05)')
+    compare.add_argument('--alpha', type=float, default=0.05, help='significance level (default: 0.05)')
+    compare.add_argument('--all-hosts', action='store_true',
+                         help='compare runs of every host class, normalised per class (default: this host class only)')
+    compare.add_argument('--fail-on-missing', action='store_true', help='also fail when a benchmark has no baseline')
+    compare.add_argument('--output', metavar='FILE', help="file receiving the JSON comparison, '-' for the standard output")
+    compare.set_defaults(handler=_compare)
+
+    trace = commands.add_parser('trace', help='convert recorded samples to a trace viewable in Perfetto or chrome://tracing')
+    trace.add_argument('records', nargs='+', metavar='FILE',
+                       help="JSON lines written by 'powerpyro run --stream' or a sample sink")
+    trace.add_argument('-o', '--output', metavar='FILE', help='file receiving the trace (default: standard output)')
+    trace.add_argument('--pid', type=int, default=0, help='process id of the events, to merge with other traces (default: 0)')
+    trace.add_argument('--clock-offset', type=float, default=0.0,
+                       help='seconds added to every timestamp to align with another trace (default: 0)')
+    trace.set_defaults(handler=_trace)
+
+    options = parser.parse_args(arguments)
+
+    return options.handler(options)
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,231 @@
+from .monitor import Monitor
+from .attribution_type import AttributionType
+from .sample import Sample
+
+from typing import Any, Dict, List, TextIO, Tuple, Union
+import json
+import os
+import signal
+import subprocess
+import time
+
+class CommandRunner():
+    """Runs a command and measures the energy of its whole process tree.
+
+    On POSIX systems the command is started by a shell that waits on a pipe
+    and then replaces itself with the command (keeping its process id), so
+    the monitor is attached before any part of the command runs, and its
+    exit is awaited without reaping it, so the last sample still reads its
+    CPU time. The runner forwards SIGTERM and SIGHUP to the command and
+    ignores SIGINT, which the terminal already delivers to the command.
+
+    Attributes:
+        __command (List[str]): The command and its arguments.
+        __required_components (Dict[str, bool]): Components to monitor.
+        __sampling_interval (float): Time in seconds between two samples.
+        __attribution (AttributionType): How CPU energy is attributed.
+        __stream (Union[TextIO, None]): File receiving every sample as a JSON
+        line while the command runs, if any.
+        __result (Union[Dict[str, Any], None]): Result of the last run.
+        __GATE (str): Shell script holding the command until the monitor is 
+        attached.
+    """
+    __GATE: str = 'read _ <&"$POWERPYRO_GATE_FD"; eval "exec $POWERPYRO_GATE_FD<&-"; unset POWERPYRO_GATE_FD; exec "$@"'
+
+    def __init__(self, command: List[str], required_components: Union[Dict[str, bool], None] = None,
+                 sampling_interval: float = 1.0, attribution: AttributionType = AttributionType.CPU_PERCENT,
+                 stream: Union[TextIO, None] = None):
+        """
+        Args:
+            command (List[str]): The command and its arguments.
+            required_components (Union[Dict[str, bool], None]): Components to
+            monitor (optional, default is the CPU and the memory).
+            sampling_interval (float): Time in seconds between two samples
+            (optional, default is 1).
+            attribution (AttributionType): How CPU energy is attributed
+            (optional, default is AttributionType.CPU_PERCENT, i.e. the share
+            of host CPU time used by the process tree).
+            stream (Union[TextIO, None]): File receiving every sample as a JSON
+            line while the command runs (optional).
+
+        Raises:
+            ValueError: If the command is empty.
+        """
+        if not command:
+            raise ValueError("No command to run")
+
+        self.__command: List[str] = list(command)
+        self.__required_components: Dict[str, bool] = required_components or {'cpu': True, 'memory': True}
+        self.__sampling_interval: float = sampling_interval
+        self.__attribution: AttributionType = attribution
+        self.__stream: Union[TextIO, None] = stream
+        self.__result: Union[Dict[str, Any], None] = None
+
+    @property
+    def result(self) -> Union[Dict[str, Any], None]:
+        """Gets the result of the last run.
+
+        Returns:
+            Union[Dict[str, Any], None]: JSON serializable result, or None
+            before the first run.
+        """
+        return self.__result
+
+    def __launch(self) -> Tuple[subprocess.Popen, Union[int, None]]:
+        """Starts the command, held before 'exec' on POSIX systems.
+
+        Returns:
+            Tuple[subprocess.Popen, Union[int, None]]: The command process and 
+            the descriptor releasing it, None if it is not held.
+        """
+        if os.name != 'posix':
+            return subprocess.Popen(self.__command), None
+
+        gate, release = os.pipe()
+
+        try:
+            process = subprocess.Popen(['/bin/sh', '-c', self.__GATE, 'powerpyro'] + self.__command,
+                                       pass_fds=(gate,), env=dict(os.environ, POWERPYRO_GATE_FD=str(gate)))
+        except BaseException:
+            os.close(release)
+            raise
+        finally:
+            os.close(gate)
+
+        return process, release
+
+    def __release(self, release: Union[int, None]) -> None:
+        """Lets a held command run.
+
+        Args:
+            release: Descriptor releasing the command, None if it is not held.
+        """
+        if release is not None:
+            os.write(release, b'\n')
+            os.close(release)
+
+    def __wait_for_exit(self, process: subprocess.Popen) -> None:
+        """Waits until the command exits, without reaping it on POSIX systems.
+
+        Args:
+            process: The command process.
+        """
+        if hasattr(os, 'waitid'):
+            os.waitid(os.P_PID, process.pid, os.WEXITED | os.WNOWAIT)
+        else:
+            process.wait()
+
+    def __write_sample(self, sample: Sample) -> None:
+        """Writes a sample to the stream.
+
+        Args:
+            sample: The new sample.
+        """
+        self.__stream.write(json.dumps({'timestamp': sample.timestamp, 'period': sample.period,
+                                        'power': sample.power, 'energy': sample.energy}) + '\n')
+        self.__stream.flush()
+
+    def run(self) -> int:
+        """Runs the command until it exits.
+
+        Returns:
+            int: Exit code of the command, or 128 plus the signal number if it
+            was killed by a signal.
+
+        Example:
+            ```python
+            from power_pyro.command_runner import CommandRunner
+
+            runner = CommandRunner(['make', '-j8'], sampling_interval=0.5)
+            exit_code = runner.run()
+            print(runner.result['total_energy'])
+            ```
+        """
+        process, release = self.__launch()
+
+        try:
+            monitor = Monitor(self.__required_components, sampling_interval=self.__sampling_interval,
+                              attribution=self.__attribution, pid=process.pid)
+        except BaseException:
+            process.kill()
+            process.wait()
+
+            if release is not None:
+                os.close(release)
+
+            raise
+
+        subscription = monitor.subscribe(self.__write_sample) if self.__stream is not None else None
+
+        handlers = self.__forward_signals(process)
+
+        try:
+            monitor.start()
+            start = time.time()
+            self.__release(release)
+            self.__wait_for_exit(process)
+            end = time.time()
+            monitor.end()
+            exit_code = process.wait()
+        finally:
+            for number, handler in handlers.items():
+                signal.signal(number, handler)
+
+        if subscription is not None:
+            subscription.close(wait=True)
+
+        exit_code = 128 - exit_code if exit_code < 0 else exit_code
+        self.__result = self.__summarise(monitor, process.pid, exit_code, start, end)
+
+        return exit_code
+
+    def __forward_signals(self, process: subprocess.Popen) -> Dict[int, Any]:
+        """Forwards termination signals to the command while it runs.
+
+        Args:
+            process: The command process.
+
+        Returns:
+            Dict[int, Any]: Previous handlers by signal number.
+        """
+        handlers: Dict[int, Any] = {signal.SIGINT: signal.signal(signal.SIGINT, signal.SIG_IGN)}
+
+        for name in ('SIGTERM', 'SIGHUP'):
+            if hasattr(signal, name):
+                number = getattr(signal, name)
+                handlers[number] = signal.signal(number, lambda received, frame: process.send_signal(received))
+
+        return handlers
+
+    def __summarise(self, monitor: Monitor, pid: int, exit_code: int, start: float, end: float) -> Dict[str, Any]:
+        """Builds the result of a run.
+
+        Args:
+            monitor: Monitor of the command.
+            pid: Process id of the command.
+            exit_code: Exit code of the command.
+            start: Start of the command (Unix time).
+            end: Exit of the command (Unix time).
+
+        Returns:
+            Dict[str, Any]: JSON serializable result.
+        """
+        timestamps, periods, power, energy = monitor.get_timeline().columns()
+
+        return {'command': self.__command,
+                'pid': pid,
+                'exit_code': exit_code,
+                'start': start,
+                'end': end,
+                'duration': end - start,
+                'sampling_interval': self.__sampling_interval,
+                'attribution': self.__attribution.name.lower(),
+                'energy': {key: sum(values) for key, values in energy.items()},
+                'total_energy': monitor.total_energy_consumed(),
+                'timeline': {'timestamp': list(timestamps),
+                             'period': list(periods),
+                             'power': {key: list(values) for key, values in power.items()},
+                             'energy': {key: list(values) for key, values in energy.items()}},
+                'power_sources': monitor.get_power_sources(),
+                'unavailable_components': monitor.get_unavailable_components(),
+                'sensor_health': monitor.get_sensor_health()}
@@ -0,0 +1,11 @@
+from enum import Enum
+
+class ComparisonVerdict(Enum):
+    """ Enumeration representing the outcome of comparing the energy of a
+        benchmark against its baseline."""
+
+    UNCHANGED = 0
+    REGRESSED = 1
+    IMPROVED = 2
+    NO_BASELINE = 3
+    INSUFFICIENT_DATA = 4
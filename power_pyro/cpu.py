@@ -3,15 +3,21 @@ from .cpu_type import CpuType
 from .os_type import OsType
 from .identify_hardware_manufacturer_exception import IdentifyHardwareManufacturerException
 from .hardware_name_identify_exception import HardwareNameIdentifyException
+from .sensor_read_exception import SensorReadException
 from .hardware_type import HardwareType as HT
+from .cpu_power_model import CpuPowerModel
+from .cpu_utilization_reader import CpuUtilizationReader
+from .cpu_telemetry_reader import CpuTelemetryReader
 
 import os
 import cpuinfo
+import shutil
 import subprocess
 import time
 import psutil
 import clr
-from typing import TYPE_CHECKING
+import glob
+from typing import TYPE_CHECKING, Dict, List, Tuple, Union
 
 if TYPE_CHECKING:
     import clr
@@ -28,18 +34,52 @@ class Cpu(ProcessingUnit):
        for accessing and retrieving power consumption values 
        ​​from hardware sensors.
 
+    On Linux, the RAPL package energy is read from the powercap counters 
+    when they are readable, and otherwise with 'sudo -n perf'. Which one 
+    works is probed once at construction; on machines where neither does, 
+    such as cloud VMs and containers, the power is estimated from the host 
+    CPU utilisation with a 'CpuPowerModel' of the CPU brand instead.
+
+    On Linux, the frequency, temperature and thermal throttling of the CPUs 
+    can also be read with 'get_telemetry', to explain changes of power.
+
     Attributes:
         __manufacturer (CpuType): CPU  type.
+        __power_model (Union[CpuPowerModel, None]): Model estimating the power, 
+        created from the CPU name on first use if the power cannot be read.
+        __utilization_reader (Union[CpuUtilizationReader, None]): Reader of the 
+        host CPU utilisation driving the power model.
+        __telemetry_reader (Union[CpuTelemetryReader, None]): Reader of the 
+        frequency, temperature and throttling, opened on first use.
+        __powercap_zones (List[Tuple[str, int]]): Energy counter file and 
+        counter range of each RAPL package, empty if powercap is not used.
+        __last_powercap (Tuple[float, List[int]]): Monotonic time and energy 
+        counters in µJ at the previous powercap read.
+        __COMMAND_TIMEOUT (float): Maximum time in seconds a sensor command 
+        may run before it is killed.
+        __RAPL_EVENT (str): Perf event reading the RAPL package energy 
+        counter.
+        __POWERCAP_ZONES (str): Pattern of the powercap RAPL package zones.
     """
     def __init__(self, operating_system: OsType):
         super().__init__(operating_system)
         self.__manufacturer: CpuType
+        self.__power_model: Union[CpuPowerModel, None] = None
+        self.__utilization_reader: Union[CpuUtilizationReader, None] = None
+        self.__telemetry_reader: Union[CpuTelemetryReader, None] = None
+        self.__powercap_zones: List[Tuple[str, int]] = []
+        self.__last_powercap: Tuple[float, List[int]] = (0.0, [])
+        self.__COMMAND_TIMEOUT: float = 5.0
+        self.__RAPL_EVENT: str = '/sys/bus/event_source/devices/power/events/energy-pkg'
+        self.__POWERCAP_ZONES: str = '/sys/class/powercap/intel-rapl:[0-9]*'
 
         if operating_system == OsType.WINDOWS:
             self.computer.IsCpuEnabled = True
         
         self._update_manufacture()
-        self._update_hardware_name()
+
+        if operating_system == OsType.LINUX and not self.__open_powercap() and not self.__probe_perf():
+            self.__use_power_model()
     
     @property
     def get_manufacturer(self) -> CpuType:
@@ -62,6 +102,138 @@ class Cpu(ProcessingUnit):
         """
         return self.__manufacturer
 
+    @property
+    def is_power_estimated(self) -> bool:
+        """Checks if the power is estimated by a model instead of read from 
+           a sensor.
+
+        Returns:
+            bool: True if the power comes from a 'CpuPowerModel'.
+        """
+        return self.__utilization_reader is not None
+
+    @property
+    def power_model(self) -> Union[CpuPowerModel, None]:
+        """Gets the model estimating the power.
+
+        Returns:
+            Union[CpuPowerModel, None]: The power model, or None if the power 
+            is read from a sensor.
+        """
+        if self.__utilization_reader is not None and self.__power_model is None:
+            self.__power_model = CpuPowerModel(self.name)
+
+        return self.__power_model
+
+    def __open_powercap(self) -> bool:
+        """Finds the readable powercap energy counters of the RAPL packages.
+
+        Returns:
+            bool: True if every package counter can be read, in which case 
+            the power is read from them.
+        """
+        zones: List[Tuple[str, int]] = []
+
+        for zone in sorted(glob.glob(self.__POWERCAP_ZONES)):
+            # Subzones such as 'intel-rapl:0:0' (core, dram) are inside the package.
+            if zone.count(':') != 1:
+                continue
+
+            try:
+                with open(os.path.join(zone, 'max_energy_range_uj'), 'r') as file:
+                    zones.append((os.path.join(zone, 'energy_uj'), int(file.read())))
+            except (OSError, ValueError):
+                return False
+
+        if not zones:
+            return False
+
+        self.__powercap_zones = zones
+
+        try:
+            self.__last_powercap = (time.monotonic(), self.__read_powercap_counters())
+        except (OSError, ValueError):
+            # The counters are only readable by root on recent kernels.
+            self.__powercap_zones = []
+            return False
+
+        return True
+
+    def __probe_perf(self) -> bool:
+        """Checks once that 'sudo -n perf' can read the RAPL package energy.
+
+        Returns:
+            bool: True if the power can be read with perf.
+        """
+        if not os.path.exists(self.__RAPL_EVENT) or shutil.which('perf') is None:
+            return False
+
+        try:
+            command = ["sudo", "-n", "perf", "stat", "-e", "power/energy-pkg/", "true"]
+            result = subprocess.run(command, capture_output=True, text=True, timeout=self.__COMMAND_TIMEOUT)
+        except (OSError, subprocess.SubprocessError) as e:
+            print('Error probing perf for the CPU power: ', str(e))
+            return False
+
+        return result.returncode == 0
+
+    def __read_powercap_counters(self) -> List[int]:
+        """Reads the energy counter of every RAPL package.
+
+        Returns:
+            List[int]: Energy in µJ of each package.
+        """
+        counters: List[int] = []
+
+        for path, _ in self.__powercap_zones:
+            with open(path, 'r') as file:
+                counters.append(int(file.read()))
+
+        return counters
+
+    def __use_power_model(self) -> None:
+        """Estimates the power with the model of the CPU brand from now on."""
+        try:
+            self.__utilization_reader = CpuUtilizationReader()
+        except OSError as e:
+            print('Error opening CPU utilisation for the power model: ', str(e))
+
+    def get_telemetry(self) -> Dict[str, float]:
+        """Reads the frequency, temperature and thermal throttling of the CPUs.
+
+        The sysfs files are opened on the first call and kept open, so later 
+        calls only read them again.
+
+        Returns:
+            Dict[str, float]: Telemetry values by name (see 
+            'CpuTelemetryReader'), empty if the operating system does not 
+            expose them.
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+
+            monitor = Monitor({'cpu': True})
+            cpu = monitor.get_monitored_components()['cpu']['component']
+            print(cpu.get_telemetry()['cpu_frequency']) # 2893.4
+            ```
+        """
+        if self.operating_system != OsType.LINUX:
+            return {}
+
+        if self.__telemetry_reader is None:
+            self.__telemetry_reader = CpuTelemetryReader()
+
+        return self.__telemetry_reader.read()
+
+    def close(self) -> None:
+        """Closes the computer monitoring instance and the telemetry files."""
+        super().close()
+
+        if self.__telemetry_reader is not None:
+            self.__telemetry_reader.close()
+            self.__telemetry_reader = None
+
     def _update_manufacture(self) -> None:
         if self.operating_system == OsType.WINDOWS:
             self.__update_manufacture_windows()
@@ -102,9 +274,7 @@ class Cpu(ProcessingUnit):
         """
         
         try:
-            info = cpuinfo.get_cpu_info()
-
-            manufacturer = info['vendor_id_raw']
+            manufacturer = self.__read_vendor_linux()
 
             if manufacturer == 'GenuineIntel':
                 self.__manufacturer = CpuType.INTEL
@@ -115,6 +285,47 @@ class Cpu(ProcessingUnit):
         except (ModuleNotFoundError, KeyError):
             raise IdentifyHardwareManufacturerException(HT.CPU)
     
+    @staticmethod
+    def __read_proc_cpuinfo(field: str) -> Union[str, None]:
+        """Reads a field of the first CPU in '/proc/cpuinfo', which is much 
+        faster than the full 'cpuinfo' probe (which forks and takes about a 
+        second).
+
+        Args:
+            field: Field name, e.g. 'vendor_id' or 'model name'.
+
+        Returns:
+            Union[str, None]: The value, or None if it cannot be found.
+        """
+        try:
+            with open('/proc/cpuinfo', 'r') as file:
+                for line in file:
+                    key, _, value = line.partition(':')
+
+                    if key.strip() == field and value.strip():
+                        return value.strip()
+        except OSError:
+            pass
+
+        return None
+
+    def __read_vendor_linux(self) -> str:
+        """Reads the CPU vendor from '/proc/cpuinfo', or from 'cpuinfo' if it 
+        is not there.
+
+        Returns:
+            str: Vendor id, e.g. 'GenuineIntel'.
+
+        Raises:
+            KeyError: If the vendor cannot be found.
+        """
+        vendor = self.__read_proc_cpuinfo('vendor_id')
+
+        if vendor is not None:
+            return vendor
+
+        return cpuinfo.get_cpu_info()['vendor_id_raw']
+
     def _update_hardware_name(self) -> None:
         if self.operating_system == OsType.WINDOWS:
             self.__update_hardware_name_windows()
@@ -144,6 +355,12 @@ class Cpu(ProcessingUnit):
             HardwareNameIdentifyException: Unable to identify CPU name in Linux.
         """
 
+        name = self.__read_proc_cpuinfo('model name')
+
+        if name is not None:
+            self.set_name = name
+            return
+
         try:
             self.set_name = cpuinfo.get_cpu_info()['brand_raw']
         except (ModuleNotFoundError, KeyError):
@@ -153,19 +370,68 @@ class Cpu(ProcessingUnit):
         if self.operating_system == OsType.WINDOWS:
             return self.__get_power_on_windows()
 
+        elif self.__utilization_reader is not None:
+            return self.__estimate_power()
+
+        elif self.__powercap_zones:
+            return self.__get_power_from_powercap()
+
         else:
             return self.__get_power_on_linux()
+
+    def __estimate_power(self) -> float:
+        """ Returns the CPU power in W estimated from the host CPU utilisation 
+        since the previous call.
+
+        Returns:
+            float: Estimated CPU power.
+
+        Raises:
+            SensorReadException: If the utilisation cannot be read.
+        """
+        try:
+            return self.power_model.estimate(self.__utilization_reader.read())
+        except (OSError, ValueError) as e:
+            raise SensorReadException(HT.CPU, 'Error estimating power from CPU utilisation: ' + str(e))
     
+    def __get_power_from_powercap(self) -> float:
+        """ Returns the CPU power in W from the powercap energy counters 
+        since the previous call.
+
+        Returns:
+            float: CPU power of every package.
+
+        Raises:
+            SensorReadException: If the counters cannot be read.
+        """
+        try:
+            now, counters = time.monotonic(), self.__read_powercap_counters()
+        except (OSError, ValueError) as e:
+            raise SensorReadException(HT.CPU, 'Error reading powercap energy: ' + str(e))
+
+        last_time, last_counters = self.__last_powercap
+        self.__last_powercap = (now, counters)
+        # A counter that wrapped around starts again from zero.
+        energy = sum((counter - last) % max_range if max_range > 0 else max(counter - last, 0)
+                     for counter, last, (_, max_range)
+                     in zip(counters, last_counters, self.__powercap_zones))
+
+        return energy / 1_000_000 / max(now - last_time, 1e-9)
+
     def __get_power_on_linux(self) -> float:
         """ Returns the value of the CPU power in W in Linux.
 
         Returns:
             float: CPU power.
+
+        Raises:
+            SensorReadException: If the power cannot be read from perf.
         """
 
         try:
-            command = ["sudo", "perf", "stat", "-e", "power/energy-pkg/", "sleep", "0.1"]
-            power = subprocess.run(command, capture_output=True, text=True)
+            # '-n' makes sudo fail instead of waiting for a password prompt.
+            command = ["sudo", "-n", "perf", "stat", "-e", "power/energy-pkg/", "sleep", "0.1"]
+            power = subprocess.run(command, capture_output=True, text=True, timeout=self.__COMMAND_TIMEOUT)
 
             power = power.stderr.split(" ")
             power = [string for string in power if string.strip()]
@@ -177,8 +443,8 @@ class Cpu(ProcessingUnit):
                     break
             
             power = float(power)/0.1
-        except (PermissionError, subprocess.SubprocessError, AttributeError, IndexError, ValueError) as e:
-            print('Error getting power from CPU: ', str(e))
+        except (PermissionError, subprocess.SubprocessError, AttributeError, IndexError, ValueError, TypeError) as e:
+            raise SensorReadException(HT.CPU, 'Error getting power from CPU: ' + str(e))
 
         return power
 
@@ -187,6 +453,10 @@ class Cpu(ProcessingUnit):
 
         Returns:
             float: CPU power.
+
+        Raises:
+            SensorReadException: If the power cannot be read from 
+            LibreHardwareMonitor.
         """
         try:
             cpu = next((hardware for hardware in self.computer.Hardware if hardware.HardwareType == HardwareType.Cpu), None)
@@ -195,8 +465,8 @@ class Cpu(ProcessingUnit):
 
             power = next((sensor for sensor in cpu.Sensors if sensor.SensorType == SensorType.Power and (sensor.Name == "CPU Package" or sensor.Name == "Package")))
             power = power.Value
-        except AttributeError as e:
-            print('Error getting power from CPU: ', str(e))
+        except (AttributeError, StopIteration) as e:
+            raise SensorReadException(HT.CPU, 'Error getting power from CPU: ' + str(e))
 
         return power
 
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+
+class CpuAttributionModel(ABC):
+    """Abstract base class representing a model that decides which share of
+       the CPU package power belongs to the monitored process.
+    """
+    @abstractmethod
+    def get_share(self) -> float:
+        """Abstract method to retrieve the share of the CPU power attributed
+           to the monitored process since the previous call.
+
+        Returns:
+            float: Share between 0 and 1.
+        """
+        pass
+
+    def close(self) -> None:
+        """Releases the resources held by the model."""
+        pass
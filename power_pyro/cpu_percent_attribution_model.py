@@ -0,0 +1,21 @@
+from .cpu_attribution_model import CpuAttributionModel
+from .cpu import Cpu
+
+class CpuPercentAttributionModel(CpuAttributionModel):
+    """Attributes CPU power by the share of CPU percent used by the monitored
+       process among all processes.
+
+    Attributes:
+        __cpu (Cpu): CPU component that scans the processes.
+    """
+    def __init__(self, cpu: Cpu):
+        super().__init__()
+        self.__cpu: Cpu = cpu
+
+    def get_share(self) -> float:
+        """Returns the CPU percent share of the monitored process.
+
+        Returns:
+            float: Share between 0 and 1.
+        """
+        return self.__cpu.get_cpu_percent_for_process()
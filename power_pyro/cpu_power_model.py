@@ -0,0 +1,165 @@
+from typing import ClassVar, Dict, List, Tuple, Union
+import os
+import re
+
+class CpuPowerModel():
+    """Estimates the package power of a CPU from its utilisation.
+
+    Used on machines without power sensors, such as cloud VMs. The model is
+    taken from a bundled table of package TDP, idle power ratio and hardware
+    threads per package, matched against the CPU brand string:
+
+        power = (idle + (tdp - idle) * utilisation) * logical_cpus / threads
+
+    where 'logical_cpus / threads' is the part of the package visible to
+    the machine: a fraction for a VM with a few vCPUs, the number of
+    packages on a bare-metal host. Models that are not listed fall back to
+    the default of their family, then to a generic per-thread default.
+
+    The table is indexed by the model number of each row (e.g. '8375c',
+    'e5-2686', '7r13'), so a lookup only compares the brand with the few
+    rows sharing one of its tokens.
+
+    Attributes:
+        __model (str): Table row the brand matched.
+        __tdp (float): Package TDP in W.
+        __idle_ratio (float): Idle power as a fraction of the TDP.
+        __threads (int): Hardware threads of one package.
+        __packages (float): Packages visible to the machine.
+        __index (Dict[str, List[Tuple[List[str], str]]]): Words and name of
+        the listed models by model number, loaded once per process.
+        __families (Dict[str, str]): Family default rows by family word.
+        __rows (Dict[str, Tuple[float, float, int]]): TDP, idle ratio and
+        threads by row name.
+        __TABLE (str): Path of the bundled table.
+    """
+    __index: ClassVar[Union[Dict[str, List[Tuple[List[str], str]]], None]] = None
+    __families: ClassVar[Dict[str, str]] = {}
+    __rows: ClassVar[Dict[str, Tuple[float, float, int]]] = {}
+    __TABLE: ClassVar[str] = os.path.join(os.path.dirname(__file__), 'data', 'cpu_power_models.csv')
+
+    def __init__(self, brand: Union[str, None], logical_cpus: Union[int, None] = None):
+        """
+        Args:
+            brand (Union[str, None]): CPU brand string, e.g. 'Intel(R) Xeon(R)
+            Platinum 8375C CPU @ 2.90GHz'.
+            logical_cpus (Union[int, None]): Logical CPUs of the machine
+            (optional, default is 'os.cpu_count()').
+        """
+        self.__model: str = CpuPowerModel.__match(brand or '')
+        self.__tdp, self.__idle_ratio, self.__threads = CpuPowerModel.__rows[self.__model]
+        self.__packages: float = (logical_cpus or os.cpu_count() or 1) / self.__threads
+
+    @property
+    def model(self) -> str:
+        """Gets the table row the brand matched.
+
+        Returns:
+            str: Model name, '*<family>' for a family default or '*' for the
+            generic default.
+        """
+        return self.__model
+
+    @property
+    def is_generic(self) -> bool:
+        """Checks if the CPU model is missing from the table.
+
+        Returns:
+            bool: True if a family or generic default is used.
+        """
+        return self.__model.startswith('*')
+
+    @property
+    def idle_power(self) -> float:
+        """Gets the estimated power of the visible CPUs when idle.
+
+        Returns:
+            float: Power in W.
+        """
+        return self.__tdp * self.__idle_ratio * self.__packages
+
+    @property
+    def max_power(self) -> float:
+        """Gets the estimated power of the visible CPUs when fully busy.
+
+        Returns:
+            float: Power in W.
+        """
+        return self.__tdp * self.__packages
+
+    def estimate(self, utilization: float) -> float:
+        """Estimates the power of the visible CPUs.
+
+        Args:
+            utilization (float): Busy fraction of the CPUs, between 0 and 1.
+
+        Returns:
+            float: Estimated power in W.
+        """
+        utilization = min(max(utilization, 0.0), 1.0)
+
+        return self.idle_power + (self.max_power - self.idle_power) * utilization
+
+    @staticmethod
+    def __words(text: str) -> List[str]:
+        """Splits a brand or a model name into comparable words.
+
+        Args:
+            text: Brand or model name.
+
+        Returns:
+            List[str]: Lower case words without trademarks and punctuation.
+        """
+        text = re.sub(r'\((r|tm)\)', ' ', text.lower())
+
+        return re.sub(r'[^a-z0-9.+-]', ' ', text).split()
+
+    @classmethod
+    def __load(cls) -> None:
+        """Reads the bundled table and indexes it by model number."""
+        index: Dict[str, List[Tuple[List[str], str]]] = {}
+
+        with open(cls.__TABLE, 'r') as file:
+            for line in file:
+                if line.startswith('#') or line.startswith('model,') or not line.strip():
+                    continue
+
+                name, tdp, idle_ratio, threads = line.strip().split(',')
+                cls.__rows[name] = (float(tdp), float(idle_ratio), int(threads))
+
+                if name.startswith('*'):
+                    cls.__families[name[1:]] = name
+                    continue
+
+                words = cls.__words(name)
+                number = max((word for word in words if any(character.isdigit() for character in word)), key=len)
+                index.setdefault(number, []).append((words, name))
+
+        cls.__index = index
+
+    @classmethod
+    def __match(cls, brand: str) -> str:
+        """Finds the table row of a CPU brand.
+
+        Args:
+            brand: CPU brand string.
+
+        Returns:
+            str: Name of the matching row.
+        """
+        if cls.__index is None:
+            cls.__load()
+
+        words = cls.__words(brand)
+        present = set(words)
+        best: Union[Tuple[int, str], None] = None
+
+        for word in words:
+            for model_words, name in cls.__index.get(word, []):
+                if present.issuperset(model_words) and (best is None or len(model_words) > best[0]):
+                    best = (len(model_words), name)
+
+        if best is not None:
+            return best[1]
+
+        return next((row for family, row in cls.__families.items() if family and family in present), '*')
@@ -0,0 +1,240 @@
+from typing import Dict, List, Set, Tuple
+from threading import Lock
+import glob
+import math
+import os
+import re
+
+class CpuTelemetryReader():
+    """Reads the frequency, temperature and thermal throttling of the CPUs
+       from sysfs.
+
+    Every file is opened once and read again with 'pread' at offset 0, which
+    makes sysfs produce a fresh value, so a read is one system call per file
+    in a single pass over the open descriptors. Files that do not exist on
+    the machine (e.g. no 'cpufreq' in a VM, no 'thermal_throttle' on AMD)
+    are left out. Each read returns:
+
+    - 'cpu_frequency', 'cpu_frequency_min' and 'cpu_frequency_max': mean,
+      lowest and highest current frequency of the online CPUs in MHz, and
+      'cpu<N>_frequency' for each CPU if per-CPU values are requested.
+    - 'cpu_temperature': highest CPU temperature in °C, and
+      'cpu_temperature_<device>_<label>' for each sensor of the 'coretemp',
+      'k10temp' or 'zenpower' hwmon devices (e.g.
+      'cpu_temperature_hwmon3_tctl'), so the sensors of each socket keep
+      their own key.
+    - 'cpu_core_throttle_events' and 'cpu_package_throttle_events': thermal
+      throttling events since the previous read, counted once per core and
+      once per package.
+
+    A value that cannot be read is NaN.
+
+    Attributes:
+        __frequency_fds (List[Tuple[str, int]]): Key and descriptor of the
+        current frequency of every CPU.
+        __temperature_fds (List[Tuple[str, int]]): Key and descriptor of every
+        temperature sensor.
+        __core_throttle_fds (List[int]): Descriptors of the throttle counter
+        of every core.
+        __package_throttle_fds (List[int]): Descriptors of the throttle
+        counter of every package.
+        __last_throttles (Tuple[float, float]): Core and package throttle
+        events at the previous read.
+        __per_cpu (bool): Whether the frequency of each CPU is returned.
+        __lock (Lock): Serializes the reads.
+        __HWMON_NAMES (Set[str]): Names of the hwmon devices of CPU sensors.
+    """
+    __HWMON_NAMES: Set[str] = {'coretemp', 'k10temp', 'zenpower'}
+
+    def __init__(self, per_cpu: bool = True, sysfs: str = '/sys'):
+        """
+        Args:
+            per_cpu (bool): Whether the frequency of each CPU is returned
+            (optional, default is True).
+            sysfs (str): Mount point of sysfs (optional, default is '/sys').
+        """
+        self.__frequency_fds: List[Tuple[str, int]] = []
+        self.__temperature_fds: List[Tuple[str, int]] = []
+        self.__core_throttle_fds: List[int] = []
+        self.__package_throttle_fds: List[int] = []
+        self.__per_cpu: bool = per_cpu
+        self.__lock: Lock = Lock()
+
+        self.__open_cpus(os.path.join(sysfs, 'devices', 'system', 'cpu'))
+        self.__open_hwmon(os.path.join(sysfs, 'class', 'hwmon'))
+
+        self.__last_throttles: Tuple[float, float] = (self.__sum(self.__core_throttle_fds),
+                                                      self.__sum(self.__package_throttle_fds))
+
+    @staticmethod
+    def __open(path: str) -> int:
+        """Opens a sysfs file for reading.
+
+        Args:
+            path: File path.
+
+        Returns:
+            int: The descriptor, or -1 if the file cannot be opened.
+        """
+        try:
+            return os.open(path, os.O_RDONLY)
+        except OSError:
+            return -1
+
+    @staticmethod
+    def __read_text(path: str) -> str:
+        """Reads a small sysfs file once.
+
+        Args:
+            path: File path.
+
+        Returns:
+            str: The stripped content, or '' if it cannot be read.
+        """
+        try:
+            with open(path, 'r') as file:
+                return file.read().strip()
+        except OSError:
+            return ''
+
+    def __open_cpus(self, directory: str) -> None:
+        """Opens the frequency and throttle counters of every CPU.
+
+        Args:
+            directory: The 'devices/system/cpu' directory of sysfs.
+        """
+        cores: Set[Tuple[str, str]] = set()
+        packages: Set[str] = set()
+        paths = glob.glob(os.path.join(directory, 'cpu[0-9]*'))
+
+        for path in sorted(paths, key=lambda path: int(re.sub(r'\D', '', os.path.basename(path)))):
+            cpu = os.path.basename(path)
+            fd = self.__open(os.path.join(path, 'cpufreq', 'scaling_cur_freq'))
+
+            if fd >= 0:
+                self.__frequency_fds.append((f'{cpu}_frequency', fd))
+
+            package = self.__read_text(os.path.join(path, 'topology', 'physical_package_id'))
+            core = (package, self.__read_text(os.path.join(path, 'topology', 'core_id')))
+
+            # Throttle counters are kept per core and per package, so the
+            # hardware threads of a core (and the cores of a package) show
+            # the same counter.
+            if core not in cores:
+                fd = self.__open(os.path.join(path, 'thermal_throttle', 'core_throttle_count'))
+
+                if fd >= 0:
+                    cores.add(core)
+                    self.__core_throttle_fds.append(fd)
+
+            if package not in packages:
+                fd = self.__open(os.path.join(path, 'thermal_throttle', 'package_throttle_count'))
+
+                if fd >= 0:
+                    packages.add(package)
+                    self.__package_throttle_fds.append(fd)
+
+    def __open_hwmon(self, directory: str) -> None:
+        """Opens the temperature sensors of the CPU hwmon devices.
+
+        Args:
+            directory: The 'class/hwmon' directory of sysfs.
+        """
+        for path in sorted(glob.glob(os.path.join(directory, 'hwmon*'))):
+            if self.__read_text(os.path.join(path, 'name')) not in self.__HWMON_NAMES:
+                continue
+
+            for input_path in sorted(glob.glob(os.path.join(path, 'temp*_input'))):
+                label = self.__read_text(input_path[:-len('input')] + 'label')
+                label = re.sub(r'[^a-z0-9]+', '_', (label or os.path.basename(input_path)[:-len('_input')]).lower())
+                fd = self.__open(input_path)
+
+                if fd >= 0:
+                    self.__temperature_fds.append((f"cpu_temperature_{os.path.basename(path)}_{label.strip('_')}", fd))
+
+    @staticmethod
+    def __read_value(fd: int) -> float:
+        """Reads an integer sysfs file from its start.
+
+        Args:
+            fd: Open descriptor of the file.
+
+        Returns:
+            float: The value, or NaN if it cannot be read.
+        """
+        try:
+            return float(os.pread(fd, 32, 0))
+        except (OSError, ValueError):
+            return math.nan
+
+    def __sum(self, fds: List[int]) -> float:
+        """Reads and adds up counters.
+
+        Args:
+            fds: Open descriptors of the counters.
+
+        Returns:
+            float: Sum of the counters, NaN if one cannot be read.
+        """
+        return sum(self.__read_value(fd) for fd in fds)
+
+    @property
+    def is_available(self) -> bool:
+        """Checks if any telemetry file was found.
+
+        Returns:
+            bool: True if at least one value can be read.
+        """
+        return bool(self.__frequency_fds or self.__temperature_fds or self.__core_throttle_fds
+                    or self.__package_throttle_fds)
+
+    def read(self) -> Dict[str, float]:
+        """Reads every telemetry file once.
+
+        Returns:
+            Dict[str, float]: Telemetry values by name, with throttling events
+            since the previous read.
+        """
+        telemetry: Dict[str, float] = {}
+
+        with self.__lock:
+            frequencies = [(key, self.__read_value(fd) / 1000) for key, fd in self.__frequency_fds]
+            temperatures = [(key, self.__read_value(fd) / 1000) for key, fd in self.__temperature_fds]
+            throttles = (self.__sum(self.__core_throttle_fds), self.__sum(self.__package_throttle_fds))
+            last_throttles, self.__last_throttles = self.__last_throttles, throttles
+
+        if frequencies:
+            values = [value for _, value in frequencies if not math.isnan(value)]
+            telemetry['cpu_frequency'] = sum(values) / len(values) if values else math.nan
+            telemetry['cpu_frequency_min'] = min(values, default=math.nan)
+            telemetry['cpu_frequency_max'] = max(values, default=math.nan)
+
+            if self.__per_cpu:
+                telemetry.update(frequencies)
+
+        if temperatures:
+            telemetry['cpu_temperature'] = max((value for _, value in temperatures if not math.isnan(value)),
+                                               default=math.nan)
+            telemetry.update(temperatures)
+
+        if self.__core_throttle_fds:
+            telemetry['cpu_core_throttle_events'] = throttles[0] - last_throttles[0]
+
+        if self.__package_throttle_fds:
+            telemetry['cpu_package_throttle_events'] = throttles[1] - last_throttles[1]
+
+        return telemetry
+
+    def close(self) -> None:
+        """Closes every telemetry file."""
+        with self.__lock:
+            fds = ([fd for _, fd in self.__frequency_fds] + [fd for _, fd in self.__temperature_fds]
+                   + self.__core_throttle_fds + self.__package_throttle_fds)
+            self.__frequency_fds, self.__temperature_fds = [], []
+            self.__core_throttle_fds, self.__package_throttle_fds = [], []
+
+        for fd in fds:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
@@ -0,0 +1,91 @@
+from typing import Any, IO, Tuple
+from threading import Lock
+
+class CpuUtilizationReader():
+    """Reads the busy fraction of the host CPUs from '/proc/stat'.
+
+    The file is kept open and read again from the start at every call, so a
+    read costs one small 'read' system call. Each read returns the
+    utilisation since the previous one.
+
+    Attributes:
+        __file (IO[bytes]): Open '/proc/stat'.
+        __last_busy (int): Busy jiffies at the previous read.
+        __last_total (int): Total jiffies at the previous read.
+        __lock (Lock): Serializes the reads.
+    """
+    def __init__(self, path: str = '/proc/stat'):
+        """
+        Args:
+            path (str): Statistics file (optional, default is '/proc/stat').
+
+        Raises:
+            OSError: If the file cannot be opened.
+        """
+        self.__file: IO[bytes] = open(path, 'rb', buffering=0)
+        self.__lock: Lock = Lock()
+        self.__last_busy, self.__last_total = self.__read_jiffies()
+
+    def __read_jiffies(self) -> Tuple[int, int]:
+        """Reads the cumulative CPU time of the host.
+
+        Returns:
+            Tuple[int, int]: Busy and total jiffies of all CPUs.
+
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If the file has no aggregate 'cpu' line.
+        """
+        self.__file.seek(0)
+        line = self.__file.read(512).split(b'\n', 1)[0].split()
+
+        if not line or line[0] != b'cpu':
+            raise ValueError("No aggregate cpu line in /proc/stat")
+
+        # user nice system idle iowait irq softirq steal: guest time is
+        # already in user and nice, and steal is time the hypervisor gave to
+        # other machines, so it is not busy time of this one.
+        values = [int(value) for value in line[1:9]] + [0] * (9 - len(line))
+        busy = values[0] + values[1] + values[2] + values[5] + values[6]
+
+        return busy, sum(values)
+
+    def read(self) -> float:
+        """Reads the utilisation of the host CPUs since the previous read.
+
+        Returns:
+            float: Busy fraction between 0 and 1.
+
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If the file cannot be parsed.
+        """
+        with self.__lock:
+            busy, total = self.__read_jiffies()
+            busy_delta, total_delta = busy - self.__last_busy, total - self.__last_total
+            self.__last_busy, self.__last_total = busy, total
+
+        if total_delta <= 0:
+            return 0.0
+
+        return min(max(busy_delta / total_delta, 0.0), 1.0)
+
+    @staticmethod
+    def busy_time(times: Any) -> float:
+        """Sums the busy fields of host CPU times read with psutil.
+
+        The same fields as in '/proc/stat' are counted, so guest and steal 
+        time are left out.
+
+        Args:
+            times: Result of 'psutil.cpu_times'.
+
+        Returns:
+            float: Busy CPU time of all CPUs in seconds.
+        """
+        return sum(getattr(times, field, 0.0) for field in
+                   ('user', 'nice', 'system', 'irq', 'softirq', 'interrupt', 'dpc'))
+
+    def close(self) -> None:
+        """Closes '/proc/stat'."""
+        self.__file.close()
@@ -0,0 +1,9 @@
+from enum import Enum
+
+class DeliveryPolicy(Enum):
+    """ Enumeration representing what happens to a new sample when the queue 
+        of a subscriber is full."""
+    
+    DROP_OLDEST = 0
+    DROP_NEWEST = 1
+    BLOCK = 2
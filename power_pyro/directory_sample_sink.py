@@ -0,0 +1,64 @@
+from .sample_sink import SampleSink
+
+from typing import Any, BinaryIO, Dict, Union
+import os
+
+class DirectorySampleSink(SampleSink):
+    """Writes samples as JSON lines to a directory shared by every rank.
+
+    Each rank appends to its own '<directory>/<run_id>/<host>-<rank>.jsonl'
+    file, so ranks never contend for a file and a shared filesystem is
+    enough to gather a whole job.
+
+    Attributes:
+        __path (str): File written by this rank.
+        __file (Union[BinaryIO, None]): Open file, once the first record is written.
+    """
+    def __init__(self, directory: str, run_id: Union[str, None] = None, rank: Union[int, None] = None,
+                 host: Union[str, None] = None):
+        """
+        Args:
+            directory (str): Shared directory.
+            run_id (Union[str, None]): Identifier of the job (optional).
+            rank (Union[int, None]): Rank of the process (optional).
+            host (Union[str, None]): Host name (optional).
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+            from power_pyro.directory_sample_sink import DirectorySampleSink
+
+            monitor = Monitor({'cpu': True, 'gpu': True}, sink=DirectorySampleSink('/shared/energy', run_id='job-42'))
+            ```
+        """
+        super().__init__(run_id, rank, host)
+        self.__path: str = os.path.join(directory, self.run_id, f"{self.host}-{self.rank}.jsonl")
+        self.__file: Union[BinaryIO, None] = None
+
+    @property
+    def path(self) -> str:
+        """Gets the file written by this rank.
+
+        Returns:
+            str: File path.
+        """
+        return self.__path
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Appends a record to the rank file.
+
+        Args:
+            record (Dict[str, Any]): Record written by the monitor.
+        """
+        if self.__file is None:
+            os.makedirs(os.path.dirname(self.__path), exist_ok=True)
+            self.__file = open(self.__path, 'ab')
+
+        self.__file.write(self.encode(record))
+        self.__file.flush()
+
+    def close(self) -> None:
+        """Closes the rank file."""
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
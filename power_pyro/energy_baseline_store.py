@@ -0,0 +1,250 @@
+from .host_profile import HostProfile
+
+from typing import Dict, List, Union
+import json
+import os
+import sqlite3
+import subprocess
+import time
+
+class EnergyBaselineStore():
+    """Local SQLite store of benchmark energy results, keyed by commit and
+       host profile.
+
+    Every run of a benchmark is kept, so repeated runs of the same commit
+    form a sample that 'EnergyRegressionChecker' compares statistically.
+
+    Attributes:
+        __path (str): Path of the database file.
+        __connection (sqlite3.Connection): Open database connection.
+        __VERSION (int): Version of the database schema.
+    """
+    __VERSION: int = 1
+
+    def __init__(self, path: Union[str, None] = None):
+        """
+        Args:
+            path (Union[str, None]): Database file, created if missing
+            (optional, default is 'default_path').
+
+        Raises:
+            ValueError: If the file was written by a newer version.
+        """
+        self.__path: str = path or EnergyBaselineStore.default_path()
+
+        if os.path.dirname(self.__path):
+            os.makedirs(os.path.dirname(self.__path), exist_ok=True)
+
+        self.__connection: sqlite3.Connection = sqlite3.connect(self.__path)
+        self.__create_schema()
+
+    def __create_schema(self) -> None:
+        """Creates the tables of an empty database.
+
+        Raises:
+            ValueError: If the database schema is newer than this version.
+        """
+        version = self.__connection.execute('PRAGMA user_version').fetchone()[0]
+
+        if version > self.__VERSION:
+            self.__connection.close()
+            raise ValueError(f"Unsupported baseline store version {version} in {self.__path}")
+
+        with self.__connection:
+            self.__connection.execute('CREATE TABLE IF NOT EXISTS hosts ('
+                                      'key TEXT PRIMARY KEY, profile TEXT NOT NULL)')
+            self.__connection.execute('CREATE TABLE IF NOT EXISTS results ('
+                                      'id INTEGER PRIMARY KEY, benchmark TEXT NOT NULL, '
+                                      'commit_id TEXT NOT NULL, host TEXT NOT NULL REFERENCES hosts(key), '
+                                      'hostname TEXT NOT NULL, energy REAL NOT NULL, duration REAL, '
+                                      'recorded_at REAL NOT NULL)')
+            self.__connection.execute('CREATE INDEX IF NOT EXISTS results_by_commit '
+                                      'ON results (commit_id, host, benchmark)')
+            self.__connection.execute(f'PRAGMA user_version = {self.__VERSION}')
+
+    @property
+    def path(self) -> str:
+        """Gets the path of the database file.
+
+        Returns:
+            str: File path.
+        """
+        return self.__path
+
+    def record(self, benchmark: str, energy: float, commit: Union[str, None] = None,
+               host: Union[HostProfile, None] = None, duration: Union[float, None] = None) -> None:
+        """Stores the energy of one run of a benchmark.
+
+        Args:
+            benchmark (str): Benchmark name.
+            energy (float): Energy of the run in kWh.
+            commit (Union[str, None]): Commit that was measured (optional,
+            default is 'current_commit').
+            host (Union[HostProfile, None]): Host that ran the benchmark
+            (optional, default is the current host).
+            duration (Union[float, None]): Duration of the run in seconds
+            (optional).
+
+        Raises:
+            ValueError: If the energy is negative or not finite, or no commit
+            is given and none can be found.
+        """
+        if not 0 <= energy < float('inf'):
+            raise ValueError(f"Invalid energy {energy} for benchmark {benchmark}")
+
+        commit = commit or EnergyBaselineStore.current_commit()
+
+        if commit is None:
+            raise ValueError("No commit given and none found (set POWERPYRO_COMMIT or run inside a git repository)")
+
+        host = host or HostProfile.current()
+
+        with self.__connection:
+            self.__connection.execute('INSERT OR IGNORE INTO hosts VALUES (?, ?)',
+                                      (host.key, json.dumps(host.to_dict())))
+            self.__connection.execute('INSERT INTO results (benchmark, commit_id, host, hostname, energy, '
+                                      'duration, recorded_at) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                                      (benchmark, commit, host.key, host.hostname, energy, duration, time.time()))
+
+    def energies(self, benchmark: str, commit: str, host_key: Union[str, None] = None) -> Dict[str, List[float]]:
+        """Gets the energy of every stored run of a benchmark at a commit.
+
+        Args:
+            benchmark (str): Benchmark name.
+            commit (str): Commit id.
+            host_key (Union[str, None]): Only return runs of this host class
+            (optional, default is every host class).
+
+        Returns:
+            Dict[str, List[float]]: Energies in kWh by host profile key.
+        """
+        query = 'SELECT host, energy FROM results WHERE commit_id = ? AND benchmark = ?'
+        parameters = [commit, benchmark]
+
+        if host_key is not None:
+            query += ' AND host = ?'
+            parameters.append(host_key)
+
+        energies: Dict[str, List[float]] = {}
+
+        for host, energy in self.__connection.execute(query + ' ORDER BY id', parameters):
+            energies.setdefault(host, []).append(energy)
+
+        return energies
+
+    def benchmarks(self, commit: str, host_key: Union[str, None] = None) -> List[str]:
+        """Lists the benchmarks stored for a commit.
+
+        Args:
+            commit (str): Commit id.
+            host_key (Union[str, None]): Only consider this host class
+            (optional, default is every host class).
+
+        Returns:
+            List[str]: Benchmark names in alphabetical order.
+        """
+        if host_key is None:
+            rows = self.__connection.execute('SELECT DISTINCT benchmark FROM results WHERE commit_id = ? '
+                                             'ORDER BY benchmark', (commit,))
+        else:
+            rows = self.__connection.execute('SELECT DISTINCT benchmark FROM results WHERE commit_id = ? '
+                                             'AND host = ? ORDER BY benchmark', (commit, host_key))
+
+        return [row[0] for row in rows]
+
+    def commits(self, host_key: Union[str, None] = None) -> List[str]:
+        """Lists the stored commits.
+
+        Args:
+            host_key (Union[str, None]): Only consider this host class
+            (optional, default is every host class).
+
+        Returns:
+            List[str]: Commit ids, the most recently recorded first.
+        """
+        if host_key is None:
+            rows = self.__connection.execute('SELECT commit_id FROM results GROUP BY commit_id '
+                                             'ORDER BY MAX(recorded_at) DESC')
+        else:
+            rows = self.__connection.execute('SELECT commit_id FROM results WHERE host = ? GROUP BY commit_id '
+                                             'ORDER BY MAX(recorded_at) DESC', (host_key,))
+
+        return [row[0] for row in rows]
+
+    def resolve_commit(self, prefix: str) -> str:
+        """Finds the stored commit starting with a prefix, such as a short
+           commit id.
+
+        Args:
+            prefix (str): Commit id or a prefix of it.
+
+        Returns:
+            str: Full stored commit id, or the prefix if it matches no commit.
+
+        Raises:
+            ValueError: If the prefix matches several commits.
+        """
+        matches = [row[0] for row in self.__connection.execute(
+            "SELECT DISTINCT commit_id FROM results WHERE commit_id = ? OR commit_id LIKE ? ESCAPE '\\'",
+            (prefix, prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'))]
+
+        if prefix in matches or not matches:
+            return prefix
+
+        if len(matches) > 1:
+            raise ValueError(f"Ambiguous commit {prefix}: {', '.join(sorted(matches))}")
+
+        return matches[0]
+
+    def hosts(self) -> Dict[str, HostProfile]:
+        """Gets the profiles of the hosts that recorded results.
+
+        Returns:
+            Dict[str, HostProfile]: Profile by key, as first recorded.
+        """
+        return {key: HostProfile.from_dict(json.loads(profile))
+                for key, profile in self.__connection.execute('SELECT key, profile FROM hosts')}
+
+    def close(self) -> None:
+        """Closes the database."""
+        self.__connection.close()
+
+    def __enter__(self) -> "EnergyBaselineStore":
+        return self
+
+    def __exit__(self, *exception) -> None:
+        self.close()
+
+    @staticmethod
+    def current_commit() -> Union[str, None]:
+        """Finds the commit being measured.
+
+        Returns:
+            Union[str, None]: The 'POWERPYRO_COMMIT' environment variable, or
+            the commit checked out in the current directory, or None.
+        """
+        if os.environ.get('POWERPYRO_COMMIT'):
+            return os.environ['POWERPYRO_COMMIT']
+
+        try:
+            output = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, timeout=10)
+        except (OSError, subprocess.SubprocessError):
+            return None
+
+        if output.returncode != 0:
+            return None
+
+        return output.stdout.strip() or None
+
+    @staticmethod
+    def default_path() -> str:
+        """Returns where results are stored by default.
+
+        The file can be changed with the 'POWERPYRO_BASELINE_STORE'
+        environment variable and defaults to '~/.powerpyro/baselines.sqlite'.
+
+        Returns:
+            str: Path of the database file.
+        """
+        return os.environ.get('POWERPYRO_BASELINE_STORE',
+                              os.path.join(os.path.expanduser('~'), '.powerpyro', 'baselines.sqlite'))
@@ -0,0 +1,124 @@
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, List, Union
+import math
+
+class EnergyHistogram():
+    """Distribution of the energy of many small events, such as requests.
+
+    Bucket bounds are spaced logarithmically and fixed up front, so adding
+    a value is a binary search and an increment, and memory does not grow
+    with the number of events.
+
+    Attributes:
+        __bounds (List[float]): Upper bound in J of each bucket but the last,
+        which holds every larger value.
+        __counts (array): Number of values in each bucket.
+        __count (int): Number of values added.
+        __sum (float): Sum of the values in J.
+        __minimum (float): Lowest value in J.
+        __maximum (float): Highest value in J.
+    """
+    def __init__(self, lowest: float = 1e-6, highest: float = 1e4, buckets_per_decade: int = 4):
+        """
+        Args:
+            lowest (float): Upper bound in J of the first bucket (optional,
+            default is 1e-6).
+            highest (float): Upper bound in J of the last bounded bucket
+            (optional, default is 1e4).
+            buckets_per_decade (int): Number of buckets per power of ten
+            (optional, default is 4).
+
+        Raises:
+            ValueError: If the bounds are not positive and increasing or there
+            is not at least one bucket per decade.
+        """
+        if lowest <= 0 or highest <= lowest or buckets_per_decade <= 0:
+            raise ValueError("Histogram bounds must be positive and increasing")
+
+        steps = math.ceil(math.log10(highest / lowest) * buckets_per_decade)
+
+        self.__bounds: List[float] = [lowest * 10 ** (step / buckets_per_decade) for step in range(steps + 1)]
+        self.__counts: array = array('q', [0]) * (len(self.__bounds) + 1)
+        self.__count: int = 0
+        self.__sum: float = 0.0
+        self.__minimum: float = math.inf
+        self.__maximum: float = -math.inf
+
+    @property
+    def count(self) -> int:
+        """Gets the number of values added.
+
+        Returns:
+            int: Count.
+        """
+        return self.__count
+
+    @property
+    def total(self) -> float:
+        """Gets the sum of the values added.
+
+        Returns:
+            float: Sum in J.
+        """
+        return self.__sum
+
+    def add(self, value: float) -> None:
+        """Adds a value.
+
+        Args:
+            value (float): Energy in J.
+        """
+        self.__counts[bisect_left(self.__bounds, value)] += 1
+        self.__count += 1
+        self.__sum += value
+
+        if value < self.__minimum:
+            self.__minimum = value
+
+        if value > self.__maximum:
+            self.__maximum = value
+
+    def quantile(self, q: float) -> Union[float, None]:
+        """Estimates a quantile from the buckets.
+
+        Args:
+            q (float): Quantile between 0 and 1.
+
+        Returns:
+            Union[float, None]: Upper bound in J of the bucket holding the
+            quantile, clamped to the values seen, or None if no value was added.
+        """
+        if self.__count == 0:
+            return None
+
+        rank = q * self.__count
+        seen = 0
+
+        for index, count in enumerate(self.__counts):
+            seen += count
+
+            if seen >= rank and count > 0:
+                bound = self.__bounds[index] if index < len(self.__bounds) else self.__maximum
+                return min(max(bound, self.__minimum), self.__maximum)
+
+        return self.__maximum
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarises the histogram as a JSON serializable dictionary.
+
+        Returns:
+            Dict[str, Any]: Count, sum, mean, min, p50, p90, p99 and max in J,
+            and the non-empty buckets as 'le' (upper bound, None for the last
+            bucket) and 'count'.
+        """
+        return {'count': self.__count,
+                'sum': self.__sum,
+                'mean': self.__sum / self.__count if self.__count else None,
+                'min': self.__minimum if self.__count else None,
+                'p50': self.quantile(0.5),
+                'p90': self.quantile(0.9),
+                'p99': self.quantile(0.99),
+                'max': self.__maximum if self.__count else None,
+                'buckets': [{'le': self.__bounds[index] if index < len(self.__bounds) else None, 'count': count}
+                            for index, count in enumerate(self.__counts) if count > 0]}
@@ -0,0 +1,327 @@
+from .sample import Sample
+from .tiered_retention import TieredRetention
+
+from IPython.core.magic import Magics, magics_class, line_magic, line_cell_magic
+from IPython.core.magic_arguments import argument, magic_arguments, parse_argstring
+from IPython.core.error import UsageError
+from traitlets import Float, Unicode
+from typing import Any, Dict, List, Union
+from threading import Lock
+import json
+import math
+import time
+
+@magics_class
+class EnergyMagics(Magics):
+    """IPython magics measuring the energy of statements and notebook cells.
+
+    A single monitor is created the first time a cell is measured and runs
+    for the lifetime of the kernel, so hardware discovery and the sampling
+    thread are paid once. Measuring a cell only records its start and end:
+    the samples of the monitor are delivered to a subscription that adds
+    the part of each sample overlapping a measured cell, so the cost per
+    cell is a few clock reads whatever the sampling interval.
+
+    When a cell ends between two samples, the energy since the last sample
+    is estimated from the power of that sample, and the history entry is
+    made exact once the next sample arrives.
+
+    The components and the sampling interval are set with '%config', before
+    the first measurement:
+
+        %config EnergyMagics.components = 'cpu,gpu,memory'
+        %config EnergyMagics.interval = 0.05
+
+    Attributes:
+        components (str): Comma separated components to monitor.
+        interval (float): Time in seconds between two samples.
+        retention (float): Time in seconds the raw samples of the kernel
+        monitor are kept, which bounds its memory.
+        __monitor (Any): Kernel-wide monitor, None before the first
+        measurement.
+        __cells (List[Dict[str, Any]]): History of the measured cells.
+        __pending (List[Dict[str, Any]]): Cells not yet covered by a sample.
+        __last_sample (Union[Sample, None]): Last sample delivered.
+        __lock (Lock): Guards the history between the kernel and the
+        subscription thread.
+        __WATT_TO_KWH (float): Constant to convert energy from joules to
+        kilowatt-hours.
+    """
+    components = Unicode('cpu,memory', help="Comma separated components to monitor.").tag(config=True)
+    interval = Float(0.1, help="Time in seconds between two samples.").tag(config=True)
+    retention = Float(600.0, help="Time in seconds the raw samples of the kernel monitor are kept.").tag(config=True)
+
+    def __init__(self, shell: Any = None, **kwargs: Any):
+        """
+        Args:
+            shell (Any): The IPython shell.
+        """
+        super().__init__(shell, **kwargs)
+        self.__monitor: Any = None
+        self.__cells: List[Dict[str, Any]] = []
+        self.__pending: List[Dict[str, Any]] = []
+        self.__last_sample: Union[Sample, None] = None
+        self.__lock: Lock = Lock()
+        self.__WATT_TO_KWH: float = 3_600_000
+
+    def __ensure_monitor(self) -> None:
+        """Creates and starts the kernel-wide monitor on first use."""
+        if self.__monitor is not None:
+            return
+
+        from .monitor import Monitor
+
+        names = [name.strip() for name in self.components.split(',') if name.strip()]
+        monitor = Monitor({name: True for name in names}, sampling_interval=self.interval,
+                          retention=TieredRetention(raw_window=self.retention))
+        monitor.subscribe(self.__on_sample)
+        monitor.start()
+        self.__monitor = monitor
+
+    def __on_sample(self, sample: Sample) -> None:
+        """Adds the part of a sample overlapping each pending cell.
+
+        Args:
+            sample: Sample delivered by the kernel monitor.
+        """
+        sample_start = sample.timestamp - sample.period
+
+        with self.__lock:
+            self.__last_sample = sample
+
+            for cell in self.__pending:
+                end = cell['end'] if cell['end'] is not None else math.inf
+                overlap = min(sample.timestamp, end) - max(sample_start, cell['start'])
+
+                if overlap > 0 and sample.period > 0:
+                    for key, value in sample.energy.items():
+                        cell['measured'][key] = (cell['measured'].get(key, 0.0)
+                                                 + value * overlap / sample.period * self.__WATT_TO_KWH)
+
+                cell['covered'] = max(cell['covered'], sample.timestamp)
+
+            self.__pending = [cell for cell in self.__pending if not self.__settle(cell)]
+
+    def __settle(self, cell: Dict[str, Any]) -> bool:
+        """Updates the reported energy of a cell.
+
+        The energy measured so far is completed with the power of the last
+        sample for the time after it.
+
+        Args:
+            cell: Entry of the history.
+
+        Returns:
+            bool: True once samples cover the whole cell.
+        """
+        if cell['end'] is None:
+            return False
+
+        energy = dict(cell['measured'])
+        tail = cell['end'] - max(cell['covered'], cell['start'])
+        sample = self.__last_sample
+
+        if tail > 0 and sample is not None and sample.period > 0:
+            for key, value in sample.energy.items():
+                energy[key] = energy.get(key, 0.0) + value / sample.period * tail * self.__WATT_TO_KWH
+
+        cell['energy'] = energy
+        cell['total'] = sum(energy.values())
+        cell['power'] = cell['total'] / cell['duration'] if cell['duration'] > 0 else 0.0
+        cell['exact'] = tail <= 0
+
+        return cell['exact']
+
+    def __measure(self, code: str, label: Union[str, None]) -> Dict[str, Any]:
+        """Runs code and records its energy.
+
+        Args:
+            code: Statement or cell to run.
+            label: Name of the entry in the history.
+
+        Returns:
+            Dict[str, Any]: Entry of the history.
+        """
+        self.__ensure_monitor()
+
+        cell = {'index': len(self.__cells) + 1, 'label': label or f"In[{self.shell.execution_count}]",
+                'start': time.time(), 'end': None, 'duration': 0.0, 'covered': 0.0, 'measured': {},
+                'energy': {}, 'total': 0.0, 'power': 0.0, 'exact': False, 'error': False}
+
+        with self.__lock:
+            self.__pending.append(cell)
+
+        try:
+            result = self.shell.run_cell(code, store_history=False)
+            cell['error'] = not result.success
+        finally:
+            end = time.time()
+
+            with self.__lock:
+                cell['end'] = end
+                cell['duration'] = end - cell['start']
+
+                if self.__settle(cell):
+                    self.__pending.remove(cell)
+
+                self.__cells.append(cell)
+
+        print(self.__format(cell))
+
+        return cell
+
+    @staticmethod
+    def __format(cell: Dict[str, Any]) -> str:
+        """Describes the energy of a cell on one line.
+
+        Args:
+            cell: Entry of the history.
+
+        Returns:
+            str: Energy, mean power and wall time of the cell.
+        """
+        approximate = '' if cell['exact'] else '~'
+        components = ', '.join(f"{key} {value:.3f} J" for key, value in cell['energy'].items())
+
+        return (f"energy: {approximate}{cell['total']:.3f} J ({components}), "
+                f"mean power: {cell['power']:.2f} W, wall time: {cell['duration']:.3f} s")
+
+    @line_cell_magic
+    def energy(self, line: str, cell: Union[str, None] = None) -> None:
+        """Measures the energy of a statement, or of a cell with '%%energy'.
+
+        Usage:
+
+            %energy statement
+
+            %%energy [label]
+            code
+
+        Prints the energy of every component, the mean power and the wall
+        time, and adds them to the history shown by '%energy_history'.
+        """
+        if cell is None:
+            if not line.strip():
+                raise UsageError("%energy needs a statement to measure, or use %%energy on a cell")
+
+            self.__measure(line, None)
+        else:
+            self.__measure(cell, line.strip() or None)
+
+    @magic_arguments()
+    @argument('-b', '--baseline', help='label or index of the entry the others are compared to')
+    @argument('-o', '--output', action='store_true', help='return the history instead of printing it')
+    @argument('--json', action='store_true', help='print the history as JSON')
+    @argument('--clear', action='store_true', help='forget the measured cells')
+    @line_magic
+    def energy_history(self, line: str) -> Union[List[Dict[str, Any]], None]:
+        """Shows the energy of every cell measured with '%energy' or '%%energy'."""
+        options = parse_argstring(self.energy_history, line)
+
+        with self.__lock:
+            if options.clear:
+                self.__cells = []
+                return None
+
+            history = [{'index': cell['index'], 'label': cell['label'], 'start': cell['start'],
+                        'duration': cell['duration'], 'energy': dict(cell['energy']), 'total': cell['total'],
+                        'power': cell['power'], 'exact': cell['exact'], 'error': cell['error']}
+                       for cell in self.__cells]
+
+        baseline = self.__find_baseline(history, options.baseline)
+
+        if baseline is not None:
+            for entry in history:
+                entry['ratio'] = entry['total'] / baseline['total'] if baseline['total'] > 0 else None
+
+        if options.output:
+            return history
+
+        if options.json:
+            print(json.dumps(history, indent=2))
+            return None
+
+        print(self.__table(history, baseline is not None))
+
+        return None
+
+    @staticmethod
+    def __find_baseline(history: List[Dict[str, Any]], key: Union[str, None]) -> Union[Dict[str, Any], None]:
+        """Finds the entry the others are compared to.
+
+        Args:
+            history: Entries of the history.
+            key: Label or index of the entry, if any.
+
+        Returns:
+            Union[Dict[str, Any], None]: The entry, or None without a key.
+
+        Raises:
+            UsageError: If no entry has this label or index.
+        """
+        if key is None:
+            return None
+
+        for entry in history:
+            if entry['label'] == key or str(entry['index']) == key:
+                return entry
+
+        raise UsageError(f"No measured cell {key!r}")
+
+    @staticmethod
+    def __table(history: List[Dict[str, Any]], compared: bool) -> str:
+        """Formats the history as a text table.
+
+        Args:
+            history: Entries of the history.
+            compared: Whether the entries have a ratio to a baseline.
+
+        Returns:
+            str: One line per cell, with the energy of every component.
+        """
+        if not history:
+            return "No cell measured yet"
+
+        components = list(dict.fromkeys(key for entry in history for key in entry['energy']))
+        header = f"{'#':>3}  {'cell':<16} {'time (s)':>9} {'energy (J)':>11} {'power (W)':>9}"
+        header += ''.join(f" {key + ' (J)':>11}" for key in components)
+        header += f" {'vs base':>8}" if compared else ''
+        lines = [header]
+
+        for entry in history:
+            approximate = ' ' if entry['exact'] else '~'
+            line = (f"{entry['index']:>3}  {entry['label'][:16]:<16} {entry['duration']:>9.3f} "
+                    f"{approximate}{entry['total']:>10.3f} {entry['power']:>9.2f}")
+            line += ''.join(f" {entry['energy'].get(key, 0.0):>11.3f}" for key in components)
+
+            if compared:
+                line += f" {entry['ratio']:>7.2f}x" if entry['ratio'] is not None else f" {'-':>8}"
+
+            lines.append(line + (' (error)' if entry['error'] else ''))
+
+        return '\n'.join(lines)
+
+    def close(self) -> None:
+        """Ends the kernel-wide monitor."""
+        if self.__monitor is not None:
+            self.__monitor.end()
+            self.__monitor = None
+
+def load_ipython_extension(ipython: Any) -> None:
+    """Registers the energy magics, with '%load_ext power_pyro'.
+
+    Args:
+        ipython (Any): The IPython shell.
+    """
+    ipython.register_magics(EnergyMagics)
+
+def unload_ipython_extension(ipython: Any) -> None:
+    """Ends the kernel-wide monitor of the energy magics.
+
+    Args:
+        ipython (Any): The IPython shell.
+    """
+    magics = ipython.magics_manager.registry.get('EnergyMagics')
+
+    if magics is not None:
+        magics.close()
@@ -0,0 +1,266 @@
+from .energy_baseline_store import EnergyBaselineStore
+from .benchmark_comparison import BenchmarkComparison
+from .comparison_verdict import ComparisonVerdict
+
+from typing import Dict, List, Tuple, Union
+import math
+import random
+import statistics
+
+class EnergyRegressionChecker():
+    """Compares the energy of benchmarks at a candidate commit against a
+       baseline commit.
+
+    The runs of both commits are compared with a one-sided Mann-Whitney U
+    test, which makes no assumption on the shape of the energy distribution
+    and is robust to the occasional outlier run. A benchmark regresses when
+    the candidate uses significantly more energy ('p_value' below 'alpha')
+    and its median energy grew by more than 'threshold'; the change is also
+    reported with a bootstrap confidence interval.
+
+    Runs are only compared within a host class ('HostProfile.key'). When
+    several host classes measured both commits, the runs of each class are
+    divided by the median baseline energy of that class before being pooled,
+    so the differences between hosts are not mistaken for a change.
+
+    Attributes:
+        __store (EnergyBaselineStore): Store holding the runs.
+        __threshold (float): Smallest relative growth of the median energy
+        reported as a regression.
+        __alpha (float): Significance level of the test.
+        __confidence (float): Confidence level of the bootstrap interval.
+        __resamples (int): Number of bootstrap resamples.
+        __random (random.Random): Generator of the bootstrap resamples.
+        __EXACT_LIMIT (int): Largest product of the sample sizes for which
+        the exact distribution of U is used.
+    """
+    __EXACT_LIMIT: int = 400
+
+    def __init__(self, store: EnergyBaselineStore, threshold: float = 0.05, alpha: float = 0.05,
+                 confidence: float = 0.95, resamples: int = 2000, seed: Union[int, None] = None):
+        """
+        Args:
+            store (EnergyBaselineStore): Store holding the runs.
+            threshold (float): Smallest relative growth of the median energy
+            reported as a regression (optional, default is 0.05, i.e. 5%).
+            alpha (float): Significance level of the test (optional, default
+            is 0.05).
+            confidence (float): Confidence level of the bootstrap interval
+            (optional, default is 0.95).
+            resamples (int): Number of bootstrap resamples (optional, default
+            is 2000).
+            seed (Union[int, None]): Seed of the bootstrap, for reproducible
+            intervals (optional).
+
+        Raises:
+            ValueError: If a parameter is out of range.
+        """
+        if threshold < 0 or not 0 < alpha < 1 or not 0 < confidence < 1 or resamples < 1:
+            raise ValueError("Invalid threshold, alpha, confidence or number of resamples")
+
+        self.__store: EnergyBaselineStore = store
+        self.__threshold: float = threshold
+        self.__alpha: float = alpha
+        self.__confidence: float = confidence
+        self.__resamples: int = resamples
+        self.__random: random.Random = random.Random(seed)
+
+    def compare(self, baseline_commit: str, candidate_commit: str,
+                host_key: Union[str, None] = None) -> List[BenchmarkComparison]:
+        """Compares every benchmark of the candidate commit with the baseline.
+
+        Args:
+            baseline_commit (str): Commit of the baseline runs.
+            candidate_commit (str): Commit of the candidate runs.
+            host_key (Union[str, None]): Only compare runs of this host class
+            (optional, default is every host class measuring both commits).
+
+        Returns:
+            List[BenchmarkComparison]: One comparison per candidate benchmark.
+
+        Example:
+            ```python
+            from power_pyro.energy_baseline_store import EnergyBaselineStore
+            from power_pyro.energy_regression_checker import EnergyRegressionChecker
+            from power_pyro.host_profile import HostProfile
+
+            with EnergyBaselineStore() as store:
+                checker = EnergyRegressionChecker(store, threshold=0.03)
+                comparisons = checker.compare('a1b2c3d', 'e4f5a6b', HostProfile.current().key)
+
+            print([c.benchmark for c in comparisons if c.verdict.name == 'REGRESSED'])
+            ```
+        """
+        return [self.compare_runs(benchmark,
+                                  self.__store.energies(benchmark, baseline_commit, host_key),
+                                  self.__store.energies(benchmark, candidate_commit, host_key))
+                for benchmark in self.__store.benchmarks(candidate_commit, host_key)]
+
+    def compare_runs(self, benchmark: str, baseline: Dict[str, List[float]],
+                     candidate: Dict[str, List[float]]) -> BenchmarkComparison:
+        """Compares the runs of one benchmark.
+
+        Args:
+            benchmark (str): Benchmark name.
+            baseline (Dict[str, List[float]]): Baseline energies by host class.
+            candidate (Dict[str, List[float]]): Candidate energies by host class.
+
+        Returns:
+            BenchmarkComparison: The comparison.
+        """
+        hosts = [key for key in candidate if baseline.get(key) and candidate[key]]
+
+        if not hosts:
+            return BenchmarkComparison(benchmark, ComparisonVerdict.NO_BASELINE,
+                                       candidate_count=sum(len(values) for values in candidate.values()))
+
+        baseline_runs, candidate_runs = [], []
+
+        for key in hosts:
+            scale = statistics.median(baseline[key]) if len(hosts) > 1 else 1.0
+            scale = scale if scale > 0 else 1.0
+            baseline_runs.extend(value / scale for value in baseline[key])
+            candidate_runs.extend(value / scale for value in candidate[key])
+
+        baseline_median = statistics.median(baseline_runs)
+        candidate_median = statistics.median(candidate_runs)
+        change = self.__relative_change(baseline_median, candidate_median)
+        change_low, change_high = self.__bootstrap(baseline_runs, candidate_runs)
+        greater = change >= 0
+        p_value = EnergyRegressionChecker.mann_whitney(baseline_runs, candidate_runs, greater)
+
+        if 1 / math.comb(len(baseline_runs) + len(candidate_runs), len(baseline_runs)) > self.__alpha:
+            verdict = ComparisonVerdict.INSUFFICIENT_DATA
+        elif p_value < self.__alpha and greater and change > self.__threshold:
+            verdict = ComparisonVerdict.REGRESSED
+        elif p_value < self.__alpha and not greater and -change > self.__threshold:
+            verdict = ComparisonVerdict.IMPROVED
+        else:
+            verdict = ComparisonVerdict.UNCHANGED
+
+        single_host = len(hosts) == 1
+
+        return BenchmarkComparison(benchmark, verdict, len(baseline_runs), len(candidate_runs), len(hosts),
+                                   baseline_median if single_host else None,
+                                   candidate_median if single_host else None,
+                                   change, change_low, change_high, p_value)
+
+    def __relative_change(self, baseline: float, candidate: float) -> float:
+        """Computes the relative change between two energies.
+
+        Args:
+            baseline: Baseline energy.
+            candidate: Candidate energy.
+
+        Returns:
+            float: Relative change, infinite if only the candidate is positive.
+        """
+        if baseline > 0:
+            return candidate / baseline - 1
+
+        return math.inf if candidate > 0 else 0.0
+
+    def __bootstrap(self, baseline: List[float], candidate: List[float]) -> Tuple[float, float]:
+        """Estimates a confidence interval of the relative change of the
+           median energy by resampling the runs.
+
+        Args:
+            baseline: Baseline energies.
+            candidate: Candidate energies.
+
+        Returns:
+            Tuple[float, float]: Lower and upper bounds of the interval.
+        """
+        changes = sorted(self.__relative_change(statistics.median(self.__random.choices(baseline, k=len(baseline))),
+                                                statistics.median(self.__random.choices(candidate, k=len(candidate))))
+                         for _ in range(self.__resamples))
+        tail = (1 - self.__confidence) / 2
+
+        return (changes[int(tail * (len(changes) - 1))],
+                changes[math.ceil((1 - tail) * (len(changes) - 1))])
+
+    @staticmethod
+    def mann_whitney(baseline: List[float], candidate: List[float], greater: bool = True) -> float:
+        """Runs a one-sided Mann-Whitney U test.
+
+        The exact distribution of U is used for small samples without ties,
+        and the normal approximation with tie and continuity corrections
+        otherwise.
+
+        Args:
+            baseline (List[float]): Baseline values.
+            candidate (List[float]): Candidate values.
+            greater (bool): Test if the candidate values tend to be greater
+            than the baseline values, or lower if 'False' (optional, default
+            is 'True').
+
+        Returns:
+            float: The p-value.
+        """
+        m, n = len(candidate), len(baseline)
+
+        if m == 0 or n == 0:
+            return 1.0
+
+        values = sorted([(value, 0) for value in baseline] + [(value, 1) for value in candidate])
+        ranks = [0.0] * len(values)
+        tie_term = 0
+        start = 0
+
+        while start < len(values):
+            end = start
+            while end + 1 < len(values) and values[end + 1][0] == values[start][0]:
+                end += 1
+
+            for index in range(start, end + 1):
+                ranks[index] = (start + end) / 2 + 1
+
+            tie_term += (end - start + 1) ** 3 - (end - start + 1)
+            start = end + 1
+
+        u = sum(rank for rank, (_, sample) in zip(ranks, values) if sample == 1) - m * (m + 1) / 2
+        u = u if greater else m * n - u
+
+        if tie_term == 0 and m * n <= EnergyRegressionChecker.__EXACT_LIMIT:
+            counts = EnergyRegressionChecker.__u_distribution(m, n)
+            return sum(counts[math.ceil(u):]) / sum(counts)
+
+        variance = m * n / 12 * ((m + n + 1) - tie_term / ((m + n) * (m + n - 1)))
+
+        if variance <= 0:
+            return 1.0
+
+        z = (u - m * n / 2 - 0.5) / math.sqrt(variance)
+
+        return 0.5 * math.erfc(z / math.sqrt(2))
+
+    @staticmethod
+    def __u_distribution(m: int, n: int) -> List[int]:
+        """Counts the arrangements of two samples giving each value of U.
+
+        Args:
+            m: Size of the first sample.
+            n: Size of the second sample.
+
+        Returns:
+            List[int]: Number of arrangements with U = 0, 1, ..., m * n.
+        """
+        # counts[j] holds the distribution for i values of the first sample
+        # and j of the second: N(u; i, j) = N(u - j; i - 1, j) + N(u; i, j - 1).
+        counts = [[1] for _ in range(n + 1)]
+
+        for i in range(1, m + 1):
+            row = [[1]]
+            for j in range(1, n + 1):
+                previous, left = counts[j], row[j - 1]
+                current = [0] * (i * j + 1)
+
+                for u, count in enumerate(previous):
+                    current[u + j] += count
+                for u, count in enumerate(left):
+                    current[u] += count
+
+                row.append(current)
+            counts = row
+
+        return counts[n]
@@ -0,0 +1,110 @@
+from dataclasses import dataclass, field
+from typing import Dict
+
+@dataclass(frozen=True)
+class EnergySnapshot():
+    """Totals of a monitor as of one counted sample.
+
+    A monitor publishes a new snapshot after every sample it counts, so all
+    the totals of a snapshot come from the same samples and never mix
+    components updated at different times. Snapshots are immutable and
+    reading the latest one takes no lock and no sensor read, which makes
+    the difference between two of them as cheap as a subtraction.
+
+    Attributes:
+        version (int): Number of samples counted since the monitor was
+        created, or reset.
+        epoch (int): Number of resets before the snapshot; snapshots of
+        different epochs cannot be subtracted.
+        timestamp (float): End of the last counted period (Unix time), or the
+        time of the reset for an empty snapshot.
+        duration (float): Time in seconds covered by the counted samples,
+        excluding pauses.
+        energy (Dict[str, float]): Energy in kWh attributed to the monitored
+        process, by component name.
+        dynamic_energy (Dict[str, float]): Energy in kWh above idle power by
+        component name, empty if idle calibration is disabled.
+        memory_nodes (Dict[str, float]): Memory energy in kWh by NUMA node
+        name, on hosts with several nodes.
+        work (Dict[str, float]): Units of work counted with 'Monitor.count',
+        by counter name.
+    """
+    version: int
+    epoch: int
+    timestamp: float
+    duration: float
+    energy: Dict[str, float] = field(default_factory=dict)
+    dynamic_energy: Dict[str, float] = field(default_factory=dict)
+    memory_nodes: Dict[str, float] = field(default_factory=dict)
+    work: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def total_energy(self) -> float:
+        """Gets the energy of every component.
+
+        Returns:
+            float: Sum of the energy in kWh.
+        """
+        return sum(self.energy.values())
+
+    def energy_per_unit(self) -> Dict[str, float]:
+        """Divides the energy of every component by each work counter.
+
+        Returns:
+            Dict[str, float]: Energy in J per unit of work by counter name,
+            for the counters that counted some work.
+        """
+        joules = self.total_energy * 3_600_000
+
+        return {name: joules / units for name, units in self.work.items() if units > 0}
+
+    def since(self, earlier: 'EnergySnapshot') -> 'EnergySnapshot':
+        """Computes what was counted between an earlier snapshot and this one.
+
+        Args:
+            earlier (EnergySnapshot): Snapshot taken before this one by the
+            same monitor.
+
+        Returns:
+            EnergySnapshot: Snapshot holding the differences of the totals,
+            with the version and the timestamp of this one.
+
+        Raises:
+            ValueError: If the snapshots are separated by a reset, or
+            'earlier' is more recent.
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+
+            monitor = Monitor({'cpu': True}, sampling_interval=1.0)
+            monitor.start()
+            before = monitor.snapshot()
+            handle_request()
+            print(monitor.snapshot().since(before).energy)  # {'cpu': 1.4e-06}
+            ```
+        """
+        if earlier.epoch != self.epoch:
+            raise ValueError("Snapshots are separated by a reset")
+
+        if earlier.version > self.version:
+            raise ValueError("Snapshot is more recent than this one")
+
+        return EnergySnapshot(self.version, self.epoch, self.timestamp, self.duration - earlier.duration,
+                              EnergySnapshot.__subtract(self.energy, earlier.energy),
+                              EnergySnapshot.__subtract(self.dynamic_energy, earlier.dynamic_energy),
+                              EnergySnapshot.__subtract(self.memory_nodes, earlier.memory_nodes),
+                              EnergySnapshot.__subtract(self.work, earlier.work))
+
+    @staticmethod
+    def __subtract(later: Dict[str, float], earlier: Dict[str, float]) -> Dict[str, float]:
+        """Subtracts totals by name.
+
+        Args:
+            later: Totals of the later snapshot.
+            earlier: Totals of the earlier snapshot.
+
+        Returns:
+            Dict[str, float]: Differences by name of the later totals.
+        """
+        return {key: value - earlier.get(key, 0.0) for key, value in later.items()}
@@ -0,0 +1,109 @@
+from .parallelism_tuner import ParallelismTuner
+from .tuning_result import TuningResult
+
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, Type, Union
+
+class EnergyTunedExecutor(Executor):
+    """Executor running with the number of workers chosen by a
+       'ParallelismTuner'.
+
+    Work is delegated to an executor of the wrapped class created with the
+    tuned 'max_workers', so it is a drop-in replacement for it.
+
+    Attributes:
+        __executor (Executor): The wrapped executor.
+        __tuning (Union[TuningResult, None]): Result of the tuning, if the
+        number of workers comes from one.
+        __max_workers (int): Number of workers of the wrapped executor.
+    """
+    def __init__(self, tuning: Union[TuningResult, int], executor_class: Type[Executor] = ProcessPoolExecutor,
+                 **kwargs: Any):
+        """
+        Args:
+            tuning (Union[TuningResult, int]): Tuning result, or a number of
+            workers e.g. stored from an earlier tuning.
+            executor_class (Type[Executor]): Executor to wrap (optional,
+            default is ProcessPoolExecutor).
+            **kwargs (Any): Other arguments of the wrapped executor.
+        """
+        self.__tuning: Union[TuningResult, None] = tuning if isinstance(tuning, TuningResult) else None
+        self.__max_workers: int = tuning.workers if isinstance(tuning, TuningResult) else int(tuning)
+        self.__executor: Executor = executor_class(max_workers=self.__max_workers, **kwargs)
+
+    @classmethod
+    def tuned(cls, fn: Callable[..., Any], *iterables: Iterable[Any],
+              executor_class: Type[Executor] = ProcessPoolExecutor, tuner_options: Union[Dict[str, Any], None] = None,
+              **kwargs: Any) -> 'EnergyTunedExecutor':
+        """Tunes the number of workers on a sample, then creates the executor.
+
+        Args:
+            fn (Callable[..., Any]): Function of the sample.
+            *iterables (Iterable[Any]): Arguments of the sample, as for
+            'Executor.map'.
+            executor_class (Type[Executor]): Executor to wrap (optional,
+            default is ProcessPoolExecutor).
+            tuner_options (Union[Dict[str, Any], None]): Arguments of the
+            'ParallelismTuner', e.g. levels or objective (optional).
+            **kwargs (Any): Other arguments of the wrapped executor.
+
+        Returns:
+            EnergyTunedExecutor: The executor, with the tuning in 'tuning'.
+
+        Example:
+            ```python
+            from power_pyro.energy_tuned_executor import EnergyTunedExecutor
+            from power_pyro.tuning_objective import TuningObjective
+
+            with EnergyTunedExecutor.tuned(render, tiles[:64],
+                                           tuner_options={'objective': TuningObjective.ENERGY_DELAY_PRODUCT}) as executor:
+                print(executor.max_workers)  # 6
+                images = list(executor.map(render, tiles))
+            ```
+        """
+        tuner = ParallelismTuner.for_executor(fn, *iterables, executor_class=executor_class, **(tuner_options or {}))
+
+        return cls(tuner.tune(), executor_class, **kwargs)
+
+    @property
+    def tuning(self) -> Union[TuningResult, None]:
+        """Gets the result of the tuning.
+
+        Returns:
+            Union[TuningResult, None]: The tuning, or None if the number of
+            workers was given.
+        """
+        return self.__tuning
+
+    @property
+    def max_workers(self) -> int:
+        """Gets the number of workers.
+
+        Returns:
+            int: Number of workers of the wrapped executor.
+        """
+        return self.__max_workers
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        """Schedules a call on the wrapped executor.
+
+        Returns:
+            Future: The future of the call.
+        """
+        return self.__executor.submit(fn, *args, **kwargs)
+
+    def map(self, fn: Callable[..., Any], *iterables: Iterable[Any], timeout: Union[float, None] = None,
+            chunksize: int = 1) -> Iterator[Any]:
+        """Maps a function over iterables on the wrapped executor.
+
+        Returns:
+            Iterator[Any]: The results, in order.
+        """
+        if isinstance(self.__executor, ProcessPoolExecutor):
+            return self.__executor.map(fn, *iterables, timeout=timeout, chunksize=chunksize)
+
+        return self.__executor.map(fn, *iterables, timeout=timeout)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Shuts the wrapped executor down."""
+        self.__executor.shutdown(wait=wait, cancel_futures=cancel_futures)
@@ -4,13 +4,15 @@ from .os_type import OsType
 from .identify_hardware_manufacturer_exception import IdentifyHardwareManufacturerException
 from .hardware_name_identify_exception import HardwareNameIdentifyException
 from .resource_unavailable_exception import ResourceUnavailableException
+from .sensor_read_exception import SensorReadException
 from .hardware_type import HardwareType as HT
+from .amd_gpu_sysfs_reader import AmdGpuSysfsReader
 
 import time
 import subprocess
-import re
 import os
 import clr
+from typing import Dict, Union
 
 if os.name == 'nt':
 
@@ -23,19 +25,28 @@ class Gpu(ProcessingUnit):
        for accessing and retrieving power consumption values 
        ​​from hardware sensors.
 
+    On Linux, AMD GPUs are read from the amdgpu sysfs files of every card, 
+    which are found once and kept open; the power of several cards is 
+    added up.
+
     Attributes:
         __manufacturer (GpuType): GPU  type.
+        __amd_reader (Union[AmdGpuSysfsReader, None]): Reader of the amdgpu 
+        cards, if the GPUs are AMD GPUs on Linux.
+        __COMMAND_TIMEOUT (float): Maximum time in seconds a probe or sensor 
+        command may run before it is killed.
     """
 
     def __init__(self, operating_system: OsType):
         super().__init__(operating_system)
         self.__manufacturer: GpuType
+        self.__amd_reader: Union[AmdGpuSysfsReader, None] = None
+        self.__COMMAND_TIMEOUT: float = 5.0
 
         if operating_system == OsType.WINDOWS:
             self.computer.IsGpuEnabled = True        
 
         self._update_manufacture()
-        self._update_hardware_name()
     
     @property
     def get_manufacturer(self) -> GpuType:
@@ -170,14 +181,14 @@ class Gpu(ProcessingUnit):
             HardwareNameIdentifyException: Unable to identify GPU name in Linux.
         """
         try:
-            if self.__is_there_nvidia_on_linux():
-                self.set_name = subprocess.check_output("nvidia-smi --query-gpu=name --format=csv,noheader", shell=True).decode().strip()
-            elif self.__is_there_amd_on_linux():
-                output = subprocess.check_output("lspci | grep -i vga", shell=True).decode().strip()
-                self.set_name = re.findall(r'\w+ \w+ \w+ \w+ / \w+ \w+\W\w+', output)
+            if self.__amd_reader is not None:
+                self.set_name = ', '.join(self.__amd_reader.names)
+            elif self.__is_there_nvidia_on_linux():
+                self.set_name = subprocess.check_output("nvidia-smi --query-gpu=name --format=csv,noheader", shell=True,
+                                                        timeout=self.__COMMAND_TIMEOUT).decode().strip()
             else:
                 raise HardwareNameIdentifyException(HT.GPU)
-        except (FileNotFoundError, subprocess.CalledProcessError, UnicodeDecodeError):
+        except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired, UnicodeDecodeError):
             raise HardwareNameIdentifyException(HT.GPU)
     
     def get_power(self) -> float:
@@ -190,20 +201,138 @@ class Gpu(ProcessingUnit):
             elif self.__manufacturer == GpuType.AMD:
                 return self.__get_amd_power_on_linux()
 
+        raise SensorReadException(HT.GPU, "No power sensor for this GPU")
+
+    def get_utilization(self) -> float:
+        """ Returns the share of time the GPU was busy, in percent.
+
+        Returns:
+            float: GPU utilization between 0 and 100.
+
+        Raises:
+            SensorReadException: If the utilization cannot be read.
+        """
+        if self.operating_system == OsType.WINDOWS:
+            return self.__get_utilization_on_windows()
+
+        else:
+            if self.__manufacturer == GpuType.NVIDIA:
+                return self.__get_nvidia_utilization_on_linux()
+            elif self.__manufacturer == GpuType.AMD:
+                return self.__get_amd_utilization_on_linux()
+
+        raise SensorReadException(HT.GPU, "No utilization sensor for this GPU")
+
+    def __get_utilization_on_windows(self) -> float:
+        """ Returns the GPU core load in percent in Windows.
+
+        Returns:
+            float: GPU utilization.
+
+        Raises:
+            SensorReadException: If the load cannot be read from 
+            LibreHardwareMonitor.
+        """
+        try:
+            gpu = next((hardware for hardware in self.computer.Hardware if (hardware.HardwareType == HardwareType.GpuIntel or
+                                                                            hardware.HardwareType == HardwareType.GpuAmd or
+                                                                            hardware.HardwareType == HardwareType.GpuNvidia)), None)
+            gpu.Update()
+
+            load = next((sensor for sensor in gpu.Sensors if sensor.SensorType == SensorType.Load and sensor.Name == "GPU Core"))
+            return load.Value
+        except (AttributeError, StopIteration) as e:
+            raise SensorReadException(HT.GPU, 'Error getting utilization from GPU: ' + str(e))
+
+    def __get_nvidia_utilization_on_linux(self) -> float:
+        """ Returns the NVIDIA GPU utilization in percent in Linux.
+
+        Returns:
+            float: GPU utilization.
+
+        Raises:
+            SensorReadException: If the utilization cannot be read from nvidia-smi.
+        """
+        try:
+            result = subprocess.run(["nvidia-smi", "--query-gpu=utilization.gpu", "--format=csv,noheader,nounits"],
+                                    stdout=subprocess.PIPE,
+                                    stderr=subprocess.PIPE,
+                                    text=True,
+                                    check=True,
+                                    timeout=self.__COMMAND_TIMEOUT)
+
+            return float(result.stdout.strip().splitlines()[0])
+        except Exception as e:
+            raise SensorReadException(HT.GPU, 'Error getting utilization from GPU: ' + str(e))
+
+    def __get_amd_utilization_on_linux(self) -> float:
+        """ Returns the AMD GPU utilization in percent in Linux, averaged 
+        over the cards.
+
+        Returns:
+            float: GPU utilization.
+
+        Raises:
+            SensorReadException: If no amdgpu busy counter can be read.
+        """
+        try:
+            utilization = self.__amd_reader.read_utilization()
+        except (OSError, ValueError) as e:
+            raise SensorReadException(HT.GPU, 'Error getting utilization from GPU: ' + str(e))
+
+        if not utilization:
+            raise SensorReadException(HT.GPU, 'Error getting utilization from GPU: no amdgpu busy counter found')
+
+        return sum(utilization.values()) / len(utilization)
+
+    def get_card_power(self) -> Dict[str, float]:
+        """ Returns the power of every AMD GPU in W in Linux.
+
+        Returns:
+            Dict[str, float]: Power by PCI slot of the card, empty for other 
+            GPUs.
+
+        Raises:
+            SensorReadException: If an amdgpu power sensor cannot be read.
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+
+            monitor = Monitor({'gpu': True})
+            gpu = monitor.get_monitored_components()['gpu']['component']
+            print(gpu.get_card_power()) # {'0000:03:00.0': 212.0, '0000:43:00.0': 198.5}
+            ```
+        """
+        if self.__amd_reader is None:
+            return {}
+
+        try:
+            return self.__amd_reader.read_power()
+        except (OSError, ValueError, KeyError) as e:
+            raise SensorReadException(HT.GPU, 'Error getting power from GPU: ' + str(e))
+
     def __get_power_on_windows(self) -> float:
         """ Returns the value of the GPU power in W in Windows.
 
         Returns:
             float: GPU power.
+
+        Raises:
+            SensorReadException: If the power cannot be read from 
+            LibreHardwareMonitor.
         """
-        gpu = next((hardware for hardware in self.computer.Hardware if (hardware.HardwareType == HardwareType.GpuIntel or
-                                                                        hardware.HardwareType == HardwareType.GpuAmd or
-                                                                        hardware.HardwareType == HardwareType.GpuNvidia)), None)
-        gpu.Update()
-        time.sleep(0.1)
+        try:
+            gpu = next((hardware for hardware in self.computer.Hardware if (hardware.HardwareType == HardwareType.GpuIntel or
+                                                                            hardware.HardwareType == HardwareType.GpuAmd or
+                                                                            hardware.HardwareType == HardwareType.GpuNvidia)), None)
+            gpu.Update()
+            time.sleep(0.1)
 
-        power = next((sensor for sensor in gpu.Sensors if sensor.SensorType == SensorType.Power and (sensor.Name == "GPU Power" or sensor.Name == "GPU Package")))
-        return power.Value
+            power = next((sensor for sensor in gpu.Sensors if sensor.SensorType == SensorType.Power and (sensor.Name == "GPU Power" or sensor.Name == "GPU Package")))
+            return power.Value
+        except (AttributeError, StopIteration) as e:
+            raise SensorReadException(HT.GPU, 'Error getting power from GPU: ' + str(e))
 
     def __is_there_nvidia_on_linux(self) -> bool:
         """ Check if the GPU present in linux is NVIDIA.
@@ -214,9 +343,9 @@ class Gpu(ProcessingUnit):
                 - 'False' if you don't have NVIDIA GPU on linux.
         """
         try:
-            subprocess.run(['nvidia-smi'], stdout=subprocess.PIPE, stderr= subprocess.PIPE, check=True)
+            subprocess.run(['nvidia-smi'], stdout=subprocess.PIPE, stderr= subprocess.PIPE, check=True, timeout=self.__COMMAND_TIMEOUT)
             return True
-        except (FileNotFoundError, subprocess.CalledProcessError):
+        except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
             return False
     
     def __get_nvidia_power_on_linux(self) -> float:
@@ -224,65 +353,47 @@ class Gpu(ProcessingUnit):
 
         Returns:
             float: GPU power.
+
+        Raises:
+            SensorReadException: If the power cannot be read from nvidia-smi.
         """
         try:
             result = subprocess.run(["nvidia-smi", "--query-gpu=power.draw", "--format=csv,noheader,nounits"],
                                     stdout=subprocess.PIPE,
                                     stderr=subprocess.PIPE,
                                     text=True,
-                                    check=True)
+                                    check=True,
+                                    timeout=self.__COMMAND_TIMEOUT)
             
             return float(result.stdout.strip())
         except Exception as e:
-            print('Error getting power from GPU: ', str(e))
-            return 0.0
+            raise SensorReadException(HT.GPU, 'Error getting power from GPU: ' + str(e))
     
     def __is_there_amd_on_linux(self) -> bool:
-        """ Check if the GPU present in Linux is AMD.
+        """ Check if the GPU present in Linux is AMD, opening the sensors of 
+        every amdgpu card if it is.
 
         Returns:
             bool: 
                 - 'True' if you have AMD GPU on Linux.
                 - 'False' if you don't have AMD GPU on Linux.
-
-        Raises:
-            Exception: Error when checking AMD dedicated video card on Linux.
         """
-        try:
-            result = subprocess.check_output(['lspci', '-nnk'], universal_newlines=True)
+        if self.__amd_reader is None:
+            try:
+                self.__amd_reader = AmdGpuSysfsReader()
+            except OSError:
+                return False
 
-            for line in result.splitlines():
-                if re.search(r"( VGA | 3D )", line) and re.search(r"AMD", line.upper()): 
-                    return True
-            
-            return False
-        except Exception as e:
-            raise Exception(f'Error checking for AMD graphics card:{e}')   
+        return True
     
     def __get_amd_power_on_linux(self) -> float:
-        """ Returns the value of the AMD GPU power in W in Linux.
+        """ Returns the value of the AMD GPU power in W in Linux, added up 
+        over the cards.
 
         Returns:
             float: GPU power.
+
+        Raises:
+            SensorReadException: If an amdgpu power sensor cannot be read.
         """
-        try:
-            hwmon_path = '/sys/class/hwmon/'
-
-            for hwmon in os.listdir(hwmon_path):
-                hwmon_dir = os.path.join(hwmon_path, hwmon)
-                
-                name_file = os.path.join(hwmon_dir, 'name')
-                if os.path.exists(name_file):
-                    with open(name_file, 'r') as file:
-                        device = file.read().strip()
-
-                    if device == 'amdgpu':
-                        power_file = os.path.join(hwmon_dir, 'power1_input')
-                        if os.path.exists(power_file):
-                            with open(power_file, 'r') as file:
-                                power = float(file.read().strip())
-
-                            power /= 10**6
-                            return power
-        except (FileNotFoundError, PermissionError, ValueError) as e:
-            print('Error getting power from GPU: ', str(e))
+        return sum(self.get_card_power().values())
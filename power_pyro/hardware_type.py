@@ -5,4 +5,6 @@ class HardwareType(Enum):
     
     GPU = 0
     CPU = 1
-    MEMORY = 2
\ No newline at end of file
+    MEMORY = 2
+    STORAGE = 3
+    NETWORK = 4
\ No newline at end of file
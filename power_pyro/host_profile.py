@@ -0,0 +1,128 @@
+from typing import Dict
+import hashlib
+import json
+import os
+import platform
+import socket
+import sys
+import psutil
+
+class HostProfile():
+    """Hardware and software class of a host, used to decide which energy
+       results can be compared with each other.
+
+    Two hosts with the same CPU model, number of logical CPUs, memory size,
+    operating system and Python version share the same 'key', even with
+    different host names, so identical CI runners pool their results.
+    Results from different keys are never compared directly.
+
+    Attributes:
+        __hostname (str): Name of the host.
+        __cpu (str): CPU model name.
+        __logical_cpus (int): Number of logical CPUs.
+        __memory (int): Total memory rounded to GiB.
+        __system (str): Operating system and machine architecture.
+        __python (str): Python major and minor version.
+    """
+    def __init__(self, hostname: str, cpu: str, logical_cpus: int, memory: int, system: str, python: str):
+        self.__hostname: str = hostname
+        self.__cpu: str = cpu
+        self.__logical_cpus: int = logical_cpus
+        self.__memory: int = memory
+        self.__system: str = system
+        self.__python: str = python
+
+    @property
+    def hostname(self) -> str:
+        """Gets the name of the host.
+
+        Returns:
+            str: Host name.
+        """
+        return self.__hostname
+
+    @property
+    def key(self) -> str:
+        """Gets the key shared by every host of the same class.
+
+        Returns:
+            str: Short hash of every field except the host name.
+        """
+        fields = {name: value for name, value in self.to_dict().items() if name != 'hostname'}
+        digest = hashlib.sha256(json.dumps(fields, sort_keys=True).encode()).hexdigest()
+
+        return digest[:12]
+
+    def describe(self) -> str:
+        """Describes the host class in one line.
+
+        Returns:
+            str: CPU, memory, system and Python version.
+        """
+        return (f"{self.__cpu} ({self.__logical_cpus} CPUs), {self.__memory} GiB, "
+                f"{self.__system}, Python {self.__python}")
+
+    def to_dict(self) -> Dict[str, object]:
+        """Converts the profile into a JSON serializable dictionary.
+
+        Returns:
+            Dict[str, object]: The profile fields.
+        """
+        return {'hostname': self.__hostname,
+                'cpu': self.__cpu,
+                'logical_cpus': self.__logical_cpus,
+                'memory': self.__memory,
+                'system': self.__system,
+                'python': self.__python}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "HostProfile":
+        """Creates a profile from a dictionary produced by 'to_dict'.
+
+        Args:
+            data (Dict[str, object]): The profile fields.
+
+        Returns:
+            HostProfile: The restored profile.
+
+        Raises:
+            ValueError: If the dictionary is not a valid profile.
+        """
+        try:
+            return cls(str(data['hostname']), str(data['cpu']), int(data['logical_cpus']),
+                       int(data['memory']), str(data['system']), str(data['python']))
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid host profile: {e}")
+
+    @staticmethod
+    def __read_cpu_model() -> str:
+        """Reads the CPU model name.
+
+        Returns:
+            str: Model name, or the processor reported by the platform.
+        """
+        if os.path.exists('/proc/cpuinfo'):
+            try:
+                with open('/proc/cpuinfo', 'r') as file:
+                    for line in file:
+                        if line.startswith('model name'):
+                            return line.split(':', 1)[1].strip()
+            except OSError:
+                pass
+
+        return platform.processor() or platform.machine() or 'unknown'
+
+    @classmethod
+    def current(cls) -> "HostProfile":
+        """Profiles the host running the process.
+
+        Returns:
+            HostProfile: The profile of the current host.
+        """
+        return cls(socket.gethostname(),
+                   cls.__read_cpu_model(),
+                   os.cpu_count() or 1,
+                   round(psutil.virtual_memory().total / 2**30),
+                   f"{platform.system()} {platform.machine()}",
+                   f"{sys.version_info.major}.{sys.version_info.minor}")
+
@@ -0,0 +1,122 @@
+from .hardware_component import HardwareComponent
+from .calibration_profile import CalibrationProfile
+from .sensor_reader import SensorReader
+
+from typing import Dict, List, Union
+import statistics
+import time
+
+class IdlePowerCalibrator():
+    """Measures the idle power of hardware components.
+
+    The power of each component is sampled repeatedly over a window while the
+    host is expected to be idle, and the median of the readings is taken as
+    the idle baseline, so short spikes during the window do not inflate it.
+
+    Every reading goes through a deadline-bounded 'SensorReader', so a hung
+    backend cannot block the calibration. A component that times out or
+    fails before giving any reading is not read again and gets no baseline.
+
+    Attributes:
+        __components (Dict[str, HardwareComponent]): Components to calibrate.
+        __readers (Dict[str, SensorReader]): Power reader of each component.
+        __window (float): Duration of the calibration window in seconds.
+        __interval (float): Pause between two readings in seconds.
+    """
+    def __init__(self, components: Dict[str, HardwareComponent], window: float = 30.0, interval: float = 1.0,
+                 read_timeout: float = 5.0, readers: Union[Dict[str, SensorReader], None] = None):
+        """
+        Args:
+            components (Dict[str, HardwareComponent]): Components to calibrate
+            by name ('cpu', 'gpu', 'memory').
+            window (float): Duration of the calibration window in seconds
+            (optional, default is 30).
+            interval (float): Pause between two readings in seconds
+            (optional, default is 1).
+            read_timeout (float): Time in seconds a reading may take
+            (optional, default is 5).
+            readers (Union[Dict[str, SensorReader], None]): Power readers to
+            use by component name, e.g. the ones of the sampler, so a hung
+            backend is not read by a second thread (optional, default is a
+            new reader for each component).
+
+        Raises:
+            ValueError: If the window, the interval or the read timeout is
+            not positive.
+        """
+        if window <= 0 or interval <= 0:
+            raise ValueError("Calibration window and interval must be positive")
+
+        if read_timeout <= 0:
+            raise ValueError("Read timeout must be positive")
+
+        self.__components: Dict[str, HardwareComponent] = components
+        self.__readers: Dict[str, SensorReader] = {
+            key: (readers or {}).get(key) or SensorReader(key, component.get_power, read_timeout)
+            for key, component in components.items()}
+        self.__window: float = window
+        self.__interval: float = interval
+
+    @staticmethod
+    def hardware_names(components: Dict[str, HardwareComponent]) -> Dict[str, Union[str, None]]:
+        """Returns the hardware name of each component.
+
+        Args:
+            components (Dict[str, HardwareComponent]): Components by name.
+
+        Returns:
+            Dict[str, Union[str, None]]: Hardware name by component name, or
+            None for components without a name.
+        """
+        names: Dict[str, Union[str, None]] = {}
+
+        for key, component in components.items():
+            name = getattr(component, 'name', None)
+            names[key] = str(name) if name is not None else None
+
+        return names
+
+    def calibrate(self) -> CalibrationProfile:
+        """Samples every component over the window and builds the profile.
+
+        Returns:
+            CalibrationProfile: The idle baseline of the current host, with
+            the components that could not be read listed as unavailable.
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+
+            monitor = Monitor({'cpu': True, 'memory': True}, idle_calibration=True)
+            print(monitor.get_calibration_profile().idle_power) # {'cpu': 4.1, 'memory': 0.02}
+            ```
+        """
+        readings: Dict[str, List[float]] = {key: [] for key in self.__components}
+        skipped: List[str] = []
+        deadline = time.time() + self.__window
+
+        while True:
+            for key, reader in self.__readers.items():
+                if key in skipped:
+                    continue
+
+                reading = reader.read()
+
+                if not reading.stale and reading.value is not None:
+                    readings[key].append(reading.value)
+                elif not readings[key]:
+                    skipped.append(key)
+                    print(f'Error calibrating {key} component, it will have no idle baseline: ',
+                          'sensor read timed out or failed')
+
+            if time.time() + self.__interval > deadline or len(skipped) == len(self.__readers):
+                break
+
+            time.sleep(self.__interval)
+
+        idle_power = {key: statistics.median(values) for key, values in readings.items() if values}
+
+        return CalibrationProfile(CalibrationProfile.current_hostname(),
+                                  idle_power,
+                                  IdlePowerCalibrator.hardware_names(self.__components),
+                                  self.__window, unavailable=skipped)
@@ -0,0 +1,334 @@
+from .hardware_component import HardwareComponent
+from .os_type import OsType
+from .io_power_model import IoPowerModel
+from .process_tree import ProcessTree
+from .sensor_read_exception import SensorReadException
+from .hardware_type import HardwareType
+from .resource_unavailable_exception import ResourceUnavailableException
+
+from abc import abstractmethod
+from threading import Lock
+from typing import Dict, List, Tuple, Union
+import os
+import time
+
+class IoComponent(HardwareComponent):
+    """Abstract base class of the components whose power follows the bytes
+       they transfer, such as disks and network interfaces.
+
+    Each read takes one pass over a host counter file and over the I/O
+    counters of the process ('/proc/self/io'), both kept open, so it costs
+    the same however long the process runs. The power of each device comes
+    from its 'IoPowerModel' and the bytes it transferred since the previous
+    read; the share of the process is its part of those bytes.
+
+    Attributes:
+        __devices (List[str]): Names of the monitored devices.
+        __models (Dict[str, IoPowerModel]): Power model of each device.
+        __counters_path (str): Host counter file.
+        __counters_fd (int): Open descriptor of the host counter file, -1
+        once closed.
+        __process_fd (int): Open descriptor of '/proc/self/io', -1 once
+        closed.
+        __process_tree (Union[ProcessTree, None]): Process tree whose bytes
+        are counted instead of the ones of the process, if any.
+        __last (Tuple[float, Dict[str, int], int]): Monotonic time, device
+        bytes and process bytes at the previous read.
+        __device_power (Dict[str, float]): Power in W of each device at the
+        last read.
+        __share (float): Share of the process in the bytes of the last read.
+        __lock (Lock): Serializes the reads.
+        __READ_SIZE (int): Bytes read at once from a counter file.
+    """
+    def __init__(self, operating_system: OsType, counters_path: str,
+                 power_models: Union[Dict[str, IoPowerModel], None] = None):
+        """
+        Args:
+            operating_system (OsType): The current operating system.
+            counters_path (str): Host counter file.
+            power_models (Union[Dict[str, IoPowerModel], None]): Power model
+            by device name, replacing the default model of these devices
+            (optional).
+
+        Raises:
+            ResourceUnavailableException: If the operating system is not
+            Linux, no device is found or the counters cannot be opened.
+        """
+        super().__init__(operating_system)
+        self.__READ_SIZE: int = 65536
+        self.__lock: Lock = Lock()
+        self.__process_tree: Union[ProcessTree, None] = None
+        self.__counters_path: str = counters_path
+
+        if operating_system != OsType.LINUX:
+            raise ResourceUnavailableException(self._hardware_type().name, "only available on Linux")
+
+        try:
+            self.__counters_fd: int = os.open(counters_path, os.O_RDONLY)
+            self.__process_fd: int = os.open('/proc/self/io', os.O_RDONLY)
+        except OSError as e:
+            raise ResourceUnavailableException(self._hardware_type().name, str(e))
+
+        self.__devices: List[str] = self._list_devices()
+
+        if not self.__devices:
+            raise ResourceUnavailableException(self._hardware_type().name, "no device found")
+
+        self.__models: Dict[str, IoPowerModel] = {device: self._default_model(device) for device in self.__devices}
+        self.__models.update({device: model for device, model in (power_models or {}).items()
+                              if device in self.__models})
+        self.__device_power: Dict[str, float] = {}
+        self.__share: float = 0.0
+        self.__last: Tuple[float, Dict[str, int], int] = (time.monotonic(), self.__read_device_bytes(),
+                                                          self.__read_process_bytes())
+
+    @abstractmethod
+    def _hardware_type(self) -> HardwareType:
+        """Gets the type of the component.
+
+        Returns:
+            HardwareType: Hardware type used in error messages.
+        """
+        pass
+
+    @abstractmethod
+    def _list_devices(self) -> List[str]:
+        """Lists the devices whose power is modelled.
+
+        Returns:
+            List[str]: Device names, as they appear in the counter file.
+        """
+        pass
+
+    @abstractmethod
+    def _default_model(self, device: str) -> IoPowerModel:
+        """Chooses the power model of a device.
+
+        Args:
+            device (str): Device name.
+
+        Returns:
+            IoPowerModel: Default model of the kind of device.
+        """
+        pass
+
+    @abstractmethod
+    def _parse_counters(self, content: str) -> Dict[str, int]:
+        """Parses the host counter file.
+
+        Args:
+            content (str): Content of the counter file.
+
+        Returns:
+            Dict[str, int]: Cumulative bytes transferred by device name.
+        """
+        pass
+
+    @abstractmethod
+    def _process_bytes(self, counters: Dict[str, int]) -> int:
+        """Picks the bytes of the component in the I/O counters of a process.
+
+        Args:
+            counters (Dict[str, int]): Fields of '/proc/<pid>/io'.
+
+        Returns:
+            int: Cumulative bytes transferred by the process.
+        """
+        pass
+
+    def __read_fd(self, fd: int) -> str:
+        """Reads an open file from its start.
+
+        Args:
+            fd: Open descriptor.
+
+        Returns:
+            str: Whole content of the file.
+        """
+        chunks: List[bytes] = []
+
+        while True:
+            chunk = os.pread(fd, self.__READ_SIZE, sum(len(chunk) for chunk in chunks))
+            chunks.append(chunk)
+
+            if len(chunk) < self.__READ_SIZE:
+                return b''.join(chunks).decode()
+
+    def __read_device_bytes(self) -> Dict[str, int]:
+        """Reads the cumulative bytes of the monitored devices.
+
+        Returns:
+            Dict[str, int]: Bytes by device name.
+        """
+        counters = self._parse_counters(self.__read_fd(self.__counters_fd))
+
+        return {device: counters.get(device, 0) for device in self.__devices}
+
+    @staticmethod
+    def __parse_io(content: str) -> Dict[str, int]:
+        """Parses '/proc/<pid>/io'.
+
+        Args:
+            content: Content of the file.
+
+        Returns:
+            Dict[str, int]: Counters by field name.
+        """
+        return {key.strip(): int(value) for key, _, value in (line.partition(':') for line in content.splitlines())
+                if value.strip()}
+
+    def __read_process_bytes(self) -> int:
+        """Reads the cumulative bytes of the process or of its tree.
+
+        Returns:
+            int: Bytes transferred by the component for the measured processes.
+        """
+        if self.__process_tree is None:
+            return self._process_bytes(self.__parse_io(self.__read_fd(self.__process_fd)))
+
+        total = 0
+
+        for pid in self.__process_tree.read_pids():
+            try:
+                with open(f'/proc/{pid}/io', 'r') as file:
+                    total += self._process_bytes(self.__parse_io(file.read()))
+            except (OSError, ValueError):
+                # A descendant may exit between the listing and the read.
+                pass
+
+        return total
+
+    def use_process_tree(self, process_tree: Union[ProcessTree, None]) -> None:
+        """Counts the bytes of a process tree instead of the ones of the
+           process.
+
+        Args:
+            process_tree (Union[ProcessTree, None]): Process tree to measure,
+            or None to go back to the process.
+        """
+        with self.__lock:
+            self.__process_tree = process_tree
+            self.__last = (self.__last[0], self.__last[1], self.__read_process_bytes())
+
+    def open(self) -> None:
+        """Reopens the counter files after 'close'.
+
+        Raises:
+            SensorReadException: If the counters cannot be opened.
+        """
+        with self.__lock:
+            if self.__counters_fd >= 0:
+                return
+
+            try:
+                self.__counters_fd = os.open(self.__counters_path, os.O_RDONLY)
+                self.__process_fd = os.open('/proc/self/io', os.O_RDONLY)
+                self.__last = (time.monotonic(), self.__read_device_bytes(), self.__read_process_bytes())
+            except (OSError, ValueError, IndexError) as e:
+                self.__close_fds()
+                raise SensorReadException(self._hardware_type(), 'Error opening I/O counters: ' + str(e))
+
+    def close(self) -> None:
+        """Closes the counter files."""
+        with self.__lock:
+            self.__close_fds()
+
+    def __close_fds(self) -> None:
+        """Closes the open counter descriptors."""
+        for fd in (self.__counters_fd, self.__process_fd):
+            if fd >= 0:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+
+        self.__counters_fd, self.__process_fd = -1, -1
+
+    @property
+    def devices(self) -> List[str]:
+        """Gets the monitored devices.
+
+        Returns:
+            List[str]: Device names.
+        """
+        return list(self.__devices)
+
+    @property
+    def power_models(self) -> Dict[str, IoPowerModel]:
+        """Gets the power model of every device.
+
+        Returns:
+            Dict[str, IoPowerModel]: Model by device name.
+        """
+        return dict(self.__models)
+
+    def set_power_model(self, device: str, model: IoPowerModel) -> None:
+        """Replaces the power model of a device, e.g. with values measured
+           on the host.
+
+        Args:
+            device (str): Device name.
+            model (IoPowerModel): New power model.
+
+        Raises:
+            KeyError: If the device is not monitored.
+        """
+        if device not in self.__models:
+            raise KeyError(device)
+
+        self.__models[device] = model
+
+    def get_power(self) -> float:
+        """Returns the power of the monitored devices in W since the previous
+           read.
+
+        Returns:
+            float: Sum of the modelled power of the devices.
+
+        Raises:
+            SensorReadException: If the counters cannot be read.
+        """
+        try:
+            with self.__lock:
+                now, devices, process = time.monotonic(), self.__read_device_bytes(), self.__read_process_bytes()
+                last_time, last_devices, last_process = self.__last
+                self.__last = (now, devices, process)
+        except (OSError, ValueError, IndexError) as e:
+            raise SensorReadException(self._hardware_type(), 'Error reading I/O counters: ' + str(e))
+
+        elapsed = max(now - last_time, 1e-9)
+        transferred = {device: max(devices[device] - last_devices.get(device, devices[device]), 0)
+                       for device in devices}
+        total = sum(transferred.values())
+
+        self.__device_power = {device: self.__models[device].power(transferred[device] / elapsed) for device in devices}
+        self.__share = min(max(process - last_process, 0) / total, 1.0) if total > 0 else 0.0
+
+        return sum(self.__device_power.values())
+
+    @property
+    def counts_process_bytes(self) -> bool:
+        """Tells whether the share of the process is known from the bytes
+           it transferred.
+
+        Returns:
+            bool: True if 'get_share' gives the share of the process.
+        """
+        return True
+
+    def get_share(self) -> float:
+        """Returns the share of the process in the bytes of the last read.
+
+        Returns:
+            float: Fraction between 0 and 1 of the device power attributed to
+            the process.
+        """
+        return self.__share
+
+    def get_device_power(self) -> Dict[str, float]:
+        """Returns the power of each device at the last read.
+
+        Returns:
+            Dict[str, float]: Power in W by device name.
+        """
+        return dict(self.__device_power)
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class IoPowerModel():
+    """Power model of a storage or network device.
+
+    The device draws its idle power plus a fixed energy for every byte it
+    transfers:
+
+        power = idle_power + joules_per_byte * bytes / second
+
+    Attributes:
+        idle_power (float): Power in W of the device when it transfers
+        nothing.
+        joules_per_byte (float): Energy in J of every byte read or written
+        (storage), received or sent (network).
+    """
+    idle_power: float
+    joules_per_byte: float
+
+    def power(self, bytes_per_second: float) -> float:
+        """Computes the power of the device at a throughput.
+
+        Args:
+            bytes_per_second (float): Bytes transferred per second.
+
+        Returns:
+            float: Power in W.
+        """
+        return self.idle_power + self.joules_per_byte * max(bytes_per_second, 0.0)
@@ -0,0 +1,378 @@
+from .timeline_analyzer import TimelineAnalyzer
+
+from typing import Any, Dict, Iterator, List, Tuple, Union
+import argparse
+import bisect
+import glob
+import json
+import math
+import os
+
+class JobEnergyMerger():
+    """Combines the samples written by every rank of a distributed job.
+
+    The records of each rank ('DirectorySampleSink' or 'SampleCollector'
+    layout) are loaded into one timeline per rank, placed on a common wall
+    clock, and summed into job-wide energy per phase. Phases are the regions
+    marked with 'Monitor.region': the k-th occurrence of a region name spans
+    from its earliest start to its latest end across ranks.
+
+    Energy that several co-located ranks read from the same source is only
+    counted once. Each rank declares the scope of its values: 'process'
+    values are disjoint and summed over ranks, while any other scope (such as
+    'host' for package and GPU power, or 'cgroup:<path>' for a container) is
+    taken, at each instant, from the lowest rank of the host sharing it that
+    has a sample then. Host energy outside the span or the pauses of one
+    rank is thus still counted, and only once. Two views are produced:
+    'attributed', the energy attributed to the job processes, and 'sensor',
+    the energy read from the sensors of the hosts.
+
+    Like the totals of its monitor, a rank only counts from its last reset
+    or start: earlier samples and regions are left out.
+
+    Attributes:
+        __run_directory (str): Directory with one JSON lines file per rank.
+        __clock_offsets (Dict[str, float]): Seconds added to the timestamps
+        of each host.
+        __streams (Dict[Tuple[str, int], Dict[str, Any]]): Records of each
+        (host, rank).
+        __WATT_TO_KWH (float): Constant to convert energy from joules to
+        kilowatt-hours.
+    """
+    def __init__(self, run_directory: str, clock_offsets: Union[Dict[str, float], None] = None):
+        """
+        Args:
+            run_directory (str): Directory of the run, i.e. the sink directory
+            followed by the run id.
+            clock_offsets (Union[Dict[str, float], None]): Seconds added to the
+            timestamps of each host to correct clock skew (optional).
+
+        Raises:
+            FileNotFoundError: If the directory has no rank files.
+        """
+        self.__run_directory: str = run_directory
+        self.__clock_offsets: Dict[str, float] = dict(clock_offsets or {})
+        self.__WATT_TO_KWH: float = 3_600_000
+        self.__streams: Dict[Tuple[str, int], Dict[str, Any]] = self.__load()
+
+        if not self.__streams:
+            raise FileNotFoundError(f"No rank files found in {run_directory}")
+
+    def __load(self) -> Dict[Tuple[str, int], Dict[str, Any]]:
+        """Reads the records of every rank file.
+
+        Returns:
+            Dict[Tuple[str, int], Dict[str, Any]]: Meta data, samples and
+            regions by (host, rank).
+        """
+        streams: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+        for path in sorted(glob.glob(os.path.join(self.__run_directory, '*.jsonl'))):
+            with open(path, 'r') as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                        key = (str(record['host']), int(record['rank']))
+                    except (ValueError, KeyError, TypeError):
+                        continue
+
+                    offset = self.__clock_offsets.get(key[0], 0.0)
+                    stream = streams.setdefault(key, {'meta': {}, 'timestamps': [], 'periods': [],
+                                                      'power': {}, 'energy': {}, 'regions': [], 'cut': -math.inf})
+
+                    if record.get('type') == 'meta':
+                        stream['meta'] = record
+
+                        if 'start' in record:
+                            stream['cut'] = max(stream['cut'], record['start'] + offset)
+                    elif record.get('type') == 'reset':
+                        stream['cut'] = max(stream['cut'], record['timestamp'] + offset)
+                    elif record.get('type') == 'sample':
+                        stream['timestamps'].append(record['timestamp'] + offset)
+                        stream['periods'].append(record['period'])
+
+                        for component, value in record['power'].items():
+                            stream['power'].setdefault(component, []).append(value)
+
+                        for component, value in record['energy'].items():
+                            stream['energy'].setdefault(component, []).append(value)
+                    elif record.get('type') == 'region':
+                        stream['regions'].append((record['name'], record['start'] + offset, record['end'] + offset))
+
+        for stream in streams.values():
+            JobEnergyMerger.__cut(stream)
+
+        return streams
+
+    @staticmethod
+    def __cut(stream: Dict[str, Any]) -> None:
+        """Drops the samples and regions of a rank before its last reset or
+           start, prorating the sample across it.
+
+        Args:
+            stream: Records of the rank.
+        """
+        cut = stream['cut']
+        kept: List[int] = []
+        fractions: List[float] = []
+
+        for index, (timestamp, period) in enumerate(zip(stream['timestamps'], stream['periods'])):
+            if timestamp <= cut:
+                continue
+
+            kept.append(index)
+            fractions.append(min((timestamp - cut) / period, 1.0) if period > 0 else 1.0)
+
+        stream['timestamps'] = [stream['timestamps'][index] for index in kept]
+        stream['periods'] = [stream['periods'][index] * fraction for index, fraction in zip(kept, fractions)]
+        stream['power'] = {component: [values[index] for index in kept] for component, values in stream['power'].items()}
+        stream['energy'] = {component: [values[index] * fraction for index, fraction in zip(kept, fractions)]
+                            for component, values in stream['energy'].items()}
+        stream['regions'] = [(name, max(start, cut), end) for name, start, end in stream['regions'] if end > cut]
+
+    @property
+    def ranks(self) -> List[Tuple[str, int]]:
+        """Gets the ranks found in the run directory.
+
+        Returns:
+            List[Tuple[str, int]]: (host, rank) of every rank.
+        """
+        return sorted(self.__streams)
+
+    def __intervals(self, key: Tuple[str, int], view: str, component: str) -> Iterator[Tuple[float, float, float]]:
+        """Lists the sampled periods of a component of a rank.
+
+        Args:
+            key: (host, rank).
+            view: 'attributed' or 'sensor'.
+            component: Component name.
+
+        Returns:
+            Iterator[Tuple[float, float, float]]: Start, end and mean power in
+            W of each period.
+        """
+        stream = self.__streams[key]
+        values = stream['energy' if view == 'attributed' else 'power'].get(component, [])
+
+        for timestamp, period, value in zip(stream['timestamps'], stream['periods'], values):
+            if period > 0:
+                yield timestamp - period, timestamp, value * self.__WATT_TO_KWH / period if view == 'attributed' else value
+
+    @staticmethod
+    def __uncovered(starts: List[float], ends: List[float], start: float, end: float) -> Iterator[Tuple[float, float]]:
+        """Lists the parts of a period outside sorted, disjoint intervals.
+
+        Args:
+            starts: Start of each interval.
+            ends: End of each interval.
+            start: Start of the period.
+            end: End of the period.
+
+        Returns:
+            Iterator[Tuple[float, float]]: Uncovered parts as (start, end).
+        """
+        cursor = start
+
+        for index in range(bisect.bisect_right(ends, start), len(starts)):
+            if starts[index] >= end:
+                break
+
+            if starts[index] > cursor:
+                yield cursor, starts[index]
+
+            cursor = max(cursor, ends[index])
+
+        if cursor < end:
+            yield cursor, end
+
+    def __analyzer(self, keys: List[Tuple[str, int]], view: str, component: str) -> TimelineAnalyzer:
+        """Builds the analyzer of a component shared by ranks.
+
+        Each instant is taken from the first rank, in the given order, with a
+        sample covering it.
+
+        Args:
+            keys: (host, rank) of the ranks sharing the component.
+            view: 'attributed' or 'sensor'.
+            component: Component name.
+
+        Returns:
+            TimelineAnalyzer: Analyzer over the power of the component.
+        """
+        covered: List[Tuple[float, float]] = []
+        pieces: List[Tuple[float, float, float]] = []
+
+        for key in keys:
+            starts = [start for start, _ in covered]
+            ends = [end for _, end in covered]
+
+            for start, end, power in self.__intervals(key, view, component):
+                pieces.extend((piece_start, piece_end, power)
+                              for piece_start, piece_end in self.__uncovered(starts, ends, start, end))
+
+            covered = []
+
+            for start, end, _ in sorted(pieces):
+                if covered and start <= covered[-1][1]:
+                    covered[-1] = (covered[-1][0], max(covered[-1][1], end))
+                else:
+                    covered.append((start, end))
+
+        pieces.sort(key=lambda piece: piece[1])
+
+        return TimelineAnalyzer([end for _, end, _ in pieces], {component: [power for _, _, power in pieces]},
+                                [end - start for start, end, _ in pieces])
+
+    def __sources(self, view: str) -> Dict[str, List[List[Tuple[str, int]]]]:
+        """Groups the ranks sharing the values of each component.
+
+        Args:
+            view: 'attributed' or 'sensor'.
+
+        Returns:
+            Dict[str, List[List[Tuple[str, int]]]]: Groups of ranks, lowest
+            rank first, by component name.
+        """
+        scopes_key = 'scopes' if view == 'attributed' else 'sensor_scopes'
+        groups: Dict[str, Dict[Tuple[str, str], List[Tuple[str, int]]]] = {}
+
+        for host, rank in sorted(self.__streams, key=lambda key: (key[0], key[1])):
+            stream = self.__streams[(host, rank)]
+            scopes = stream['meta'].get(scopes_key, {})
+
+            for component in stream['energy']:
+                scope = scopes.get(component, 'process')
+                group = (host, scope) if scope != 'process' else (host, f"process:{rank}")
+                groups.setdefault(component, {}).setdefault(group, []).append((host, rank))
+
+        return {component: list(ranks.values()) for component, ranks in groups.items()}
+
+    def phases(self) -> List[Tuple[str, float, float]]:
+        """Computes the job-wide span of every phase.
+
+        Returns:
+            List[Tuple[str, float, float]]: Phases as (name, start, end), where
+            the k-th occurrence of a name spans from its earliest start to its
+            latest end across ranks.
+        """
+        spans: Dict[Tuple[str, int], List[float]] = {}
+        order: List[Tuple[str, int]] = []
+
+        for stream in self.__streams.values():
+            occurrences: Dict[str, int] = {}
+
+            for name, start, end in stream['regions']:
+                index = occurrences.get(name, 0)
+                occurrences[name] = index + 1
+
+                if (name, index) not in spans:
+                    spans[(name, index)] = [start, end]
+                    order.append((name, index))
+                else:
+                    spans[(name, index)][0] = min(spans[(name, index)][0], start)
+                    spans[(name, index)][1] = max(spans[(name, index)][1], end)
+
+        return sorted(((name, spans[(name, index)][0], spans[(name, index)][1]) for name, index in order),
+                      key=lambda phase: phase[1])
+
+    def energy_per_phase(self, view: str = 'attributed') -> Dict[str, Dict[str, float]]:
+        """Computes the job-wide energy of each component in each phase.
+
+        Args:
+            view (str): 'attributed' for the energy attributed to the job
+            processes or 'sensor' for the energy read from the host sensors
+            (optional, default is 'attributed').
+
+        Returns:
+            Dict[str, Dict[str, float]]: Energy in kWh by phase name and
+            component name, with the whole job under the 'total' key.
+
+        Example:
+            ```python
+            from power_pyro.job_energy_merger import JobEnergyMerger
+
+            merger = JobEnergyMerger('/shared/energy/job-42')
+            print(merger.energy_per_phase())
+            # {'forward': {'cpu': 0.012, 'gpu': 0.31}, 'total': {'cpu': 0.02, 'gpu': 0.5}}
+            ```
+        """
+        phases = self.phases()
+        result: Dict[str, Dict[str, float]] = {'total': {}}
+
+        for component, groups in self.__sources(view).items():
+            for keys in groups:
+                analyzer = self.__analyzer(keys, view, component)
+
+                for name, values in analyzer.energy_per_region(phases).items():
+                    result.setdefault(name, {})
+                    result[name][component] = result[name].get(component, 0.0) + values[component]
+
+                result['total'][component] = result['total'].get(component, 0.0) + analyzer.energy()[component]
+
+        return result
+
+    def timeline(self, step: float, view: str = 'attributed') -> Tuple[Any, Dict[str, Any]]:
+        """Resamples the job-wide power of each component onto a common grid.
+
+        Args:
+            step (float): Grid step in seconds.
+            view (str): 'attributed' or 'sensor' (optional, default is
+            'attributed').
+
+        Returns:
+            Tuple[np.ndarray, Dict[str, np.ndarray]]: Start of each grid cell
+            and the job-wide mean power in W of each cell by component name.
+        """
+        analyzers = [(component, self.__analyzer(keys, view, component))
+                     for component, groups in self.__sources(view).items() for keys in groups]
+        analyzers = [(component, analyzer) for component, analyzer in analyzers if analyzer.timestamps.size]
+        start = min(float(analyzer.timestamps[0]) for _, analyzer in analyzers)
+        end = max(float(analyzer.timestamps[-1]) for _, analyzer in analyzers)
+
+        grid = None
+        power: Dict[str, Any] = {}
+
+        for component, analyzer in analyzers:
+            grid, values = analyzer.resample(step, start, end)
+            power[component] = power[component] + values[component] if component in power else values[component]
+
+        return grid, power
+
+    def summary(self) -> Dict[str, Any]:
+        """Summarises the job as a JSON serializable dictionary.
+
+        Returns:
+            Dict[str, Any]: Ranks, phases and the energy per phase of both views.
+        """
+        return {'ranks': [{'host': host, 'rank': rank} for host, rank in self.ranks],
+                'phases': [{'name': name, 'start': start, 'end': end} for name, start, end in self.phases()],
+                'attributed': self.energy_per_phase('attributed'),
+                'sensor': self.energy_per_phase('sensor')}
+
+def main(arguments: Union[List[str], None] = None) -> int:
+    """Prints the merged energy of a run as JSON.
+
+    Args:
+        arguments (Union[List[str], None]): Command line arguments (optional,
+        default is 'sys.argv').
+
+    Returns:
+        int: Exit code.
+    """
+    parser = argparse.ArgumentParser(prog='python -m power_pyro.job_energy_merger',
+                                     description='Merge the energy samples of every rank of a job.')
+    parser.add_argument('run_directory', help='directory with one JSON lines file per rank')
+    parser.add_argument('--clock-offset', action='append', default=[], metavar='HOST=SECONDS',
+                        help='seconds added to the timestamps of a host')
+    options = parser.parse_args(arguments)
+
+    offsets = {}
+    for value in options.clock_offset:
+        host, _, seconds = value.partition('=')
+        offsets[host] = float(seconds)
+
+    print(json.dumps(JobEnergyMerger(options.run_directory, offsets).summary(), indent=2))
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -1,10 +1,19 @@
 from .hardware_component import HardwareComponent
 from .os_type import OsType
+from .sensor_read_exception import SensorReadException
+from .hardware_type import HardwareType as HT
+from .cgroup import Cgroup
+from .process_tree import ProcessTree
+from .resource_unavailable_exception import ResourceUnavailableException
+from .numa_topology import NumaTopology
+from .numa_maps_reader import NumaMapsReader
 
+from typing import Dict, List, Tuple, Union
 import os
 import psutil
 import subprocess
 import re
+import time
 
 if os.name == 'nt':
     import wmi
@@ -13,12 +22,113 @@ class Memory(HardwareComponent):
     """Represents a Memory component responsible for calculating power consumption
        based on the amount of memory used.
 
+    On Linux hosts with several NUMA nodes, the memory is split by the node 
+    it resides on and each node uses its own watts per GB, from the modules 
+    it holds. The residency comes from 'memory.numa_stat' for a cgroup and 
+    from 'numa_maps' for processes. As 'numa_maps' grows with the address 
+    space, it is only parsed again when the measured memory changed by more 
+    than 5% or after 30 seconds; in between, the last split by node is 
+    applied to the memory read at each sample.
+
     Attributes:
         __WATT_PER_GB (float): Power consumption per GB of memory.
+        __COMMAND_TIMEOUT (float): Maximum time in seconds a probe command 
+        may run before it is killed.
+        __cgroup (Union[Cgroup, None]): Cgroup whose working set is measured 
+        instead of the resident memory of the process, if any.
+        __process_tree (Union[ProcessTree, None]): Process tree whose resident 
+        memory is measured instead of the one of the process, if any.
+        __modules (List[Tuple[float, str]]): Size in GB and locators of the 
+        installed memory modules, if 'dmidecode' lists them.
+        __numa (Union[NumaTopology, None]): NUMA nodes of the host, if it has 
+        more than one.
+        __numa_readers (Dict[int, NumaMapsReader]): Open 'numa_maps' of the 
+        measured processes by process id.
+        __node_fractions (Dict[int, float]): Fraction of the measured memory 
+        on each node at the last residency read.
+        __resident_at_refresh (float): Measured memory in bytes at the last 
+        residency read.
+        __refreshed_at (float): Monotonic time of the last residency read.
+        __node_shares (Dict[str, float]): Fraction of the last power read 
+        drawn by each node, by node name ('node0').
+        __NUMA_TOLERANCE (float): Relative change of the measured memory 
+        that triggers a new residency read.
+        __NUMA_MAX_AGE (float): Time in seconds after which the residency is 
+        read again.
     """
     def __init__(self, operating_system: OsType):
         super().__init__(operating_system)
+        self.__COMMAND_TIMEOUT: float = 5.0
+        self.__modules: List[Tuple[float, str]] = []
         self.__WATT_PER_GB: float = self.__watt_per_gb()
+        self.__cgroup: Union[Cgroup, None] = None
+        self.__process_tree: Union[ProcessTree, None] = None
+        self.__numa: Union[NumaTopology, None] = self.__open_numa_topology()
+        self.__numa_readers: Dict[int, NumaMapsReader] = {}
+        self.__node_fractions: Dict[int, float] = {}
+        self.__resident_at_refresh: float = 0.0
+        self.__refreshed_at: float = 0.0
+        self.__node_shares: Dict[str, float] = {}
+        self.__NUMA_TOLERANCE: float = 0.05
+        self.__NUMA_MAX_AGE: float = 30.0
+
+    def use_cgroup(self, cgroup: Union[Cgroup, None]) -> None:
+        """Measures the working set of a cgroup instead of the resident 
+           memory of the process.
+
+        Args:
+            cgroup (Union[Cgroup, None]): Cgroup to measure, or None to go back 
+            to the resident memory of the process.
+        """
+        self.__cgroup = cgroup
+        self.__refreshed_at = 0.0
+
+    def use_process_tree(self, process_tree: Union[ProcessTree, None]) -> None:
+        """Measures the resident memory of a process tree instead of the one 
+           of the process.
+
+        Args:
+            process_tree (Union[ProcessTree, None]): Process tree to measure, 
+            or None to go back to the resident memory of the process.
+        """
+        self.__process_tree = process_tree
+        self.__refreshed_at = 0.0
+
+    def __open_numa_topology(self) -> Union[NumaTopology, None]:
+        """Reads the NUMA nodes of the host.
+
+        Returns:
+            Union[NumaTopology, None]: The topology, or None if the host has a 
+            single node or is not a Linux host.
+        """
+        if self.operating_system != OsType.LINUX:
+            return None
+
+        try:
+            topology = NumaTopology(self.__WATT_PER_GB, self.__modules)
+        except OSError:
+            return None
+
+        return topology if len(topology.nodes) > 1 else None
+
+    @property
+    def numa_topology(self) -> Union[NumaTopology, None]:
+        """Gets the NUMA nodes the memory power is split by.
+
+        Returns:
+            Union[NumaTopology, None]: The topology, or None if the host has a 
+            single node.
+        """
+        return self.__numa
+
+    def get_node_shares(self) -> Dict[str, float]:
+        """Gets the fraction of the last power read drawn by each NUMA node.
+
+        Returns:
+            Dict[str, float]: Fraction by node name ('node0', 'node1', ...), 
+            empty if the host has a single node.
+        """
+        return self.__node_shares
     
     def __watt_per_gb(self) -> float:
         """Calculates the power consumption per GB of memory.
@@ -68,28 +178,127 @@ class Memory(HardwareComponent):
             RuntimeError: Unable to get information from memory.
         """
         try:
-            output = subprocess.check_output(["sudo", "dmidecode", "-t", "memory"], universal_newlines=True)
+            # '-n' makes sudo fail instead of waiting for a password prompt.
+            output = subprocess.check_output(["sudo", "-n", "dmidecode", "-t", "memory"], universal_newlines=True,
+                                             timeout=self.__COMMAND_TIMEOUT)
 
             num_memory_modules_found = len(re.findall(r"\tSize:", output))
             number_unused_memory_modules = len(re.findall(r"Size: No Module Installed", output))
 
             num_memory_modules = num_memory_modules_found - number_unused_memory_modules
+            self.__modules = self.__read_modules(output)
             
             gb_per_module = re.findall(r"\tSize: \d+ \w+", output)
             gb_per_module = gb_per_module[0].split(": ")
             gb_per_module = gb_per_module[1].split(" ")
             gb_per_module = int(gb_per_module[0])
-        except (FileNotFoundError, PermissionError, subprocess.CalledProcessError, IndexError, ValueError):
+        except (FileNotFoundError, PermissionError, subprocess.CalledProcessError, subprocess.TimeoutExpired, IndexError, ValueError):
             raise RuntimeError("Unable to get watts per GB information from memory")
 
         return (5 * num_memory_modules)/gb_per_module 
     
+    @staticmethod
+    def __read_modules(output: str) -> List[Tuple[float, str]]:
+        """Lists the installed modules of a 'dmidecode -t memory' output.
+
+        Args:
+            output: Output of 'dmidecode'.
+
+        Returns:
+            List[Tuple[float, str]]: Size in GB and locators ('Bank Locator' 
+            then 'Locator') of every installed module.
+        """
+        modules: List[Tuple[float, str]] = []
+
+        for device in output.split('\n\n'):
+            if 'Memory Device' not in device:
+                continue
+
+            size = re.search(r"\tSize: (\d+) (\w+)", device)
+            bank = re.search(r"\tBank Locator: (.*)", device)
+            locator = re.search(r"\tLocator: (.*)", device)
+
+            if size is None:
+                continue
+
+            gigabytes = int(size.group(1)) / (1024 if size.group(2) == 'MB' else 1)
+            modules.append((gigabytes, ' '.join(match.group(1).strip() for match in (bank, locator) if match)))
+
+        return modules
+
+    def __read_node_residency(self) -> Dict[int, int]:
+        """Reads where the measured memory resides.
+
+        Returns:
+            Dict[int, int]: Measured memory in bytes by node id.
+
+        Raises:
+            OSError: If 'numa_maps' cannot be read.
+            ResourceUnavailableException: If the cgroup has no NUMA 
+            statistics.
+        """
+        if self.__cgroup is not None:
+            return self.__cgroup.read_numa_working_set()
+
+        pids = self.__process_tree.read_pids() if self.__process_tree is not None else [os.getpid()]
+        residency: Dict[int, int] = {}
+
+        for pid in [pid for pid in self.__numa_readers if pid not in pids]:
+            self.__numa_readers.pop(pid).close()
+
+        for pid in pids:
+            try:
+                if pid not in self.__numa_readers:
+                    self.__numa_readers[pid] = NumaMapsReader('self' if pid == os.getpid() else pid)
+
+                for node, size in self.__numa_readers[pid].read().items():
+                    residency[node] = residency.get(node, 0) + size
+            except OSError:
+                # A descendant may exit between the listing and the read.
+                if pid == pids[0]:
+                    raise
+
+        return residency
+
+    def __split_by_node(self, resident: float) -> Dict[int, float]:
+        """Splits the measured memory by the node it resides on.
+
+        Args:
+            resident: Measured memory in bytes.
+
+        Returns:
+            Dict[int, float]: Memory in bytes by node id.
+
+        Raises:
+            OSError: If 'numa_maps' cannot be read.
+            ResourceUnavailableException: If the cgroup has no NUMA 
+            statistics.
+        """
+        now = time.monotonic()
+        changed = abs(resident - self.__resident_at_refresh) > self.__NUMA_TOLERANCE * self.__resident_at_refresh
+
+        if not self.__node_fractions or changed or now - self.__refreshed_at > self.__NUMA_MAX_AGE:
+            residency = self.__read_node_residency()
+            total = sum(residency.values())
+
+            if total > 0:
+                self.__node_fractions = {node: size / total for node, size in residency.items()}
+
+            self.__resident_at_refresh = resident
+            self.__refreshed_at = now
+
+        return {node: resident * fraction for node, fraction in self.__node_fractions.items()}
+
     def get_power(self) -> float:
         """Returns the power consumption of the memory in W.
 
         Returns:
             float: Memory power consumption.
 
+        Raises:
+            SensorReadException: If the memory usage of the process (or of its 
+            cgroup) cannot be read.
+
         Example:
             Monitor and print memory power consumption:
 
@@ -103,13 +312,32 @@ class Memory(HardwareComponent):
 
         """
         try:
-            pid = os.getpid()
-            process = psutil.Process(pid)
-
-            power = process.memory_info().rss
-            power /= (1024 ** 3)
-            power *= self.__WATT_PER_GB
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess) as e:
-            print('Error getting power from memory:', str(e))
+            if self.__cgroup is not None:
+                resident = self.__cgroup.read_working_set()
+            elif self.__process_tree is not None:
+                resident = self.__process_tree.read_rss()
+            else:
+                pid = os.getpid()
+                process = psutil.Process(pid)
+
+                resident = process.memory_info().rss
+
+            power = resident / (1024 ** 3) * self.__WATT_PER_GB
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess,
+                ResourceUnavailableException, OSError, ValueError) as e:
+            raise SensorReadException(HT.MEMORY, 'Error getting power from memory: ' + str(e))
+
+        if self.__numa is not None:
+            try:
+                nodes = self.__numa.power(self.__split_by_node(resident))
+
+                if nodes:
+                    power = sum(nodes.values())
+                    self.__node_shares = {f'node{node}': value / power if power > 0 else 0.0
+                                          for node, value in nodes.items()}
+            except (ResourceUnavailableException, OSError, ValueError) as e:
+                print('Error splitting memory power by NUMA node: ', str(e))
+                self.__numa = None
+                self.__node_shares = {}
         
         return power
\ No newline at end of file
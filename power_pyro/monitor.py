@@ -1,32 +1,107 @@
 from .hardware_component import HardwareComponent
 from .invalid_keys_error_exception import InvalidKeysErrorException
-from .hardware_component_factory import HardwareComponentFactory
-from .cpu_component_factory import CpuComponentFactory
-from .gpu_component_factory import GpuComponentFactory
-from .memory_component_factory import MemoryComponentFactory
 from .os_type import OsType
+from .calibration_profile import CalibrationProfile
+from .idle_power_calibrator import IdlePowerCalibrator
+from .sample_timeline import SampleTimeline
+from .attribution_type import AttributionType
+from .cpu_attribution_model import CpuAttributionModel
+from .sample_sink import SampleSink
+from .sample import Sample
+from .sample_subscription import SampleSubscription
+from .delivery_policy import DeliveryPolicy
+from .tiered_retention import TieredRetention
+from .sampler import Sampler
+from .raw_recording import RawRecording
+from .energy_snapshot import EnergySnapshot
+from .work_counter import WorkCounter
 
-from typing import Dict, Any
+from typing import Dict, Any, Union, Iterator, Callable, List, Tuple
+from collections import deque
+from contextlib import contextmanager
+import math
 import time
 import os
-from threading import Thread
+import weakref
+from threading import Lock
 
 class Monitor():
     """
     Class responsible for monitoring the energy consumption of 
     selected hardware components 
-    (CPU, GPU, and memory) in a system.
+    (CPU, GPU, memory, storage and network) in a system.
+
+    Every monitor of a process attaches to a shared 'Sampler', so the sensors 
+    are read by a single thread however many monitors are live. Each monitor 
+    only counts the energy of its own start/end window, less the time it was 
+    paused. A monitor can be started again after 'end', and its totals are 
+    published as immutable 'EnergySnapshot' objects after every sample, so 
+    reading them never blocks the sampling thread.
 
     Attributes:
         __operating_system (OsType): The current operating system.
+        __sampler (Sampler): Shared sampler reading the sensors.
         __components (Dict[str, HardwareComponent]): Dictionary of initialized 
         hardware components.
-        __stop_sign (bool): Flag to stop the monitoring loop.
-        __thread (Thread): Thread in which monitoring occurs.
+        __unavailable (Dict[str, str]): Why discovery failed, by name of the 
+        required components that could not be created.
+        __energy (Dict[str, float]): Energy in kWh attributed to the monitored 
+        process during the window, by component name.
+        __dynamic_energy (Dict[str, float]): Energy in kWh above idle power 
+        during the window, by component name.
+        __memory_node_energy (Dict[str, float]): Memory energy in kWh 
+        attributed during the window, by NUMA node name.
+        __window_start (Union[float, None]): Start of the window (Unix time), 
+        None before 'start'.
+        __window_end (float): End of the window (Unix time), infinite while 
+        monitoring.
+        __running (bool): Whether the monitor is attached to the sampler.
+        __paused (bool): Whether the monitor was paused since its last start.
+        __version (int): Samples counted since the creation or the last reset.
+        __epoch (int): Number of resets.
+        __duration (float): Time in seconds covered by the counted samples.
+        __pending_reset (Union[float, None]): Time of a reset requested while 
+        running, applied by the sampling thread with the next sample.
+        __snapshot (EnergySnapshot): Totals as of the last counted sample, 
+        replaced as a whole so it is read without a lock.
+        __work_counter (WorkCounter): Units of work counted by the threads of 
+        the process, merged at every sample.
+        __work (Dict[str, float]): Units of work counted during the window, 
+        by counter name.
+        __work_window (float): Duration in seconds of the rolling energy per 
+        unit of work.
+        __work_history (deque): End, duration, energy in J and units of work 
+        of the samples of the rolling window.
+        __rolling_work (Tuple[float, float, Dict[str, float]]): Duration, 
+        energy in J and units of work of the rolling window, replaced as a 
+        whole so it is read without a lock.
         __WATT_TO_KWH (float): Constant to convert energy from 
         watts to kilowatt-hours.
+        __calibration_profile (Union[CalibrationProfile, None]): Idle power 
+        baseline used to compute dynamic energy, if idle calibration is enabled.
+        __sampling_interval (float): Time in seconds between two samples.
+        __timeline (SampleTimeline): Samples taken during monitoring.
+        __sink (Union[SampleSink, None]): Destination of the samples, if any.
+        __sink_lock (Lock): Serializes the records written to the sink.
+        __subscriptions (List[SampleSubscription]): Subscribers receiving each 
+        sample as it is taken.
+        __subscriptions_lock (Lock): Guards the list of subscribers.
+        __retention (Union[TieredRetention, None]): Downsampled history of the 
+        timeline, if raw samples are only kept for a recent window.
+        __raw_recording (Union[RawRecording, None]): Raw inputs of every 
+        sample, if they are recorded.
+        __record_telemetry (bool): Whether the CPU telemetry of every sample 
+        is recorded.
+        __publish_raw (bool): Whether the samples delivered to subscribers 
+        carry the raw counters.
     """
-    def __init__(self, required_components: Dict[str, bool]):
+    def __init__(self, required_components: Dict[str, bool], idle_calibration: bool = False,
+                 calibration_window: float = 30.0, recalibrate: bool = False,
+                 sampling_interval: float = 10.0, read_timeout: float = 5.0,
+                 attribution: AttributionType = AttributionType.CPU_PERCENT,
+                 sink: Union[SampleSink, None] = None, retention: Union[TieredRetention, None] = None,
+                 record_raw: bool = False, pid: Union[int, None] = None, record_telemetry: bool = False,
+                 work_window: float = 60.0, publish_raw: bool = False):
         """
         Initializes the Monitor class by setting up the operating system, 
         validating required components, creating component instances,
@@ -34,11 +109,79 @@ class Monitor():
 
         Args:
             required_components (Dict[str, bool]): Dictionary specifying which 
-            components ('cpu', 'gpu', 'memory') should be monitored.
+            components ('cpu', 'gpu', 'memory', 'storage', 'network') should 
+            be monitored. Storage and network power is modelled from the bytes 
+            transferred by the devices of the host. Storage is attributed by 
+            the share of those bytes the process transferred, network by its 
+            CPU share unless it has a network namespace of its own.
+            idle_calibration (bool): Whether the dynamic (above idle) energy 
+            should be reported next to the total energy (optional, default 
+            is False). The idle baseline of the host is loaded from its 
+            stored calibration profile, or measured and stored if there is 
+            none for the monitored hardware.
+            calibration_window (float): Duration in seconds of the idle 
+            sampling when a calibration is needed (optional, default is 30).
+            recalibrate (bool): Whether a stored calibration profile should be 
+            ignored and measured again (optional, default is False).
+            sampling_interval (float): Time in seconds between two samples 
+            (optional, default is 10). When other monitors of the process 
+            share the sampler, samples are taken at the shortest interval 
+            among them.
+            read_timeout (float): Time in seconds a sensor read may take before 
+            the last good value is used instead (optional, default is 5). 
+            Monitors share a sampler when they use the same read timeout and 
+            attribution.
+            attribution (AttributionType): How energy is attributed to the 
+            monitored workload (optional, default is 
+            AttributionType.CPU_PERCENT). With AttributionType.PERF_COUNTERS 
+            CPU power is split by the share of CPU cycles of the process. With 
+            AttributionType.CGROUP the whole cgroup v2 of the process (e.g. a 
+            container) is monitored: CPU power is split by the cgroup share of 
+            host CPU time and memory power follows the cgroup working set. 
+            Both fall back to the CPU percent share and the resident memory 
+            of the process when their sources are unavailable.
+            sink (Union[SampleSink, None]): Destination where every sample and 
+            region is also written, tagged with the run id, rank and host, 
+            so the ranks of a distributed job can be merged with 
+            'JobEnergyMerger' (optional).
+            retention (Union[TieredRetention, None]): Keeps raw samples in the 
+            timeline only for the retention window and rolls every sample into 
+            coarser tiers, so memory stays fixed on long runs (optional, 
+            default is to keep every raw sample).
+            record_raw (bool): Whether the raw inputs of the attribution 
+            (process and host CPU time, hardware counters, GPU utilisation, 
+            RSS and PSS) are recorded with every sample, so the energy can be 
+            attributed again offline with 'OfflineAttribution' (optional, 
+            default is False).
+            pid (Union[int, None]): Process whose energy is measured together 
+            with every descendant it starts, e.g. a command launched by 
+            'powerpyro run' (optional, default is the current process).
+            record_telemetry (bool): Whether the CPU frequency, temperature 
+            and thermal throttling are read with every sample and stored in 
+            the timeline next to power, to correlate energy with frequency 
+            scaling and throttling (optional, default is False). Only Linux 
+            exposes them.
+            work_window (float): Duration in seconds over which the rolling 
+            energy per unit of work of 'get_energy_per_unit' is computed 
+            (optional, default is 60).
+            publish_raw (bool): Whether the samples delivered to subscribers 
+            carry the raw counters even if they are not recorded, e.g. the 
+            CPU time of the process during each sample (optional, default is 
+            False, or True if 'record_raw' is set).
         
+        Components are discovered concurrently. A required component that 
+        cannot be created (e.g. the GPU of a host without one) is not 
+        monitored and is reported by 'get_unavailable_components' instead, 
+        as long as another required component is available.
+
         Raises:
             InvalidKeysErrorException: If any invalid keys are found in 
             the provided dictionary.
+            ObjectCreationException: If none of the required components can 
+            be created.
+            ResourceUnavailableException: If the process 'pid' does not exist.
+            ValueError: If the sampling interval, the read timeout or the work 
+            window is not positive.
 
         Example:
             Basic usage monitoring only CPU:
@@ -64,12 +207,85 @@ class Monitor():
 
             monitor = Monitor({'cpu': True, 'gpu': True, 'memory': True})
             ```
+
+            Reporting dynamic energy with the host idle baseline:
+
+            ```python
+            from power_pyro import Monitor
+
+            monitor = Monitor({'cpu': True, 'gpu': True}, idle_calibration=True)
+            ```
+
+            Recording the CPU frequency and temperature next to power:
+
+            ```python
+            from power_pyro import Monitor
+
+            monitor = Monitor({'cpu': True}, sampling_interval=1.0, record_telemetry=True)
+            monitor.start()
+            # ... perform operations ...
+            monitor.end()
+            print(monitor.get_timeline().telemetry_columns()['cpu_frequency'])
+            ```
         """
+        if sampling_interval <= 0:
+            raise ValueError("Sampling interval must be positive")
+
+        if read_timeout <= 0:
+            raise ValueError("Read timeout must be positive")
+
+        if work_window <= 0:
+            raise ValueError("Work window must be positive")
+
+        if not self.__check_components(required_components):
+            raise InvalidKeysErrorException()
+
         self.__operating_system: OsType = self.__get_operating_system()
-        self.__components: Dict[str, HardwareComponent] = self.__create_components(required_components)
-        self.__stop_sign: bool = False
-        self.__thread:Thread = Thread(target=self.__monitor)
+        self.__sampler: Sampler = Sampler.shared(self.__operating_system, attribution, read_timeout, pid)
+        # The sampler stays shared until the last monitor using it is collected.
+        weakref.finalize(self, self.__sampler.release)
+        self.__components: Dict[str, HardwareComponent] = self.__sampler.require(
+            [key for key, required in required_components.items() if required])
+        self.__unavailable: Dict[str, str] = self.__sampler.get_unavailable(
+            [key for key, required in required_components.items() if required])
+        self.__energy: Dict[str, float] = {key: 0.0 for key in self.__components}
+        self.__dynamic_energy: Dict[str, float] = {key: 0.0 for key in self.__components}
+        self.__memory_node_energy: Dict[str, float] = {}
+        self.__window_start: Union[float, None] = None
+        self.__window_end: float = math.inf
+        self.__running: bool = False
+        self.__paused: bool = False
+        self.__version: int = 0
+        self.__epoch: int = 0
+        self.__duration: float = 0.0
+        self.__pending_reset: Union[float, None] = None
+        self.__work_counter: WorkCounter = WorkCounter()
+        self.__work: Dict[str, float] = {}
+        self.__work_window: float = work_window
+        self.__work_history: deque = deque()
+        self.__rolling_work: Tuple[float, float, Dict[str, float]] = (0.0, 0.0, {})
         self.__WATT_TO_KWH:float = 3_600_000
+        self.__calibration_profile: Union[CalibrationProfile, None] = None
+        self.__sampling_interval: float = sampling_interval
+        self.__retention: Union[TieredRetention, None] = retention
+        self.__timeline: SampleTimeline = SampleTimeline(list(self.__components), 
+                                                         retention.raw_window if retention is not None else None)
+
+        if retention is not None:
+            retention.bind(list(self.__components))
+
+        self.__raw_recording: Union[RawRecording, None] = RawRecording(list(self.__components)) if record_raw else None
+        self.__record_telemetry: bool = record_telemetry
+        self.__publish_raw: bool = publish_raw or record_raw
+        self.__sink: Union[SampleSink, None] = sink
+        self.__sink_lock: Lock = Lock()
+        self.__subscriptions: List[SampleSubscription] = []
+        self.__subscriptions_lock: Lock = Lock()
+
+        if idle_calibration:
+            self.__calibration_profile = self.__load_calibration_profile(calibration_window, recalibrate)
+
+        self.__snapshot: EnergySnapshot = self.__take_snapshot(time.time())
     
     def __get_operating_system(self) -> OsType:
         """Determines the operating system type.
@@ -110,7 +326,9 @@ class Monitor():
         """
         monitored_components:Dict[str, Any] = {'cpu': {'component': None, 'monitored': False}, 
                                                'gpu': {'component': None, 'monitored': False}, 
-                                               'memory': {'component': None, 'monitored': False}}
+                                               'memory': {'component': None, 'monitored': False},
+                                               'storage': {'component': None, 'monitored': False},
+                                               'network': {'component': None, 'monitored': False}}
 
         for key in self.__components.keys():
             monitored_components[key]['component'] = self.__components[key]
@@ -118,6 +336,24 @@ class Monitor():
         
         return monitored_components
 
+    def get_unavailable_components(self) -> Dict[str, str]:
+        """Retrieves the required components that could not be created.
+
+        Returns:
+            Dict[str, str]: Why the component could not be discovered, by 
+            component name.
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+
+            monitor = Monitor({'cpu': True, 'gpu': True})  # On a host without GPU
+            print(monitor.get_unavailable_components())
+            # {'gpu': 'Cannot create object: GPU: Unable to identify hardware manufacturer'}
+            ```
+        """
+        return dict(self.__unavailable)
+
     def __check_components(self, required_components: Dict[str, bool]) -> bool:
         """Validates the required components keys.
 
@@ -129,51 +365,125 @@ class Monitor():
                 - 'True' if all the dictionary keys are in the list, 
                 - 'False' otherwise.
         """
-        required_keys = ['cpu', 'gpu', 'memory']
+        required_keys = ['cpu', 'gpu', 'memory', 'storage', 'network']
 
         return len(required_components.keys()) <= len(required_keys) and all(key in required_keys for key in required_components)
     
-    def __create_components(self, required_components: Dict[str, bool]) -> Dict[str, HardwareComponent]:
-        """Creates the required hardware components using the appropriate factories.
+    def __load_calibration_profile(self, calibration_window: float, recalibrate: bool) -> CalibrationProfile:
+        """Loads the idle baseline of the host, calibrating it if needed.
+
+        A stored profile is reused when it was made on the same hardware for 
+        every monitored component, including components whose power could 
+        not be read then, so they do not trigger a new calibration. Otherwise the components are sampled over 
+        the calibration window and the new profile is stored, keeping the 
+        baselines of components that were not monitored this time.
 
         Args:
-            required_components: Dictionary indicating which components should be created.
+            calibration_window: Duration in seconds of the idle sampling.
+            recalibrate: Whether a stored profile should be ignored.
 
-        Returns: 
-            components: Dictionary containing the created hardware components.
+        Returns:
+            CalibrationProfile: The idle baseline of the monitored components.
+        """
+        hardware_names = IdlePowerCalibrator.hardware_names(self.__components)
+        stored_profile = CalibrationProfile.load()
 
-        Raises:
-            InvalidKeysErrorException: If the required components contain invalid keys.
+        if stored_profile is not None and not recalibrate and stored_profile.covers(hardware_names):
+            return stored_profile
+
+        profile = IdlePowerCalibrator(self.__components, calibration_window,
+                                      readers=self.__sampler.get_power_readers(list(self.__components))).calibrate()
+
+        if stored_profile is not None:
+            idle_power = stored_profile.idle_power
+
+            for key in profile.unavailable:
+                idle_power.pop(key, None)
+
+            idle_power.update(profile.idle_power)
+
+            names = stored_profile.hardware_names
+            names.update(profile.hardware_names)
+
+            unavailable = [key for key in stored_profile.unavailable if key not in profile.idle_power]
+            unavailable += [key for key in profile.unavailable if key not in unavailable]
+
+            profile = CalibrationProfile(profile.hostname, idle_power, names, profile.window, profile.created_at,
+                                         unavailable)
+
+        try:
+            profile.save()
+        except OSError as e:
+            print('Error saving calibration profile: ', str(e))
+
+        return profile
+
+    def get_calibration_profile(self) -> Union[CalibrationProfile, None]:
+        """Retrieves the idle baseline used to compute dynamic energy.
+
+        Returns:
+            Union[CalibrationProfile, None]: The calibration profile, or None 
+            if idle calibration is disabled.
         """
-        if not self.__check_components(required_components):
-            raise InvalidKeysErrorException()
+        return self.__calibration_profile
 
-        factories: Dict[str, HardwareComponentFactory] = { 
-            'cpu': CpuComponentFactory(),
-            'gpu': GpuComponentFactory(),
-            'memory': MemoryComponentFactory()
-        }
+    def get_cpu_attribution_model(self) -> Union[CpuAttributionModel, None]:
+        """Retrieves the model that attributes CPU power to the monitored process.
+
+        Returns:
+            Union[CpuAttributionModel, None]: The attribution model in use, 
+            which is the CPU percent model when the requested one could not 
+            be created, or None if the CPU is not monitored.
+        """
+        if 'cpu' not in self.__components:
+            return None
+
+        return self.__sampler.cpu_attribution_model
+
+    def get_power_sources(self) -> Dict[str, str]:
+        """Retrieves where the power of each monitored component comes from.
+
+        Returns:
+            Dict[str, str]: 'sensor' for power read from the hardware and 
+            'estimate' for power estimated by a model of the hardware (e.g. 
+            the CPU of a cloud VM without energy counters), by component name.
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+
+            monitor = Monitor({'cpu': True, 'memory': True})
+            print(monitor.get_power_sources())  # {'cpu': 'estimate', 'memory': 'sensor'}
+            ```
+        """
+        return self.__sampler.get_power_sources(list(self.__components))
+
+    def get_sensor_health(self) -> Dict[str, Dict[str, Any]]:
+        """Retrieves the read counters of every sensor backend.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: For each backend ('cpu', 'cpu_share', 
+            'gpu', 'memory'), the number of reads, timeouts, errors and stale 
+            reads, the mean, max and last read latency in seconds, the last 
+            error and whether the backend is degraded. The counters are shared 
+            by every monitor of the process using the same sampler.
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+
+            monitor = Monitor({'cpu': True, 'gpu': True}, read_timeout=2.0)
+            monitor.start()
+            # ... perform operations ...
+            print(monitor.get_sensor_health()['gpu'])
+            # {'reads': 12, 'timeouts': 1, 'errors': 0, 'stale_reads': 1, ...}
+            ```
+        """
+        return self.__sampler.get_sensor_health(list(self.__components))
 
-        components: Dict[str, HardwareComponent] = {}
-        
-        for component in required_components:
-            if required_components[component]:
-                components[component] = factories[component].create_component(self.__operating_system)
-    
-                if hasattr(components[component], 'open'):
-                    components[component].open()
-        
-        return components
-    
-    def __close_resources(self) -> None:
-        """Closes resources allocated by the components."""
-        for component in self.__components:
-            
-            if hasattr(self.__components[component], 'close'):
-                self.__components[component].close()
-    
     def get_energy_consumed_by_components(self) -> Dict[str, float]:
-        """Retrieves the total energy consumed by each hardware component.
+        """Retrieves the energy consumed by each hardware component during 
+           the monitoring window.
 
         Returns: 
             energy_consumed_by_components: A dictionary where the keys are component names ('cpu', 'gpu', 'memory') and the values are the energy consumed by each component.
@@ -186,20 +496,49 @@ class Monitor():
             ```
         """
         energy_consumed_by_components: Dict[str, float] = {}
+        energy = self.__snapshot.energy
 
         if 'cpu' in self.__components:
-            energy_consumed_by_components['cpu'] = self.__components['cpu'].total_energy_consumed
+            energy_consumed_by_components['cpu'] = energy['cpu']
 
             if 'gpu' in self.__components:
-                energy_consumed_by_components['gpu'] = self.__components['gpu'].total_energy_consumed
+                energy_consumed_by_components['gpu'] = energy['gpu']
 
                 if 'memory' in self.__components:
-                    energy_consumed_by_components['memory'] = self.__components['memory'].total_energy_consumed
+                    energy_consumed_by_components['memory'] = energy['memory']
             
             if 'memory' in self.__components:
-                energy_consumed_by_components['memory'] = self.__components['memory'].total_energy_consumed
+                energy_consumed_by_components['memory'] = energy['memory']
+
+        for key in ('storage', 'network'):
+            if key in self.__components:
+                energy_consumed_by_components[key] = energy[key]
         
         return energy_consumed_by_components
+
+    def get_memory_energy_by_node(self) -> Dict[str, float]:
+        """Retrieves the memory energy of the window split by NUMA node.
+
+        Each node draws the power of the memory of the workload residing on 
+        it, with the watts per GB of the modules it holds.
+
+        Returns:
+            Dict[str, float]: Energy in kWh by node name ('node0', 'node1', 
+            ...), empty if memory is not monitored or the host has a single 
+            node.
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+
+            monitor = Monitor({'cpu': True, 'memory': True})
+            monitor.start()
+            # ... perform operations ...
+            monitor.end()
+            print(monitor.get_memory_energy_by_node())  # {'node0': 1.2e-05, 'node1': 3.1e-06}
+            ```
+        """
+        return dict(self.__snapshot.memory_nodes)
     
     def total_energy_consumed(self) -> float:
         """Retrieves the total energy consumed by all components monitored.
@@ -221,44 +560,464 @@ class Monitor():
         
         """
 
-        total_energy_consumed: float = 0.0
+        return self.__snapshot.total_energy
 
-        for component in self.__components:
-            total_energy_consumed += self.__components[component].total_energy_consumed
+    def get_dynamic_energy_consumed_by_components(self) -> Dict[str, float]:
+        """Retrieves the energy consumed by each hardware component above 
+           its idle power.
 
-        return total_energy_consumed
+        Returns: 
+            A dictionary where the keys are component names ('cpu', 'gpu', 'memory') 
+            and the values are the dynamic energy consumed by each component, 
+            or an empty dictionary if idle calibration is disabled.
 
-    def __monitor(self) -> None:
-        """Monitors energy consumption of components at regular intervals."""
+        Example:
+            ```python
+            monitor = Monitor({'cpu': True, 'gpu': True}, idle_calibration=True)
+            monitor.start()
+            # ... perform operations ...
+            monitor.end()
 
-        while not self.__stop_sign:
-            start = time.time() 
+            print(monitor.get_energy_consumed_by_components())         # {'cpu': 2.5, 'gpu': 4.0}
+            print(monitor.get_dynamic_energy_consumed_by_components()) # {'cpu': 1.2, 'gpu': 0.9}
+            ```
+        """
+        return dict(self.__snapshot.dynamic_energy)
 
-            time.sleep(10)
-            
-            end = time.time() 
+    def total_dynamic_energy_consumed(self) -> float:
+        """Retrieves the energy consumed above idle power by all components 
+           monitored.
 
-            period = end - start
+        Returns:
+            float: Total dynamic energy, or 0.0 if idle calibration is disabled.
+        """
+        return sum(self.get_dynamic_energy_consumed_by_components().values())
 
-            if 'cpu' in self.__components: 
-                cpu = self.__components['cpu']
-                cpu.update_energy_consumed((cpu.get_power() * cpu.get_cpu_percent_for_process() * period)/self.__WATT_TO_KWH)
+    def get_timeline(self) -> SampleTimeline:
+        """Retrieves the samples taken during monitoring.
 
-            if 'gpu' in self.__components:   
-                gpu = self.__components['gpu']  
-                gpu.update_energy_consumed((gpu.get_power() * period)/self.__WATT_TO_KWH)
+        Returns:
+            SampleTimeline: Power read and energy attributed at each sample, 
+            together with the regions marked with 'region'.
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+            from power_pyro.timeline_analyzer import TimelineAnalyzer
+
+            monitor = Monitor({'cpu': True}, sampling_interval=1.0)
+            monitor.start()
+            # ... perform operations ...
+            monitor.end()
+
+            analyzer = TimelineAnalyzer.from_timeline(monitor.get_timeline())
+            print(analyzer.peak_to_mean()) # {'cpu': 1.8}
+            ```
+        """
+        return self.__timeline
+
+    def get_retention(self) -> Union[TieredRetention, None]:
+        """Retrieves the downsampled history of the timeline.
+
+        Returns:
+            Union[TieredRetention, None]: The retention tiers, or None if 
+            every raw sample is kept.
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+            from power_pyro.tiered_retention import TieredRetention
+
+            monitor = Monitor({'cpu': True}, sampling_interval=1.0, retention=TieredRetention())
+            monitor.start()
+            # ... a week of work ...
+            for bucket in monitor.get_retention().get_tier(3600.0):
+                print(bucket['start'], bucket['cpu']['mean'], bucket['cpu']['energy'])
+            ```
+        """
+        return self.__retention
+
+    def get_raw_recording(self) -> Union[RawRecording, None]:
+        """Retrieves the raw inputs recorded with every sample.
+
+        Returns:
+            Union[RawRecording, None]: The recording, or None if raw inputs 
+            are not recorded.
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+            from power_pyro.offline_attribution import OfflineAttribution
+
+            monitor = Monitor({'cpu': True, 'memory': True}, record_raw=True)
+            monitor.start()
+            # ... perform operations ...
+            monitor.end()
+            monitor.get_raw_recording().save('run.json')
+
+            attribution = OfflineAttribution(monitor.get_raw_recording())
+            print(attribution.energy({'cpu': 'cpu_time', 'memory': 'pss'}))
+            ```
+        """
+        return self.__raw_recording
+
+    @contextmanager
+    def region(self, name: str) -> Iterator[None]:
+        """Marks a region of the workload on the timeline.
+
+        Args:
+            name (str): Region name. Regions with the same name are summed 
+            by the analysis.
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+
+            monitor = Monitor({'cpu': True})
+            monitor.start()
+
+            with monitor.region('load'):
+                data = load()
+
+            with monitor.region('train'):
+                train(data)
+
+            monitor.end()
+            ```
+        """
+        start = time.time()
+        index = self.__timeline.open_region(name, start)
+
+        try:
+            yield
+        finally:
+            end = time.time()
+            self.__timeline.close_region(index, end)
+            self.__write_to_sink({'type': 'region', 'name': name, 'start': start, 'end': end})
+
+    def __on_sample(self, sample: Sample) -> None:
+        """Counts the part of a sample of the shared sampler inside the window.
+
+        A sample covers the period before its timestamp. Only the fraction of 
+        that period between the start and the end of the monitor is counted, 
+        so monitors started or ended between two samples get exactly their 
+        own share of the energy.
+
+        Args:
+            sample: Sample of every component of the sampler.
+        """
+        pending_reset = self.__pending_reset
+
+        if pending_reset is not None:
+            self.__apply_reset(pending_reset)
+
+        start = max(sample.timestamp - sample.period, self.__window_start)
+        end = min(sample.timestamp, self.__window_end)
+
+        if end <= start or sample.period <= 0 or any(key not in sample.power for key in self.__components):
+            return
+
+        fraction = (end - start) / sample.period
+        period = end - start
+        power: Dict[str, float] = {key: sample.power[key] for key in self.__components}
+        stale: Dict[str, bool] = {key: sample.stale[key] for key in self.__components}
+        energy: Dict[str, float] = {}
+
+        for key in self.__components:
+            energy[key] = sample.energy[key] * fraction
+            self.__energy[key] += energy[key]
+
+            if self.__calibration_profile is not None:
+                dynamic_power = max(power[key] - self.__calibration_profile.idle_power.get(key, 0.0), 0.0)
+                self.__dynamic_energy[key] += (dynamic_power * sample.share[key] * period)/self.__WATT_TO_KWH
+
+        telemetry: Dict[str, float] = sample.telemetry if self.__record_telemetry else {}
+        memory_nodes: Dict[str, float] = sample.memory_nodes if 'memory' in self.__components else {}
+
+        for node, node_share in memory_nodes.items():
+            self.__memory_node_energy[node] = self.__memory_node_energy.get(node, 0.0) + energy['memory'] * node_share
+
+        work = self.__work_counter.collect()
+
+        for name, units in work.items():
+            self.__work[name] = self.__work.get(name, 0) + units
+
+        self.__update_rolling_work(end, period, sum(energy.values()) * self.__WATT_TO_KWH, work)
+        self.__version += 1
+        self.__duration += period
+        self.__snapshot = self.__take_snapshot(end)
+        self.__timeline.append(end, period, power, energy, stale, telemetry)
+
+        if self.__retention is not None:
+            self.__retention.add(end, period, power, energy)
+
+        share: Dict[str, float] = {key: sample.share[key] for key in self.__components}
+        record: Dict[str, Any] = {'type': 'sample', 'timestamp': end, 'period': period,
+                                  'power': power, 'energy': energy, 'stale': stale}
+
+        if self.__raw_recording is not None:
+            self.__raw_recording.append(end, period, power, share, sample.raw, fraction)
+            record['share'] = share
+            record['raw'] = {key: value if not math.isnan(value) else None for key, value in sample.raw.items()}
+
+        if memory_nodes:
+            record['memory_nodes'] = {node: energy['memory'] * node_share for node, node_share in memory_nodes.items()}
+
+        if work:
+            record['work'] = work
+
+        if telemetry:
+            record['telemetry'] = {key: value if not math.isnan(value) else None for key, value in telemetry.items()}
+
+        self.__write_to_sink(record)
+
+        # The published sample covers the counted part of the period only, 
+        # so its counter deltas are scaled like its energy.
+        raw = {key: value * fraction if key in RawRecording.DELTAS else value for key, value in sample.raw.items()}
+        self.__publish(Sample(end, period, power, energy, stale, share, raw, telemetry, memory_nodes))
+
+    def __take_snapshot(self, timestamp: float) -> EnergySnapshot:
+        """Copies the totals into a new snapshot.
+
+        Args:
+            timestamp: End of the last counted period (Unix time).
+
+        Returns:
+            EnergySnapshot: The totals as of now.
+        """
+        return EnergySnapshot(self.__version, self.__epoch, timestamp, self.__duration, dict(self.__energy),
+                              dict(self.__dynamic_energy) if self.__calibration_profile is not None else {},
+                              dict(self.__memory_node_energy), dict(self.__work))
+
+    def __update_rolling_work(self, timestamp: float, period: float, joules: float, work: Dict[str, float]) -> None:
+        """Adds a sample to the rolling window of work and drops the 
+           samples older than the window.
+
+        Args:
+            timestamp: End of the counted period (Unix time).
+            period: Duration of the counted period in seconds.
+            joules: Energy of every component during the period in J.
+            work: Units of work counted during the period by counter name.
+        """
+        self.__work_history.append((timestamp, period, joules, work))
+
+        while self.__work_history[0][0] <= timestamp - self.__work_window:
+            self.__work_history.popleft()
+
+        totals: Dict[str, float] = {}
+
+        for _, _, _, units in self.__work_history:
+            for name, value in units.items():
+                totals[name] = totals.get(name, 0) + value
+
+        self.__rolling_work = (sum(entry[1] for entry in self.__work_history),
+                               sum(entry[2] for entry in self.__work_history), totals)
+
+    def __apply_reset(self, reset_time: float) -> None:
+        """Zeroes the totals and starts counting from the reset.
+
+        Called by the sampling thread for a reset requested while running, 
+        and by the caller otherwise, so the totals only have one writer.
+
+        Args:
+            reset_time: Time of the reset (Unix time).
+        """
+        self.__pending_reset = None
+        self.__energy = {key: 0.0 for key in self.__components}
+        self.__dynamic_energy = {key: 0.0 for key in self.__components}
+        self.__memory_node_energy = {}
+        self.__work_counter.collect()
+        self.__work = {}
+        self.__work_history.clear()
+        self.__rolling_work = (0.0, 0.0, {})
+        self.__version = 0
+        self.__epoch += 1
+        self.__duration = 0.0
+
+        if self.__window_start is not None:
+            self.__window_start = max(self.__window_start, reset_time)
+
+        self.__snapshot = self.__take_snapshot(reset_time)
+
+    def snapshot(self) -> EnergySnapshot:
+        """Retrieves the totals as of the last counted sample.
+
+        The snapshot is replaced as a whole by the sampling thread, so this 
+        neither reads a sensor nor takes a lock, and its totals are always 
+        consistent with each other. Subtracting two snapshots gives the 
+        energy in between, e.g. of a request of a long-lived service.
+
+        Returns:
+            EnergySnapshot: Versioned totals of every component.
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+
+            monitor = Monitor({'cpu': True, 'memory': True}, sampling_interval=1.0)
+            monitor.start()
+
+            before = monitor.snapshot()
+            # ... perform operations ...
+            delta = monitor.snapshot().since(before)
+            print(delta.duration, delta.energy)  # 12.0 {'cpu': 3.1e-05, 'memory': 2.2e-07}
+            ```
+        """
+        return self.__snapshot
+
+    def count(self, name: str, amount: float = 1) -> None:
+        """Counts units of work done by the monitored workload.
+
+        Each thread adds to its own counters, merged with the energy at 
+        every sample, so this is cheap enough for hot loops and takes no 
+        lock. Work counted while the monitor is not running is ignored.
+
+        Args:
+            name (str): Counter name, e.g. 'rows', 'requests' or 'batches'.
+            amount (float): Units done (optional, default is 1).
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+
+            monitor = Monitor({'cpu': True, 'memory': True}, sampling_interval=1.0)
+            monitor.start()
+
+            for batch in batches:
+                process(batch)
+                monitor.count('rows', len(batch))
+                monitor.count('batches')
+
+            monitor.end()
+            print(monitor.get_energy_per_unit()['rows']['joules_per_unit'])  # 0.0021
+            ```
+        """
+        self.__work_counter.count(name, amount)
+
+    def get_energy_per_unit(self) -> Dict[str, Dict[str, float]]:
+        """Retrieves the energy per unit of work of every counter.
+
+        The energy of every monitored component is divided by the units 
+        counted with 'count', over the whole window and over the rolling 
+        work window. Both are as of the last sample.
+
+        Returns:
+            Dict[str, Dict[str, float]]: By counter name, the units counted 
+            ('units'), the energy in J per unit ('joules_per_unit'), and the 
+            same over the rolling window ('rolling_units', 
+            'rolling_joules_per_unit', None when no unit was counted in it).
+        """
+        snapshot = self.__snapshot
+        _, rolling_joules, rolling_units = self.__rolling_work
+        joules_per_unit = snapshot.energy_per_unit()
+
+        return {name: {'units': units, 'joules_per_unit': joules_per_unit.get(name),
+                       'rolling_units': rolling_units.get(name, 0),
+                       'rolling_joules_per_unit': rolling_joules / rolling_units[name]
+                                                  if rolling_units.get(name, 0) > 0 else None}
+                for name, units in snapshot.work.items()}
+
+    def subscribe(self, callback: Union[Callable[[Sample], None], None] = None, maxsize: int = 1024,
+                  policy: DeliveryPolicy = DeliveryPolicy.DROP_OLDEST, block_timeout: float = 1.0) -> SampleSubscription:
+        """Delivers each sample to a subscriber as soon as it is taken.
+
+        Samples go through a bounded queue per subscriber, so a slow 
+        subscriber (a network shipper, a UI) cannot stall the sampler or 
+        make memory grow: when its queue is full, the policy decides whether 
+        the oldest or the newest sample is dropped, or whether the sampler 
+        waits up to 'block_timeout' for room.
+
+        Args:
+            callback (Union[Callable[[Sample], None], None]): Function called 
+            with each sample on a dedicated thread (optional, default is to 
+            iterate over the returned subscription).
+            maxsize (int): Capacity of the queue (optional, default is 1024).
+            policy (DeliveryPolicy): What happens to a sample when the queue 
+            is full (optional, default is DeliveryPolicy.DROP_OLDEST).
+            block_timeout (float): Time in seconds the sampler may wait with 
+            DeliveryPolicy.BLOCK (optional, default is 1).
+
+        Returns:
+            SampleSubscription: The subscription, which is closed when the 
+            monitor ends.
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+
+            monitor = Monitor({'cpu': True, 'gpu': True}, sampling_interval=1.0)
+            monitor.subscribe(lambda sample: print(sample.power))
+            monitor.start()
+            # ... perform operations ...
+            monitor.end()
+            ```
+        """
+        subscription = SampleSubscription(callback, maxsize, policy, block_timeout)
+
+        with self.__subscriptions_lock:
+            self.__subscriptions.append(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription: SampleSubscription) -> None:
+        """Stops delivering samples to a subscriber.
+
+        Args:
+            subscription (SampleSubscription): Subscription returned by 'subscribe'.
+        """
+        with self.__subscriptions_lock:
+            if subscription in self.__subscriptions:
+                self.__subscriptions.remove(subscription)
+
+        subscription.close()
+
+    def get_subscription_stats(self) -> List[Dict[str, int]]:
+        """Retrieves the delivery counters of every subscriber.
+
+        Returns:
+            List[Dict[str, int]]: For each subscription, in subscription order, 
+            the samples published, delivered and dropped, the callback errors 
+            and the samples still queued.
+        """
+        with self.__subscriptions_lock:
+            return [subscription.get_stats() for subscription in self.__subscriptions]
+
+    def __publish(self, sample: Sample) -> None:
+        """Offers a sample to every subscriber.
+
+        Args:
+            sample: The new sample.
+        """
+        with self.__subscriptions_lock:
+            subscriptions = list(self.__subscriptions)
+
+        for subscription in subscriptions:
+            subscription.publish(sample)
+
+    def __write_to_sink(self, record: Dict[str, Any]) -> None:
+        """Writes a record to the sink, if there is one.
+
+        Args:
+            record: Record to write.
+        """
+        if self.__sink is None:
+            return
+
+        with self.__sink_lock:
+            try:
+                self.__sink.write(record)
+            except OSError as e:
+                print('Error writing to sample sink: ', str(e))
 
-            if 'memory' in self.__components:     
-                memory = self.__components['memory']
-                memory.update_energy_consumed((memory.get_power() * period)/self.__WATT_TO_KWH)
-        
-        if self.__operating_system == OsType.WINDOWS:
-            self.__close_resources()
-    
     def start(self) -> None:
         """
         Starts the monitoring process in a separate thread.
 
+        A monitor that was ended can be started again: the new run counts 
+        from zero, with a new snapshot epoch, and writes to the same sink. 
+        Subscriptions closed by 'end' are dropped. Starting a running or 
+        paused monitor does nothing.
+
         Example:
             Start the monitoring process:
 
@@ -269,14 +1028,35 @@ class Monitor():
             monitor.start()
             ```
         """
-        self.__thread.start()
+        if self.__running or self.__paused:
+            return
+
+        if self.__window_start is not None:
+            self.__apply_reset(time.time())
+
+            with self.__subscriptions_lock:
+                self.__subscriptions = [subscription for subscription in self.__subscriptions
+                                        if not subscription.closed]
+
+        scopes, sensor_scopes = self.__sampler.get_scopes(list(self.__components))
+        self.__work_counter.collect()
+        self.__window_start = time.time()
+        self.__window_end = math.inf
+        self.__write_to_sink({'type': 'meta', 'components': list(self.__components), 'scopes': scopes,
+                              'sensor_scopes': sensor_scopes, 'power_sources': self.get_power_sources(),
+                              'sampling_interval': self.__sampling_interval,
+                              'start': self.__window_start})
+        self.__running = True
+        self.__sampler.attach(self.__on_sample, self.__sampling_interval, self.__publish_raw,
+                              self.__record_telemetry)
     
     def is_running(self) -> bool:
         """
         Checks if the monitoring process is currently running.
 
         Returns:
-            bool: True if the monitoring thread is alive (running), False otherwise.
+            bool: True between 'start' and 'end', False otherwise or while 
+            paused.
 
         Example:
             Verify if the monitoring process is still running:
@@ -291,11 +1071,113 @@ class Monitor():
             print(monitor.is_running())  # False, since monitoring has ended
             ```
         """
-        return self.__thread.is_alive()
-    
+        return self.__running
+
+    def flush(self) -> None:
+        """
+        Takes a sample now, so the energy and the timeline cover the workload
+        up to this moment without waiting for the next sampling interval.
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+
+            monitor = Monitor({'cpu': True}, sampling_interval=60.0)
+            monitor.start()
+            # ... perform operations ...
+            monitor.flush()
+            print(monitor.total_energy_consumed())  # Energy up to the flush
+            ```
+        """
+        if self.__running:
+            self.__sampler.flush()
+
+    def pause(self) -> None:
+        """
+        Stops counting energy until 'resume', once the energy up to now is 
+        counted.
+
+        The monitor detaches from the shared sampler, so a paused monitor 
+        costs nothing; its totals, timeline and subscriptions are kept.
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+
+            monitor = Monitor({'cpu': True}, sampling_interval=1.0)
+            monitor.start()
+            serve_batch()
+            monitor.pause()
+            wait_for_next_batch()  # Not counted
+            monitor.resume()
+            serve_batch()
+            monitor.end()
+            ```
+        """
+        if not self.__running:
+            return
+
+        self.__window_end = time.time()
+        self.__sampler.flush()
+        self.__sampler.detach(self.__on_sample)
+        self.__running = False
+        self.__paused = True
+        self.__write_to_sink({'type': 'pause', 'timestamp': self.__window_end})
+
+    def resume(self) -> None:
+        """
+        Counts energy again after 'pause', adding to the same totals.
+        """
+        if not self.__paused:
+            return
+
+        self.__work_counter.collect()
+        self.__window_start = time.time()
+        self.__window_end = math.inf
+        self.__paused = False
+        self.__running = True
+        self.__write_to_sink({'type': 'resume', 'timestamp': self.__window_start})
+        self.__sampler.attach(self.__on_sample, self.__sampling_interval, self.__publish_raw,
+                              self.__record_telemetry)
+
+    def reset(self) -> None:
+        """
+        Zeroes the energy totals and starts counting from now, without 
+        stopping the monitor.
+
+        The timeline, the raw recording and the subscriptions are kept. A 
+        reset starts a new snapshot epoch, so snapshots taken before it 
+        cannot be subtracted from later ones. While running, the reset is 
+        applied by the sampling thread with a sample taken immediately.
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+
+            monitor = Monitor({'cpu': True}, sampling_interval=60.0)
+            monitor.start()
+
+            while serving:
+                serve_for_an_hour()
+                report(monitor.snapshot().energy)
+                monitor.reset()
+            ```
+        """
+        reset_time = time.time()
+        self.__write_to_sink({'type': 'reset', 'timestamp': reset_time})
+
+        if self.__running:
+            self.__pending_reset = reset_time
+            self.__sampler.flush()
+        else:
+            self.__apply_reset(reset_time)
+
     def end(self) -> None:
         """
-        Stops the monitoring process and waits for the monitoring thread to finish.
+        Stops the monitoring process once the energy up to now is counted.
+
+        The shared sampler takes a last sample immediately, and stops when no 
+        other monitor of the process is running.
 
         Example:
             Stop the monitoring process:
@@ -306,8 +1188,23 @@ class Monitor():
             monitor = Monitor({'cpu': True, 'gpu': False, 'memory': True})
             monitor.start()
             # ... perform operations to monitor ...
-            monitor.end()  # Stops monitoring and waits for thread to finish
+            monitor.end()  # Stops monitoring and counts the last sample
             ```
         """
-        self.__stop_sign = True
-        self.__thread.join()
+        if not self.__running and not self.__paused:
+            return
+
+        if self.__running:
+            self.__window_end = time.time()
+            self.__sampler.flush()
+            self.__sampler.detach(self.__on_sample)
+
+        self.__running = False
+        self.__paused = False
+
+        if self.__sink is not None:
+            self.__sink.close()
+
+        with self.__subscriptions_lock:
+            for subscription in self.__subscriptions:
+                subscription.close()
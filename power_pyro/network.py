@@ -0,0 +1,160 @@
+from .io_component import IoComponent
+from .io_power_model import IoPowerModel
+from .os_type import OsType
+from .hardware_type import HardwareType
+
+from typing import Dict, List, Union
+import os
+
+class Network(IoComponent):
+    """Represents the network interfaces of the host.
+
+    The physical interfaces are the entries of '/sys/class/net' backed by a
+    device; when there is none, as in most containers, the virtual ones
+    other than the loopback are used instead. Their bytes are the ones
+    received and sent in '/proc/net/dev'.
+
+    Linux does not count the socket bytes of a process. When the process
+    has a network namespace of its own, as in a container, its interfaces
+    carry only the traffic of that namespace, which gets all their power.
+    Otherwise the sampler attributes the network power by the CPU share of
+    the process, or not at all without the CPU, since the I/O counters of '/proc/self/io' also
+    count pipes, terminals and page cache reads and would give most of the
+    host traffic to any process.
+
+    Attributes:
+        __sysfs (str): Mount point of sysfs.
+        __namespace (Union[str, None]): Network namespace of the process,
+        if it is not the one of the host.
+        __DEFAULT_MODELS (Dict[str, IoPowerModel]): Default power model of
+        wired, wireless and virtual interfaces.
+    """
+    __DEFAULT_MODELS: Dict[str, IoPowerModel] = {
+        'ethernet': IoPowerModel(idle_power = 1.0, joules_per_byte = 5e-9),
+        'wifi': IoPowerModel(idle_power = 0.5, joules_per_byte = 1e-8),
+        'virtual': IoPowerModel(idle_power = 0.0, joules_per_byte = 5e-9),
+    }
+
+    def __init__(self, operating_system: OsType, power_models: Union[Dict[str, IoPowerModel], None] = None,
+                 sysfs: str = '/sys', procfs: str = '/proc'):
+        """
+        Args:
+            operating_system (OsType): The current operating system.
+            power_models (Union[Dict[str, IoPowerModel], None]): Power model
+            by interface name, e.g. {'eth0': IoPowerModel(0.8, 4e-9)}
+            (optional).
+            sysfs (str): Mount point of sysfs (optional, default is '/sys').
+            procfs (str): Mount point of procfs (optional, default is '/proc').
+
+        Raises:
+            ResourceUnavailableException: If the operating system is not
+            Linux or no interface is found.
+        """
+        self.__sysfs: str = sysfs
+        self.__namespace: Union[str, None] = self.__read_namespace(procfs)
+        super().__init__(operating_system, os.path.join(procfs, 'net', 'dev'), power_models)
+
+    @staticmethod
+    def __read_namespace(procfs: str) -> Union[str, None]:
+        """Reads the network namespace of the process.
+
+        Args:
+            procfs: Mount point of procfs.
+
+        Returns:
+            Union[str, None]: The namespace, e.g. 'net:[4026532281]', or None
+            if it is the one of the host or cannot be read.
+        """
+        try:
+            namespace = os.readlink(os.path.join(procfs, 'self', 'ns', 'net'))
+            host_namespace = os.readlink(os.path.join(procfs, '1', 'ns', 'net'))
+        except OSError:
+            return None
+
+        return namespace if namespace != host_namespace else None
+
+    @property
+    def namespace(self) -> Union[str, None]:
+        """Gets the network namespace of the process.
+
+        Returns:
+            Union[str, None]: The namespace, or None if the process uses the
+            one of the host.
+        """
+        return self.__namespace
+
+    @property
+    def counts_process_bytes(self) -> bool:
+        """Tells whether the share of the process is known from the bytes
+           it transferred.
+
+        Returns:
+            bool: True if the process has a network namespace of its own,
+            False if its share has to come from another estimate.
+        """
+        return self.__namespace is not None
+
+    def get_share(self) -> float:
+        """Returns the share of the process in the traffic of the
+           interfaces.
+
+        Returns:
+            float: 1.0 in a network namespace of its own, whose interfaces
+            only carry its traffic, otherwise 0.0 as the bytes of the process
+            are unknown.
+        """
+        return 1.0 if self.__namespace is not None else 0.0
+
+    def _hardware_type(self) -> HardwareType:
+        return HardwareType.NETWORK
+
+    def _list_devices(self) -> List[str]:
+        net = os.path.join(self.__sysfs, 'class', 'net')
+
+        try:
+            names = sorted(name for name in os.listdir(net) if name != 'lo')
+        except OSError:
+            return []
+
+        physical = [name for name in names if os.path.exists(os.path.join(net, name, 'device'))]
+
+        return physical or names
+
+    def kind(self, device: str) -> str:
+        """Guesses the kind of an interface.
+
+        Args:
+            device (str): Interface name.
+
+        Returns:
+            str: 'wifi', 'ethernet' for another physical interface, or
+            'virtual'.
+        """
+        net = os.path.join(self.__sysfs, 'class', 'net', device)
+
+        if os.path.exists(os.path.join(net, 'wireless')) or os.path.exists(os.path.join(net, 'phy80211')):
+            return 'wifi'
+
+        return 'ethernet' if os.path.exists(os.path.join(net, 'device')) else 'virtual'
+
+    def _default_model(self, device: str) -> IoPowerModel:
+        return self.__DEFAULT_MODELS[self.kind(device)]
+
+    def _parse_counters(self, content: str) -> Dict[str, int]:
+        counters: Dict[str, int] = {}
+
+        # The first two lines are headers; receive bytes come first and
+        # transmit bytes are the ninth field after the name.
+        for line in content.splitlines()[2:]:
+            name, _, values = line.partition(':')
+            fields = values.split()
+
+            if len(fields) > 8:
+                counters[name.strip()] = int(fields[0]) + int(fields[8])
+
+        return counters
+
+    def _process_bytes(self, counters: Dict[str, int]) -> int:
+        # '/proc/<pid>/io' has no socket counter, the share comes from
+        # 'get_share' instead.
+        return 0
@@ -0,0 +1,35 @@
+from .hardware_component_factory import HardwareComponentFactory
+from .os_type import OsType
+from .hardware_component import HardwareComponent
+from .network import Network
+from .object_creation_exception import ObjectCreationException
+from .resource_unavailable_exception import ResourceUnavailableException
+
+class NetworkComponentFactory(HardwareComponentFactory):
+    """Factory class for creating Network components.
+    
+    This class implements the 'HardwareComponentFactory' to provide concrete Network components
+    based on the specified operating system.
+    """
+    def __init__(self):
+        super().__init__()
+
+    def create_component(self, operating_system: OsType) -> HardwareComponent:
+        """Creates a network hardware component based on the provided operating system.
+
+            Args:
+                operating_system (OsType): The type of operating system for 
+                which the network component will be created.
+
+            Returns:
+                HardwareComponent: An instance of the network component 
+                corresponding to the given operating system.
+
+            Raises:
+                ObjectCreationException: If the operating system does not 
+                expose network counters or they cannot be read.
+    """
+        try:
+            return Network(operating_system)
+        except (ResourceUnavailableException, OSError) as e:
+            raise ObjectCreationException(additional_info = str(e))
@@ -0,0 +1,88 @@
+from typing import Dict, Union
+import os
+import re
+
+class NumaMapsReader():
+    """Reads how much memory of a process resides on each NUMA node.
+
+    '/proc/<pid>/numa_maps' lists every mapping of the process with its
+    resident pages per node ('N0=512 N1=20') followed by their page size
+    ('kernelpagesize_kB=4'), which mappings without resident pages lack.
+    The file is kept open and read from its start in fixed-size chunks,
+    and each chunk is scanned with a single regular expression that only
+    picks those tokens, so parsing stays linear in the size of the file
+    and never builds one string per mapping, even for processes with
+    hundreds of thousands of mappings.
+
+    Attributes:
+        __fd (int): Open descriptor of 'numa_maps'.
+        __CHUNK_SIZE (int): Bytes read at once.
+        __TOKENS (re.Pattern): Node pages and page size tokens.
+    """
+    __CHUNK_SIZE: int = 256 * 1024
+    __TOKENS: "re.Pattern[bytes]" = re.compile(rb' N(\d+)=(\d+)| kernelpagesize_kB=(\d+)')
+
+    def __init__(self, pid: Union[int, str] = 'self', procfs: str = '/proc'):
+        """
+        Args:
+            pid (Union[int, str]): Process to read (optional, default is the
+            current process).
+            procfs (str): Mount point of procfs (optional, default is '/proc').
+
+        Raises:
+            OSError: If the file cannot be opened, e.g. on a kernel without
+            NUMA support.
+        """
+        self.__fd: int = os.open(os.path.join(procfs, str(pid), 'numa_maps'), os.O_RDONLY)
+
+    def read(self) -> Dict[int, int]:
+        """Reads the resident memory of the process on each node.
+
+        Returns:
+            Dict[int, int]: Resident bytes by node id.
+
+        Raises:
+            OSError: If the file cannot be read, e.g. the process exited.
+        """
+        nodes: Dict[bytes, int] = {}
+        pending: Dict[bytes, int] = {}
+        carry = b''
+
+        os.lseek(self.__fd, 0, os.SEEK_SET)
+
+        while True:
+            chunk = os.read(self.__fd, self.__CHUNK_SIZE)
+
+            if not chunk:
+                break
+
+            # Only whole lines are scanned, the rest waits for the next chunk.
+            end = chunk.rfind(b'\n') + 1
+
+            if not end:
+                carry += chunk
+                continue
+
+            data, carry = carry + chunk[:end], chunk[end:]
+
+            # The pages of a mapping on each node come before its page size.
+            for node, pages, page_size in self.__TOKENS.findall(data):
+                if node:
+                    pending[node] = pending.get(node, 0) + int(pages)
+                    continue
+
+                size = int(page_size) * 1024
+
+                for key, value in pending.items():
+                    nodes[key] = nodes.get(key, 0) + value * size
+
+                pending.clear()
+
+        return {int(node): size for node, size in nodes.items()}
+
+    def close(self) -> None:
+        """Closes 'numa_maps'."""
+        try:
+            os.close(self.__fd)
+        except OSError:
+            pass
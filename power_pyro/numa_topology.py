@@ -0,0 +1,135 @@
+from typing import Dict, List, Tuple
+import glob
+import os
+import re
+
+class NumaTopology():
+    """The NUMA nodes of the host and the memory power of a GB on each one.
+
+    Nodes and their capacity are read from sysfs. When the memory modules
+    listed by 'dmidecode' name their socket or node (e.g. 'P1-DIMMA1',
+    'P0_Node0_Channel0_Dimm0', 'CPU2_DIMM_B1') and there are as many
+    sockets as nodes, the watts per GB of a node are scaled by the modules
+    it holds relative to its capacity: a node with fewer or larger DIMMs
+    draws less per GB. Otherwise every node uses the host figure.
+
+    Attributes:
+        __capacity (Dict[int, int]): Memory of each node in bytes.
+        __watt_per_gb (Dict[int, float]): Power per GB of memory on each
+        node.
+        __SOCKET (re.Pattern): Socket or node number in a module locator.
+    """
+    __SOCKET: "re.Pattern[str]" = re.compile(r'(?:node|cpu|socket|proc|p)[\s_-]?(\d+)', re.IGNORECASE)
+
+    def __init__(self, watt_per_gb: float, modules: List[Tuple[float, str]], sysfs: str = '/sys'):
+        """
+        Args:
+            watt_per_gb (float): Power per GB of memory of the host.
+            modules (List[Tuple[float, str]]): Size in GB and locators of
+            every installed memory module, possibly empty.
+            sysfs (str): Mount point of sysfs (optional, default is '/sys').
+
+        Raises:
+            OSError: If the host has no NUMA information in sysfs.
+        """
+        self.__capacity: Dict[int, int] = self.__read_capacity(os.path.join(sysfs, 'devices', 'system', 'node'))
+        self.__watt_per_gb: Dict[int, float] = {node: watt_per_gb for node in self.__capacity}
+        self.__scale_by_modules(modules)
+
+    @staticmethod
+    def __read_capacity(directory: str) -> Dict[int, int]:
+        """Reads the memory of every node that has some.
+
+        Args:
+            directory: The 'devices/system/node' directory of sysfs.
+
+        Returns:
+            Dict[int, int]: Memory in bytes by node id.
+
+        Raises:
+            OSError: If no node can be read.
+        """
+        capacity: Dict[int, int] = {}
+
+        for path in glob.glob(os.path.join(directory, 'node[0-9]*')):
+            try:
+                with open(os.path.join(path, 'meminfo'), 'r') as file:
+                    for line in file:
+                        if 'MemTotal:' in line:
+                            capacity[int(os.path.basename(path)[4:])] = int(line.split()[-2]) * 1024
+                            break
+            except (OSError, ValueError, IndexError):
+                continue
+
+        capacity = {node: size for node, size in sorted(capacity.items()) if size > 0}
+
+        if not capacity:
+            raise OSError(f"No NUMA node memory information in {directory}")
+
+        return capacity
+
+    def __scale_by_modules(self, modules: List[Tuple[float, str]]) -> None:
+        """Scales the watts per GB of each node by the modules it holds.
+
+        Args:
+            modules: Size in GB and locators of every memory module.
+        """
+        sockets: Dict[int, List[float]] = {}
+
+        for size, locator in modules:
+            match = self.__SOCKET.search(locator)
+
+            if match is None:
+                return
+
+            sockets.setdefault(int(match.group(1)), []).append(size)
+
+        if len(self.__capacity) < 2 or len(sockets) != len(self.__capacity):
+            return
+
+        # Sockets are numbered from 0 or 1 depending on the vendor, so they
+        # are matched to the nodes in order.
+        density = {node: len(sockets[socket]) / sum(sockets[socket])
+                   for node, socket in zip(self.__capacity, sorted(sockets))}
+        average = len(modules) / sum(size for size, _ in modules)
+
+        for node in self.__watt_per_gb:
+            self.__watt_per_gb[node] *= density[node] / average
+
+    @property
+    def nodes(self) -> List[int]:
+        """Gets the nodes that have memory.
+
+        Returns:
+            List[int]: Node ids.
+        """
+        return list(self.__capacity)
+
+    @property
+    def capacity(self) -> Dict[int, int]:
+        """Gets the memory of every node.
+
+        Returns:
+            Dict[int, int]: Memory in bytes by node id.
+        """
+        return dict(self.__capacity)
+
+    @property
+    def watt_per_gb(self) -> Dict[int, float]:
+        """Gets the power per GB of memory on every node.
+
+        Returns:
+            Dict[int, float]: Watts per GB by node id.
+        """
+        return dict(self.__watt_per_gb)
+
+    def power(self, resident: Dict[int, float]) -> Dict[int, float]:
+        """Computes the memory power of each node.
+
+        Args:
+            resident (Dict[int, float]): Memory in bytes by node id.
+
+        Returns:
+            Dict[int, float]: Power in W by node id.
+        """
+        return {node: size / (1024 ** 3) * self.__watt_per_gb.get(node, 0.0) for node, size in resident.items()}
@@ -0,0 +1,147 @@
+from .raw_recording import RawRecording
+
+from typing import Callable, Dict, List, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+AttributionFunction = Callable[[Dict[str, "np.ndarray"]], "np.ndarray"]
+
+class OfflineAttribution():
+    """Attributes the energy of a raw recording again with any model.
+
+    A model maps the columns of one component to the share of its power
+    attributed to the process at every sample, as a NumPy array. It receives
+    'timestamp', 'period', the 'power' and the recorded 'share' of the
+    component, and every raw counter by name, so the whole run is
+    attributed in one vectorised batch without rerunning the workload.
+    Shares are clipped to [0, 1] and samples where a model cannot be
+    evaluated (a NaN counter) are attributed no energy.
+
+    Built-in models, in 'MODELS':
+
+    - 'recorded': the share attributed while monitoring.
+    - 'full': the whole power of the component.
+    - 'cpu_time': process CPU time over host busy CPU time.
+    - 'cpu_capacity': process CPU time over the CPU time of every logical
+      CPU during the period.
+    - 'cycles': process cycles over system cycles (perf counter recordings).
+    - 'cgroup': cgroup CPU time over host busy CPU time (cgroup recordings).
+    - 'pss': memory power scaled from the resident to the proportional set
+      size, so shared pages are split between the processes using them.
+
+    Attributes:
+        __recording (RawRecording): The recording.
+        __columns (Dict[str, np.ndarray]): Columns shared by every component.
+        __power (Dict[str, np.ndarray]): Power in W by component name.
+        __share (Dict[str, np.ndarray]): Recorded share by component name.
+        __WATT_TO_KWH (float): Constant to convert energy from joules to
+        kilowatt-hours.
+    """
+    MODELS: Dict[str, AttributionFunction] = {
+        'recorded': lambda columns: columns['share'],
+        'full': lambda columns: np.ones_like(columns['period']),
+        'cpu_time': lambda columns: columns['process_cpu_time'] / columns['system_cpu_time'],
+        'cpu_capacity': lambda columns: columns['process_cpu_time'] / (columns['period'] * columns['cpu_count']),
+        'cycles': lambda columns: columns['cycles'] / columns['system_cycles'],
+        'cgroup': lambda columns: columns['cgroup_cpu_time'] / columns['system_cpu_time'],
+        'pss': lambda columns: columns['share'] * columns['pss'] / columns['rss'],
+    }
+
+    def __init__(self, recording: RawRecording):
+        """
+        Args:
+            recording (RawRecording): Recording made with 'record_raw=True'
+            or loaded with 'RawRecording.load'.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError("NumPy is required for offline attribution: pip install numpy")
+
+        columns = recording.columns()
+
+        self.__WATT_TO_KWH: float = 3_600_000
+        self.__recording: RawRecording = recording
+        self.__columns: Dict[str, "np.ndarray"] = {name: np.frombuffer(values, dtype=np.float64)
+                                                   for name, values in columns['raw'].items()}
+        self.__columns['timestamp'] = np.frombuffer(columns['timestamp'], dtype=np.float64)
+        self.__columns['period'] = np.frombuffer(columns['period'], dtype=np.float64)
+        self.__power: Dict[str, "np.ndarray"] = {key: np.frombuffer(values, dtype=np.float64)
+                                                 for key, values in columns['power'].items()}
+        self.__share: Dict[str, "np.ndarray"] = {key: np.frombuffer(values, dtype=np.float64)
+                                                 for key, values in columns['share'].items()}
+
+    def shares(self, component: str, model: Union[str, AttributionFunction]) -> "np.ndarray":
+        """Computes the share of a component attributed at every sample.
+
+        Args:
+            component (str): Component name.
+            model (Union[str, AttributionFunction]): Name of a built-in model
+            or a function of the columns.
+
+        Returns:
+            np.ndarray: Share between 0 and 1 of every sample.
+
+        Raises:
+            KeyError: If the component, the model or a counter the model needs
+            is not in the recording.
+        """
+        function = OfflineAttribution.MODELS[model] if isinstance(model, str) else model
+        columns = dict(self.__columns, power=self.__power[component], share=self.__share[component])
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            shares = np.asarray(function(columns), dtype=np.float64)
+
+        return np.clip(np.nan_to_num(shares, nan=0.0, posinf=0.0, neginf=0.0), 0.0, 1.0)
+
+    def energy_series(self, models: Dict[str, Union[str, AttributionFunction]]) -> Dict[str, "np.ndarray"]:
+        """Computes the energy attributed at every sample.
+
+        Args:
+            models (Dict[str, Union[str, AttributionFunction]]): Model by
+            component name; components left out use 'recorded'.
+
+        Returns:
+            Dict[str, np.ndarray]: Energy in kWh of every sample by component name.
+        """
+        period = self.__columns['period']
+
+        return {component: self.__power[component] * self.shares(component, models.get(component, 'recorded'))
+                * period / self.__WATT_TO_KWH
+                for component in self.__recording.components}
+
+    def energy(self, models: Dict[str, Union[str, AttributionFunction]]) -> Dict[str, float]:
+        """Computes the energy attributed over the whole recording.
+
+        Args:
+            models (Dict[str, Union[str, AttributionFunction]]): Model by
+            component name; components left out use 'recorded'.
+
+        Returns:
+            Dict[str, float]: Energy in kWh by component name.
+
+        Example:
+            ```python
+            from power_pyro.raw_recording import RawRecording
+            from power_pyro.offline_attribution import OfflineAttribution
+
+            attribution = OfflineAttribution(RawRecording.load('run.json'))
+            print(attribution.energy({'cpu': 'recorded'}))           # {'cpu': 0.012, 'memory': 0.001}
+            print(attribution.energy({'cpu': 'cpu_time', 'memory': 'pss'}))
+            print(attribution.energy({'cpu': lambda c: c['cycles'] / c['system_cycles'] * 0.9}))
+            ```
+        """
+        return {component: float(values.sum()) for component, values in self.energy_series(models).items()}
+
+    @staticmethod
+    def available_models() -> List[str]:
+        """Lists the built-in models.
+
+        Returns:
+            List[str]: Model names.
+        """
+        return list(OfflineAttribution.MODELS)
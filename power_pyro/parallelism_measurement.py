@@ -0,0 +1,38 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict
+
+@dataclass(frozen=True)
+class ParallelismMeasurement():
+    """Energy and time to solution of a workload at one concurrency level.
+
+    Attributes:
+        workers (int): Number of workers or threads.
+        time (float): Wall time in seconds, median of the repeats.
+        energy (float): Energy in J read from the host sensors, or
+        attributed to the process and its children, median of the repeats.
+        components (Dict[str, float]): Energy in J by component name of the
+        median repeat.
+    """
+    workers: int
+    time: float
+    energy: float
+    components: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def energy_delay_product(self) -> float:
+        """Gets the energy-delay product.
+
+        Returns:
+            float: Energy times time, in J.s.
+        """
+        return self.energy * self.time
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the measurement into a JSON serializable dictionary.
+
+        Returns:
+            Dict[str, Any]: The measurement fields and the energy-delay
+            product.
+        """
+        return {'workers': self.workers, 'time': self.time, 'energy': self.energy,
+                'energy_delay_product': self.energy_delay_product, 'components': dict(self.components)}
@@ -0,0 +1,340 @@
+from .tuning_objective import TuningObjective
+from .tuning_result import TuningResult
+from .parallelism_measurement import ParallelismMeasurement
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Type, Union
+import os
+import statistics
+import time
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None
+
+class ParallelismTuner():
+    """Finds the number of workers that minimises the energy of a workload.
+
+    A sample of the workload runs at several concurrency levels, measured by
+    a monitor of the process and every child it starts, so process pools
+    are measured too. Time to solution is fitted with Amdahl's law,
+    T(n) = a + b / n, and energy to solution with E(n) = c + d * n + e / n:
+    the static power of the host paid while waiting for the serial part,
+    the cost of each extra worker, and the parallel work. The level between
+    the smallest and the largest tried ones that minimises the energy, the
+    energy-delay product or the time on these curves is recommended. With
+    fewer than three levels, the best measured one is.
+
+    Energy to solution is the energy read from the sensors of the host
+    during each run, so the static power paid while workers wait is
+    counted. The energy attributed to the process can be used instead, but
+    it only charges the CPU time used, so it has no static term and biases
+    the energy objective toward the fewest workers.
+
+    Attributes:
+        __workload (Callable[[int], Any]): Runs the workload sample with a
+        number of workers.
+        __levels (List[int]): Numbers of workers tried.
+        __objective (TuningObjective): What the recommendation minimises.
+        __components (Dict[str, bool]): Components to monitor.
+        __repeats (int): Runs per level, the median is kept.
+        __sampling_interval (float): Time in seconds between two samples.
+        __warmup (bool): Whether the workload runs once unmeasured first.
+        __scope (str): 'sensor' or 'attributed', the energy measured.
+        __apply (Union[Callable[[int], None], None]): Applies a number of
+        workers, if the tuner can.
+        __WATT_TO_KWH (float): Constant to convert energy from joules to
+        kilowatt-hours.
+    """
+    def __init__(self, workload: Callable[[int], Any], levels: Union[List[int], None] = None,
+                 objective: TuningObjective = TuningObjective.ENERGY,
+                 components: Union[Dict[str, bool], None] = None, repeats: int = 1,
+                 sampling_interval: float = 0.05, warmup: bool = True,
+                 apply: Union[Callable[[int], None], None] = None, scope: str = 'sensor'):
+        """
+        Args:
+            workload (Callable[[int], Any]): Runs a representative sample of
+            the workload with the given number of workers and returns when
+            it is done.
+            levels (Union[List[int], None]): Numbers of workers to try
+            (optional, default is the powers of two up to the number of
+            CPUs, and the number of CPUs).
+            objective (TuningObjective): What the recommendation minimises
+            (optional, default is TuningObjective.ENERGY).
+            components (Union[Dict[str, bool], None]): Components to monitor
+            (optional, default is the CPU and the memory).
+            repeats (int): Runs per level, the median is kept (optional,
+            default is 1).
+            sampling_interval (float): Time in seconds between two samples
+            (optional, default is 0.05).
+            warmup (bool): Whether the workload runs once unmeasured before
+            the measurements, e.g. to fill caches (optional, default is
+            True).
+            apply (Union[Callable[[int], None], None]): Applies the
+            recommended number of workers when 'tune' is asked to
+            (optional).
+            scope (str): 'sensor' for the energy read from the sensors of
+            the host, or 'attributed' for the energy attributed to the
+            process and its children, which leaves out static power
+            (optional, default is 'sensor').
+
+        Raises:
+            ValueError: If a level or the number of repeats is not positive,
+            or if the scope is unknown.
+        """
+        cpus = os.cpu_count() or 1
+        default_levels = sorted({2 ** power for power in range(cpus.bit_length()) if 2 ** power <= cpus} | {cpus})
+
+        self.__workload: Callable[[int], Any] = workload
+        self.__levels: List[int] = sorted(set(levels)) if levels is not None else default_levels
+        self.__objective: TuningObjective = objective
+        self.__components: Dict[str, bool] = components if components is not None else {'cpu': True, 'memory': True}
+        self.__repeats: int = repeats
+        self.__sampling_interval: float = sampling_interval
+        self.__warmup: bool = warmup
+        self.__apply: Union[Callable[[int], None], None] = apply
+        self.__scope: str = scope
+        self.__WATT_TO_KWH: float = 3_600_000
+
+        if not self.__levels or self.__levels[0] <= 0:
+            raise ValueError("Levels must be positive")
+
+        if repeats <= 0:
+            raise ValueError("Repeats must be positive")
+
+        if scope not in ('sensor', 'attributed'):
+            raise ValueError(f"Unknown energy scope: {scope}")
+
+    @classmethod
+    def for_executor(cls, fn: Callable[..., Any], *iterables: Iterable[Any],
+                     executor_class: Type[Executor] = ProcessPoolExecutor, **kwargs: Any) -> 'ParallelismTuner':
+        """Creates a tuner of the 'max_workers' of an executor.
+
+        Each level creates an executor with that many workers and maps the
+        function over the sample, so the start of the workers is measured
+        too.
+
+        Args:
+            fn (Callable[..., Any]): Function submitted to the executor.
+            *iterables (Iterable[Any]): Arguments of the sample, as for
+            'Executor.map'.
+            executor_class (Type[Executor]): Executor to tune (optional,
+            default is ProcessPoolExecutor).
+            **kwargs (Any): Arguments of the tuner.
+
+        Returns:
+            ParallelismTuner: The tuner.
+
+        Example:
+            ```python
+            from power_pyro.parallelism_tuner import ParallelismTuner
+
+            tuner = ParallelismTuner.for_executor(render, tiles[:64])
+            print(tuner.tune().workers)  # 6
+            ```
+        """
+        arguments = [list(iterable) for iterable in iterables]
+
+        def workload(workers: int) -> None:
+            with executor_class(max_workers=workers) as executor:
+                list(executor.map(fn, *arguments))
+
+        return cls(workload, **kwargs)
+
+    @classmethod
+    def for_blas(cls, workload: Callable[[], Any], **kwargs: Any) -> 'ParallelismTuner':
+        """Creates a tuner of the threads of the BLAS and OpenMP libraries
+           used by NumPy and SciPy.
+
+        Each level runs the workload with the libraries limited to that many
+        threads, and 'tune(apply=True)' keeps the recommended limit for the
+        rest of the process.
+
+        Args:
+            workload (Callable[[], Any]): Runs a representative sample.
+            **kwargs (Any): Arguments of the tuner.
+
+        Returns:
+            ParallelismTuner: The tuner.
+
+        Raises:
+            ImportError: If threadpoolctl is not installed.
+
+        Example:
+            ```python
+            import numpy as np
+            from power_pyro.parallelism_tuner import ParallelismTuner
+
+            a = np.random.rand(2000, 2000)
+            tuner = ParallelismTuner.for_blas(lambda: a @ a, repeats=3)
+            tuner.tune(apply=True)
+            ```
+        """
+        if threadpool_limits is None:
+            raise ImportError("threadpoolctl is required to tune BLAS threads: pip install threadpoolctl")
+
+        def limited(threads: int) -> None:
+            with threadpool_limits(limits=threads):
+                workload()
+
+        return cls(limited, apply=lambda threads: threadpool_limits(limits=threads), **kwargs)
+
+    def measure(self, workers: int, monitor: Any = None) -> ParallelismMeasurement:
+        """Measures the workload at one concurrency level.
+
+        Args:
+            workers (int): Number of workers.
+            monitor (Any): Monitor to reuse (optional, default is a new one).
+
+        Returns:
+            ParallelismMeasurement: Median time and energy of the repeats.
+        """
+        if monitor is None:
+            from .monitor import Monitor
+            monitor = Monitor(self.__components, sampling_interval=self.__sampling_interval, pid=os.getpid())
+
+        runs: List[Tuple[float, float, Dict[str, float]]] = []
+        timeline = monitor.get_timeline()
+
+        for _ in range(self.__repeats):
+            first = len(timeline)
+            monitor.start()
+            start = time.perf_counter()
+
+            try:
+                self.__workload(workers)
+            finally:
+                elapsed = time.perf_counter() - start
+                monitor.end()
+
+            if self.__scope == 'sensor':
+                _, periods, power, _ = timeline.columns()
+                components = {key: sum(value * period for value, period in zip(values[first:], periods[first:]))
+                              for key, values in power.items()}
+            else:
+                components = {key: value * self.__WATT_TO_KWH
+                              for key, value in monitor.get_energy_consumed_by_components().items()}
+
+            runs.append((elapsed, sum(components.values()), components))
+
+        median = sorted(runs, key=lambda run: run[1])[(len(runs) - 1) // 2]
+
+        return ParallelismMeasurement(workers, statistics.median(run[0] for run in runs), median[1], median[2])
+
+    def tune(self, apply: bool = False) -> TuningResult:
+        """Measures every level and recommends one.
+
+        Args:
+            apply (bool): Whether the recommended level is applied, for
+            tuners that can apply it (optional, default is False).
+
+        Returns:
+            TuningResult: Measurements, fitted curves and recommendation.
+
+        Raises:
+            ValueError: If 'apply' is True and the tuner cannot apply a level.
+        """
+        if apply and self.__apply is None:
+            raise ValueError("This tuner cannot apply the number of workers, pass it to the executor instead")
+
+        from .monitor import Monitor
+        monitor = Monitor(self.__components, sampling_interval=self.__sampling_interval, pid=os.getpid())
+
+        if self.__warmup:
+            self.__workload(self.__levels[0])
+
+        measurements = [self.measure(workers, monitor) for workers in self.__levels]
+        predicted = self.__predict(measurements)
+
+        if predicted:
+            workers = min(predicted, key=lambda level: self.__cost(*predicted[level]))
+        else:
+            workers = min(measurements, key=lambda measurement: self.__cost(measurement.energy, measurement.time)).workers
+
+        if apply:
+            self.__apply(workers)
+
+        return TuningResult(self.__objective, workers, measurements, predicted)
+
+    def __cost(self, energy: float, elapsed: float) -> float:
+        """Computes the minimised value.
+
+        Args:
+            energy: Energy in J.
+            elapsed: Time in seconds.
+
+        Returns:
+            float: Energy, energy-delay product or time.
+        """
+        if self.__objective == TuningObjective.ENERGY:
+            return energy
+
+        if self.__objective == TuningObjective.ENERGY_DELAY_PRODUCT:
+            return energy * elapsed
+
+        return elapsed
+
+    def __predict(self, measurements: List[ParallelismMeasurement]) -> Dict[int, Tuple[float, float]]:
+        """Fits the energy and time curves.
+
+        Args:
+            measurements: Measurement of every level.
+
+        Returns:
+            Dict[int, Tuple[float, float]]: Predicted energy and time by
+            number of workers, empty with fewer than three levels or if the
+            curves cannot be fitted.
+        """
+        if len(measurements) < 3:
+            return {}
+
+        levels = [measurement.workers for measurement in measurements]
+        time_fit = self.__least_squares([[1.0, 1.0 / n] for n in levels], [m.time for m in measurements])
+        energy_fit = self.__least_squares([[1.0, float(n), 1.0 / n] for n in levels],
+                                          [m.energy for m in measurements])
+
+        if time_fit is None or energy_fit is None:
+            return {}
+
+        predicted: Dict[int, Tuple[float, float]] = {}
+
+        for n in range(levels[0], levels[-1] + 1):
+            energy = energy_fit[0] + energy_fit[1] * n + energy_fit[2] / n
+            elapsed = time_fit[0] + time_fit[1] / n
+            predicted[n] = (max(energy, 0.0), max(elapsed, 0.0))
+
+        return predicted
+
+    @staticmethod
+    def __least_squares(rows: List[List[float]], values: List[float]) -> Union[List[float], None]:
+        """Solves a small linear least squares problem with the normal
+           equations.
+
+        Args:
+            rows: Features of every observation.
+            values: Observed values.
+
+        Returns:
+            Union[List[float], None]: Coefficients of the features, or None if
+            the problem is singular.
+        """
+        size = len(rows[0])
+        matrix = [[sum(row[i] * row[j] for row in rows) for j in range(size)]
+                  + [sum(row[i] * value for row, value in zip(rows, values))] for i in range(size)]
+
+        # Gaussian elimination with partial pivoting.
+        for column in range(size):
+            pivot = max(range(column, size), key=lambda row: abs(matrix[row][column]))
+
+            if abs(matrix[pivot][column]) < 1e-12:
+                return None
+
+            matrix[column], matrix[pivot] = matrix[pivot], matrix[column]
+
+            for row in range(size):
+                if row != column:
+                    factor = matrix[row][column] / matrix[column][column]
+                    matrix[row] = [a - factor * b for a, b in zip(matrix[row], matrix[column])]
+
+        return [matrix[row][size] / matrix[row][row] for row in range(size)]
@@ -0,0 +1,205 @@
+from .cpu_attribution_model import CpuAttributionModel
+from .resource_unavailable_exception import ResourceUnavailableException
+
+from typing import Dict, List
+import ctypes
+import os
+import platform
+import struct
+
+class _PerfEventAttr(ctypes.Structure):
+    """Layout of 'struct perf_event_attr' (PERF_ATTR_SIZE_VER5) from
+       'linux/perf_event.h'."""
+    _fields_ = [('type', ctypes.c_uint32),
+                ('size', ctypes.c_uint32),
+                ('config', ctypes.c_uint64),
+                ('sample_period', ctypes.c_uint64),
+                ('sample_type', ctypes.c_uint64),
+                ('read_format', ctypes.c_uint64),
+                ('flags', ctypes.c_uint64),
+                ('wakeup_events', ctypes.c_uint32),
+                ('bp_type', ctypes.c_uint32),
+                ('config1', ctypes.c_uint64),
+                ('config2', ctypes.c_uint64),
+                ('branch_sample_type', ctypes.c_uint64),
+                ('sample_regs_user', ctypes.c_uint64),
+                ('sample_stack_user', ctypes.c_uint32),
+                ('clockid', ctypes.c_int32),
+                ('sample_regs_intr', ctypes.c_uint64),
+                ('aux_watermark', ctypes.c_uint32),
+                ('sample_max_stack', ctypes.c_uint16),
+                ('reserved', ctypes.c_uint16)]
+
+class PerfCounterAttributionModel(CpuAttributionModel):
+    """Attributes CPU power by the share of CPU cycles spent by the monitored
+       process among all cycles of the system.
+
+    Cycles and instructions of every thread of the process are counted with
+    'perf_event_open' (inherited by threads created later), and system-wide
+    cycles with one counter per online CPU. The counters are opened once
+    through ctypes and read with 'read()' on their open file descriptors, so
+    no subprocess is involved while sampling. Counts are scaled by the time
+    each counter was actually running, in case the kernel multiplexes them.
+
+    Attributes:
+        __process_fds (Dict[str, List[int]]): Descriptors of the process
+        counters ('cycles', 'instructions'), one per thread.
+        __system_fds (List[int]): Descriptors of the system-wide cycle
+        counters, one per online CPU.
+        __last_counts (Dict[str, float]): Counts at the previous call.
+        __last_deltas (Dict[str, float]): Counts between the two last calls.
+    """
+    __SYSCALL_NUMBERS: Dict[str, int] = {'x86_64': 298, 'amd64': 298, 'i386': 336, 'i686': 336,
+                                         'aarch64': 241, 'arm64': 241, 'armv7l': 364, 'riscv64': 241,
+                                         'ppc64le': 319, 'ppc64': 319, 's390x': 331}
+    __PERF_TYPE_HARDWARE: int = 0
+    __PERF_COUNT_HW_CPU_CYCLES: int = 0
+    __PERF_COUNT_HW_INSTRUCTIONS: int = 1
+    __PERF_FORMAT_TOTAL_TIME_ENABLED: int = 1 << 0
+    __PERF_FORMAT_TOTAL_TIME_RUNNING: int = 1 << 1
+    __FLAG_INHERIT: int = 1 << 1
+    __FLAG_EXCLUDE_HV: int = 1 << 6
+    __PERF_FLAG_FD_CLOEXEC: int = 1 << 3
+
+    def __init__(self):
+        """
+        Raises:
+            ResourceUnavailableException: If the counters cannot be opened,
+            e.g. on a non-Linux system, without a PMU (most VMs) or when
+            'perf_event_paranoid' forbids system-wide counting.
+        """
+        super().__init__()
+        self.__process_fds: Dict[str, List[int]] = {'cycles': [], 'instructions': []}
+        self.__system_fds: List[int] = []
+
+        try:
+            self.__open_counters()
+        except (OSError, AttributeError, KeyError, TypeError) as e:
+            self.close()
+            raise ResourceUnavailableException("perf_event", f"Unable to open hardware counters: {e}")
+
+        self.__last_counts: Dict[str, float] = self.__read_counts()
+        self.__last_deltas: Dict[str, float] = {key: 0.0 for key in self.__last_counts}
+
+    def __open_counters(self) -> None:
+        """Opens the process and system-wide counters."""
+        syscall_number = PerfCounterAttributionModel.__SYSCALL_NUMBERS[platform.machine().lower()]
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.syscall.restype = ctypes.c_long
+
+        def open_counter(config: int, pid: int, cpu: int, inherit: bool) -> int:
+            attr = _PerfEventAttr()
+            attr.type = PerfCounterAttributionModel.__PERF_TYPE_HARDWARE
+            attr.size = ctypes.sizeof(_PerfEventAttr)
+            attr.config = config
+            attr.read_format = (PerfCounterAttributionModel.__PERF_FORMAT_TOTAL_TIME_ENABLED |
+                                PerfCounterAttributionModel.__PERF_FORMAT_TOTAL_TIME_RUNNING)
+            attr.flags = PerfCounterAttributionModel.__FLAG_EXCLUDE_HV
+
+            if inherit:
+                attr.flags |= PerfCounterAttributionModel.__FLAG_INHERIT
+
+            fd = libc.syscall(ctypes.c_long(syscall_number), ctypes.byref(attr), ctypes.c_long(pid),
+                              ctypes.c_long(cpu), ctypes.c_long(-1),
+                              ctypes.c_ulong(PerfCounterAttributionModel.__PERF_FLAG_FD_CLOEXEC))
+
+            if fd < 0:
+                error = ctypes.get_errno()
+                raise OSError(error, os.strerror(error))
+
+            return fd
+
+        for task in os.listdir('/proc/self/task'):
+            self.__process_fds['cycles'].append(open_counter(PerfCounterAttributionModel.__PERF_COUNT_HW_CPU_CYCLES, int(task), -1, True))
+            self.__process_fds['instructions'].append(open_counter(PerfCounterAttributionModel.__PERF_COUNT_HW_INSTRUCTIONS, int(task), -1, True))
+
+        for cpu in self.__online_cpus():
+            self.__system_fds.append(open_counter(PerfCounterAttributionModel.__PERF_COUNT_HW_CPU_CYCLES, -1, cpu, False))
+
+    def __online_cpus(self) -> List[int]:
+        """Lists the online CPUs.
+
+        Returns:
+            List[int]: CPU numbers.
+        """
+        with open('/sys/devices/system/cpu/online', 'r') as file:
+            ranges = file.read().strip()
+
+        cpus: List[int] = []
+
+        for part in ranges.split(','):
+            bounds = part.split('-')
+            cpus.extend(range(int(bounds[0]), int(bounds[-1]) + 1))
+
+        return cpus
+
+    def __read_counter(self, fd: int) -> float:
+        """Reads a counter scaled by the fraction of time it was running.
+
+        Args:
+            fd: Counter descriptor.
+
+        Returns:
+            float: Estimated count.
+        """
+        value, enabled, running = struct.unpack('QQQ', os.read(fd, 24))
+
+        if running == 0:
+            return 0.0
+
+        return value * (enabled / running)
+
+    def __read_counts(self) -> Dict[str, float]:
+        """Reads every counter.
+
+        Returns:
+            Dict[str, float]: Process cycles, process instructions and
+            system cycles.
+        """
+        return {'cycles': sum(self.__read_counter(fd) for fd in self.__process_fds['cycles']),
+                'instructions': sum(self.__read_counter(fd) for fd in self.__process_fds['instructions']),
+                'system_cycles': sum(self.__read_counter(fd) for fd in self.__system_fds)}
+
+    def get_share(self) -> float:
+        """Returns the share of system cycles spent by the monitored process
+           since the previous call.
+
+        Returns:
+            float: Share between 0 and 1.
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+            from power_pyro.attribution_type import AttributionType
+
+            monitor = Monitor({'cpu': True}, attribution=AttributionType.PERF_COUNTERS)
+            ```
+        """
+        counts = self.__read_counts()
+        self.__last_deltas = {key: counts[key] - self.__last_counts[key] for key in counts}
+        self.__last_counts = counts
+
+        if self.__last_deltas['system_cycles'] <= 0:
+            return 0.0
+
+        return min(max(self.__last_deltas['cycles'] / self.__last_deltas['system_cycles'], 0.0), 1.0)
+
+    def get_counters(self) -> Dict[str, float]:
+        """Returns the counts between the two last calls to 'get_share'.
+
+        Returns:
+            Dict[str, float]: Process cycles, process instructions and
+            system cycles.
+        """
+        return dict(self.__last_deltas)
+
+    def close(self) -> None:
+        """Closes every counter descriptor."""
+        for fd in self.__process_fds['cycles'] + self.__process_fds['instructions'] + self.__system_fds:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+        self.__process_fds = {'cycles': [], 'instructions': []}
+        self.__system_fds = []
@@ -0,0 +1,111 @@
+from .resource_unavailable_exception import ResourceUnavailableException
+
+from typing import List
+import psutil
+
+class ProcessTree():
+    """A process and every descendant it starts, such as a shell pipeline.
+
+    The CPU time of the tree is the CPU time of its live processes plus the
+    CPU time they collected from the descendants they already reaped, so
+    processes that exit between two reads are still counted exactly once.
+    An exited root can still be read until it is reaped, so its parent
+    should wait for it without reaping ('os.waitid' with 'WNOWAIT') until
+    the last read.
+
+    Attributes:
+        __pid (int): Process id of the root.
+        __root (psutil.Process): The root process.
+        __last_cpu_time (float): CPU time of the tree at the previous read.
+    """
+    def __init__(self, pid: int):
+        """
+        Args:
+            pid (int): Process id of the root.
+
+        Raises:
+            ResourceUnavailableException: If the process does not exist.
+        """
+        try:
+            self.__pid: int = pid
+            self.__root: psutil.Process = psutil.Process(pid)
+        except psutil.Error as e:
+            raise ResourceUnavailableException("process tree", str(e))
+
+        self.__last_cpu_time: float = 0.0
+
+    @property
+    def pid(self) -> int:
+        """Gets the process id of the root.
+
+        Returns:
+            int: Process id.
+        """
+        return self.__pid
+
+    def __processes(self) -> List[psutil.Process]:
+        """Lists the live processes of the tree.
+
+        Returns:
+            List[psutil.Process]: The root followed by its descendants.
+
+        Raises:
+            psutil.NoSuchProcess: If the root is gone.
+        """
+        return [self.__root] + self.__root.children(recursive=True)
+
+    def read_pids(self) -> List[int]:
+        """Lists the process ids of the live processes of the tree.
+
+        Returns:
+            List[int]: The root followed by its descendants, empty if the 
+            root is gone.
+        """
+        try:
+            return [process.pid for process in self.__processes()]
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            return []
+
+    def read_cpu_time(self) -> float:
+        """Reads the CPU time used by the tree since the root started.
+
+        Returns:
+            float: Cumulative CPU time in seconds, never lower than at the 
+            previous read.
+        """
+        total = 0.0
+
+        try:
+            for process in self.__processes():
+                try:
+                    times = process.cpu_times()
+                    total += times.user + times.system + times.children_user + times.children_system
+                except (psutil.NoSuchProcess, psutil.ZombieProcess, psutil.AccessDenied):
+                    pass
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            pass
+
+        self.__last_cpu_time = max(self.__last_cpu_time, total)
+
+        return self.__last_cpu_time
+
+    def read_rss(self) -> int:
+        """Reads the resident memory of the tree.
+
+        Returns:
+            int: Sum of the resident set size of the live processes in bytes.
+        """
+        total = 0
+
+        try:
+            processes = self.__processes()
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            return 0
+
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.ZombieProcess, psutil.AccessDenied):
+                pass
+
+        return total
@@ -0,0 +1,46 @@
+from .cpu_attribution_model import CpuAttributionModel
+from .process_tree import ProcessTree
+from .cpu_utilization_reader import CpuUtilizationReader
+
+import psutil
+
+class ProcessTreeAttributionModel(CpuAttributionModel):
+    """Attributes CPU power by the share of host CPU time used by a process
+       tree, such as a command launched by 'powerpyro run'.
+
+    Attributes:
+        __tree (ProcessTree): The measured process tree.
+        __last_tree_time (float): CPU time of the tree at the previous call.
+        __last_host_time (float): Busy CPU time of the host at the previous call.
+    """
+    def __init__(self, tree: ProcessTree):
+        super().__init__()
+        self.__tree: ProcessTree = tree
+        self.__last_tree_time: float = tree.read_cpu_time()
+        self.__last_host_time: float = self.__read_host_time()
+
+    def __read_host_time(self) -> float:
+        """Reads the busy CPU time of the host.
+
+        Returns:
+            float: Cumulative busy CPU time of all CPUs in seconds.
+        """
+        return CpuUtilizationReader.busy_time(psutil.cpu_times())
+
+    def get_share(self) -> float:
+        """Returns the share of host CPU time used by the tree since the
+           previous call.
+
+        Returns:
+            float: Share between 0 and 1.
+        """
+        tree_time = self.__tree.read_cpu_time()
+        host_time = self.__read_host_time()
+        tree_delta = tree_time - self.__last_tree_time
+        host_delta = host_time - self.__last_host_time
+        self.__last_tree_time, self.__last_host_time = tree_time, host_time
+
+        if host_delta <= 0:
+            return 0.0
+
+        return min(max(tree_delta / host_delta, 0.0), 1.0)
@@ -1,9 +1,12 @@
 from .hardware_component import HardwareComponent
 from .os_type import OsType
+from .hardware_name_identify_exception import HardwareNameIdentifyException
+from .resource_unavailable_exception import ResourceUnavailableException
 
 import clr
 import os
 from abc import abstractmethod
+from threading import Lock
 from typing import Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -18,22 +21,36 @@ class ProcessingUnit(HardwareComponent):
     
     This class extends 'HardwareComponent' and provides common functionality
     for processing units, including name management and computer interaction.
+    The hardware name needs slower probes than the power readings, so it is 
+    only identified when it is first requested.
     """
     def __init__(self, operating_system: OsType):
         super().__init__(operating_system)
 
         self.__name: str = None
+        self.__name_identified: bool = False
+        self.__name_lock: Lock = Lock()
 
         if operating_system == OsType.WINDOWS:
             self.__computer: "Computer" = Computer()
 
     @property
     def name(self) -> str:
-        """Gets the name of the processing unit.
+        """Gets the name of the processing unit, identifying it on first use.
 
         Returns:
-            str: The name of the processing unit.
+            str: The name of the processing unit, or None if it cannot be 
+            identified.
         """
+        with self.__name_lock:
+            if not self.__name_identified:
+                self.__name_identified = True
+
+                try:
+                    self._update_hardware_name()
+                except (HardwareNameIdentifyException, ResourceUnavailableException) as e:
+                    print('Error identifying hardware name: ', str(e))
+
         return self.__name
     
     @name.setter
@@ -43,6 +60,7 @@ class ProcessingUnit(HardwareComponent):
         Args:
             name (str): The new name of the processing unit.
         """
+        self.__name_identified = True
         self.__name = name
     
     @property
@@ -0,0 +1,267 @@
+from typing import Any, Dict, Generator, List, Tuple, Union
+from array import array
+import bisect
+import json
+import time
+import pytest
+
+class PytestEnergyPlugin():
+    """Measures the energy of every test of a pytest session.
+
+    A single monitor runs for the whole session and each test only records
+    the timestamps of its call phase, so measuring a test costs two clock
+    reads. When the session ends, each test is given the energy of the
+    samples overlapping its call, pro-rated by the overlap, like a monitor
+    started and ended at those timestamps.
+
+    Tests marked with 'energy_budget' are also measured by their own monitor
+    on the shared sampler, which takes a sample as the test ends, and fail
+    when they use more energy than the budget.
+
+    Attributes:
+        __config (pytest.Config): Configuration of the session.
+        __components (Dict[str, bool]): Components to monitor.
+        __sampling_interval (float): Time in seconds between two samples.
+        __enabled (bool): Whether the session is measured.
+        __monitor (Any): Monitor of the session, None before collection ends.
+        __start (float): Start of the session monitor (Unix time).
+        __end (float): End of the session monitor (Unix time).
+        __tests (List[Tuple[str, float, float]]): Node id, start and end of
+        the call phase of every test.
+        __outcomes (Dict[str, str]): Outcome of the call phase by node id.
+        __budgets (Dict[str, Dict[str, Any]]): Budget and measured energy of
+        the tests marked with 'energy_budget', by node id.
+        __results (List[Dict[str, Any]]): Energy of every test, computed when
+        the session ends.
+        __session_energy (Dict[str, float]): Energy of the session in J by
+        component name.
+        __error (Union[str, None]): Why the session could not be measured.
+        __WATT_TO_KWH (float): Constant to convert energy from joules to
+        kilowatt-hours.
+    """
+    def __init__(self, config: pytest.Config):
+        """
+        Args:
+            config (pytest.Config): Configuration of the session.
+        """
+        names = [name.strip() for name in config.getoption('energy_components').split(',') if name.strip()]
+
+        self.__config: pytest.Config = config
+        self.__components: Dict[str, bool] = {name: True for name in names}
+        self.__sampling_interval: float = config.getoption('energy_interval')
+        self.__enabled: bool = config.getoption('energy') or config.getini('energy')
+        self.__monitor: Any = None
+        self.__start: float = 0.0
+        self.__end: float = 0.0
+        self.__tests: List[Tuple[str, float, float]] = []
+        self.__outcomes: Dict[str, str] = {}
+        self.__budgets: Dict[str, Dict[str, Any]] = {}
+        self.__results: List[Dict[str, Any]] = []
+        self.__session_energy: Dict[str, float] = {}
+        self.__error: Union[str, None] = None
+        self.__WATT_TO_KWH: float = 3_600_000
+
+    def __create_monitor(self) -> Any:
+        """Creates a monitor of the configured components.
+
+        Returns:
+            Monitor: The monitor, attached to the shared sampler when started.
+        """
+        from .monitor import Monitor
+
+        return Monitor(self.__components, sampling_interval=self.__sampling_interval)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, items: List[pytest.Item]) -> None:
+        """Measures the session when a selected test has an energy budget."""
+        if any(item.get_closest_marker('energy_budget') is not None for item in items):
+            self.__enabled = True
+
+    def pytest_collection_finish(self) -> None:
+        """Starts the session monitor once the tests are collected."""
+        if not self.__enabled:
+            return
+
+        try:
+            self.__monitor = self.__create_monitor()
+            self.__monitor.start()
+            self.__start = time.time()
+        except Exception as e:
+            self.__monitor = None
+            self.__error = str(e) or type(e).__name__
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item: pytest.Item) -> Generator[None, Any, None]:
+        """Records the boundaries of the call phase of a test and checks its
+           energy budget."""
+        if self.__monitor is None:
+            yield
+            return
+
+        marker = item.get_closest_marker('energy_budget')
+        monitor = self.__create_monitor() if marker is not None else None
+
+        if monitor is not None:
+            monitor.start()
+
+        start = time.time()
+        outcome = yield
+        end = time.time()
+
+        self.__tests.append((item.nodeid, start, end))
+
+        if monitor is not None:
+            monitor.end()
+            self.__check_budget(item.nodeid, marker, monitor, outcome)
+
+    def __check_budget(self, nodeid: str, marker: pytest.Mark, monitor: Any, outcome: Any) -> None:
+        """Fails a test that used more energy than its budget.
+
+        Args:
+            nodeid: Node id of the test.
+            marker: The 'energy_budget' marker of the test.
+            monitor: Monitor of the call phase of the test.
+            outcome: Outcome of the call phase.
+
+        Raises:
+            pytest.UsageError: If the marker has no budget.
+        """
+        joules = marker.args[0] if marker.args else marker.kwargs.get('joules')
+        kwh = marker.kwargs.get('kwh')
+        component = marker.kwargs.get('component')
+
+        if joules is None and kwh is None:
+            raise pytest.UsageError(f"{nodeid}: energy_budget needs a budget in joules or 'kwh'")
+
+        budget = float(joules) if joules is not None else float(kwh) * self.__WATT_TO_KWH
+        energy = monitor.get_energy_consumed_by_components()
+        used = (energy.get(component, 0.0) if component is not None else sum(energy.values())) * self.__WATT_TO_KWH
+
+        self.__budgets[nodeid] = {'budget': budget, 'used': used, 'component': component}
+
+        if used > budget and outcome.excinfo is None:
+            scope = f" by {component}" if component is not None else ""
+            outcome.force_exception(AssertionError(f"Energy budget exceeded{scope}: {used:.6g} J used, "
+                                                   f"{budget:.6g} J allowed"))
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        """Keeps the outcome of the call phase of every test."""
+        if report.when == 'call':
+            self.__outcomes[report.nodeid] = report.outcome
+
+    def __window_energy(self, timestamps: array, periods: array, energy: Dict[str, array],
+                        start: float, end: float) -> Dict[str, float]:
+        """Computes the energy of the samples overlapping a window.
+
+        Args:
+            timestamps: End of every sample.
+            periods: Duration of every sample in seconds.
+            energy: Energy of every sample in kWh by component name.
+            start: Start of the window (Unix time).
+            end: End of the window (Unix time).
+
+        Returns:
+            Dict[str, float]: Energy in J by component name.
+        """
+        totals = {key: 0.0 for key in energy}
+        index = bisect.bisect_right(timestamps, start)
+
+        while index < len(timestamps) and timestamps[index] - periods[index] < end:
+            overlap = min(timestamps[index], end) - max(timestamps[index] - periods[index], start)
+
+            if overlap > 0 and periods[index] > 0:
+                for key, values in energy.items():
+                    totals[key] += values[index] * overlap / periods[index] * self.__WATT_TO_KWH
+
+            index += 1
+
+        return totals
+
+    def pytest_sessionfinish(self) -> None:
+        """Ends the session monitor and computes the energy of every test."""
+        if self.__monitor is None:
+            return
+
+        self.__monitor.end()
+        self.__end = time.time()
+        self.__session_energy = {key: value * self.__WATT_TO_KWH
+                                 for key, value in self.__monitor.get_energy_consumed_by_components().items()}
+
+        timestamps, periods, _, energy = self.__monitor.get_timeline().columns()
+
+        for nodeid, start, end in self.__tests:
+            components = self.__window_energy(timestamps, periods, energy, start, end)
+            result = {'nodeid': nodeid, 'outcome': self.__outcomes.get(nodeid), 'start': start,
+                      'duration': end - start, 'energy': components, 'total': sum(components.values())}
+
+            if nodeid in self.__budgets:
+                result['budget'] = self.__budgets[nodeid]
+
+            self.__results.append(result)
+
+        path = self.__config.getoption('energy_json')
+
+        if path is not None:
+            with open(path, 'w') as file:
+                json.dump(self.report(), file, indent=2)
+
+    def report(self) -> Dict[str, Any]:
+        """Builds the energy report of the session.
+
+        Returns:
+            Dict[str, Any]: JSON serializable report, energies in J.
+        """
+        return {'components': list(self.__components),
+                'sampling_interval': self.__sampling_interval,
+                'start': self.__start,
+                'end': self.__end,
+                'energy': self.__session_energy,
+                'total': sum(self.__session_energy.values()),
+                'power_sources': self.__monitor.get_power_sources() if self.__monitor is not None else {},
+                'sensor_health': self.__monitor.get_sensor_health() if self.__monitor is not None else {},
+                'tests': self.__results}
+
+    def pytest_terminal_summary(self, terminalreporter: Any) -> None:
+        """Writes the energy of the most expensive tests."""
+        if self.__error is not None:
+            terminalreporter.write_sep('-', 'energy')
+            terminalreporter.write_line(f"Energy not measured: {self.__error}")
+            return
+
+        if self.__monitor is None:
+            return
+
+        top = self.__config.getoption('energy_top')
+        results = sorted(self.__results, key=lambda result: result['total'], reverse=True)
+        shown = results[:top] if top > 0 else results
+
+        terminalreporter.write_sep('-', f"energy per test (top {len(shown)} of {len(results)})")
+        terminalreporter.write_line(f"{'energy (J)':>12} {'time (s)':>9} {'power (W)':>9}  test")
+
+        for result in shown:
+            power = result['total'] / result['duration'] if result['duration'] > 0 else 0.0
+            terminalreporter.write_line(f"{result['total']:>12.4f} {result['duration']:>9.3f} {power:>9.2f}  "
+                                        f"{result['nodeid']}")
+
+        components = ', '.join(f"{key} {value:.2f} J" for key, value in self.__session_energy.items())
+        terminalreporter.write_line(f"session: {sum(self.__session_energy.values()):.2f} J over "
+                                    f"{self.__end - self.__start:.1f} s ({components})")
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Adds the options of the energy plugin."""
+    group = parser.getgroup('powerpyro', 'energy measurement with powerpyro')
+    group.addoption('--energy', action='store_true', default=False, help='measure the energy of every test')
+    group.addoption('--energy-components', default='cpu,memory', metavar='NAMES',
+                    help='comma separated components to monitor (default: cpu,memory)')
+    group.addoption('--energy-interval', type=float, default=0.1, metavar='SECONDS',
+                    help='seconds between two samples (default: 0.1)')
+    group.addoption('--energy-json', metavar='FILE', help='write the energy of every test to a JSON file')
+    group.addoption('--energy-top', type=int, default=20, metavar='N',
+                    help='number of tests shown in the energy summary, 0 for all (default: 20)')
+    parser.addini('energy', type='bool', default=False, help='measure the energy of every test')
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Registers the 'energy_budget' marker and the energy plugin."""
+    config.addinivalue_line('markers', 'energy_budget(joules, kwh=None, component=None): fail the test if its '
+                                       'call uses more energy than the budget')
+    config.pluginmanager.register(PytestEnergyPlugin(config), 'powerpyro-energy')
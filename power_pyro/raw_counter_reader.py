@@ -0,0 +1,130 @@
+from .cpu_attribution_model import CpuAttributionModel
+from .cgroup import Cgroup
+from .cpu_utilization_reader import CpuUtilizationReader
+from .process_tree import ProcessTree
+
+from typing import Dict, Union
+import math
+import os
+import psutil
+
+class RawCounterReader():
+    """Reads the raw inputs of the energy attribution at each sample.
+
+    Cumulative counters are returned as deltas since the previous read, so
+    a recording holds everything an attribution model needs for each
+    sample and can be attributed again offline:
+
+    - 'process_cpu_time': CPU time of the process (or of the measured
+      process tree) in seconds.
+    - 'system_cpu_time': busy CPU time of the host in seconds.
+    - 'cpu_count': logical CPUs of the host.
+    - 'rss' and 'pss': resident and proportional set size of the process
+      in bytes ('pss' is NaN where the kernel does not report it).
+    - 'cycles', 'instructions' and 'system_cycles': hardware counter deltas,
+      with the perf counter attribution.
+    - 'cgroup_cpu_time': CPU time of the cgroup in seconds, with the cgroup
+      attribution.
+
+    A value that cannot be read is NaN. GPU utilisation may hang like any
+    GPU sensor, so the sampler reads it through its own deadline-bounded
+    reader instead.
+
+    Attributes:
+        __cpu_attribution_model (Union[CpuAttributionModel, None]): Model
+        attributing CPU power, whose counters are recorded if it has any.
+        __cgroup (Union[Cgroup, None]): Cgroup of the process, if energy is
+        attributed to it.
+        __process_tree (Union[ProcessTree, None]): Process tree measured 
+        instead of the process, if any.
+        __last_totals (Dict[str, float]): Cumulative counters at the previous
+        read.
+    """
+    def __init__(self, cpu_attribution_model: Union[CpuAttributionModel, None] = None, cgroup: Union[Cgroup, None] = None,
+                 process_tree: Union[ProcessTree, None] = None):
+        """
+        Args:
+            cpu_attribution_model (Union[CpuAttributionModel, None]): Model
+            attributing CPU power (optional).
+            cgroup (Union[Cgroup, None]): Cgroup of the process (optional).
+            process_tree (Union[ProcessTree, None]): Process tree measured 
+            instead of the process (optional).
+        """
+        self.__cpu_attribution_model: Union[CpuAttributionModel, None] = cpu_attribution_model
+        self.__cgroup: Union[Cgroup, None] = cgroup
+        self.__process_tree: Union[ProcessTree, None] = process_tree
+        self.__last_totals: Dict[str, float] = self.__read_totals()
+
+    def use_cpu_attribution_model(self, cpu_attribution_model: Union[CpuAttributionModel, None]) -> None:
+        """Sets the model whose counters are recorded.
+
+        Args:
+            cpu_attribution_model (Union[CpuAttributionModel, None]): Model
+            attributing CPU power.
+        """
+        self.__cpu_attribution_model = cpu_attribution_model
+
+    def reset(self) -> None:
+        """Starts the next deltas from now."""
+        self.__last_totals = self.__read_totals()
+
+    def __read_totals(self) -> Dict[str, float]:
+        """Reads the cumulative CPU time counters.
+
+        Returns:
+            Dict[str, float]: Process, host and cgroup CPU time in seconds.
+        """
+        times = os.times()
+        system = psutil.cpu_times()
+        totals = {'process_cpu_time': times.user + times.system if self.__process_tree is None
+                                      else self.__process_tree.read_cpu_time(),
+                  'system_cpu_time': CpuUtilizationReader.busy_time(system)}
+
+        if self.__cgroup is not None:
+            try:
+                totals['cgroup_cpu_time'] = self.__cgroup.read_cpu_usage()
+            except (OSError, KeyError, ValueError):
+                totals['cgroup_cpu_time'] = math.nan
+
+        return totals
+
+    def __read_memory(self) -> Dict[str, float]:
+        """Reads the resident and proportional set size of the process.
+
+        Returns:
+            Dict[str, float]: 'rss' and 'pss' in bytes ('pss' is NaN for a 
+            process tree).
+        """
+        if self.__process_tree is not None:
+            return {'rss': float(self.__process_tree.read_rss()), 'pss': math.nan}
+
+        try:
+            with open('/proc/self/smaps_rollup', 'rb') as file:
+                fields = dict(line.split(b':', 1) for line in file.read().splitlines() if b':' in line)
+
+            return {'rss': int(fields[b'Rss'].split()[0]) * 1024, 'pss': int(fields[b'Pss'].split()[0]) * 1024}
+        except (OSError, KeyError, ValueError):
+            pass
+
+        try:
+            return {'rss': float(psutil.Process().memory_info().rss), 'pss': math.nan}
+        except psutil.Error:
+            return {'rss': math.nan, 'pss': math.nan}
+
+    def read(self) -> Dict[str, float]:
+        """Reads the raw inputs since the previous read.
+
+        Returns:
+            Dict[str, float]: Raw inputs by name.
+        """
+        totals = self.__read_totals()
+        raw = {key: totals[key] - self.__last_totals.get(key, math.nan) for key in totals}
+        self.__last_totals = totals
+
+        raw['cpu_count'] = float(os.cpu_count() or 1)
+        raw.update(self.__read_memory())
+
+        if self.__cpu_attribution_model is not None and hasattr(self.__cpu_attribution_model, 'get_counters'):
+            raw.update(self.__cpu_attribution_model.get_counters())
+
+        return raw
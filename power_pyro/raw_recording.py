@@ -0,0 +1,181 @@
+from array import array
+from threading import Lock
+from typing import Any, Dict, List, Tuple
+import json
+import math
+
+class RawRecording():
+    """Column-oriented record of the raw inputs of every sample of a monitor.
+
+    Next to the power read from each component and the share attributed to
+    the process, every sample keeps the raw counters read by
+    'RawCounterReader', so the energy can be attributed again offline with
+    another model (see 'OfflineAttribution'). Counters that first appear
+    after some samples were recorded are NaN for those samples.
+
+    Attributes:
+        __components (List[str]): Names of the recorded components.
+        __timestamps (array): End of each sampled period (Unix time).
+        __periods (array): Duration of each sampled period in seconds.
+        __power (Dict[str, array]): Power read in W by component name.
+        __share (Dict[str, array]): Share attributed to the process by
+        component name.
+        __raw (Dict[str, array]): Raw counters by name.
+        __lock (Lock): Guards the columns against concurrent appends.
+    """
+    VERSION: int = 1
+
+    DELTAS: Tuple[str, ...] = ('process_cpu_time', 'system_cpu_time', 'cgroup_cpu_time',
+                               'cycles', 'instructions', 'system_cycles')
+
+    def __init__(self, components: List[str]):
+        """
+        Args:
+            components (List[str]): Names of the recorded components.
+        """
+        self.__components: List[str] = list(components)
+        self.__timestamps: array = array('d')
+        self.__periods: array = array('d')
+        self.__power: Dict[str, array] = {component: array('d') for component in components}
+        self.__share: Dict[str, array] = {component: array('d') for component in components}
+        self.__raw: Dict[str, array] = {}
+        self.__lock: Lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.__timestamps)
+
+    @property
+    def components(self) -> List[str]:
+        """Gets the names of the recorded components.
+
+        Returns:
+            List[str]: Component names.
+        """
+        return list(self.__components)
+
+    @property
+    def counters(self) -> List[str]:
+        """Gets the names of the recorded raw counters.
+
+        Returns:
+            List[str]: Counter names.
+        """
+        with self.__lock:
+            return list(self.__raw)
+
+    def append(self, timestamp: float, period: float, power: Dict[str, float], share: Dict[str, float],
+               raw: Dict[str, float], fraction: float = 1.0) -> None:
+        """Adds a sample to the end of the recording.
+
+        Args:
+            timestamp (float): End of the recorded period (Unix time).
+            period (float): Duration of the recorded period in seconds.
+            power (Dict[str, float]): Power read in W by component name.
+            share (Dict[str, float]): Share attributed to the process by
+            component name.
+            raw (Dict[str, float]): Raw counters of the whole sample by name.
+            fraction (float): Part of the sample inside the recorded period,
+            applied to the counters listed in 'DELTAS' (optional, default is 1).
+        """
+        with self.__lock:
+            for name in raw:
+                if name not in self.__raw:
+                    self.__raw[name] = array('d', [math.nan]) * len(self.__timestamps)
+
+            self.__timestamps.append(timestamp)
+            self.__periods.append(period)
+
+            for component in self.__components:
+                self.__power[component].append(power.get(component, 0.0))
+                self.__share[component].append(share.get(component, 1.0))
+
+            for name, values in self.__raw.items():
+                value = raw.get(name, math.nan)
+                values.append(value * fraction if name in RawRecording.DELTAS else value)
+
+    def columns(self) -> Dict[str, Any]:
+        """Returns a consistent copy of every column.
+
+        Returns:
+            Dict[str, Any]: 'timestamp' and 'period' arrays, 'power' and
+            'share' arrays by component name and 'raw' arrays by counter name.
+        """
+        with self.__lock:
+            return {'timestamp': array('d', self.__timestamps),
+                    'period': array('d', self.__periods),
+                    'power': {component: array('d', values) for component, values in self.__power.items()},
+                    'share': {component: array('d', values) for component, values in self.__share.items()},
+                    'raw': {name: array('d', values) for name, values in self.__raw.items()}}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializes the recording.
+
+        Returns:
+            Dict[str, Any]: JSON serializable recording, NaN values as None.
+        """
+        def listed(values: array) -> List[Any]:
+            return [None if math.isnan(value) else value for value in values]
+
+        columns = self.columns()
+
+        return {'version': RawRecording.VERSION,
+                'components': self.__components,
+                'timestamp': list(columns['timestamp']),
+                'period': list(columns['period']),
+                'power': {key: listed(values) for key, values in columns['power'].items()},
+                'share': {key: listed(values) for key, values in columns['share'].items()},
+                'raw': {key: listed(values) for key, values in columns['raw'].items()}}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RawRecording':
+        """Deserializes a recording.
+
+        Args:
+            data (Dict[str, Any]): Recording returned by 'to_dict'.
+
+        Returns:
+            RawRecording: The recording.
+
+        Raises:
+            ValueError: If the recording has an unknown version or its columns
+            do not have the same length.
+        """
+        if data.get('version') != RawRecording.VERSION:
+            raise ValueError(f"Unsupported raw recording version: {data.get('version')}")
+
+        recording = cls(data['components'])
+        columns = [data['period']] + list(data['power'].values()) + list(data['share'].values()) + list(data['raw'].values())
+
+        if any(len(values) != len(data['timestamp']) for values in columns):
+            raise ValueError("Raw recording columns must have the same length")
+
+        def row(columns: Dict[str, List[Any]], index: int) -> Dict[str, float]:
+            return {key: math.nan if values[index] is None else values[index] for key, values in columns.items()}
+
+        for index, timestamp in enumerate(data['timestamp']):
+            recording.append(timestamp, data['period'][index], row(data['power'], index),
+                             row(data['share'], index), row(data['raw'], index))
+
+        return recording
+
+    def save(self, path: str) -> None:
+        """Writes the recording to a JSON file.
+
+        Args:
+            path (str): File path.
+        """
+        with open(path, 'w') as file:
+            json.dump(self.to_dict(), file)
+
+    @classmethod
+    def load(cls, path: str) -> 'RawRecording':
+        """Reads a recording written by 'save'.
+
+        Args:
+            path (str): File path.
+
+        Returns:
+            RawRecording: The recording.
+        """
+        with open(path, 'r') as file:
+            return cls.from_dict(json.load(file))
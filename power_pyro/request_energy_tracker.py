@@ -0,0 +1,207 @@
+from .monitor import Monitor
+from .attribution_type import AttributionType
+from .energy_histogram import EnergyHistogram
+from .sample import Sample
+
+from typing import Any, Dict, Union
+from threading import Lock
+import math
+
+class RequestEnergyTracker():
+    """Charges short units of work, such as web requests, their share of energy.
+
+    A monitor on the shared sampler measures the energy attributed to the
+    process. At every sample, that energy is divided by the CPU time used
+    by the process during the sample, read by the sampler together with the
+    power so both cover the same period, giving the energy of one CPU
+    second.
+    A request is then charged the CPU time of its own thread, measured with
+    'time.thread_time', times the latest rate, so charging costs a
+    multiplication and a histogram update and needs no per-request sensor
+    read. The rate lags by one sample, which is negligible for services
+    whose load changes slower than the sampling interval.
+
+    CPU time spent by a request outside the measured thread, e.g. in a
+    thread pool, is not charged. The share of the process CPU time charged
+    to requests is reported as 'coverage', and a warning is printed once
+    if most of it is not charged.
+
+    Routes beyond 'max_routes' are charged into a single 'other' histogram,
+    so paths with ids do not make memory grow in a long-lived service.
+
+    Attributes:
+        __monitor (Monitor): Monitor measuring the process energy.
+        __rate (float): Energy in J of one CPU second of the process.
+        __histograms (Dict[str, EnergyHistogram]): Energy of the requests by
+        route.
+        __max_routes (int): Number of routes with their own histogram.
+        __charged_cpu_time (float): CPU time charged to requests in seconds.
+        __process_cpu_time (float): CPU time used by the process during the
+        samples in seconds.
+        __warned (bool): Whether the low coverage warning was printed.
+        __lock (Lock): Guards the histograms and the CPU time totals.
+        __MIN_COVERAGE (float): Coverage under which the warning is printed.
+        __MIN_CPU_TIME (float): Process CPU time in seconds needed before
+        the coverage is checked.
+        __WATT_TO_KWH (float): Constant to convert energy from joules to
+        kilowatt-hours.
+    """
+    def __init__(self, required_components: Union[Dict[str, bool], None] = None, sampling_interval: float = 1.0,
+                 attribution: AttributionType = AttributionType.CPU_PERCENT, max_routes: int = 256):
+        """
+        Args:
+            required_components (Union[Dict[str, bool], None]): Components whose
+            energy is charged to requests (optional, default is the CPU and
+            the memory).
+            sampling_interval (float): Time in seconds between two samples
+            (optional, default is 1).
+            attribution (AttributionType): How energy is attributed to the
+            process (optional, default is AttributionType.CPU_PERCENT).
+            max_routes (int): Number of routes with their own histogram, the
+            requests of any further route are charged to 'other' (optional,
+            default is 256).
+
+        Raises:
+            ValueError: If 'max_routes' is not positive.
+        """
+        if max_routes <= 0:
+            raise ValueError("Maximum number of routes must be positive")
+
+        self.__WATT_TO_KWH: float = 3_600_000
+        self.__rate: float = 0.0
+        self.__MIN_COVERAGE: float = 0.5
+        self.__MIN_CPU_TIME: float = 10.0
+        self.__histograms: Dict[str, EnergyHistogram] = {}
+        self.__max_routes: int = max_routes
+        self.__charged_cpu_time: float = 0.0
+        self.__process_cpu_time: float = 0.0
+        self.__warned: bool = False
+        self.__lock: Lock = Lock()
+        self.__monitor: Monitor = Monitor(required_components or {'cpu': True, 'memory': True},
+                                          sampling_interval=sampling_interval, attribution=attribution,
+                                          publish_raw=True)
+        self.__monitor.subscribe(self.__on_sample, maxsize=16)
+        self.__monitor.start()
+
+    @property
+    def rate(self) -> float:
+        """Gets the energy of one CPU second of the process.
+
+        Returns:
+            float: Energy in J per CPU second, 0.0 before the first sample.
+        """
+        return self.__rate
+
+    @property
+    def coverage(self) -> Union[float, None]:
+        """Gets the share of the process CPU time charged to requests.
+
+        Returns:
+            Union[float, None]: Charged CPU time over process CPU time, or
+            None before the first sample with CPU time.
+        """
+        with self.__lock:
+            return self.__coverage()
+
+    def __coverage(self) -> Union[float, None]:
+        return self.__charged_cpu_time / self.__process_cpu_time if self.__process_cpu_time > 0 else None
+
+    def get_monitor(self) -> Monitor:
+        """Retrieves the monitor measuring the process energy.
+
+        Returns:
+            Monitor: The monitor.
+        """
+        return self.__monitor
+
+    def __on_sample(self, sample: Sample) -> None:
+        """Updates the energy of one CPU second from a sample.
+
+        Args:
+            sample: The new sample.
+        """
+        cpu_time = sample.raw.get('process_cpu_time', math.nan)
+
+        if not cpu_time > 0:
+            return
+
+        self.__rate = sum(sample.energy.values()) * self.__WATT_TO_KWH / cpu_time
+
+        with self.__lock:
+            self.__process_cpu_time += cpu_time
+            coverage = self.__coverage()
+            warn = (not self.__warned and self.__charged_cpu_time > 0 and
+                    self.__process_cpu_time >= self.__MIN_CPU_TIME and coverage < self.__MIN_COVERAGE)
+            self.__warned = self.__warned or warn
+
+        if warn:
+            print('Warning charging requests: ',
+                  f'only {coverage:.0%} of the process CPU time was charged, requests running in a '
+                  'thread pool (e.g. sync endpoints of an ASGI framework) are charged their event loop '
+                  'time only')
+
+    def charge(self, route: str, cpu_time: float) -> float:
+        """Charges a request for the CPU time it used.
+
+        Args:
+            route (str): Route of the request, replaced by 'other' once
+            'max_routes' routes have been charged.
+            cpu_time (float): CPU time used by the request in seconds.
+
+        Returns:
+            float: Energy charged in J.
+        """
+        energy = cpu_time * self.__rate
+
+        with self.__lock:
+            self.__charged_cpu_time += cpu_time
+            histogram = self.__histograms.get(route)
+
+            if histogram is None and len(self.__histograms) >= self.__max_routes:
+                route = 'other'
+                histogram = self.__histograms.get(route)
+
+            if histogram is None:
+                histogram = self.__histograms[route] = EnergyHistogram()
+
+            histogram.add(energy)
+
+        return energy
+
+    def get_histograms(self) -> Dict[str, EnergyHistogram]:
+        """Retrieves the energy distribution of the requests of each route.
+
+        Returns:
+            Dict[str, EnergyHistogram]: Histograms by route.
+        """
+        with self.__lock:
+            return dict(self.__histograms)
+
+    def summary(self) -> Dict[str, Any]:
+        """Summarises the requests as a JSON serializable dictionary.
+
+        Returns:
+            Dict[str, Any]: The energy of one CPU second in J, the coverage
+            and, for each route, the count, sum, mean, quantiles and buckets
+            of the energy charged to its requests in J.
+
+        Example:
+            ```python
+            from power_pyro.request_energy_tracker import RequestEnergyTracker
+            from power_pyro.wsgi_energy_middleware import WsgiEnergyMiddleware
+
+            tracker = RequestEnergyTracker()
+            app = WsgiEnergyMiddleware(app, tracker)
+            # ... serve requests ...
+            print(tracker.summary()['routes']['GET /items'])
+            # {'count': 1200, 'sum': 3.4, 'mean': 0.0028, 'p50': 0.0018, ...}
+            ```
+        """
+        with self.__lock:
+            return {'rate': self.__rate,
+                    'coverage': self.__coverage(),
+                    'routes': {route: histogram.to_dict() for route, histogram in self.__histograms.items()}}
+
+    def close(self) -> None:
+        """Ends the monitor measuring the process energy."""
+        self.__monitor.end()
@@ -0,0 +1,138 @@
+from array import array
+from typing import Any, Dict, List
+import math
+
+class RetentionTier():
+    """Fixed-size ring of time buckets summarising samples at one resolution.
+
+    Every column is preallocated for 'capacity' buckets, so the memory of a
+    tier does not change however long the run lasts. A sample is added to
+    the bucket containing its timestamp; when the ring wraps around, the
+    oldest bucket is reused.
+
+    Attributes:
+        __resolution (float): Duration of a bucket in seconds.
+        __capacity (int): Number of buckets kept.
+        __components (List[str]): Names of the summarised components.
+        __ids (array): Index of the bucket held by each slot, -1 if empty.
+        __durations (array): Sampled time in each bucket in seconds.
+        __counts (array): Number of samples in each bucket.
+        __minimum (Dict[str, array]): Lowest power read in W by component.
+        __maximum (Dict[str, array]): Highest power read in W by component.
+        __power_time (Dict[str, array]): Power read multiplied by time in
+        W·s by component, used for the time-weighted mean.
+        __energy (Dict[str, array]): Attributed energy in kWh by component.
+        __latest (int): Index of the newest bucket, -1 before any sample.
+    """
+    def __init__(self, resolution: float, capacity: int, components: List[str]):
+        """
+        Args:
+            resolution (float): Duration of a bucket in seconds.
+            capacity (int): Number of buckets kept.
+            components (List[str]): Names of the summarised components.
+
+        Raises:
+            ValueError: If the resolution or the capacity is not positive.
+        """
+        if resolution <= 0 or capacity <= 0:
+            raise ValueError("Tier resolution and capacity must be positive")
+
+        self.__resolution: float = resolution
+        self.__capacity: int = capacity
+        self.__components: List[str] = list(components)
+        self.__ids: array = array('q', [-1]) * capacity
+        self.__durations: array = array('d', [0.0]) * capacity
+        self.__counts: array = array('q', [0]) * capacity
+        self.__minimum: Dict[str, array] = {key: array('d', [math.inf]) * capacity for key in components}
+        self.__maximum: Dict[str, array] = {key: array('d', [-math.inf]) * capacity for key in components}
+        self.__power_time: Dict[str, array] = {key: array('d', [0.0]) * capacity for key in components}
+        self.__energy: Dict[str, array] = {key: array('d', [0.0]) * capacity for key in components}
+        self.__latest: int = -1
+
+    @property
+    def resolution(self) -> float:
+        """Gets the duration of a bucket.
+
+        Returns:
+            float: Resolution in seconds.
+        """
+        return self.__resolution
+
+    @property
+    def capacity(self) -> int:
+        """Gets the number of buckets kept.
+
+        Returns:
+            int: Capacity.
+        """
+        return self.__capacity
+
+    def add(self, timestamp: float, period: float, power: Dict[str, float], energy: Dict[str, float]) -> None:
+        """Adds a sample to the bucket containing its timestamp.
+
+        Args:
+            timestamp (float): End of the sampled period (Unix time).
+            period (float): Duration of the sampled period in seconds.
+            power (Dict[str, float]): Power read in W by component name.
+            energy (Dict[str, float]): Attributed energy in kWh by component name.
+        """
+        bucket = int(timestamp // self.__resolution)
+
+        if bucket <= self.__latest - self.__capacity:
+            return
+
+        slot = bucket % self.__capacity
+
+        if self.__ids[slot] != bucket:
+            self.__ids[slot] = bucket
+            self.__durations[slot] = 0.0
+            self.__counts[slot] = 0
+
+            for key in self.__components:
+                self.__minimum[key][slot] = math.inf
+                self.__maximum[key][slot] = -math.inf
+                self.__power_time[key][slot] = 0.0
+                self.__energy[key][slot] = 0.0
+
+        self.__durations[slot] += period
+        self.__counts[slot] += 1
+        self.__latest = max(self.__latest, bucket)
+
+        for key in self.__components:
+            value = power.get(key, 0.0)
+            self.__minimum[key][slot] = min(self.__minimum[key][slot], value)
+            self.__maximum[key][slot] = max(self.__maximum[key][slot], value)
+            self.__power_time[key][slot] += value * period
+            self.__energy[key][slot] += energy.get(key, 0.0)
+
+    def buckets(self) -> List[Dict[str, Any]]:
+        """Lists the buckets kept, oldest first.
+
+        Returns:
+            List[Dict[str, Any]]: For each bucket, its 'start' (Unix time),
+            'duration' sampled in seconds, sample 'count', and for each
+            component the 'min', 'mean' and 'max' power read in W and the
+            attributed 'energy' in kWh.
+        """
+        result: List[Dict[str, Any]] = []
+
+        for bucket in range(max(self.__latest - self.__capacity + 1, 0), self.__latest + 1):
+            slot = bucket % self.__capacity
+
+            if self.__ids[slot] != bucket:
+                continue
+
+            duration = self.__durations[slot]
+            entry: Dict[str, Any] = {'start': bucket * self.__resolution,
+                                     'duration': duration,
+                                     'count': self.__counts[slot]}
+
+            for key in self.__components:
+                entry[key] = {'min': self.__minimum[key][slot],
+                              'mean': self.__power_time[key][slot] / duration if duration > 0 else 0.0,
+                              'max': self.__maximum[key][slot],
+                              'energy': self.__energy[key][slot]}
+
+            result.append(entry)
+
+        return result
@@ -0,0 +1,34 @@
+from dataclasses import dataclass, field
+from typing import Dict
+
+@dataclass(frozen=True)
+class Sample():
+    """A sample taken by a monitor.
+
+    Attributes:
+        timestamp (float): End of the sampled period (Unix time).
+        period (float): Duration of the sampled period in seconds.
+        power (Dict[str, float]): Power read in W by component name.
+        energy (Dict[str, float]): Energy in kWh attributed to the monitored 
+        process during the period, by component name.
+        stale (Dict[str, bool]): Whether a component reused the last good 
+        sensor value, by component name.
+        share (Dict[str, float]): Fraction of the power attributed to the 
+        monitored process, by component name.
+        raw (Dict[str, float]): Raw counters of the period by name, if the 
+        monitor records them.
+        telemetry (Dict[str, float]): CPU frequency, temperature and 
+        throttling at the end of the period by name, if the monitor records 
+        them.
+        memory_nodes (Dict[str, float]): Fraction of the memory power drawn 
+        by each NUMA node, by node name, on hosts with several nodes.
+    """
+    timestamp: float
+    period: float
+    power: Dict[str, float] = field(default_factory=dict)
+    energy: Dict[str, float] = field(default_factory=dict)
+    stale: Dict[str, bool] = field(default_factory=dict)
+    share: Dict[str, float] = field(default_factory=dict)
+    raw: Dict[str, float] = field(default_factory=dict)
+    telemetry: Dict[str, float] = field(default_factory=dict)
+    memory_nodes: Dict[str, float] = field(default_factory=dict)
@@ -0,0 +1,209 @@
+from typing import Any, BinaryIO, Tuple, Union
+from threading import Lock, Thread
+from collections import OrderedDict
+import json
+import os
+import socketserver
+
+class SampleCollector():
+    """Receives samples from 'SocketSampleSink' instances and stores them in
+       the same layout as 'DirectorySampleSink', ready to be merged.
+
+    The run id, host and rank of a record come from the network, so records
+    whose run id or host is not a plain file name, or whose rank is not an
+    integer, are dropped, and a bounded number of files are kept open. A
+    connection sending a line longer than 'max_line_size' is closed, so a
+    client cannot exhaust the memory of the collector.
+
+    Attributes:
+        __directory (str): Directory where the records are stored.
+        __address (Union[str, Tuple[str, int]]): Unix socket path or
+        (host, port) to listen on.
+        __server (Union[socketserver.BaseServer, None]): Running server.
+        __thread (Union[Thread, None]): Thread serving the connections.
+        __files (OrderedDict): Open files by path, least recently written 
+        first.
+        __max_open_files (int): Number of files kept open at most.
+        __max_line_size (int): Length in bytes of the longest record accepted.
+        __lock (Lock): Guards the open files.
+    """
+    def __init__(self, directory: str, address: Union[str, Tuple[str, int]], max_open_files: int = 256,
+                 max_line_size: int = 1_048_576):
+        """
+        Args:
+            directory (str): Directory where the records are stored.
+            address (Union[str, Tuple[str, int]]): Unix socket path or 
+            (host, port) to listen on.
+            max_open_files (int): Number of rank files kept open at most, 
+            the least recently written one is closed beyond it (optional, 
+            default is 256).
+            max_line_size (int): Length in bytes of the longest record 
+            accepted, including its newline (optional, default is 1 MiB).
+
+        Raises:
+            ValueError: If 'max_open_files' or 'max_line_size' is not 
+            positive.
+
+        Example:
+            ```python
+            from power_pyro.sample_collector import SampleCollector
+
+            collector = SampleCollector('/data/energy', '/tmp/powerpyro.sock')
+            collector.start()
+            # ... ranks run with SocketSampleSink('/tmp/powerpyro.sock') ...
+            collector.stop()
+            ```
+        """
+        if max_open_files <= 0:
+            raise ValueError("Maximum number of open files must be positive")
+
+        if max_line_size <= 0:
+            raise ValueError("Maximum line size must be positive")
+
+        self.__directory: str = os.path.realpath(directory)
+        self.__address: Union[str, Tuple[str, int]] = address
+        self.__server: Union[socketserver.BaseServer, None] = None
+        self.__thread: Union[Thread, None] = None
+        self.__files: "OrderedDict[str, BinaryIO]" = OrderedDict()
+        self.__max_open_files: int = max_open_files
+        self.__max_line_size: int = max_line_size
+        self.__lock: Lock = Lock()
+
+    @property
+    def address(self) -> Union[str, Tuple[str, int]]:
+        """Gets the address the collector listens on.
+
+        Returns:
+            Union[str, Tuple[str, int]]: Unix socket path or (host, port), 
+            with the actual port when port 0 was requested.
+        """
+        if self.__server is not None and not isinstance(self.__address, str):
+            return self.__server.server_address
+
+        return self.__address
+
+    @staticmethod
+    def __is_file_name(name: Any) -> bool:
+        """Checks if a value can be used as a single path component.
+
+        Args:
+            name: Value received in a record.
+
+        Returns:
+            bool: True for a non-empty string without separators that is 
+            neither '.' nor '..'.
+        """
+        return (isinstance(name, str) and name not in ('', '.', '..') and '\0' not in name
+                and '/' not in name and '\\' not in name and os.path.basename(name) == name)
+
+    def __path(self, record: Any) -> Union[str, None]:
+        """Builds the file of the rank of a record.
+
+        Args:
+            record: Decoded record.
+
+        Returns:
+            Union[str, None]: The file, or None if the record does not name 
+            a rank safely.
+        """
+        if not isinstance(record, dict):
+            return None
+
+        run_id, host, rank = record.get('run_id'), record.get('host'), record.get('rank')
+
+        if not self.__is_file_name(run_id) or not self.__is_file_name(host):
+            return None
+
+        if not isinstance(rank, int) or isinstance(rank, bool) or rank < 0:
+            return None
+
+        path = os.path.realpath(os.path.join(self.__directory, run_id, f"{host}-{rank}.jsonl"))
+
+        if os.path.commonpath([path, self.__directory]) != self.__directory:
+            return None
+
+        return path
+
+    def store(self, line: bytes) -> None:
+        """Appends a received JSON line to the file of its rank.
+
+        Records that cannot be decoded or do not name a rank safely are 
+        dropped.
+
+        Args:
+            line (bytes): Tagged record.
+        """
+        try:
+            path = self.__path(json.loads(line))
+        except ValueError:
+            return
+
+        if path is None:
+            return
+
+        with self.__lock:
+            if path in self.__files:
+                self.__files.move_to_end(path)
+            else:
+                if len(self.__files) >= self.__max_open_files:
+                    _, oldest = self.__files.popitem(last=False)
+                    oldest.close()
+
+                try:
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    self.__files[path] = open(path, 'ab')
+                except OSError as e:
+                    print('Error opening rank file: ', str(e))
+                    return
+
+            self.__files[path].write(line if line.endswith(b'\n') else line + b'\n')
+            self.__files[path].flush()
+
+    def start(self) -> None:
+        """Starts listening in a background thread."""
+        collector = self
+        max_line_size = self.__max_line_size
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                while True:
+                    line = self.rfile.readline(max_line_size + 1)
+
+                    if not line:
+                        return
+
+                    if len(line) > max_line_size:
+                        print('Error receiving samples: ', f'record longer than {max_line_size} bytes, '
+                              'closing the connection')
+                        return
+
+                    collector.store(line)
+
+        if isinstance(self.__address, str):
+            if os.path.exists(self.__address):
+                os.unlink(self.__address)
+
+            self.__server = socketserver.ThreadingUnixStreamServer(self.__address, Handler)
+        else:
+            self.__server = socketserver.ThreadingTCPServer(self.__address, Handler)
+
+        self.__server.daemon_threads = True
+        self.__thread = Thread(target=self.__server.serve_forever, name='powerpyro-collector', daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """Stops listening and closes every file."""
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__thread.join()
+            self.__server = None
+
+            if isinstance(self.__address, str) and os.path.exists(self.__address):
+                os.unlink(self.__address)
+
+        with self.__lock:
+            for file in self.__files.values():
+                file.close()
+
+            self.__files = OrderedDict()
@@ -0,0 +1,93 @@
+from typing import Any, Dict, Union
+from abc import ABC, abstractmethod
+import json
+import os
+import socket
+
+class SampleSink(ABC):
+    """Abstract base class representing a destination for the samples of a
+       monitor, tagged with the run, rank and host that produced them.
+
+    Attributes:
+        __run_id (str): Identifier shared by every rank of a job.
+        __rank (int): Rank of the process inside the job.
+        __host (str): Name of the host running the process.
+    """
+    __RANK_VARIABLES = ('RANK', 'OMPI_COMM_WORLD_RANK', 'PMI_RANK', 'SLURM_PROCID')
+
+    def __init__(self, run_id: Union[str, None] = None, rank: Union[int, None] = None, host: Union[str, None] = None):
+        """
+        Args:
+            run_id (Union[str, None]): Identifier of the job (optional, default 
+            is the 'POWERPYRO_RUN_ID' environment variable, or 'default').
+            rank (Union[int, None]): Rank of the process (optional, default is 
+            read from 'RANK', 'OMPI_COMM_WORLD_RANK', 'PMI_RANK' or 
+            'SLURM_PROCID', or 0).
+            host (Union[str, None]): Host name (optional, default is the 
+            current host).
+        """
+        self.__run_id: str = run_id or os.environ.get('POWERPYRO_RUN_ID', 'default')
+        self.__rank: int = rank if rank is not None else SampleSink.__rank_from_environment()
+        self.__host: str = host or socket.gethostname()
+
+    @staticmethod
+    def __rank_from_environment() -> int:
+        for variable in SampleSink.__RANK_VARIABLES:
+            if os.environ.get(variable, '').isdigit():
+                return int(os.environ[variable])
+
+        return 0
+
+    @property
+    def run_id(self) -> str:
+        """Gets the identifier of the job.
+
+        Returns:
+            str: Run identifier.
+        """
+        return self.__run_id
+
+    @property
+    def rank(self) -> int:
+        """Gets the rank of the process.
+
+        Returns:
+            int: Rank.
+        """
+        return self.__rank
+
+    @property
+    def host(self) -> str:
+        """Gets the host name.
+
+        Returns:
+            str: Host name.
+        """
+        return self.__host
+
+    def encode(self, record: Dict[str, Any]) -> bytes:
+        """Tags a record and encodes it as a JSON line.
+
+        Args:
+            record (Dict[str, Any]): Record written by the monitor.
+
+        Returns:
+            bytes: The tagged record followed by a newline.
+        """
+        tagged = {'run_id': self.__run_id, 'rank': self.__rank, 'host': self.__host}
+        tagged.update(record)
+
+        return (json.dumps(tagged, separators=(',', ':')) + '\n').encode()
+
+    @abstractmethod
+    def write(self, record: Dict[str, Any]) -> None:
+        """Abstract method to deliver a record ('meta', 'sample' or 'region').
+
+        Args:
+            record (Dict[str, Any]): Record written by the monitor.
+        """
+        pass
+
+    def close(self) -> None:
+        """Releases the resources held by the sink."""
+        pass
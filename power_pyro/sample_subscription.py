@@ -0,0 +1,190 @@
+from .sample import Sample
+from .delivery_policy import DeliveryPolicy
+
+from typing import Callable, Deque, Dict, Iterator, Union
+from collections import deque
+from threading import Condition, Thread
+
+class SampleSubscription():
+    """Bounded queue delivering the samples of a monitor to one subscriber.
+
+    The sampler only appends to the queue, so a slow subscriber never makes
+    it wait longer than the policy allows and never grows memory past
+    'maxsize' samples. A subscriber either passes a callback, which runs on
+    a dedicated thread, or iterates over the subscription.
+
+    Attributes:
+        __queue (Deque[Sample]): Samples waiting to be delivered.
+        __maxsize (int): Capacity of the queue.
+        __policy (DeliveryPolicy): What happens to a sample when the queue
+        is full.
+        __block_timeout (float): Time in seconds the sampler may wait for
+        room with 'DeliveryPolicy.BLOCK' before the sample is dropped.
+        __condition (Condition): Guards the queue and signals changes.
+        __closed (bool): Whether no more samples will be published.
+        __published (int): Samples offered by the sampler.
+        __delivered (int): Samples handed to the subscriber.
+        __dropped (int): Samples discarded because the queue was full.
+        __errors (int): Callback calls that raised an exception.
+        __thread (Union[Thread, None]): Thread running the callback, if any.
+    """
+    def __init__(self, callback: Union[Callable[[Sample], None], None] = None, maxsize: int = 1024,
+                 policy: DeliveryPolicy = DeliveryPolicy.DROP_OLDEST, block_timeout: float = 1.0):
+        """
+        Args:
+            callback (Union[Callable[[Sample], None], None]): Function called
+            with each sample on a dedicated thread (optional, default is to
+            iterate over the subscription).
+            maxsize (int): Capacity of the queue (optional, default is 1024).
+            policy (DeliveryPolicy): What happens to a sample when the queue
+            is full (optional, default is DeliveryPolicy.DROP_OLDEST).
+            block_timeout (float): Time in seconds the sampler may wait for
+            room with DeliveryPolicy.BLOCK before the sample is dropped
+            (optional, default is 1).
+
+        Raises:
+            ValueError: If 'maxsize' is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError("Subscription queue size must be positive")
+
+        self.__queue: Deque[Sample] = deque()
+        self.__maxsize: int = maxsize
+        self.__policy: DeliveryPolicy = policy
+        self.__block_timeout: float = block_timeout
+        self.__condition: Condition = Condition()
+        self.__closed: bool = False
+        self.__published: int = 0
+        self.__delivered: int = 0
+        self.__dropped: int = 0
+        self.__errors: int = 0
+        self.__thread: Union[Thread, None] = None
+
+        if callback is not None:
+            self.__thread = Thread(target=self.__dispatch, args=(callback,), name='powerpyro-subscriber', daemon=True)
+            self.__thread.start()
+
+    @property
+    def closed(self) -> bool:
+        """Checks if the subscription stopped receiving samples.
+
+        Returns:
+            bool: True after the monitor ended or the subscriber unsubscribed.
+        """
+        return self.__closed
+
+    def publish(self, sample: Sample) -> bool:
+        """Offers a sample to the subscriber.
+
+        Args:
+            sample (Sample): The new sample.
+
+        Returns:
+            bool: True if the sample was queued, False if it was dropped.
+        """
+        with self.__condition:
+            if self.__closed:
+                return False
+
+            self.__published += 1
+
+            if len(self.__queue) >= self.__maxsize:
+                if self.__policy == DeliveryPolicy.DROP_NEWEST:
+                    self.__dropped += 1
+                    return False
+                elif self.__policy == DeliveryPolicy.DROP_OLDEST:
+                    self.__queue.popleft()
+                    self.__dropped += 1
+                elif not self.__condition.wait_for(lambda: len(self.__queue) < self.__maxsize or self.__closed,
+                                                   self.__block_timeout) or self.__closed:
+                    self.__dropped += 1
+                    return False
+
+            self.__queue.append(sample)
+            self.__condition.notify_all()
+            return True
+
+    def get(self, timeout: Union[float, None] = None) -> Union[Sample, None]:
+        """Takes the oldest queued sample.
+
+        Args:
+            timeout (Union[float, None]): Time in seconds to wait for a sample
+            (optional, default is to wait until one arrives or the
+            subscription is closed).
+
+        Returns:
+            Union[Sample, None]: The sample, or None if none arrived in time
+            or the subscription is closed and drained.
+        """
+        with self.__condition:
+            if not self.__condition.wait_for(lambda: self.__queue or self.__closed, timeout) or not self.__queue:
+                return None
+
+            sample = self.__queue.popleft()
+            self.__delivered += 1
+            self.__condition.notify_all()
+            return sample
+
+    def __iter__(self) -> Iterator[Sample]:
+        """Yields samples as they are taken until the subscription is closed.
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+
+            monitor = Monitor({'cpu': True}, sampling_interval=1.0)
+            subscription = monitor.subscribe(maxsize=100)
+            monitor.start()
+
+            for sample in subscription:
+                print(sample.timestamp, sample.power['cpu'])
+            ```
+        """
+        while True:
+            sample = self.get()
+
+            if sample is None:
+                return
+
+            yield sample
+
+    def __dispatch(self, callback: Callable[[Sample], None]) -> None:
+        """Calls the callback with each sample until the subscription is closed."""
+        for sample in self:
+            try:
+                callback(sample)
+            except Exception as e:
+                with self.__condition:
+                    self.__errors += 1
+
+                print('Error in sample subscriber: ', str(e))
+
+    def close(self, wait: bool = False) -> None:
+        """Stops publishing samples to the subscriber.
+
+        Samples already queued are still delivered.
+
+        Args:
+            wait (bool): Whether to wait for the callback thread to deliver
+            the queued samples (optional, default is False).
+        """
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+
+        if wait and self.__thread is not None:
+            self.__thread.join()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Retrieves the delivery counters of the subscription.
+
+        Returns:
+            Dict[str, int]: Samples published, delivered and dropped, callback
+            errors and samples still queued.
+        """
+        with self.__condition:
+            return {'published': self.__published,
+                    'delivered': self.__delivered,
+                    'dropped': self.__dropped,
+                    'errors': self.__errors,
+                    'queued': len(self.__queue)}
@@ -0,0 +1,185 @@
+from array import array
+from bisect import bisect_left
+from threading import Lock
+from typing import Dict, List, Tuple, Union
+import math
+
+class SampleTimeline():
+    """Column-oriented record of the samples taken by a monitor.
+
+    Every sample covers the period that ends at its timestamp and stores, for
+    each component, the power read from the sensor and the energy attributed
+    to the monitored process. Columns are kept in typed arrays so they can be
+    handed over to NumPy without copying element by element.
+
+    With a maximum age, samples older than it are dropped. Dropping happens
+    once at least half of the timeline has expired, so each append stays
+    O(1) amortised and memory holds at most about twice the window.
+
+    CPU telemetry (frequency, temperature, throttling) is kept in its own 
+    columns next to power, one per value name. A value missing from a 
+    sample, such as a name that appears later in the run, is NaN.
+
+    Attributes:
+        __timestamps (array): End of each sampled period (Unix time).
+        __periods (array): Duration of each sampled period in seconds.
+        __power (Dict[str, array]): Power read in W by component name.
+        __energy (Dict[str, array]): Attributed energy in kWh by component name.
+        __stale (Dict[str, array]): Whether each sample of a component reused 
+        the last good sensor value, by component name.
+        __telemetry (Dict[str, array]): CPU telemetry values by name.
+        __regions (List[Tuple[str, float, Union[float, None]]]): User-defined
+        regions as (name, start, end), with 'end' None while still open.
+        __lock (Lock): Guards the columns against concurrent appends.
+        __max_age (Union[float, None]): Time in seconds samples are kept, or 
+        None to keep every sample.
+    """
+    def __init__(self, components: List[str], max_age: Union[float, None] = None):
+        self.__timestamps: array = array('d')
+        self.__periods: array = array('d')
+        self.__power: Dict[str, array] = {component: array('d') for component in components}
+        self.__energy: Dict[str, array] = {component: array('d') for component in components}
+        self.__stale: Dict[str, array] = {component: array('b') for component in components}
+        self.__telemetry: Dict[str, array] = {}
+        self.__regions: List[Tuple[str, float, Union[float, None]]] = []
+        self.__lock: Lock = Lock()
+        self.__max_age: Union[float, None] = max_age
+
+    def __len__(self) -> int:
+        return len(self.__timestamps)
+
+    @property
+    def components(self) -> List[str]:
+        """Gets the names of the recorded components.
+
+        Returns:
+            List[str]: Component names.
+        """
+        return list(self.__power)
+
+    def append(self, timestamp: float, period: float, power: Dict[str, float], energy: Dict[str, float],
+               stale: Union[Dict[str, bool], None] = None, telemetry: Union[Dict[str, float], None] = None) -> None:
+        """Adds a sample to the end of the timeline.
+
+        Args:
+            timestamp (float): End of the sampled period.
+            period (float): Duration of the sampled period in seconds.
+            power (Dict[str, float]): Power read in W by component name.
+            energy (Dict[str, float]): Attributed energy in kWh by component name.
+            stale (Union[Dict[str, bool], None]): Whether a component reused 
+            the last good sensor value (optional, default is no stale value).
+            telemetry (Union[Dict[str, float], None]): CPU telemetry values by 
+            name (optional).
+        """
+        stale = stale or {}
+        telemetry = telemetry or {}
+
+        with self.__lock:
+            self.__timestamps.append(timestamp)
+            self.__periods.append(period)
+
+            for component in self.__power:
+                self.__power[component].append(power.get(component, 0.0))
+                self.__energy[component].append(energy.get(component, 0.0))
+                self.__stale[component].append(1 if stale.get(component, False) else 0)
+
+            for name in telemetry:
+                if name not in self.__telemetry:
+                    self.__telemetry[name] = array('d', [math.nan]) * (len(self.__timestamps) - 1)
+
+            for name, values in self.__telemetry.items():
+                values.append(telemetry.get(name, math.nan))
+
+            if self.__max_age is not None:
+                self.__drop_expired(timestamp - self.__max_age)
+
+    def __drop_expired(self, cutoff: float) -> None:
+        """Drops the samples older than the cutoff once they are half of the timeline.
+
+        Args:
+            cutoff: Oldest timestamp to keep.
+        """
+        expired = bisect_left(self.__timestamps, cutoff)
+
+        if expired == 0 or expired * 2 < len(self.__timestamps):
+            return
+
+        del self.__timestamps[:expired]
+        del self.__periods[:expired]
+
+        for component in self.__power:
+            del self.__power[component][:expired]
+            del self.__energy[component][:expired]
+            del self.__stale[component][:expired]
+
+        for values in self.__telemetry.values():
+            del values[:expired]
+
+    def open_region(self, name: str, start: float) -> int:
+        """Starts a user-defined region.
+
+        Args:
+            name (str): Region name.
+            start (float): Start of the region (Unix time).
+
+        Returns:
+            int: Index of the region, used to close it.
+        """
+        with self.__lock:
+            self.__regions.append((name, start, None))
+            return len(self.__regions) - 1
+
+    def close_region(self, index: int, end: float) -> None:
+        """Ends a user-defined region.
+
+        Args:
+            index (int): Index returned by 'open_region'.
+            end (float): End of the region (Unix time).
+        """
+        with self.__lock:
+            name, start, _ = self.__regions[index]
+            self.__regions[index] = (name, start, end)
+
+    @property
+    def regions(self) -> List[Tuple[str, float, Union[float, None]]]:
+        """Gets the user-defined regions.
+
+        Returns:
+            List[Tuple[str, float, Union[float, None]]]: Regions as
+            (name, start, end), with 'end' None for regions still open.
+        """
+        with self.__lock:
+            return list(self.__regions)
+
+    def columns(self) -> Tuple[array, array, Dict[str, array], Dict[str, array]]:
+        """Returns a consistent copy of every column.
+
+        Returns:
+            Tuple[array, array, Dict[str, array], Dict[str, array]]: Timestamps,
+            periods, power by component and energy by component.
+        """
+        with self.__lock:
+            return (array('d', self.__timestamps),
+                    array('d', self.__periods),
+                    {component: array('d', values) for component, values in self.__power.items()},
+                    {component: array('d', values) for component, values in self.__energy.items()})
+
+    def stale_flags(self) -> Dict[str, array]:
+        """Returns a copy of the stale tags of every component.
+
+        Returns:
+            Dict[str, array]: One flag per sample, 1 when the sample reused 
+            the last good sensor value, by component name.
+        """
+        with self.__lock:
+            return {component: array('b', values) for component, values in self.__stale.items()}
+
+    def telemetry_columns(self) -> Dict[str, array]:
+        """Returns a copy of the CPU telemetry columns.
+
+        Returns:
+            Dict[str, array]: One value per sample, NaN where it was not read, 
+            by telemetry name.
+        """
+        with self.__lock:
+            return {name: array('d', values) for name, values in self.__telemetry.items()}
@@ -0,0 +1,706 @@
+from .hardware_component import HardwareComponent
+from .hardware_component_factory import HardwareComponentFactory
+from .cpu_component_factory import CpuComponentFactory
+from .gpu_component_factory import GpuComponentFactory
+from .memory_component_factory import MemoryComponentFactory
+from .storage_component_factory import StorageComponentFactory
+from .network_component_factory import NetworkComponentFactory
+from .os_type import OsType
+from .sensor_reader import SensorReader
+from .attribution_type import AttributionType
+from .cpu_attribution_model import CpuAttributionModel
+from .cpu_percent_attribution_model import CpuPercentAttributionModel
+from .perf_counter_attribution_model import PerfCounterAttributionModel
+from .cgroup_attribution_model import CgroupAttributionModel
+from .cgroup import Cgroup
+from .sample import Sample
+from .raw_counter_reader import RawCounterReader
+from .process_tree import ProcessTree
+from .process_tree_attribution_model import ProcessTreeAttributionModel
+from .resource_unavailable_exception import ResourceUnavailableException
+
+from typing import Any, Callable, ClassVar, Dict, List, Set, Tuple, Union
+from threading import Condition, Event, Lock, Thread, current_thread
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+class Sampler():
+    """Reads the sensors of a process once per tick for every attached listener.
+
+    A sampler owns the hardware components, their deadline-bounded readers
+    and the CPU attribution model, so hardware is discovered once and every
+    sensor is read once per tick however many monitors are live. Samplers
+    are shared per process through 'Sampler.shared': monitors asking for the
+    same attribution and read timeout get the same sampler, which creates
+    the union of the components they require. Components are discovered
+    concurrently, so creating them takes as long as the slowest probe, and
+    a component whose discovery fails is reported as unavailable.
+
+    The sampling thread runs only while at least one listener is attached,
+    at the shortest interval they asked for. When the last listener
+    detaches, the readers, the components, the CPU attribution model and
+    the cgroup are closed, and the next listener reopens them. A sampler
+    stays shared while a monitor references it, and is dropped with the
+    last one, so samplers of processes measured once do not pile up. Ticks are contiguous: each
+    sample covers the time since the previous one, so listeners can
+    attribute exactly the part of a sample that falls in their own window.
+
+    Attributes:
+        __shared (Dict[Tuple[AttributionType, float, Union[int, None]], Sampler]): 
+        Samplers of the process by attribution, read timeout and measured 
+        process id.
+        __shared_lock (Lock): Guards the shared samplers.
+        __key (Tuple[AttributionType, float, Union[int, None]]): Key of the
+        sampler among the shared ones.
+        __references (int): Number of monitors using the sampler.
+        __operating_system (OsType): The current operating system.
+        __attribution (AttributionType): Requested attribution model.
+        __read_timeout (float): Time in seconds a sensor read may take.
+        __components (Dict[str, HardwareComponent]): Components created so far.
+        __unavailable (Dict[str, Exception]): Error raised by the discovery of 
+        each component that could not be created.
+        __opened (bool): Whether the component resources are open.
+        __cgroup (Union[Cgroup, None]): Cgroup of the process, if energy is
+        attributed to the cgroup.
+        __process_tree (Union[ProcessTree, None]): Process tree energy is 
+        attributed to, if it is not the current process.
+        __cpu_attribution_model (Union[CpuAttributionModel, None]): Model that
+        attributes CPU power to the process, once the CPU is created.
+        __readers (Dict[str, SensorReader]): Deadline-bounded readers of each
+        sensor backend.
+        __listeners (Dict[Callable[[Sample], None], float]): Attached
+        listeners and the sampling interval each one asked for.
+        __raw_listeners (Set[Callable[[Sample], None]]): Listeners that need 
+        the raw counters of each sample.
+        __raw_counter_reader (RawCounterReader): Reads the raw counters, 
+        only while a listener needs them.
+        __telemetry_listeners (Set[Callable[[Sample], None]]): Listeners that 
+        need the CPU telemetry of each sample.
+        __lock (Lock): Guards the components and the listeners.
+        __tick (Condition): Signals that a sample was delivered.
+        __last_tick (float): End of the last delivered sample (Unix time).
+        __wake (Event): Interrupts the wait between two samples.
+        __stop_sign (Event): Flag to stop the running sampling thread.
+        __thread (Union[Thread, None]): Thread in which sampling occurs.
+        __WATT_TO_KWH (float): Constant to convert energy from watts to
+        kilowatt-hours.
+    """
+    __shared: ClassVar[Dict[Tuple[AttributionType, float, Union[int, None]], 'Sampler']] = {}
+    __shared_lock: ClassVar[Lock] = Lock()
+
+    def __init__(self, operating_system: OsType, attribution: AttributionType = AttributionType.CPU_PERCENT,
+                 read_timeout: float = 5.0, pid: Union[int, None] = None):
+        """
+        Args:
+            operating_system (OsType): The current operating system.
+            attribution (AttributionType): How energy is attributed to the
+            process (optional, default is AttributionType.CPU_PERCENT).
+            read_timeout (float): Time in seconds a sensor read may take before
+            the last good value is used instead (optional, default is 5).
+            pid (Union[int, None]): Process whose whole tree energy is 
+            attributed to (optional, default is the current process).
+
+        Raises:
+            ResourceUnavailableException: If the process does not exist.
+        """
+        self.__key: Tuple[AttributionType, float, Union[int, None]] = (attribution, read_timeout, pid)
+        self.__references: int = 0
+        self.__operating_system: OsType = operating_system
+        self.__attribution: AttributionType = attribution
+        self.__read_timeout: float = read_timeout
+        self.__components: Dict[str, HardwareComponent] = {}
+        self.__unavailable: Dict[str, Exception] = {}
+        self.__opened: bool = True
+        self.__cgroup: Union[Cgroup, None] = self.__open_cgroup()
+        self.__process_tree: Union[ProcessTree, None] = ProcessTree(pid) if pid is not None else None
+        self.__cpu_attribution_model: Union[CpuAttributionModel, None] = None
+        self.__readers: Dict[str, SensorReader] = {}
+        self.__listeners: Dict[Callable[[Sample], None], float] = {}
+        self.__raw_listeners: Set[Callable[[Sample], None]] = set()
+        self.__raw_counter_reader: RawCounterReader = RawCounterReader(None, self.__cgroup, self.__process_tree)
+        self.__telemetry_listeners: Set[Callable[[Sample], None]] = set()
+        self.__lock: Lock = Lock()
+        self.__tick: Condition = Condition()
+        self.__last_tick: float = 0.0
+        self.__wake: Event = Event()
+        self.__stop_sign: Event = Event()
+        self.__thread: Union[Thread, None] = None
+        self.__WATT_TO_KWH: float = 3_600_000
+
+    @classmethod
+    def shared(cls, operating_system: OsType, attribution: AttributionType = AttributionType.CPU_PERCENT,
+               read_timeout: float = 5.0, pid: Union[int, None] = None) -> 'Sampler':
+        """Retrieves the sampler of the process for a configuration.
+
+        Args:
+            operating_system (OsType): The current operating system.
+            attribution (AttributionType): How energy is attributed to the
+            process (optional, default is AttributionType.CPU_PERCENT).
+            read_timeout (float): Time in seconds a sensor read may take
+            (optional, default is 5).
+            pid (Union[int, None]): Process whose whole tree energy is 
+            attributed to (optional, default is the current process).
+
+        Each call takes a reference that is given back with 'release'.
+
+        Returns:
+            Sampler: The sampler shared by every monitor with the same
+            attribution, read timeout and process, created on first use.
+        """
+        key = (attribution, read_timeout, pid)
+
+        with cls.__shared_lock:
+            if key not in cls.__shared:
+                cls.__shared[key] = cls(operating_system, attribution, read_timeout, pid)
+
+            sampler = cls.__shared[key]
+            sampler.__references += 1
+
+            return sampler
+
+    def release(self) -> None:
+        """Gives back a reference taken with 'shared'.
+
+        With the last reference, the sampler stops being shared and closes
+        what it holds open.
+        """
+        with Sampler.__shared_lock:
+            self.__references -= 1
+
+            if self.__references > 0:
+                return
+
+            if Sampler.__shared.get(self.__key) is self:
+                del Sampler.__shared[self.__key]
+
+        with self.__lock:
+            if not self.__listeners and self.__thread is None:
+                self.__close()
+
+    def __open_cgroup(self) -> Union[Cgroup, None]:
+        """Opens the cgroup of the process when energy is attributed to it.
+
+        Returns:
+            Union[Cgroup, None]: The cgroup, or None if it is not requested or
+            not available.
+        """
+        if self.__attribution != AttributionType.CGROUP:
+            return None
+
+        try:
+            return Cgroup()
+        except ResourceUnavailableException as e:
+            print('Falling back to process attribution: ', str(e))
+            return None
+
+    def __create_cpu_attribution_model(self) -> CpuAttributionModel:
+        """Creates the model that attributes CPU power to the process.
+
+        Returns:
+            CpuAttributionModel: The requested model, or the CPU percent model
+            (the process tree model when a process id was given) if it cannot 
+            be created.
+        """
+        if self.__attribution == AttributionType.PERF_COUNTERS and self.__process_tree is None:
+            try:
+                return PerfCounterAttributionModel()
+            except ResourceUnavailableException as e:
+                print('Falling back to CPU percent attribution: ', str(e))
+
+        if self.__attribution == AttributionType.CGROUP and self.__cgroup is not None:
+            return CgroupAttributionModel(self.__cgroup)
+
+        if self.__process_tree is not None:
+            return ProcessTreeAttributionModel(self.__process_tree)
+
+        return CpuPercentAttributionModel(self.__components['cpu'])
+
+    def __initialize_discovery_thread(self) -> None:
+        """Prepares a discovery thread for the hardware probes."""
+        if self.__operating_system == OsType.WINDOWS:
+            # WMI needs COM to be initialized on every thread using it.
+            import pythoncom
+            pythoncom.CoInitialize()
+
+    def __discover(self, keys: List[str]) -> Dict[str, Union[HardwareComponent, Exception]]:
+        """Creates components, each on its own thread.
+
+        Args:
+            keys: Names of the components to create.
+
+        Returns:
+            Dict[str, Union[HardwareComponent, Exception]]: The component, or 
+            the error raised while creating it, by name.
+        """
+        factories: Dict[str, HardwareComponentFactory] = {
+            'cpu': CpuComponentFactory(),
+            'gpu': GpuComponentFactory(),
+            'memory': MemoryComponentFactory(),
+            'storage': StorageComponentFactory(),
+            'network': NetworkComponentFactory()
+        }
+        results: Dict[str, Union[HardwareComponent, Exception]] = {}
+
+        if not keys:
+            return results
+
+        with ThreadPoolExecutor(max_workers=len(keys), thread_name_prefix='powerpyro-discovery',
+                                initializer=self.__initialize_discovery_thread) as executor:
+            futures = {key: executor.submit(factories[key].create_component, self.__operating_system) for key in keys}
+
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                results[key] = e
+
+        return results
+
+    def require(self, keys: List[str]) -> Dict[str, HardwareComponent]:
+        """Creates the components that do not exist yet.
+
+        Components that cannot be created (e.g. the GPU of a host without 
+        one) are left out and reported by 'get_unavailable', unless none of 
+        the required components is available.
+
+        Args:
+            keys (List[str]): Names of the required components ('cpu', 'gpu',
+            'memory', 'storage', 'network').
+
+        Returns:
+            Dict[str, HardwareComponent]: The available required components.
+
+        Raises:
+            Exception: The error of the first required component, if none of 
+            them can be created.
+        """
+        with self.__lock:
+            missing = [key for key in keys if key not in self.__components and key not in self.__unavailable]
+
+            for key, component in self.__discover(missing).items():
+                if isinstance(component, Exception):
+                    self.__unavailable[key] = component
+                    print(f'Error creating {key} component, it will not be monitored: ', str(component))
+                    continue
+
+                if self.__opened and hasattr(component, 'open'):
+                    component.open()
+
+                if key == 'memory' and self.__cgroup is not None and self.__cgroup.has_memory_controller:
+                    component.use_cgroup(self.__cgroup)
+                elif key == 'memory' and self.__cgroup is not None:
+                    print('Falling back to process memory attribution: memory controller is not enabled for ', self.__cgroup.path)
+
+                if key == 'memory' and self.__process_tree is not None and self.__cgroup is None:
+                    component.use_process_tree(self.__process_tree)
+
+                if key in ('storage', 'network') and self.__process_tree is not None:
+                    component.use_process_tree(self.__process_tree)
+
+                self.__components[key] = component
+                self.__readers[key] = SensorReader(key, component.get_power, self.__read_timeout)
+
+                if key == 'gpu' and hasattr(component, 'get_utilization'):
+                    self.__readers['gpu_utilization'] = SensorReader('gpu_utilization', component.get_utilization,
+                                                                     self.__read_timeout)
+
+                if key in ('storage', 'network'):
+                    self.__readers[key + '_share'] = SensorReader(key + '_share', component.get_share,
+                                                                  self.__read_timeout)
+
+                if key == 'cpu':
+                    self.__cpu_attribution_model = self.__create_cpu_attribution_model()
+                    self.__readers['cpu_share'] = SensorReader('cpu_share', self.__read_cpu_share, self.__read_timeout)
+                    self.__raw_counter_reader.use_cpu_attribution_model(self.__cpu_attribution_model)
+
+            available = {key: self.__components[key] for key in keys if key in self.__components}
+
+            if keys and not available:
+                raise self.__unavailable[keys[0]]
+
+            return available
+
+    def get_unavailable(self, keys: List[str]) -> Dict[str, str]:
+        """Describes why components could not be created.
+
+        Args:
+            keys (List[str]): Names of the described components.
+
+        Returns:
+            Dict[str, str]: Discovery error by name of the unavailable 
+            components.
+        """
+        with self.__lock:
+            return {key: str(self.__unavailable[key]) or type(self.__unavailable[key]).__name__
+                    for key in keys if key in self.__unavailable}
+
+    @property
+    def cpu_attribution_model(self) -> Union[CpuAttributionModel, None]:
+        """Gets the model that attributes CPU power to the process.
+
+        Returns:
+            Union[CpuAttributionModel, None]: The attribution model in use, or
+            None if no monitor required the CPU.
+        """
+        return self.__cpu_attribution_model
+
+    def get_scopes(self, keys: List[str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Describes which values of each component are shared by processes.
+
+        Args:
+            keys (List[str]): Names of the described components.
+
+        Returns:
+            Tuple[Dict[str, str], Dict[str, str]]: Scope of the attributed
+            energy and of the sensor power by component name: 'process' for
+            values private to the process, 'host' for values read from a
+            device of the host and 'cgroup:<path>' for values of a cgroup.
+        """
+        cgroup_scope = 'cgroup:' + self.__cgroup.path if self.__cgroup is not None else 'process'
+        scopes: Dict[str, str] = {}
+        sensor_scopes: Dict[str, str] = {}
+
+        if 'cpu' in keys:
+            scopes['cpu'] = cgroup_scope if isinstance(self.__cpu_attribution_model, CgroupAttributionModel) else 'process'
+            sensor_scopes['cpu'] = 'host'
+
+        if 'gpu' in keys:
+            scopes['gpu'] = sensor_scopes['gpu'] = 'host'
+
+        if 'memory' in keys:
+            memory_uses_cgroup = self.__cgroup is not None and self.__cgroup.has_memory_controller
+            scopes['memory'] = sensor_scopes['memory'] = cgroup_scope if memory_uses_cgroup else 'process'
+
+        if 'storage' in keys:
+            scopes['storage'] = 'process'
+            sensor_scopes['storage'] = 'host'
+
+        if 'network' in keys:
+            network = self.__components.get('network')
+            namespace = network.namespace if network is not None else None
+            cpu_uses_cgroup = isinstance(self.__cpu_attribution_model, CgroupAttributionModel)
+            # Without a namespace of its own, the network follows the CPU share.
+            scopes['network'] = namespace or (cgroup_scope if cpu_uses_cgroup else 'process')
+            sensor_scopes['network'] = namespace or 'host'
+
+        return scopes, sensor_scopes
+
+    def get_power_sources(self, keys: List[str]) -> Dict[str, str]:
+        """Describes where the power of each component comes from.
+
+        Args:
+            keys (List[str]): Names of the described components.
+
+        Returns:
+            Dict[str, str]: 'sensor' for power read from the hardware and 
+            'estimate' for power estimated by a model, by component name.
+        """
+        with self.__lock:
+            return {key: 'estimate' if getattr(self.__components[key], 'is_power_estimated', False) else 'sensor'
+                    for key in keys if key in self.__components}
+
+    def get_power_readers(self, keys: List[str]) -> Dict[str, SensorReader]:
+        """Retrieves the deadline-bounded power readers of components,
+           reopening the sampler if no listener kept it open.
+
+        Args:
+            keys (List[str]): Names of the components.
+
+        Returns:
+            Dict[str, SensorReader]: Power reader by name of the available
+            components.
+        """
+        with self.__lock:
+            if not self.__opened:
+                self.__open()
+
+            return {key: self.__readers[key] for key in keys if key in self.__readers}
+
+    def get_sensor_health(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Retrieves the read counters of the sensor backends of components.
+
+        Args:
+            keys (List[str]): Names of the components.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Health of each backend of the components
+            by backend name.
+        """
+        backends = list(keys) + (['cpu_share'] if 'cpu' in keys else []) + (['gpu_utilization'] if 'gpu' in keys else [])
+        backends += [key + '_share' for key in ('storage', 'network') if key in keys]
+
+        return {key: self.__readers[key].health.to_dict() for key in backends if key in self.__readers}
+
+    def attach(self, listener: Callable[[Sample], None], sampling_interval: float, raw: bool = False,
+               telemetry: bool = False) -> None:
+        """Delivers every sample to a listener, starting the thread if needed.
+
+        Args:
+            listener (Callable[[Sample], None]): Function called on the
+            sampling thread with each sample of every component.
+            sampling_interval (float): Time in seconds between two samples
+            wanted by the listener.
+            raw (bool): Whether the samples must carry the raw counters 
+            (optional, default is False).
+            telemetry (bool): Whether the samples must carry the CPU 
+            telemetry (optional, default is False).
+        """
+        with self.__lock:
+            shortest = min(self.__listeners.values(), default=None)
+            self.__listeners[listener] = sampling_interval
+
+            if raw:
+                if not self.__raw_listeners:
+                    self.__raw_counter_reader.reset()
+
+                self.__raw_listeners.add(listener)
+
+            if telemetry:
+                self.__telemetry_listeners.add(listener)
+
+            if self.__thread is not None:
+                if shortest is not None and sampling_interval < shortest:
+                    self.__wake.set()
+
+                return
+
+            if not self.__opened:
+                self.__open()
+
+            self.__stop_sign = Event()
+            self.__wake.clear()
+            self.__thread = Thread(target=self.__sample, args=(self.__stop_sign,), name='powerpyro-sampler', daemon=True)
+            self.__thread.start()
+
+    def detach(self, listener: Callable[[Sample], None]) -> None:
+        """Stops delivering samples to a listener, stopping the thread with the last one.
+
+        Args:
+            listener (Callable[[Sample], None]): Listener given to 'attach'.
+        """
+        with self.__lock:
+            self.__listeners.pop(listener, None)
+            self.__raw_listeners.discard(listener)
+            self.__telemetry_listeners.discard(listener)
+
+            if self.__listeners or self.__thread is None:
+                return
+
+            thread = self.__thread
+            self.__thread = None
+            self.__stop_sign.set()
+            self.__wake.set()
+
+        if thread is not current_thread():
+            thread.join()
+
+        with self.__lock:
+            # A listener may have attached while the thread stopped.
+            if not self.__listeners and self.__thread is None:
+                self.__close()
+
+    def __read_cpu_share(self) -> float:
+        """Reads the share of the CPU power of the current attribution
+           model, which is replaced when the sampler reopens.
+
+        Returns:
+            float: Share between 0 and 1.
+        """
+        return self.__cpu_attribution_model.get_share()
+
+    def __open(self) -> None:
+        """Reopens the cgroup, the components and the CPU attribution model
+           closed by '__close'. Called with the lock held.
+        """
+        if self.__cgroup is not None:
+            try:
+                self.__cgroup.open()
+            except ResourceUnavailableException as e:
+                print('Error reopening cgroup: ', str(e))
+
+        for component in self.__components.values():
+            if hasattr(component, 'open'):
+                try:
+                    component.open()
+                except Exception as e:
+                    print('Error reopening component: ', str(e))
+
+        if 'cpu' in self.__components:
+            try:
+                self.__cpu_attribution_model = self.__create_cpu_attribution_model()
+            except Exception as e:
+                print('Falling back to CPU percent attribution: ', str(e))
+                self.__cpu_attribution_model = CpuPercentAttributionModel(self.__components['cpu'])
+
+            self.__raw_counter_reader.use_cpu_attribution_model(self.__cpu_attribution_model)
+
+        self.__raw_counter_reader.reset()
+        self.__opened = True
+
+    def __close(self) -> None:
+        """Stops the readers and closes the components, the CPU attribution
+           model and the cgroup. Called with the lock held and no listener.
+        """
+        for reader in self.__readers.values():
+            reader.close()
+
+        if not self.__opened:
+            return
+
+        for component in self.__components.values():
+            if hasattr(component, 'close'):
+                component.close()
+
+        if self.__cpu_attribution_model is not None:
+            self.__cpu_attribution_model.close()
+
+        if self.__cgroup is not None:
+            self.__cgroup.close()
+
+        self.__opened = False
+
+    def flush(self, timeout: Union[float, None] = None) -> None:
+        """Takes a sample now and waits until it is delivered.
+
+        Args:
+            timeout (Union[float, None]): Time in seconds to wait (optional,
+            default is to wait until the sample is delivered).
+        """
+        requested = time.time()
+
+        with self.__tick:
+            if self.__thread is None or not self.__thread.is_alive():
+                return
+
+            self.__wake.set()
+            self.__tick.wait_for(lambda: self.__last_tick >= requested or self.__thread is None, timeout)
+
+    def __read(self, backend: str) -> Tuple[float, bool]:
+        """Reads a sensor backend within its deadline.
+
+        Args:
+            backend: Backend name.
+
+        Returns:
+            Tuple[float, bool]: The value read, or the last good value (0.0 if
+            there is none), and whether the value is stale.
+        """
+        reading = self.__readers[backend].read()
+
+        return (reading.value if reading.value is not None else 0.0), reading.stale
+
+    def __take_sample(self, timestamp: float, period: float) -> Sample:
+        """Reads every component once.
+
+        Args:
+            timestamp: End of the sampled period (Unix time).
+            period: Duration of the sampled period in seconds.
+
+        Returns:
+            Sample: Power, attributed energy, share and staleness of every
+            component, with the raw counters and the CPU telemetry if a 
+            listener needs them.
+        """
+        power: Dict[str, float] = {}
+        energy: Dict[str, float] = {}
+        share: Dict[str, float] = {}
+        stale: Dict[str, bool] = {}
+        raw: Dict[str, float] = {}
+        telemetry: Dict[str, float] = {}
+        memory_nodes: Dict[str, float] = {}
+
+        with self.__lock:
+            components = dict(self.__components)
+            record_raw = bool(self.__raw_listeners)
+            record_telemetry = bool(self.__telemetry_listeners)
+
+        # The CPU goes first, its share is the one of a network without
+        # process counters.
+        for key, component in sorted(components.items(), key=lambda item: item[0] != 'cpu'):
+            power[key], stale[key] = self.__read(key)
+            share[key] = 1.0
+
+            if key == 'cpu':
+                share['cpu'], stale_share = self.__read('cpu_share')
+                stale['cpu'] = stale['cpu'] or stale_share
+
+            if key + '_share' in self.__readers and key != 'cpu':
+                # The share of an I/O component comes from the read above.
+                share[key], stale_share = self.__read(key + '_share')
+                stale[key] = stale[key] or stale_share
+
+            if key == 'network' and not component.counts_process_bytes:
+                share[key] = share.get('cpu', 0.0)
+                stale[key] = stale[key] or stale.get('cpu', False)
+
+            if key == 'memory' and hasattr(component, 'get_node_shares'):
+                memory_nodes = dict(component.get_node_shares())
+
+            energy[key] = (power[key] * share[key] * period)/self.__WATT_TO_KWH
+            component.update_energy_consumed(energy[key])
+
+        if record_raw:
+            try:
+                raw = self.__raw_counter_reader.read()
+            except Exception as e:
+                print('Error reading raw counters: ', str(e))
+
+            if 'gpu_utilization' in self.__readers:
+                raw['gpu_utilization'], _ = self.__read('gpu_utilization')
+
+        if record_telemetry and hasattr(components.get('cpu'), 'get_telemetry'):
+            try:
+                telemetry = components['cpu'].get_telemetry()
+            except Exception as e:
+                print('Error reading CPU telemetry: ', str(e))
+
+        return Sample(timestamp, period, power, energy, stale, share, raw, telemetry, memory_nodes)
+
+    def __sample(self, stop_sign: Event) -> None:
+        """Samples the components until the last listener detaches.
+
+        Args:
+            stop_sign: Flag set when this thread must stop.
+        """
+        last_tick = time.time()
+
+        while not stop_sign.is_set():
+            with self.__lock:
+                interval = min(self.__listeners.values(), default=0.0)
+
+            self.__wake.wait(interval if interval > 0 else None)
+            self.__wake.clear()
+
+            if stop_sign.is_set():
+                break
+
+            now = time.time()
+            sample = self.__take_sample(now, now - last_tick)
+            last_tick = now
+
+            with self.__lock:
+                listeners = list(self.__listeners)
+
+            for listener in listeners:
+                try:
+                    listener(sample)
+                except Exception as e:
+                    print('Error delivering sample: ', str(e))
+
+            with self.__tick:
+                self.__last_tick = now
+                self.__tick.notify_all()
+
+        with self.__tick:
+            self.__tick.notify_all()
+
+        if self.__operating_system == OsType.WINDOWS:
+            with self.__lock:
+                if self.__thread is not None:
+                    return
+
+                for component in self.__components.values():
+                    if hasattr(component, 'close'):
+                        component.close()
+
+                self.__opened = False
@@ -0,0 +1,97 @@
+from typing import Dict, Union
+
+class SensorHealth():
+    """Counters describing how reliably a sensor backend is being read.
+
+    Attributes:
+        __reads (int): Number of read attempts.
+        __timeouts (int): Number of reads that missed their deadline.
+        __errors (int): Number of reads that raised an error.
+        __stale_reads (int): Number of reads answered with the last good value.
+        __total_latency (float): Sum of the latency of completed reads in seconds.
+        __max_latency (float): Highest latency of a completed read in seconds.
+        __last_latency (float): Latency of the last completed read in seconds.
+        __last_error (Union[str, None]): Message of the last error or timeout.
+        __degraded (bool): Whether the last read timed out or raised an error.
+    """
+    def __init__(self):
+        self.__reads: int = 0
+        self.__timeouts: int = 0
+        self.__errors: int = 0
+        self.__stale_reads: int = 0
+        self.__total_latency: float = 0.0
+        self.__max_latency: float = 0.0
+        self.__last_latency: float = 0.0
+        self.__last_error: Union[str, None] = None
+        self.__degraded: bool = False
+
+    def record_success(self, latency: float) -> None:
+        """Records a read that completed within its deadline.
+
+        Args:
+            latency (float): Duration of the read in seconds.
+        """
+        self.__reads += 1
+        self.__degraded = False
+        self.__record_latency(latency)
+
+    def record_error(self, latency: float, error: Exception) -> None:
+        """Records a read that raised an error.
+
+        Args:
+            latency (float): Duration of the read in seconds.
+            error (Exception): The error raised by the backend.
+        """
+        self.__reads += 1
+        self.__errors += 1
+        self.__last_error = str(error)
+        self.__degraded = True
+        self.__record_latency(latency)
+
+    def record_timeout(self, deadline: float) -> None:
+        """Records a read that missed its deadline.
+
+        Args:
+            deadline (float): The deadline that was missed in seconds.
+        """
+        self.__reads += 1
+        self.__timeouts += 1
+        self.__last_error = f"Read did not complete within {deadline} s"
+        self.__degraded = True
+
+    def record_stale(self) -> None:
+        """Records a read answered with the last good value."""
+        self.__stale_reads += 1
+
+    def __record_latency(self, latency: float) -> None:
+        self.__total_latency += latency
+        self.__last_latency = latency
+        self.__max_latency = max(self.__max_latency, latency)
+
+    @property
+    def degraded(self) -> bool:
+        """Checks if the last read of the sensor failed.
+
+        Returns:
+            bool: True if the last read timed out or raised an error.
+        """
+        return self.__degraded
+
+    def to_dict(self) -> Dict[str, Union[int, float, str, None]]:
+        """Returns the counters as a dictionary.
+
+        Returns:
+            Dict[str, Union[int, float, str, None]]: Counters by name, with 
+            latencies in seconds.
+        """
+        completed = self.__reads - self.__timeouts
+
+        return {'reads': self.__reads,
+                'timeouts': self.__timeouts,
+                'errors': self.__errors,
+                'stale_reads': self.__stale_reads,
+                'mean_latency': self.__total_latency / completed if completed else 0.0,
+                'max_latency': self.__max_latency,
+                'last_latency': self.__last_latency,
+                'last_error': self.__last_error,
+                'degraded': self.__degraded}
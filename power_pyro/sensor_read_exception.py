@@ -0,0 +1,13 @@
+from .hardware_type import HardwareType
+
+class SensorReadException(Exception):
+    """Exception raised when a value cannot be read from a hardware sensor.
+
+    Args:
+        hardware_type (HardwareType): The type of the hardware whose sensor
+        could not be read.
+        msg (str): Descriptive error 
+        message (optional, default is "Unable to read hardware sensor").
+    """
+    def __init__(self, hardware_type: HardwareType, msg: str = "Unable to read hardware sensor"):
+        super().__init__(hardware_type.name + ": " + msg)
@@ -0,0 +1,198 @@
+from .sensor_health import SensorHealth
+from .sensor_reading import SensorReading
+
+from typing import Callable, Union
+from threading import Thread, Event
+import time
+
+class SensorReader():
+    """Reads a sensor backend with a deadline.
+
+    The backend runs on a dedicated daemon thread, so a read that hangs (a
+    stuck 'nvidia-smi', a driver call that never returns) only costs the
+    caller the deadline. While that read is still in flight no new one is
+    started, and every read that misses the deadline or fails is answered
+    with the last good value tagged as stale.
+
+    Attributes:
+        __name (str): Name of the backend, used in error messages.
+        __read (Callable[[], float]): Function that reads the backend.
+        __deadline (float): Time in seconds a read may take.
+        __health (SensorHealth): Counters of the backend reads.
+        __worker (Union[Thread, None]): Thread running the reads.
+        __request (Event): Signals the worker that a read is requested.
+        __stop (Event): Asks the worker to exit once its read is done.
+        __done (Event): Signals the caller that the read finished.
+        __in_flight (bool): Whether a requested read was not consumed yet.
+        __result (Union[float, None]): Value of the last finished read.
+        __error (Union[Exception, None]): Error of the last finished read.
+        __latency (float): Duration of the last finished read in seconds.
+        __last_value (Union[float, None]): Last good value.
+        __last_value_time (float): Monotonic time of the last good value.
+    """
+    def __init__(self, name: str, read: Callable[[], float], deadline: float):
+        """
+        Args:
+            name (str): Name of the backend.
+            read (Callable[[], float]): Function that reads the backend and 
+            raises an exception when the value cannot be read.
+            deadline (float): Time in seconds a read may take.
+
+        Raises:
+            ValueError: If the deadline is not positive.
+        """
+        if deadline <= 0:
+            raise ValueError("Sensor read deadline must be positive")
+
+        self.__name: str = name
+        self.__read: Callable[[], float] = read
+        self.__deadline: float = deadline
+        self.__health: SensorHealth = SensorHealth()
+        self.__worker: Union[Thread, None] = None
+        self.__request: Event = Event()
+        self.__stop: Event = Event()
+        self.__done: Event = Event()
+        self.__in_flight: bool = False
+        self.__result: Union[float, None] = None
+        self.__error: Union[Exception, None] = None
+        self.__latency: float = 0.0
+        self.__last_value: Union[float, None] = None
+        self.__last_value_time: float = 0.0
+
+    @property
+    def name(self) -> str:
+        """Gets the name of the backend.
+
+        Returns:
+            str: Backend name.
+        """
+        return self.__name
+
+    @property
+    def health(self) -> SensorHealth:
+        """Gets the counters of the backend reads.
+
+        Returns:
+            SensorHealth: Read counters.
+        """
+        return self.__health
+
+    def __run(self, request: Event, stop: Event) -> None:
+        """Runs the requested reads until the reader is closed.
+
+        Args:
+            request: Signals this worker that a read is requested.
+            stop: Asks this worker to exit.
+        """
+        while not stop.is_set():
+            request.wait()
+            request.clear()
+
+            if stop.is_set():
+                return
+
+            start = time.monotonic()
+
+            try:
+                self.__result, self.__error = self.__read(), None
+            except Exception as e:
+                self.__result, self.__error = None, e
+
+            self.__latency = time.monotonic() - start
+            self.__done.set()
+
+    def __submit(self) -> None:
+        """Requests a new read from the worker."""
+        if self.__worker is None:
+            # A closed worker may still be waiting, so each one gets its own
+            # events.
+            self.__request, self.__stop = Event(), Event()
+            self.__worker = Thread(target=self.__run, args=(self.__request, self.__stop),
+                                   name=f"powerpyro-{self.__name}-reader", daemon=True)
+            self.__worker.start()
+
+        self.__done.clear()
+        self.__in_flight = True
+        self.__request.set()
+
+    def __consume(self) -> bool:
+        """Takes the result of the finished read.
+
+        Returns:
+            bool: True if the read returned a value, False if it failed.
+        """
+        self.__in_flight = False
+
+        if self.__error is not None or self.__result is None:
+            self.__health.record_error(self.__latency, self.__error or ValueError(f"{self.__name}: no value read"))
+            return False
+
+        self.__health.record_success(self.__latency)
+        self.__last_value = float(self.__result)
+        self.__last_value_time = time.monotonic()
+        return True
+
+    def __stale(self) -> SensorReading:
+        """Answers with the last good value.
+
+        Returns:
+            SensorReading: The last good value tagged as stale.
+        """
+        self.__health.record_stale()
+
+        if self.__last_value is None:
+            return SensorReading(None, True, float('inf'))
+
+        return SensorReading(self.__last_value, True, time.monotonic() - self.__last_value_time)
+
+    def read(self) -> SensorReading:
+        """Reads the backend, waiting at most the deadline.
+
+        A read that is still in flight from an earlier call is waited on
+        instead of starting a new one; if it already finished in the 
+        meantime, its result is kept as the last good value and a fresh 
+        read is started.
+
+        Returns:
+            SensorReading: The value read, or the last good value tagged as 
+            stale if the read timed out or failed.
+
+        Example:
+            ```python
+            from power_pyro.sensor_reader import SensorReader
+
+            reader = SensorReader('gpu', gpu.get_power, deadline=2.0)
+            reading = reader.read()
+            print(reading.value, reading.stale) # 48.3 False
+            ```
+        """
+        if self.__in_flight and self.__done.is_set():
+            self.__consume()
+
+        if not self.__in_flight:
+            self.__submit()
+
+        if not self.__done.wait(self.__deadline):
+            self.__health.record_timeout(self.__deadline)
+            return self.__stale()
+
+        if not self.__consume():
+            return self.__stale()
+
+        return SensorReading(self.__last_value, False, 0.0)
+
+    def close(self) -> None:
+        """Stops the worker thread.
+
+        A read in flight is left to finish, and its result is still taken by
+        the next read. Reading again starts a new worker.
+        """
+        if self.__worker is None:
+            return
+
+        self.__stop.set()
+
+        if not self.__in_flight:
+            self.__request.set()
+
+        self.__worker = None
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Union
+
+@dataclass(frozen=True)
+class SensorReading():
+    """Value returned by a deadline-bounded sensor read.
+
+    Attributes:
+        value (Union[float, None]): The value read, or the last good value 
+        when the read failed, or None if the sensor was never read successfully.
+        stale (bool): Whether 'value' comes from an earlier read because the 
+        current one timed out or failed.
+        age (float): Time in seconds since 'value' was read.
+    """
+    value: Union[float, None]
+    stale: bool
+    age: float
@@ -0,0 +1,89 @@
+from .sample_sink import SampleSink
+
+from typing import Any, Dict, Tuple, Union
+import socket
+
+class SocketSampleSink(SampleSink):
+    """Sends samples as JSON lines to a 'SampleCollector'.
+
+    The connection is opened on the first record and reopened after a
+    failure; records that cannot be delivered are dropped and counted, so a
+    missing collector never stops the monitor.
+
+    Attributes:
+        __address (Union[str, Tuple[str, int]]): Unix socket path or
+        (host, port) of the collector.
+        __socket (Union[socket.socket, None]): Open connection.
+        __dropped (int): Number of records that could not be delivered.
+        __TIMEOUT (float): Time in seconds a connection or send may take.
+    """
+    def __init__(self, address: Union[str, Tuple[str, int]], run_id: Union[str, None] = None,
+                 rank: Union[int, None] = None, host: Union[str, None] = None):
+        """
+        Args:
+            address (Union[str, Tuple[str, int]]): Unix socket path or 
+            (host, port) of the collector.
+            run_id (Union[str, None]): Identifier of the job (optional).
+            rank (Union[int, None]): Rank of the process (optional).
+            host (Union[str, None]): Host name (optional).
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+            from power_pyro.socket_sample_sink import SocketSampleSink
+
+            monitor = Monitor({'cpu': True}, sink=SocketSampleSink('/tmp/powerpyro.sock', run_id='job-42'))
+            ```
+        """
+        super().__init__(run_id, rank, host)
+        self.__address: Union[str, Tuple[str, int]] = address
+        self.__socket: Union[socket.socket, None] = None
+        self.__dropped: int = 0
+        self.__TIMEOUT: float = 1.0
+
+    @property
+    def dropped(self) -> int:
+        """Gets the number of records that could not be delivered.
+
+        Returns:
+            int: Dropped records.
+        """
+        return self.__dropped
+
+    def __connect(self) -> socket.socket:
+        family = socket.AF_UNIX if isinstance(self.__address, str) else socket.AF_INET
+        connection = socket.socket(family, socket.SOCK_STREAM)
+        connection.settimeout(self.__TIMEOUT)
+
+        try:
+            connection.connect(self.__address)
+        except OSError:
+            connection.close()
+            raise
+
+        return connection
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Sends a record to the collector.
+
+        Args:
+            record (Dict[str, Any]): Record written by the monitor.
+        """
+        try:
+            if self.__socket is None:
+                self.__socket = self.__connect()
+
+            self.__socket.sendall(self.encode(record))
+        except OSError:
+            self.__dropped += 1
+            self.close()
+
+    def close(self) -> None:
+        """Closes the connection."""
+        if self.__socket is not None:
+            try:
+                self.__socket.close()
+            except OSError:
+                pass
+
+            self.__socket = None
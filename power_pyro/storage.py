@@ -0,0 +1,95 @@
+from .io_component import IoComponent
+from .io_power_model import IoPowerModel
+from .os_type import OsType
+from .hardware_type import HardwareType
+
+from typing import Dict, List, Union
+import os
+
+class Storage(IoComponent):
+    """Represents the disks of the host.
+
+    Whole disks are the entries of '/sys/block' backed by a device, which
+    leaves out loop, zram and device-mapper volumes whose bytes end up on a
+    disk anyway. Their bytes come from '/proc/diskstats' (sectors of 512
+    bytes read and written) and the bytes of the process from the
+    'read_bytes' and 'write_bytes' fields of '/proc/self/io', which count
+    what actually reached the storage layer rather than the page cache.
+
+    Attributes:
+        __sysfs (str): Mount point of sysfs.
+        __SECTOR_SIZE (int): Size in bytes of a '/proc/diskstats' sector.
+        __DEFAULT_MODELS (Dict[str, IoPowerModel]): Default power model of
+        NVMe drives, SATA SSDs and hard disks.
+    """
+    __SECTOR_SIZE: int = 512
+    __DEFAULT_MODELS: Dict[str, IoPowerModel] = {
+        'nvme': IoPowerModel(idle_power = 2.0, joules_per_byte = 2e-9),
+        'ssd': IoPowerModel(idle_power = 0.5, joules_per_byte = 5e-9),
+        'hdd': IoPowerModel(idle_power = 5.0, joules_per_byte = 1.5e-8),
+    }
+
+    def __init__(self, operating_system: OsType, power_models: Union[Dict[str, IoPowerModel], None] = None,
+                 sysfs: str = '/sys', procfs: str = '/proc'):
+        """
+        Args:
+            operating_system (OsType): The current operating system.
+            power_models (Union[Dict[str, IoPowerModel], None]): Power model
+            by disk name, e.g. {'nvme0n1': IoPowerModel(3.5, 1e-9)} (optional).
+            sysfs (str): Mount point of sysfs (optional, default is '/sys').
+            procfs (str): Mount point of procfs (optional, default is '/proc').
+
+        Raises:
+            ResourceUnavailableException: If the operating system is not
+            Linux or no disk is found.
+        """
+        self.__sysfs: str = sysfs
+        super().__init__(operating_system, os.path.join(procfs, 'diskstats'), power_models)
+
+    def _hardware_type(self) -> HardwareType:
+        return HardwareType.STORAGE
+
+    def _list_devices(self) -> List[str]:
+        block = os.path.join(self.__sysfs, 'block')
+
+        try:
+            names = sorted(os.listdir(block))
+        except OSError:
+            return []
+
+        return [name for name in names if os.path.exists(os.path.join(block, name, 'device'))]
+
+    def kind(self, device: str) -> str:
+        """Guesses the kind of a disk.
+
+        Args:
+            device (str): Disk name.
+
+        Returns:
+            str: 'nvme', 'hdd' for a rotational disk, or 'ssd'.
+        """
+        if device.startswith('nvme'):
+            return 'nvme'
+
+        try:
+            with open(os.path.join(self.__sysfs, 'block', device, 'queue', 'rotational'), 'r') as file:
+                return 'hdd' if file.read().strip() == '1' else 'ssd'
+        except OSError:
+            return 'ssd'
+
+    def _default_model(self, device: str) -> IoPowerModel:
+        return self.__DEFAULT_MODELS[self.kind(device)]
+
+    def _parse_counters(self, content: str) -> Dict[str, int]:
+        counters: Dict[str, int] = {}
+
+        for line in content.splitlines():
+            fields = line.split()
+
+            if len(fields) > 9:
+                counters[fields[2]] = (int(fields[5]) + int(fields[9])) * self.__SECTOR_SIZE
+
+        return counters
+
+    def _process_bytes(self, counters: Dict[str, int]) -> int:
+        return counters.get('read_bytes', 0) + counters.get('write_bytes', 0)
@@ -0,0 +1,129 @@
+from .retention_tier import RetentionTier
+
+from typing import Any, Dict, List, Tuple, Union
+from threading import Lock
+import math
+
+class TieredRetention():
+    """Retention of a monitor timeline in fixed memory.
+
+    Raw samples are kept only for a recent window, and every sample is also
+    summarised into coarser tiers (by default 1 s buckets for an hour, 1 min
+    buckets for a day and 1 h buckets for a month) that keep min/mean/max
+    power and exact energy sums. Every tier has a fixed number of buckets,
+    so memory is known up front however long the run lasts.
+
+    Attributes:
+        __raw_window (float): Time in seconds raw samples are kept.
+        __tier_spans (List[Tuple[float, float]]): Resolution and span in
+        seconds of each tier.
+        __tiers (List[RetentionTier]): Tiers, finest first, once the
+        components are known.
+        __total_energy (Dict[str, float]): Attributed energy in kWh of the
+        whole run by component name.
+        __lock (Lock): Guards the tiers between the sampler and readers.
+    """
+    DEFAULT_TIERS: List[Tuple[float, float]] = [(1.0, 3600.0), (60.0, 86400.0), (3600.0, 30 * 86400.0)]
+
+    def __init__(self, raw_window: float = 600.0, tiers: Union[List[Tuple[float, float]], None] = None):
+        """
+        Args:
+            raw_window (float): Time in seconds raw samples are kept 
+            (optional, default is 600).
+            tiers (Union[List[Tuple[float, float]], None]): Resolution and span 
+            in seconds of each tier (optional, default is DEFAULT_TIERS).
+
+        Raises:
+            ValueError: If the window, a resolution or a span is not positive.
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+            from power_pyro.tiered_retention import TieredRetention
+
+            retention = TieredRetention(raw_window=300, tiers=[(1, 3600), (60, 7 * 86400)])
+            monitor = Monitor({'cpu': True}, sampling_interval=0.5, retention=retention)
+            ```
+        """
+        tiers = TieredRetention.DEFAULT_TIERS if tiers is None else tiers
+
+        if raw_window <= 0 or any(resolution <= 0 or span <= 0 for resolution, span in tiers):
+            raise ValueError("Retention window, resolutions and spans must be positive")
+
+        self.__raw_window: float = raw_window
+        self.__tier_spans: List[Tuple[float, float]] = sorted(tiers)
+        self.__tiers: List[RetentionTier] = []
+        self.__total_energy: Dict[str, float] = {}
+        self.__lock: Lock = Lock()
+
+    @property
+    def raw_window(self) -> float:
+        """Gets the time raw samples are kept.
+
+        Returns:
+            float: Window in seconds.
+        """
+        return self.__raw_window
+
+    @property
+    def resolutions(self) -> List[float]:
+        """Gets the resolution of each tier, finest first.
+
+        Returns:
+            List[float]: Resolutions in seconds.
+        """
+        return [resolution for resolution, _ in self.__tier_spans]
+
+    def bind(self, components: List[str]) -> None:
+        """Allocates the tiers for the monitored components.
+
+        Args:
+            components (List[str]): Names of the monitored components.
+        """
+        self.__tiers = [RetentionTier(resolution, math.ceil(span / resolution), components)
+                        for resolution, span in self.__tier_spans]
+        self.__total_energy = {key: 0.0 for key in components}
+
+    def add(self, timestamp: float, period: float, power: Dict[str, float], energy: Dict[str, float]) -> None:
+        """Summarises a sample into every tier.
+
+        Args:
+            timestamp (float): End of the sampled period (Unix time).
+            period (float): Duration of the sampled period in seconds.
+            power (Dict[str, float]): Power read in W by component name.
+            energy (Dict[str, float]): Attributed energy in kWh by component name.
+        """
+        with self.__lock:
+            for tier in self.__tiers:
+                tier.add(timestamp, period, power, energy)
+
+            for key, value in energy.items():
+                self.__total_energy[key] = self.__total_energy.get(key, 0.0) + value
+
+    def get_tier(self, resolution: float) -> List[Dict[str, Any]]:
+        """Lists the buckets of a tier, oldest first.
+
+        Args:
+            resolution (float): Resolution of the tier in seconds.
+
+        Returns:
+            List[Dict[str, Any]]: Buckets as described in 'RetentionTier.buckets'.
+
+        Raises:
+            KeyError: If there is no tier with that resolution.
+        """
+        with self.__lock:
+            for tier in self.__tiers:
+                if tier.resolution == resolution:
+                    return tier.buckets()
+
+        raise KeyError(f"No retention tier with resolution {resolution}")
+
+    def total_energy(self) -> Dict[str, float]:
+        """Retrieves the attributed energy of the whole run.
+
+        Returns:
+            Dict[str, float]: Energy in kWh by component name.
+        """
+        with self.__lock:
+            return dict(self.__total_energy)
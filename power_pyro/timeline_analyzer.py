@@ -0,0 +1,337 @@
+from .sample_timeline import SampleTimeline
+
+from typing import Dict, Iterable, List, Tuple, Union, Any
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+class TimelineAnalyzer():
+    """Vectorised analysis of the power samples recorded during a run.
+
+    Each sample is the mean power of a component over the period that ends at
+    its timestamp, so the energy of a component is a piecewise linear function
+    of time. The analyzer builds that cumulative curve once per component and
+    answers every query (windows, regions, resampling) by interpolating on it,
+    which keeps every operation vectorised over the whole run.
+
+    Attributes:
+        __timestamps (np.ndarray): End of each sampled period (Unix time).
+        __periods (np.ndarray): Duration of each sampled period in seconds.
+        __power (Dict[str, np.ndarray]): Power in W by component name.
+        __regions (List[Tuple[str, float, Union[float, None]]]): Regions as
+        (name, start, end).
+        __knots (np.ndarray): Start and end of every period, interleaved.
+        __cumulative (Dict[str, np.ndarray]): Energy in J accumulated at each
+        knot by component name.
+        __WATT_TO_KWH (float): Constant to convert energy from joules to
+        kilowatt-hours.
+    """
+    def __init__(self, timestamps: Iterable[float], power: Dict[str, Iterable[float]],
+                 periods: Union[Iterable[float], None] = None,
+                 regions: Union[List[Tuple[str, float, Union[float, None]]], None] = None):
+        """
+        Args:
+            timestamps (Iterable[float]): End of each sampled period, in
+            ascending order.
+            power (Dict[str, Iterable[float]]): Power in W of each sample by
+            component name.
+            periods (Union[Iterable[float], None]): Duration of each sampled
+            period in seconds (optional, default is the distance between
+            consecutive timestamps).
+            regions (Union[List[Tuple[str, float, Union[float, None]]], None]):
+            Regions as (name, start, end) (optional).
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If the columns do not have the same length.
+        """
+        if np is None:
+            raise ImportError("NumPy is required for timeline analysis: pip install numpy")
+
+        self.__WATT_TO_KWH: float = 3_600_000
+        self.__timestamps: "np.ndarray" = np.asarray(timestamps, dtype=np.float64)
+        self.__power: Dict[str, "np.ndarray"] = {key: np.asarray(values, dtype=np.float64) for key, values in power.items()}
+        self.__regions: List[Tuple[str, float, Union[float, None]]] = list(regions or [])
+
+        if periods is None:
+            periods = np.diff(self.__timestamps, prepend=self.__timestamps[:1])
+
+            if periods.size > 1:
+                periods[0] = periods[1]
+
+        self.__periods: "np.ndarray" = np.asarray(periods, dtype=np.float64)
+
+        if any(values.shape != self.__timestamps.shape for values in self.__power.values()) or \
+           self.__periods.shape != self.__timestamps.shape:
+            raise ValueError("Timestamps, periods and power columns must have the same length")
+
+        self.__knots: "np.ndarray" = np.column_stack((self.__timestamps - self.__periods, self.__timestamps)).ravel()
+        self.__cumulative: Dict[str, "np.ndarray"] = {key: self.__cumulative_energy(values) for key, values in self.__power.items()}
+
+    @classmethod
+    def from_timeline(cls, timeline: SampleTimeline, attributed: bool = True) -> "TimelineAnalyzer":
+        """Creates an analyzer over the samples recorded by a monitor.
+
+        Args:
+            timeline (SampleTimeline): Timeline of a monitor.
+            attributed (bool): Whether to analyse the power attributed to the
+            monitored process instead of the power read from the sensors
+            (optional, default is True).
+
+        Returns:
+            TimelineAnalyzer: The analyzer.
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+            from power_pyro.timeline_analyzer import TimelineAnalyzer
+
+            monitor = Monitor({'cpu': True}, sampling_interval=1.0)
+            monitor.start()
+            with monitor.region('training'):
+                train()
+            monitor.end()
+
+            analyzer = TimelineAnalyzer.from_timeline(monitor.get_timeline())
+            print(analyzer.energy_per_region()) # {'training': {'cpu': 0.0021}}
+            ```
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError("NumPy is required for timeline analysis: pip install numpy")
+
+        timestamps, periods, power, energy = timeline.columns()
+        periods = np.frombuffer(periods, dtype=np.float64)
+
+        if attributed:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                power = {key: np.where(periods > 0, np.frombuffer(values, dtype=np.float64) * 3_600_000 / periods, 0.0)
+                         for key, values in energy.items()}
+
+        return cls(np.frombuffer(timestamps, dtype=np.float64), power, periods, timeline.regions)
+
+    def __cumulative_energy(self, power: "np.ndarray") -> "np.ndarray":
+        """Energy in J accumulated at the start and end of every period.
+
+        Args:
+            power: Power in W of each sample.
+
+        Returns:
+            np.ndarray: Cumulative energy at each knot.
+        """
+        after = np.cumsum(power * self.__periods)
+        before = after - power * self.__periods
+
+        return np.column_stack((before, after)).ravel()
+
+    def __energy_at(self, component: str, instants: "np.ndarray") -> "np.ndarray":
+        """Interpolates the cumulative energy of a component.
+
+        Args:
+            component: Component name.
+            instants: Points in time.
+
+        Returns:
+            np.ndarray: Energy in J accumulated up to each instant.
+        """
+        if self.__knots.size == 0:
+            return np.zeros_like(instants, dtype=np.float64)
+
+        return np.interp(instants, self.__knots, self.__cumulative[component])
+
+    @property
+    def components(self) -> List[str]:
+        """Gets the names of the analysed components.
+
+        Returns:
+            List[str]: Component names.
+        """
+        return list(self.__power)
+
+    @property
+    def timestamps(self) -> "np.ndarray":
+        """Gets the end of each sampled period.
+
+        Returns:
+            np.ndarray: Unix timestamps.
+        """
+        return self.__timestamps
+
+    def power(self, component: str) -> "np.ndarray":
+        """Gets the power samples of a component.
+
+        Args:
+            component (str): Component name.
+
+        Returns:
+            np.ndarray: Power in W of each sample.
+        """
+        return self.__power[component]
+
+    def energy(self) -> Dict[str, float]:
+        """Computes the energy of each component over the whole run.
+
+        Returns:
+            Dict[str, float]: Energy in kWh by component name.
+        """
+        return {key: float(values[-1]) / self.__WATT_TO_KWH if values.size else 0.0
+                for key, values in self.__cumulative.items()}
+
+    def mean_power(self) -> Dict[str, float]:
+        """Computes the time-weighted mean power of each component.
+
+        Returns:
+            Dict[str, float]: Mean power in W by component name.
+        """
+        duration = float(self.__periods.sum())
+
+        return {key: float(values[-1]) / duration if values.size and duration > 0 else 0.0
+                for key, values in self.__cumulative.items()}
+
+    def windowed_power(self, window: float) -> Dict[str, "np.ndarray"]:
+        """Computes the mean power over a trailing time window at each sample.
+
+        Args:
+            window (float): Window length in seconds.
+
+        Returns:
+            Dict[str, np.ndarray]: Mean power in W over the window that ends
+            at each timestamp, by component name.
+
+        Raises:
+            ValueError: If the window is not positive.
+        """
+        if window <= 0:
+            raise ValueError("Window must be positive")
+
+        starts = self.__timestamps - window
+
+        return {key: (self.__energy_at(key, self.__timestamps) - self.__energy_at(key, starts)) / window
+                for key in self.__power}
+
+    def percentiles(self, percentiles: Iterable[float] = (50, 90, 99)) -> Dict[str, "np.ndarray"]:
+        """Computes percentiles of the power samples of each component.
+
+        Args:
+            percentiles (Iterable[float]): Percentiles between 0 and 100
+            (optional, default is 50, 90 and 99).
+
+        Returns:
+            Dict[str, np.ndarray]: Power in W at each percentile by component name.
+        """
+        percentiles = np.asarray(list(percentiles), dtype=np.float64)
+
+        return {key: np.percentile(values, percentiles) if values.size else np.full(percentiles.shape, np.nan)
+                for key, values in self.__power.items()}
+
+    def peak_to_mean(self) -> Dict[str, float]:
+        """Computes the ratio between the peak and the mean power of each component.
+
+        Returns:
+            Dict[str, float]: Peak-to-mean ratio by component name, or NaN
+            for components with zero mean power.
+        """
+        mean_power = self.mean_power()
+
+        return {key: float(values.max()) / mean_power[key] if values.size and mean_power[key] > 0 else float('nan')
+                for key, values in self.__power.items()}
+
+    def energy_per_region(self, regions: Union[List[Tuple[str, float, Union[float, None]]], None] = None) -> Dict[str, Dict[str, float]]:
+        """Computes the energy of each component inside each region.
+
+        Regions with the same name are summed, and regions still open are
+        considered to end at the last sample.
+
+        Args:
+            regions (Union[List[Tuple[str, float, Union[float, None]]], None]):
+            Regions as (name, start, end) (optional, default is the regions
+            given to the analyzer).
+
+        Returns:
+            Dict[str, Dict[str, float]]: Energy in kWh by region name and
+            component name.
+        """
+        regions = self.__regions if regions is None else regions
+
+        if not regions:
+            return {}
+
+        last = self.__timestamps[-1] if self.__timestamps.size else 0.0
+        names = [name for name, _, _ in regions]
+        starts = np.array([start for _, start, _ in regions], dtype=np.float64)
+        ends = np.array([last if end is None else end for _, _, end in regions], dtype=np.float64)
+
+        unique_names, inverse = np.unique(np.array(names, dtype=str), return_inverse=True)
+        result: Dict[str, Dict[str, float]] = {str(name): {} for name in unique_names}
+
+        for key in self.__power:
+            per_region = (self.__energy_at(key, ends) - self.__energy_at(key, starts)) / self.__WATT_TO_KWH
+            totals = np.bincount(inverse, weights=per_region, minlength=unique_names.size)
+
+            for index, name in enumerate(unique_names):
+                result[str(name)][key] = float(totals[index])
+
+        return result
+
+    def resample(self, step: float, start: Union[float, None] = None,
+                 end: Union[float, None] = None) -> Tuple["np.ndarray", Dict[str, "np.ndarray"]]:
+        """Resamples the power of every component onto a regular grid.
+
+        The value of each grid cell is the mean power over the cell, so the
+        energy of the run is preserved, which allows runs sampled at
+        different rates to be compared cell by cell.
+
+        Args:
+            step (float): Grid step in seconds.
+            start (Union[float, None]): Start of the grid (optional, default
+            is the start of the first sample).
+            end (Union[float, None]): End of the grid (optional, default is
+            the last timestamp).
+
+        Returns:
+            Tuple[np.ndarray, Dict[str, np.ndarray]]: Start of each grid cell
+            and the mean power in W of each cell by component name.
+
+        Raises:
+            ValueError: If the step is not positive.
+        """
+        if step <= 0:
+            raise ValueError("Step must be positive")
+
+        if self.__timestamps.size == 0:
+            return np.empty(0), {key: np.empty(0) for key in self.__power}
+
+        start = float(self.__knots[0]) if start is None else start
+        end = float(self.__timestamps[-1]) if end is None else end
+
+        grid = start + step * np.arange(max(int(np.ceil((end - start) / step)), 0))
+        edges = np.append(grid, grid[-1] + step) if grid.size else grid
+
+        return grid, {key: np.diff(self.__energy_at(key, edges)) / step for key in self.__power}
+
+    def to_dataframe(self) -> Any:
+        """Exports the samples to a pandas DataFrame.
+
+        Returns:
+            pandas.DataFrame: One row per sample indexed by timestamp, with the
+            period and the power of each component as columns.
+
+        Raises:
+            ImportError: If pandas is not installed.
+        """
+        if pd is None:
+            raise ImportError("pandas is required to export to a DataFrame: pip install pandas")
+
+        data = {'period': self.__periods}
+        data.update({key + '_power': values for key, values in self.__power.items()})
+
+        return pd.DataFrame(data, index=pd.to_datetime(self.__timestamps, unit='s', utc=True).rename('timestamp'))
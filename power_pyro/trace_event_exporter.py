@@ -0,0 +1,278 @@
+from .sample import Sample
+from .sample_timeline import SampleTimeline
+
+from typing import Any, Dict, List, TextIO, Union
+from threading import Lock
+import json
+import math
+import os
+
+class TraceEventExporter():
+    """Writes power timelines in the Chrome trace-event JSON format, which
+       the Perfetto UI and 'chrome://tracing' open directly.
+
+    The power and the cumulative attributed energy of every component, and
+    the CPU telemetry if it was recorded, become counter tracks, every
+    sampler tick becomes a slice on a 'sampler' track and every region
+    becomes an async slice, so overlapping regions keep their own rows.
+    Timestamps are Unix time in microseconds, shifted by 'clock_offset', and
+    events are tagged with the process id of the workload, so the tracks
+    line up with other traces of the same process.
+
+    Events are written in chunks as they arrive, so a multi-hour run is
+    never held in memory as one document.
+
+    Attributes:
+        __file (TextIO): Destination of the trace.
+        __owns_file (bool): Whether the file is closed with the exporter.
+        __pid (int): Process id the events are attributed to.
+        __clock_offset (float): Seconds added to every timestamp.
+        __chunk_size (int): Number of events buffered before a write.
+        __buffer (List[str]): Encoded events not written yet.
+        __written (int): Number of events written so far.
+        __energy (Dict[str, float]): Cumulative attributed energy in J by
+        component name.
+        __region_id (int): Identifier of the last async region slice.
+        __lock (Lock): Serializes the writes, since samples arrive on the
+        sampling thread and regions on the workload threads.
+        __closed (bool): Whether the trace is complete.
+        __WATT_TO_KWH (float): Constant to convert energy from joules to
+        kilowatt-hours.
+        __REGIONS_TID (int): Track of the regions.
+        __SAMPLER_TID (int): Track of the sampler ticks.
+    """
+    __REGIONS_TID: int = 1
+    __SAMPLER_TID: int = 2
+
+    def __init__(self, output: Union[str, TextIO], pid: Union[int, None] = None, process_name: str = 'powerpyro',
+                 clock_offset: float = 0.0, chunk_size: int = 1024):
+        """
+        Args:
+            output (Union[str, TextIO]): Path or open text file receiving the
+            trace.
+            pid (Union[int, None]): Process id the events are attributed to
+            (optional, default is the current process).
+            process_name (str): Name shown for the process (optional, default
+            is 'powerpyro').
+            clock_offset (float): Seconds added to every timestamp, to align
+            the trace with a trace recorded on another clock (optional).
+            chunk_size (int): Number of events buffered before a write
+            (optional, default is 1024).
+
+        Raises:
+            ValueError: If the chunk size is not positive.
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+
+        self.__owns_file: bool = isinstance(output, str)
+        self.__file: TextIO = open(output, 'w') if isinstance(output, str) else output
+        self.__pid: int = pid if pid is not None else os.getpid()
+        self.__clock_offset: float = clock_offset
+        self.__chunk_size: int = chunk_size
+        self.__buffer: List[str] = []
+        self.__written: int = 0
+        self.__energy: Dict[str, float] = {}
+        self.__region_id: int = 0
+        self.__lock: Lock = Lock()
+        self.__closed: bool = False
+        self.__WATT_TO_KWH: float = 3_600_000
+
+        self.__file.write('{"displayTimeUnit": "ms", "traceEvents": [\n')
+        self.__add({'name': 'process_name', 'ph': 'M', 'pid': self.__pid, 'args': {'name': process_name}})
+        self.__add({'name': 'thread_name', 'ph': 'M', 'pid': self.__pid, 'tid': self.__REGIONS_TID,
+                    'args': {'name': 'regions'}})
+        self.__add({'name': 'thread_name', 'ph': 'M', 'pid': self.__pid, 'tid': self.__SAMPLER_TID,
+                    'args': {'name': 'sampler'}})
+
+    def __microseconds(self, timestamp: float) -> float:
+        """Converts a Unix time to a trace timestamp.
+
+        Args:
+            timestamp: Unix time in seconds.
+
+        Returns:
+            float: Trace timestamp in microseconds.
+        """
+        return round((timestamp + self.__clock_offset) * 1_000_000, 3)
+
+    def __add(self, event: Dict[str, Any]) -> None:
+        """Buffers an event, writing the buffer when a chunk is full.
+
+        Args:
+            event: Trace event.
+        """
+        self.__buffer.append(json.dumps(event, separators=(',', ':')))
+
+        if len(self.__buffer) >= self.__chunk_size:
+            self.__write_chunk()
+
+    def __write_chunk(self) -> None:
+        """Writes the buffered events."""
+        if not self.__buffer:
+            return
+
+        self.__file.write((',\n' if self.__written else '') + ',\n'.join(self.__buffer))
+        self.__written += len(self.__buffer)
+        self.__buffer = []
+
+    def write_counters(self, timestamp: float, period: float, power: Dict[str, float], energy: Dict[str, float],
+                       stale: Union[Dict[str, bool], None] = None,
+                       telemetry: Union[Dict[str, Union[float, None]], None] = None) -> None:
+        """Writes one sample.
+
+        Args:
+            timestamp (float): End of the sampled period (Unix time).
+            period (float): Duration of the sampled period in seconds.
+            power (Dict[str, float]): Power in W by component name.
+            energy (Dict[str, float]): Attributed energy in kWh by component
+            name.
+            stale (Union[Dict[str, bool], None]): Whether each component reused
+            its last good value (optional).
+            telemetry (Union[Dict[str, Union[float, None]], None]): CPU
+            telemetry at the end of the period by name (optional).
+        """
+        start = self.__microseconds(timestamp - period)
+
+        with self.__lock:
+            if self.__closed:
+                return
+
+            for key, value in power.items():
+                self.__energy[key] = self.__energy.get(key, 0.0) + energy.get(key, 0.0) * self.__WATT_TO_KWH
+                self.__add({'name': f'{key} power (W)', 'ph': 'C', 'ts': start, 'pid': self.__pid,
+                            'args': {'value': value}})
+                self.__add({'name': f'{key} energy (J)', 'ph': 'C', 'ts': self.__microseconds(timestamp),
+                            'pid': self.__pid, 'args': {'value': self.__energy[key]}})
+
+            for key, value in (telemetry or {}).items():
+                if value is not None and not math.isnan(value):
+                    self.__add({'name': key, 'ph': 'C', 'ts': self.__microseconds(timestamp), 'pid': self.__pid,
+                                'args': {'value': value}})
+
+            self.__add({'name': 'tick', 'cat': 'sampler', 'ph': 'X', 'ts': start,
+                        'dur': round(period * 1_000_000, 3), 'pid': self.__pid, 'tid': self.__SAMPLER_TID,
+                        'args': {'stale': [key for key, value in (stale or {}).items() if value]}})
+
+    def write_sample(self, sample: Sample) -> None:
+        """Writes a sample of a monitor, e.g. as a subscriber.
+
+        Args:
+            sample (Sample): The sample.
+
+        Example:
+            ```python
+            from power_pyro import Monitor
+            from power_pyro.trace_event_exporter import TraceEventExporter
+
+            monitor = Monitor({'cpu': True, 'gpu': True}, sampling_interval=0.5)
+            exporter = TraceEventExporter('energy.trace.json')
+            monitor.subscribe(exporter.write_sample)
+            monitor.start()
+
+            with monitor.region('train'):
+                train()
+
+            monitor.end()
+            exporter.write_regions(monitor.get_timeline().regions)
+            exporter.close()
+            ```
+        """
+        self.write_counters(sample.timestamp, sample.period, sample.power, sample.energy, sample.stale,
+                            sample.telemetry)
+
+    def write_region(self, name: str, start: float, end: float) -> None:
+        """Writes a region as an async slice.
+
+        Args:
+            name (str): Region name.
+            start (float): Start of the region (Unix time).
+            end (float): End of the region (Unix time).
+        """
+        with self.__lock:
+            if self.__closed:
+                return
+
+            self.__region_id += 1
+            common = {'name': name, 'cat': 'region', 'id': self.__region_id, 'pid': self.__pid,
+                      'tid': self.__REGIONS_TID}
+            self.__add(dict(common, ph='b', ts=self.__microseconds(start)))
+            self.__add(dict(common, ph='e', ts=self.__microseconds(end)))
+
+    def write_regions(self, regions: List[Any]) -> None:
+        """Writes the closed regions of a timeline.
+
+        Args:
+            regions (List[Tuple[str, float, Union[float, None]]]): Regions as
+            (name, start, end); regions still open are skipped.
+        """
+        for name, start, end in regions:
+            if end is not None:
+                self.write_region(name, start, end)
+
+    def write_timeline(self, timeline: SampleTimeline) -> None:
+        """Writes every sample and region of a timeline.
+
+        Args:
+            timeline (SampleTimeline): Timeline of a monitor.
+        """
+        timestamps, periods, power, energy = timeline.columns()
+        stale = timeline.stale_flags()
+        telemetry = timeline.telemetry_columns()
+
+        for index in range(len(timestamps)):
+            self.write_counters(timestamps[index], periods[index],
+                                {key: values[index] for key, values in power.items()},
+                                {key: values[index] for key, values in energy.items()},
+                                {key: bool(values[index]) for key, values in stale.items()},
+                                {key: values[index] for key, values in telemetry.items()})
+
+        self.write_regions(timeline.regions)
+
+    def write_records(self, path: str) -> None:
+        """Writes the records of a sample sink file, reading it line by line.
+
+        Args:
+            path (str): JSON lines file written by a 'SampleSink', such as a
+            rank file of 'DirectorySampleSink', or by 'powerpyro run --stream'.
+        """
+        with open(path, 'r') as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+
+                kind = record.get('type', 'sample')
+
+                if kind == 'sample':
+                    self.write_counters(record['timestamp'], record['period'], record['power'],
+                                        record['energy'], record.get('stale'), record.get('telemetry'))
+                elif kind == 'region' and record.get('end') is not None:
+                    self.write_region(record['name'], record['start'], record['end'])
+
+    def flush(self) -> None:
+        """Writes the buffered events."""
+        with self.__lock:
+            self.__write_chunk()
+            self.__file.flush()
+
+    def close(self) -> None:
+        """Completes the trace and closes the file if the exporter opened it."""
+        with self.__lock:
+            if self.__closed:
+                return
+
+            self.__closed = True
+            self.__write_chunk()
+            self.__file.write('\n]}\n')
+            self.__file.flush()
+
+            if self.__owns_file:
+                self.__file.close()
+
+    def __enter__(self) -> "TraceEventExporter":
+        return self
+
+    def __exit__(self, *exception) -> None:
+        self.close()
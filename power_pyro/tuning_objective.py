@@ -0,0 +1,8 @@
+from enum import Enum
+
+class TuningObjective(Enum):
+    """ Enumeration representing what the parallelism tuner minimises."""
+
+    ENERGY = 0
+    ENERGY_DELAY_PRODUCT = 1
+    TIME = 2
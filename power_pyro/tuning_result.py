@@ -0,0 +1,47 @@
+from .tuning_objective import TuningObjective
+from .parallelism_measurement import ParallelismMeasurement
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+@dataclass(frozen=True)
+class TuningResult():
+    """Concurrency level recommended by 'ParallelismTuner'.
+
+    Attributes:
+        objective (TuningObjective): What the recommendation minimises.
+        workers (int): Recommended number of workers or threads.
+        measurements (List[ParallelismMeasurement]): Measurement of every
+        tried level, in increasing order of workers.
+        predicted (Dict[int, Tuple[float, float]]): Energy in J and time in
+        seconds predicted by the fitted curves for every level between the
+        smallest and the largest tried one, empty if too few levels were
+        tried to fit them.
+    """
+    objective: TuningObjective
+    workers: int
+    measurements: List[ParallelismMeasurement] = field(default_factory=list)
+    predicted: Dict[int, Tuple[float, float]] = field(default_factory=dict)
+
+    @property
+    def fitted(self) -> bool:
+        """Checks if the recommendation comes from the fitted curves.
+
+        Returns:
+            bool: True if the curves were fitted, False if the best measured
+            level was taken.
+        """
+        return bool(self.predicted)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the result into a JSON serializable dictionary.
+
+        Returns:
+            Dict[str, Any]: The objective by name, the recommended workers,
+            the measurements and the predicted curves.
+        """
+        return {'objective': self.objective.name.lower(),
+                'workers': self.workers,
+                'measurements': [measurement.to_dict() for measurement in self.measurements],
+                'predicted': [{'workers': workers, 'energy': energy, 'time': time}
+                              for workers, (energy, time) in sorted(self.predicted.items())]}
@@ -0,0 +1,89 @@
+from threading import Lock, Thread, current_thread, local
+from typing import Dict, List, Tuple
+
+class WorkCounter():
+    """Counts named units of work done by any number of threads.
+
+    Every thread adds to its own dictionary, so counting takes no lock and
+    never contends with other threads or with the sampler. Each dictionary
+    only grows and is only written by its thread: the sampler copies them
+    at every tick and subtracts what it collected before, so no count is
+    lost. The dictionaries of finished threads are folded into a single
+    total.
+
+    Attributes:
+        __local (local): Dictionary of counts of the current thread.
+        __threads (List[Tuple[Thread, Dict[str, float]]]): Counts of every
+        live thread that counted.
+        __retired (Dict[str, float]): Counts of the finished threads.
+        __collected (Dict[str, float]): Totals at the previous collection.
+        __lock (Lock): Guards the registration of threads and the
+        collection.
+    """
+    def __init__(self):
+        self.__local: local = local()
+        self.__threads: List[Tuple[Thread, Dict[str, float]]] = []
+        self.__retired: Dict[str, float] = {}
+        self.__collected: Dict[str, float] = {}
+        self.__lock: Lock = Lock()
+
+    def __register(self) -> Dict[str, float]:
+        """Creates the dictionary of counts of the current thread.
+
+        Returns:
+            Dict[str, float]: The new dictionary.
+        """
+        counts: Dict[str, float] = {}
+        self.__local.counts = counts
+
+        with self.__lock:
+            self.__threads.append((current_thread(), counts))
+
+        return counts
+
+    def count(self, name: str, amount: float = 1) -> None:
+        """Adds units of work to a counter.
+
+        Args:
+            name (str): Counter name, e.g. 'rows' or 'requests'.
+            amount (float): Units done (optional, default is 1).
+        """
+        try:
+            counts = self.__local.counts
+        except AttributeError:
+            counts = self.__register()
+
+        counts[name] = counts.get(name, 0) + amount
+
+    def collect(self) -> Dict[str, float]:
+        """Merges the counts of every thread.
+
+        Returns:
+            Dict[str, float]: Units counted since the previous collection, by
+            counter name, without the counters that did not change.
+        """
+        with self.__lock:
+            totals = dict(self.__retired)
+            alive: List[Tuple[Thread, Dict[str, float]]] = []
+
+            for thread, counts in self.__threads:
+                # A thread that finished before the copy cannot count anymore;
+                # copying a dictionary is atomic, a live one may go on counting.
+                is_alive = thread.is_alive()
+                snapshot = counts.copy()
+
+                for name, value in snapshot.items():
+                    totals[name] = totals.get(name, 0) + value
+
+                if is_alive:
+                    alive.append((thread, counts))
+                else:
+                    for name, value in snapshot.items():
+                        self.__retired[name] = self.__retired.get(name, 0) + value
+
+            self.__threads = alive
+            delta = {name: value - self.__collected.get(name, 0) for name, value in totals.items()
+                     if value != self.__collected.get(name, 0)}
+            self.__collected = totals
+
+        return delta
@@ -0,0 +1,111 @@
+from .request_energy_tracker import RequestEnergyTracker
+
+from typing import Any, Callable, Dict, Iterable, Iterator, Union
+import time
+
+class _MeteredResponse():
+    """Response body charging the request when the server closes it.
+
+    PEP 3333 requires the server to close the body once it is sent, on the
+    thread serving the request, so the CPU time between the application
+    call and the close covers the whole response, streamed or not.
+    """
+    def __init__(self, body: Iterable[bytes], tracker: RequestEnergyTracker, route: str, start: float):
+        self.__body: Iterable[bytes] = body
+        self.__tracker: RequestEnergyTracker = tracker
+        self.__route: str = route
+        self.__start: float = start
+        self.__charged: bool = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self.__body)
+
+    def close(self) -> None:
+        try:
+            if hasattr(self.__body, 'close'):
+                self.__body.close()
+        finally:
+            if not self.__charged:
+                self.__charged = True
+                self.__tracker.charge(self.__route, time.thread_time() - self.__start)
+
+class WsgiEnergyMiddleware():
+    """WSGI middleware charging every request its share of the process energy.
+
+    The CPU time of the thread serving the request is measured from the
+    application call until the server closes the response body, and charged
+    by a 'RequestEnergyTracker' into a histogram per route.
+
+    Attributes:
+        __app (Callable): The wrapped WSGI application.
+        __tracker (RequestEnergyTracker): Tracker charging the requests.
+        __route (Callable[[Dict[str, Any]], str]): Maps the environ of a
+        request to its route.
+    """
+    def __init__(self, app: Callable, tracker: Union[RequestEnergyTracker, None] = None,
+                 route: Union[Callable[[Dict[str, Any]], str], None] = None):
+        """
+        Args:
+            app (Callable): The WSGI application.
+            tracker (Union[RequestEnergyTracker, None]): Tracker charging the
+            requests (optional, default is a new tracker).
+            route (Union[Callable[[Dict[str, Any]], str], None]): Maps the
+            environ of a request to its route, e.g. to group paths with ids
+            (optional, default is the method followed by the path, with the
+            routes beyond the 'max_routes' of the tracker charged to
+            'other').
+
+        Example:
+            ```python
+            from flask import Flask
+            from power_pyro.wsgi_energy_middleware import WsgiEnergyMiddleware
+
+            app = Flask(__name__)
+            app.wsgi_app = WsgiEnergyMiddleware(app.wsgi_app)
+            ```
+        """
+        self.__app: Callable = app
+        self.__tracker: RequestEnergyTracker = tracker if tracker is not None else RequestEnergyTracker()
+        self.__route: Callable[[Dict[str, Any]], str] = route if route is not None else self.__default_route
+
+    @staticmethod
+    def __default_route(environ: Dict[str, Any]) -> str:
+        """Names the route of a request.
+
+        Args:
+            environ: WSGI environ of the request.
+
+        Returns:
+            str: Method and path of the request.
+        """
+        return f"{environ.get('REQUEST_METHOD', '')} {environ.get('PATH_INFO', '')}"
+
+    @property
+    def tracker(self) -> RequestEnergyTracker:
+        """Gets the tracker charging the requests.
+
+        Returns:
+            RequestEnergyTracker: The tracker.
+        """
+        return self.__tracker
+
+    def __call__(self, environ: Dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+        """Serves a request, measuring the CPU time of its thread.
+
+        Args:
+            environ (Dict[str, Any]): WSGI environ.
+            start_response (Callable): WSGI start_response.
+
+        Returns:
+            Iterable[bytes]: The response body of the application.
+        """
+        route = self.__route(environ)
+        start = time.thread_time()
+
+        try:
+            body = self.__app(environ, start_response)
+        except BaseException:
+            self.__tracker.charge(route, time.thread_time() - start)
+            raise
+
+        return _MeteredResponse(body, self.__tracker, route, start)
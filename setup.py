@@ -4,7 +4,17 @@ setup(
     name="powerpyro",
     version="0.5.0",
     packages=find_packages(),
+    package_data={"power_pyro": ["data/*.csv"]},
     install_requires=["pythonnet>=3.0.5",],
+    extras_require={
+        "analysis": ["numpy", "pandas"],
+        "notebook": ["ipython"],
+        "tuning": ["threadpoolctl"],
+    },
+    entry_points={
+        "console_scripts": ["powerpyro=power_pyro.cli:main"],
+        "pytest11": ["powerpyro=power_pyro.pytest_plugin"],
+    },
     author="Alexandre Bezerra de Lima, Ryann Carlos de Arruda Quintino",
     author_email="alexandrebezerra3207@gmail.com",
     maintainer="Alexandre Bezerra de Lima, Ryann Carlos de Arruda Quintino",
@@ -0,0 +1,64 @@
+"""Hardware stand-ins shared by the tests of the monitor and the sampler."""
+from typing import Dict, List
+
+import gc
+import pytest
+
+class FakeHardware():
+    """Replaces the component factories with constant power components.
+
+    Attributes:
+        created (List[str]): Name of every component created, in order.
+        power (Dict[str, float]): Power in W returned by each component.
+    """
+    def __init__(self):
+        self.created: List[str] = []
+        self.power: Dict[str, float] = {'cpu': 40.0, 'memory': 4.0}
+
+@pytest.fixture
+def fake_hardware(monkeypatch) -> FakeHardware:
+    try:
+        from power_pyro.hardware_component import HardwareComponent
+        from power_pyro.cpu_component_factory import CpuComponentFactory
+        from power_pyro.memory_component_factory import MemoryComponentFactory
+    except (ImportError, RuntimeError) as e:
+        # The processing units import pythonnet, which needs a .NET runtime.
+        pytest.skip(f"power_pyro cannot be imported: {e}")
+
+    hardware = FakeHardware()
+
+    class FakeCpu(HardwareComponent):
+        name = 'Fake CPU'
+
+        def get_power(self) -> float:
+            return hardware.power['cpu']
+
+        def get_cpu_percent_for_process(self) -> float:
+            return 0.5
+
+    class FakeMemory(HardwareComponent):
+        name = 'Fake memory'
+
+        def get_power(self) -> float:
+            return hardware.power['memory']
+
+        def use_process_tree(self, process_tree) -> None:
+            pass
+
+        def use_cgroup(self, cgroup) -> None:
+            pass
+
+    def create(name: str, component_class: type):
+        def create_component(self, operating_system):
+            hardware.created.append(name)
+            return component_class(operating_system)
+
+        return create_component
+
+    monkeypatch.setattr(CpuComponentFactory, 'create_component', create('cpu', FakeCpu))
+    monkeypatch.setattr(MemoryComponentFactory, 'create_component', create('memory', FakeMemory))
+
+    yield hardware
+
+    # Monitors give their sampler back when they are collected.
+    gc.collect()
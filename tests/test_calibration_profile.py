@@ -0,0 +1,22 @@
+"""Reuses a stored idle baseline when the monitored hardware is unchanged."""
+from power_pyro.calibration_profile import CalibrationProfile
+
+def test_components_that_could_not_be_read_are_covered(tmp_path) -> None:
+    profile = CalibrationProfile('host', {'cpu': 12.0}, {'cpu': 'Xeon', 'gpu': 'A100'}, 30.0,
+                                 unavailable=['gpu'])
+    path = profile.save(str(tmp_path / 'host.json'))
+    stored = CalibrationProfile.load(path)
+
+    assert stored.unavailable == ['gpu']
+    assert stored.covers({'cpu': 'Xeon', 'gpu': 'A100'})
+    # Another GPU model may be readable, so it is calibrated again.
+    assert not stored.covers({'cpu': 'Xeon', 'gpu': 'H100'})
+    assert not stored.covers({'cpu': 'Xeon', 'memory': None})
+
+def test_profiles_without_unavailable_components_still_load() -> None:
+    profile = CalibrationProfile.from_dict({'hostname': 'host', 'idle_power': {'cpu': 12.0},
+                                            'hardware_names': {'cpu': 'Xeon'}, 'window': 30.0,
+                                            'created_at': 1.0})
+
+    assert profile.unavailable == []
+    assert profile.covers({'cpu': 'Xeon'})
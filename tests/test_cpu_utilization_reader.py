@@ -0,0 +1,25 @@
+"""Counts the same busy CPU time from '/proc/stat' and from psutil."""
+from power_pyro.cpu_utilization_reader import CpuUtilizationReader
+
+from collections import namedtuple
+
+def test_read_leaves_out_steal_and_guest_time(tmp_path) -> None:
+    stat = tmp_path / 'stat'
+    stat.write_bytes(b'cpu  100 0 0 900 0 0 0 0 0 0\ncpu0 100 0 0 900 0 0 0 0 0 0\n')
+    reader = CpuUtilizationReader(str(stat))
+
+    # 100 busy jiffies (50 of them guest), 100 idle and 200 stolen ones.
+    stat.write_bytes(b'cpu  150 50 0 1000 0 0 0 200 50 0\n')
+
+    assert reader.read() == 100 / 400
+    reader.close()
+
+def test_busy_time_counts_the_same_fields_as_proc_stat() -> None:
+    times = namedtuple('scputimes', 'user nice system idle iowait irq softirq steal guest guest_nice')
+
+    assert CpuUtilizationReader.busy_time(times(10.0, 2.0, 3.0, 50.0, 5.0, 1.0, 1.0, 20.0, 4.0, 1.0)) == 17.0
+
+def test_busy_time_accepts_the_windows_fields() -> None:
+    times = namedtuple('scputimes', 'user system idle interrupt dpc')
+
+    assert CpuUtilizationReader.busy_time(times(10.0, 3.0, 50.0, 1.0, 0.5)) == 14.5
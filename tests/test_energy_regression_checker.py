@@ -0,0 +1,33 @@
+"""Tests whether the candidate energies of a benchmark are greater."""
+from power_pyro.energy_regression_checker import EnergyRegressionChecker
+
+import math
+import pytest
+
+mann_whitney = EnergyRegressionChecker.mann_whitney
+
+def test_exact_p_value_of_fully_separated_samples() -> None:
+    # Only one of the C(6, 3) = 20 arrangements puts every candidate on top.
+    assert mann_whitney([1.0, 2.0, 3.0], [4.0, 5.0, 6.0]) == pytest.approx(1 / 20)
+    assert mann_whitney([1.0, 2.0, 3.0], [4.0, 5.0, 6.0], greater=False) == pytest.approx(1.0)
+    assert mann_whitney([4.0, 5.0, 6.0], [1.0, 2.0, 3.0], greater=False) == pytest.approx(1 / 20)
+
+def test_exact_p_value_counts_every_arrangement_at_least_as_extreme() -> None:
+    # U = 3 of 4 for a candidate of 2 values against 2: arrangements with
+    # U >= 3 are 2 of C(4, 2) = 6.
+    assert mann_whitney([1.0, 3.0], [2.0, 4.0]) == pytest.approx(2 / 6)
+
+def test_normal_approximation_with_ties() -> None:
+    baseline = [10.0] * 10 + [11.0] * 10
+    candidate = [11.0] * 10 + [12.0] * 10
+
+    p_value = mann_whitney(baseline, candidate)
+
+    assert 0.0 < p_value < 0.01
+    assert mann_whitney(baseline, candidate, greater=False) > 0.99
+    assert mann_whitney(baseline, baseline) > 0.4
+
+def test_empty_samples_are_not_significant() -> None:
+    assert mann_whitney([], [1.0]) == 1.0
+    assert mann_whitney([1.0], []) == 1.0
+    assert not math.isnan(mann_whitney([1.0] * 5, [1.0] * 5))
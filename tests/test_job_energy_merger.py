@@ -0,0 +1,124 @@
+"""Merges the records of several local processes standing in for the ranks
+of a distributed job."""
+from power_pyro.directory_sample_sink import DirectorySampleSink
+from power_pyro.job_energy_merger import JobEnergyMerger
+
+from typing import Iterable, Union
+from multiprocessing import get_context
+import pytest
+
+pytest.importorskip('numpy')
+
+WATT_TO_KWH = 3_600_000
+START = 1_700_000_000.0
+SAMPLES = 10
+HOST_CPU_POWER = 100.0
+RANK_CPU_POWER = 20.0
+RANK_MEMORY_POWER = 2.0
+RANKS = [('node-a', 0), ('node-a', 1), ('node-a', 2), ('node-b', 3)]
+
+def run_rank(directory: str, host: str, rank: int) -> None:
+    """Writes the records a monitor of one rank would write, from its own
+       process.
+
+    Args:
+        directory: Shared sink directory.
+        host: Host name of the rank.
+        rank: Rank.
+    """
+    sink = DirectorySampleSink(directory, run_id='job', rank=rank, host=host)
+    sink.write({'type': 'meta', 'components': ['cpu', 'memory'],
+                'scopes': {'cpu': 'process', 'memory': 'process'},
+                'sensor_scopes': {'cpu': 'host', 'memory': 'process'},
+                'power_sources': {'cpu': 'sensor', 'memory': 'estimate'},
+                'sampling_interval': 1.0, 'start': START})
+
+    for index in range(1, SAMPLES + 1):
+        sink.write({'type': 'sample', 'timestamp': START + index, 'period': 1.0,
+                    'power': {'cpu': HOST_CPU_POWER, 'memory': RANK_MEMORY_POWER},
+                    'energy': {'cpu': RANK_CPU_POWER / WATT_TO_KWH, 'memory': RANK_MEMORY_POWER / WATT_TO_KWH},
+                    'stale': {'cpu': False, 'memory': False}})
+
+    # Ranks enter the phase at slightly different times.
+    sink.write({'type': 'region', 'name': 'train', 'start': START + 2 + rank * 0.5, 'end': START + 6})
+    sink.close()
+
+@pytest.fixture
+def merger(tmp_path) -> JobEnergyMerger:
+    context = get_context('spawn')
+    processes = [context.Process(target=run_rank, args=(str(tmp_path), host, rank)) for host, rank in RANKS]
+
+    for process in processes:
+        process.start()
+
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    return JobEnergyMerger(str(tmp_path / 'job'))
+
+def test_every_rank_is_loaded(merger: JobEnergyMerger) -> None:
+    assert merger.ranks == sorted(RANKS)
+
+def test_attributed_energy_is_summed_over_ranks(merger: JobEnergyMerger) -> None:
+    total = merger.energy_per_phase('attributed')['total']
+
+    assert total['cpu'] * WATT_TO_KWH == pytest.approx(len(RANKS) * RANK_CPU_POWER * SAMPLES)
+    assert total['memory'] * WATT_TO_KWH == pytest.approx(len(RANKS) * RANK_MEMORY_POWER * SAMPLES)
+
+def test_host_sensor_energy_is_counted_once_per_host(merger: JobEnergyMerger) -> None:
+    total = merger.energy_per_phase('sensor')['total']
+    hosts = len({host for host, _ in RANKS})
+
+    assert total['cpu'] * WATT_TO_KWH == pytest.approx(hosts * HOST_CPU_POWER * SAMPLES)
+    assert total['memory'] * WATT_TO_KWH == pytest.approx(len(RANKS) * RANK_MEMORY_POWER * SAMPLES)
+
+def test_phase_spans_every_rank(merger: JobEnergyMerger) -> None:
+    assert merger.phases() == [('train', START + 2, START + 6)]
+
+    train = merger.energy_per_phase('sensor')['train']
+    hosts = len({host for host, _ in RANKS})
+
+    assert train['cpu'] * WATT_TO_KWH == pytest.approx(hosts * HOST_CPU_POWER * 4)
+
+def write_rank(directory: str, rank: int, samples: Iterable[int], reset: Union[float, None] = None) -> None:
+    """Writes the records of a rank of 'node-a' sampling every second.
+
+    Args:
+        directory: Shared sink directory.
+        rank: Rank.
+        samples: End of each sample, in seconds after START.
+        reset: Time of a reset, in seconds after START (optional).
+    """
+    sink = DirectorySampleSink(directory, run_id='job', rank=rank, host='node-a')
+    sink.write({'type': 'meta', 'components': ['cpu'], 'scopes': {'cpu': 'process'},
+                'sensor_scopes': {'cpu': 'host'}, 'start': START})
+
+    for index in samples:
+        if reset is not None and index - 1 < reset <= index:
+            sink.write({'type': 'reset', 'timestamp': START + reset})
+
+        sink.write({'type': 'sample', 'timestamp': START + index, 'period': 1.0,
+                    'power': {'cpu': HOST_CPU_POWER}, 'energy': {'cpu': RANK_CPU_POWER / WATT_TO_KWH},
+                    'stale': {'cpu': False}})
+
+    sink.close()
+
+def test_host_energy_outside_the_lowest_rank_is_counted_once(tmp_path) -> None:
+    # Rank 0 stops early and pauses, rank 1 runs the whole job.
+    write_rank(str(tmp_path), 0, [1, 2, 5, 6])
+    write_rank(str(tmp_path), 1, range(1, 11))
+    merger = JobEnergyMerger(str(tmp_path / 'job'))
+
+    assert merger.energy_per_phase('sensor')['total']['cpu'] * WATT_TO_KWH == pytest.approx(HOST_CPU_POWER * 10)
+    assert merger.energy_per_phase('attributed')['total']['cpu'] * WATT_TO_KWH == pytest.approx(RANK_CPU_POWER * 14)
+
+    grid, power = merger.timeline(1.0, 'sensor')
+    assert power['cpu'] == pytest.approx([HOST_CPU_POWER] * len(grid))
+
+def test_records_before_a_reset_are_left_out(tmp_path) -> None:
+    write_rank(str(tmp_path), 0, range(1, 11), reset=4.5)
+    merger = JobEnergyMerger(str(tmp_path / 'job'))
+
+    assert merger.energy_per_phase('sensor')['total']['cpu'] * WATT_TO_KWH == pytest.approx(HOST_CPU_POWER * 5.5)
+    assert merger.energy_per_phase('attributed')['total']['cpu'] * WATT_TO_KWH == pytest.approx(RANK_CPU_POWER * 5.5)
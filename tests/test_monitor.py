@@ -0,0 +1,95 @@
+"""Counts the samples of the shared sampler inside the window of a monitor,
+and versions the totals across restarts, pauses and resets."""
+from power_pyro.sample import Sample
+
+import pytest
+import time
+
+WATT_TO_KWH = 3_600_000
+START = 1_700_000_000.0
+
+def make_sample(timestamp: float, period: float) -> Sample:
+    return Sample(timestamp, period, power={'cpu': 40.0}, energy={'cpu': 40.0 * period / WATT_TO_KWH},
+                  stale={'cpu': False}, share={'cpu': 1.0})
+
+@pytest.fixture
+def window(fake_hardware):
+    from power_pyro.monitor import Monitor
+
+    monitor = Monitor({'cpu': True}, sampling_interval=3600.0)
+    # The window is set by hand so that samples can be fed synchronously.
+    monitor._Monitor__window_start = START
+    monitor._Monitor__window_end = START + 10
+
+    return monitor
+
+def joules(monitor) -> float:
+    return monitor.snapshot().energy['cpu'] * WATT_TO_KWH
+
+def test_sample_inside_the_window_is_counted_whole(window) -> None:
+    window._Monitor__on_sample(make_sample(START + 4, 2.0))
+
+    assert joules(window) == pytest.approx(80.0)
+    assert window.snapshot().duration == pytest.approx(2.0)
+
+def test_samples_across_the_window_bounds_are_prorated(window) -> None:
+    window._Monitor__on_sample(make_sample(START + 1, 4.0))
+    window._Monitor__on_sample(make_sample(START + 11, 4.0))
+
+    # One second of the first sample and three of the last fall inside.
+    assert joules(window) == pytest.approx(40.0 * 4)
+    assert window.snapshot().duration == pytest.approx(4.0)
+    assert window.snapshot().version == 2
+
+def test_samples_outside_the_window_are_ignored(window) -> None:
+    window._Monitor__on_sample(make_sample(START, 2.0))
+    window._Monitor__on_sample(make_sample(START + 14, 4.0))
+
+    assert joules(window) == 0.0
+    assert window.snapshot().version == 0
+
+def test_published_raw_counters_cover_the_counted_part(window) -> None:
+    subscription = window.subscribe()
+    sample = make_sample(START + 1, 4.0)
+    window._Monitor__on_sample(Sample(sample.timestamp, sample.period, sample.power, sample.energy, sample.stale,
+                                      sample.share, raw={'process_cpu_time': 2.0, 'cpu_count': 8.0}))
+    published = subscription.get(timeout=1.0)
+
+    assert published.period == pytest.approx(1.0)
+    assert published.raw == pytest.approx({'process_cpu_time': 0.5, 'cpu_count': 8.0})
+
+def test_restart_pause_and_reset_epochs(fake_hardware) -> None:
+    from power_pyro.monitor import Monitor
+
+    monitor = Monitor({'cpu': True}, sampling_interval=0.05, read_timeout=4.11)
+    monitor.start()
+    time.sleep(0.1)
+    monitor.flush()
+    first = monitor.snapshot()
+
+    monitor.pause()
+    paused = monitor.snapshot()
+    monitor.resume()
+    time.sleep(0.1)
+    monitor.flush()
+    resumed = monitor.snapshot()
+
+    assert paused.epoch == resumed.epoch == first.epoch
+    assert resumed.since(first).duration > 0
+    assert resumed.total_energy > paused.total_energy
+
+    monitor.reset()
+    after_reset = monitor.snapshot()
+
+    assert after_reset.epoch == first.epoch + 1
+    with pytest.raises(ValueError):
+        after_reset.since(resumed)
+
+    monitor.end()
+    monitor.start()
+    restarted = monitor.snapshot()
+    monitor.end()
+
+    assert restarted.epoch == first.epoch + 2
+    assert restarted.version == 0
+    assert restarted.total_energy == 0.0
@@ -0,0 +1,35 @@
+"""Parses the resident memory of a process on each NUMA node."""
+from power_pyro.numa_maps_reader import NumaMapsReader
+
+NUMA_MAPS = b"""\
+55d0c0a00000 default file=/usr/bin/python3.12 mapped=120 N0=100 N1=20 kernelpagesize_kB=4
+55d0c0b00000 default anon=3 dirty=3 N1=3 kernelpagesize_kB=4
+7f0000000000 default
+7f1000000000 default anon=2 dirty=2 N0=2 kernelpagesize_kB=2048
+7ffd00000000 default stack anon=5 dirty=5 N0=5 kernelpagesize_kB=4
+"""
+
+def test_read_sums_resident_bytes_by_node(tmp_path) -> None:
+    (tmp_path / '1234').mkdir()
+    (tmp_path / '1234' / 'numa_maps').write_bytes(NUMA_MAPS)
+    reader = NumaMapsReader(1234, procfs=str(tmp_path))
+
+    try:
+        nodes = reader.read()
+
+        assert nodes == {0: (100 + 5) * 4096 + 2 * 2048 * 1024, 1: (20 + 3) * 4096}
+        # The file is read from its start every time.
+        assert reader.read() == nodes
+    finally:
+        reader.close()
+
+def test_read_handles_lines_split_across_chunks(tmp_path, monkeypatch) -> None:
+    (tmp_path / 'self').mkdir()
+    (tmp_path / 'self' / 'numa_maps').write_bytes(NUMA_MAPS)
+    monkeypatch.setattr(NumaMapsReader, '_NumaMapsReader__CHUNK_SIZE', 7)
+    reader = NumaMapsReader(procfs=str(tmp_path))
+
+    try:
+        assert reader.read() == {0: (100 + 5) * 4096 + 2 * 2048 * 1024, 1: (20 + 3) * 4096}
+    finally:
+        reader.close()
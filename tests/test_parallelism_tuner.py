@@ -0,0 +1,20 @@
+"""Measures energy to solution at each concurrency level."""
+import pytest
+import time
+
+def test_sensor_energy_counts_the_host_power_while_workers_wait(fake_hardware) -> None:
+    from power_pyro.parallelism_tuner import ParallelismTuner
+
+    tuner = ParallelismTuner(lambda workers: time.sleep(0.3), levels=[1], components={'cpu': True},
+                             warmup=False, repeats=2)
+    measurement = tuner.measure(1)
+
+    # Sleeping uses no CPU time, yet the host draws its power meanwhile.
+    assert measurement.energy == pytest.approx(fake_hardware.power['cpu'] * measurement.time, rel=0.2)
+    assert list(measurement.components) == ['cpu']
+
+def test_unknown_scope_is_rejected() -> None:
+    from power_pyro.parallelism_tuner import ParallelismTuner
+
+    with pytest.raises(ValueError):
+        ParallelismTuner(lambda workers: None, scope='host')
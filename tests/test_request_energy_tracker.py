@@ -0,0 +1,70 @@
+"""Charges requests the energy of one CPU second of the process."""
+from power_pyro.sample import Sample
+
+import pytest
+
+WATT_TO_KWH = 3_600_000
+
+@pytest.fixture
+def tracker(fake_hardware):
+    from power_pyro.request_energy_tracker import RequestEnergyTracker
+
+    tracker = RequestEnergyTracker({'cpu': True}, sampling_interval=3600.0)
+    yield tracker
+    tracker.close()
+
+def test_rate_uses_the_cpu_time_of_the_sample(tracker) -> None:
+    on_sample = tracker._RequestEnergyTracker__on_sample
+    on_sample(Sample(0.0, 1.0, energy={'cpu': 20.0 / WATT_TO_KWH}, raw={'process_cpu_time': 0.5}))
+
+    assert tracker.rate == pytest.approx(40.0)
+
+    # Samples without CPU time of the process keep the previous rate.
+    on_sample(Sample(1.0, 1.0, energy={'cpu': 20.0 / WATT_TO_KWH}, raw={'process_cpu_time': 0.0}))
+    on_sample(Sample(2.0, 1.0, energy={'cpu': 20.0 / WATT_TO_KWH}))
+
+    assert tracker.rate == pytest.approx(40.0)
+    assert tracker.charge('GET /items', 0.25) == pytest.approx(10.0)
+    assert tracker.summary()['routes']['GET /items']['count'] == 1
+
+def test_low_coverage_is_reported_once(tracker, capsys) -> None:
+    on_sample = tracker._RequestEnergyTracker__on_sample
+    tracker.charge('GET /items', 1.0)
+
+    for timestamp in range(3):
+        on_sample(Sample(float(timestamp), 1.0, energy={'cpu': 20.0 / WATT_TO_KWH}, raw={'process_cpu_time': 4.0}))
+
+    assert tracker.coverage == pytest.approx(1.0 / 12.0)
+    assert tracker.summary()['coverage'] == pytest.approx(1.0 / 12.0)
+    assert capsys.readouterr().out.count('Warning charging requests') == 1
+
+def test_routes_beyond_the_limit_are_charged_to_other(fake_hardware) -> None:
+    from power_pyro.request_energy_tracker import RequestEnergyTracker
+
+    tracker = RequestEnergyTracker({'cpu': True}, sampling_interval=3600.0, max_routes=2)
+
+    for item in range(4):
+        tracker.charge(f'GET /items/{item}', 0.1)
+
+    tracker.charge('GET /items/0', 0.1)
+    tracker.close()
+
+    counts = {route: histogram.count for route, histogram in tracker.get_histograms().items()}
+    assert counts == {'GET /items/0': 2, 'GET /items/1': 1, 'other': 2}
+
+def test_asgi_routes_use_the_route_template(tracker) -> None:
+    from power_pyro.asgi_energy_middleware import AsgiEnergyMiddleware
+    import asyncio
+
+    class Route():
+        path = '/items/{item_id}'
+
+    async def app(scope, receive, send) -> None:
+        scope['route'] = Route()
+
+    middleware = AsgiEnergyMiddleware(app, tracker)
+
+    for item in range(3):
+        asyncio.run(middleware({'type': 'http', 'method': 'GET', 'path': f'/items/{item}'}, None, None))
+
+    assert list(tracker.get_histograms()) == ['GET /items/{item_id}']
@@ -0,0 +1,76 @@
+"""Stores the records received from the ranks, refusing unsafe names."""
+from power_pyro.sample_collector import SampleCollector
+
+import json
+import os
+import pytest
+
+def record(run_id, host, rank) -> bytes:
+    return json.dumps({'run_id': run_id, 'host': host, 'rank': rank, 'type': 'sample'}).encode() + b'\n'
+
+@pytest.fixture
+def collector(tmp_path):
+    collector = SampleCollector(str(tmp_path / 'energy'), str(tmp_path / 'collector.sock'), max_open_files=2)
+    yield collector
+    collector.stop()
+
+def stored_files(tmp_path):
+    return sorted(os.path.relpath(os.path.join(directory, name), tmp_path)
+                  for directory, _, names in os.walk(tmp_path) for name in names if name.endswith('.jsonl'))
+
+def test_record_is_stored_in_the_file_of_its_rank(collector, tmp_path) -> None:
+    collector.store(record('job', 'node-a', 3))
+    collector.stop()
+
+    assert stored_files(tmp_path) == [os.path.join('energy', 'job', 'node-a-3.jsonl')]
+
+@pytest.mark.parametrize('run_id, host, rank', [
+    ('../../etc', 'node-a', 0),
+    ('..', 'node-a', 0),
+    ('job', 'node/a', 0),
+    ('job', '..\\node', 0),
+    ('job', '', 0),
+    ('job', 'node\0a', 0),
+    ('/abs', 'node-a', 0),
+    (['job'], 'node-a', 0),
+    ('job', 'node-a', -1),
+    ('job', 'node-a', True),
+    ('job', 'node-a', '0'),
+])
+def test_unsafe_records_are_dropped(collector, tmp_path, run_id, host, rank) -> None:
+    collector.store(record(run_id, host, rank))
+    collector.store(b'not json\n')
+    collector.store(b'[1, 2]\n')
+    collector.stop()
+
+    assert stored_files(tmp_path) == []
+
+def test_open_files_are_bounded(collector, tmp_path) -> None:
+    for rank in range(5):
+        collector.store(record('job', 'node-a', rank))
+
+    assert len(collector._SampleCollector__files) == 2
+
+    collector.store(record('job', 'node-a', 0))
+    collector.stop()
+
+    with open(tmp_path / 'energy' / 'job' / 'node-a-0.jsonl') as file:
+        assert len(file.readlines()) == 2
+
+def test_connection_sending_an_oversized_line_is_closed(tmp_path) -> None:
+    import socket
+
+    collector = SampleCollector(str(tmp_path / 'energy'), str(tmp_path / 'collector.sock'), max_line_size=256)
+    collector.start()
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(tmp_path / 'collector.sock'))
+        client.sendall(record('job', 'node-a', 0) + b'x' * 4096 + b'\n' + record('job', 'node-a', 1))
+        client.settimeout(5.0)
+
+        # The collector closes the connection instead of buffering the line.
+        assert client.recv(1) == b''
+
+    collector.stop()
+
+    assert stored_files(tmp_path) == [os.path.join('energy', 'job', 'node-a-0.jsonl')]
@@ -0,0 +1,69 @@
+"""Shares one sampler per configuration between the monitors of a process."""
+import gc
+import threading
+
+def sampler_threads() -> int:
+    return sum(thread.name == 'powerpyro-sampler' for thread in threading.enumerate())
+
+def test_restarted_monitor_shares_the_sampler_of_a_new_one(fake_hardware) -> None:
+    from power_pyro.monitor import Monitor
+
+    first = Monitor({'cpu': True}, sampling_interval=0.05, read_timeout=4.01)
+    first.start()
+    first.end()
+
+    second = Monitor({'cpu': True}, sampling_interval=0.05, read_timeout=4.01)
+    first.start()
+    second.start()
+
+    try:
+        assert sampler_threads() == 1
+        assert fake_hardware.created == ['cpu']
+    finally:
+        first.end()
+        second.end()
+
+    assert sampler_threads() == 0
+
+def test_sampler_is_dropped_with_the_last_monitor(fake_hardware) -> None:
+    from power_pyro.monitor import Monitor
+
+    monitor = Monitor({'cpu': True}, sampling_interval=0.05, read_timeout=4.02)
+    monitor.start()
+    monitor.end()
+    del monitor
+    gc.collect()
+
+    Monitor({'cpu': True}, sampling_interval=0.05, read_timeout=4.02)
+
+    assert fake_hardware.created == ['cpu', 'cpu']
+
+def test_sampler_reopens_when_a_listener_attaches_again(fake_hardware) -> None:
+    from power_pyro.os_type import OsType
+    from power_pyro.sampler import Sampler
+
+    sampler = Sampler.shared(OsType.LINUX, read_timeout=4.03)
+    samples = []
+
+    try:
+        sampler.require(['cpu'])
+
+        for _ in range(2):
+            sampler.attach(samples.append, 0.05)
+            sampler.flush(timeout=5)
+            sampler.detach(samples.append)
+
+        assert sampler_threads() == 0
+        assert Sampler.shared(OsType.LINUX, read_timeout=4.03) is sampler
+        sampler.release()
+    finally:
+        sampler.release()
+
+    other = Sampler.shared(OsType.LINUX, read_timeout=4.03)
+    other.release()
+
+    assert other is not sampler
+
+    assert len(samples) >= 2
+    assert all(sample.power['cpu'] == fake_hardware.power['cpu'] for sample in samples)
+    assert all(sample.share['cpu'] == 0.5 for sample in samples)
@@ -0,0 +1,39 @@
+"""Merges the work counted by several threads."""
+from power_pyro.work_counter import WorkCounter
+
+from threading import Thread
+
+def test_collect_returns_the_units_since_the_previous_collection() -> None:
+    counter = WorkCounter()
+    counter.count('rows', 10)
+    counter.count('rows', 5)
+    counter.count('batches')
+
+    assert counter.collect() == {'rows': 15, 'batches': 1}
+
+    counter.count('rows', 2)
+
+    assert counter.collect() == {'rows': 2}
+    assert counter.collect() == {}
+
+def test_collect_keeps_the_counts_of_finished_threads() -> None:
+    counter = WorkCounter()
+
+    def work() -> None:
+        for _ in range(1000):
+            counter.count('requests')
+
+    threads = [Thread(target=work) for _ in range(4)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert counter.collect() == {'requests': 4000}
+
+    # Finished threads are folded into the retired counts only once.
+    counter.count('requests')
+
+    assert counter.collect() == {'requests': 1}